@@ -32,8 +32,7 @@
 
 
 import pandas as pd
-#import numpy as np
-#import math
+import numpy as np
 from PAMI.contiguousFrequentPattern.basic import abstract as _ab
 from deprecated import deprecated
 
@@ -55,23 +54,40 @@ class PositionMining:
     About this algorithm
     ====================
 
-    :Description:  describe the algorithm
+    :Description:  PositionMining discovers the contiguous subsequences occurring at least minsup times in a set of
+                   sequences, such as the DNA sequences of a FASTA file. The sequences are concatenated and encoded as
+                   integers, and a suffix array and an LCP array are built over them. A pattern occurring minsup
+                   times is the common prefix of minsup adjacent suffixes, so the frequent patterns are read off the
+                   LCP intervals of the suffix array instead of being grown by position-list joins. Patterns are at
+                   most maxlength - 1 symbols long, so suffixes are only sorted on that many symbols.
 
     :Reference: provide the reference of the algorithm with URL of the paper, if possible
 
-    :param  parameter: parameterType :
-                    description of the parameters. Parameters are the variables used in problem definition of the model.
+    :param  minsup: int :
+                    minimum number of occurrences of a pattern, overlapping occurrences included
+    :param  datapath: str :
+                    .csv file consisting of two id,seq fields respectively in order
+    :param  maxlength: int :
+                    patterns are shorter than maxlength
 
     :Attributes:
 
-        min_IG: float
-                minimum threshold for information gain
-            
-        min_conf: float
-                minimum threshold for confidence
+        min_sup: int
+                minimum number of occurrences of a pattern
 
         datapath: .csv file consisting of two id,seq fields respectively in order
-    
+
+        maxlength: int
+                patterns are shorter than maxlength
+
+        text: str
+                the sequences concatenated, each one followed by a separator position
+
+        suffixArray: numpy.ndarray
+                start positions in text of the suffixes, sorted on their first maxlength - 1 symbols
+
+        lcp: numpy.ndarray
+                length of the common prefix of every suffix and the previous one in suffixArray, up to maxlength - 1
 
     Credits
     =======
@@ -85,14 +101,19 @@ class PositionMining:
         self.maxlength=maxlength
         self.seq_prefixes = None
         self.data = None
-        self.symbol_freq = None
         self.total_length = None
         self._startTime = None
         self._endTime = None
         self._memoryUSS = float()
         self._memoryRSS = float()
-        self.table = None
-        self.current_candidate = None
+        self.text = None
+        self.suffixArray = None
+        self.lcp = None
+        self._codes = None
+        self._bits = None
+        self._width = None
+        self._prefixKeys = None
+        self._intervals = None
         self.frequentPatterns = None
     
 
@@ -100,37 +121,120 @@ class PositionMining:
         df=pd.read_csv(self.datapath)
         vals=df.values
         self.seq_prefixes = {}
-        # prev=0
-        # self.seq_prefixes[vals[0][0]]=len(vals[0])
-        # for i in range(1,len(vals)):
-        #     self.seq_prefixes[vals[i]]
         self.data=vals
-        # print(self.data)
 
-    def getfreqs(self):
+    def encode(self):
         """
-        Initial scan of database where frequent length one candidate will be mined
+        Concatenate the sequences, each one followed by a separator, and encode every symbol as an integer. The
+        separator gets code 0 and no pattern goes through it
         """
-        self.symbol_freq={"A":set(),"G":set(),"C":set(),"T":set()}
-        self.total_length=0
-        curr_pos=0
-        # print(self.data)
-        for i in range(len(self.data)):
-            seq=self.data[i][1]
-            for j in range(len(seq)):
-                self.symbol_freq[seq[j]].add(curr_pos)
-                curr_pos+=1
-            curr_pos+=1
-            self.total_length+=len(seq)
-
-        temp={}
-        for i in self.symbol_freq:
-            if len(self.symbol_freq[i])>=self.min_sup:
-                temp.update({i:self.symbol_freq[i]})
-        self.symbol_freq=temp
-
-    
-    
+        sequences = [str(row[1]) for row in self.data]
+        self.total_length = sum(len(seq) for seq in sequences)
+        self.text = "\0".join(sequences) + "\0"
+        points = np.frombuffer(self.text.encode("utf-32-le"), dtype=np.uint32)
+        # dense codes through a lookup table, the separator being the smallest code point
+        present = np.zeros(int(points.max()) + 1, dtype=bool)
+        present[points] = True
+        table = np.cumsum(present, dtype=np.int64) - 1
+        # padding, so that the symbols past the end of the text read as separators
+        self._codes = np.concatenate((table[points], np.zeros(self.maxlength, dtype=np.int64)))
+
+    def buildSuffixArray(self):
+        """
+        Sort the suffixes of the text on their first maxlength - 1 symbols. The first symbols of every suffix are
+        packed into one integer key, as many as fit in 63 bits, so that a single sort is enough for a small
+        alphabet such as DNA. Longer prefixes are sorted by prefix doubling: each round sorts the suffixes on
+        twice as many symbols with one sort of the pair of ranks of their two halves, and the rounds stop once
+        every suffix has a rank of its own
+        """
+        n = len(self.text)
+        depth = max(self.maxlength - 1, 1)
+        self._bits = max(int(self._codes.max()), 1).bit_length()
+        self._width = max(1, min(depth, 63 // self._bits))
+        keys = np.zeros(n, dtype=np.int64)
+        for offset in range(self._width):
+            keys = (keys << self._bits) | self._codes[offset:offset + n]
+        self._prefixKeys = keys
+        order = np.argsort(keys, kind="stable")
+        span = self._width
+        if span < depth:
+            sortedKey = keys[order]
+            rank = np.empty(n, dtype=np.int64)
+            rank[order] = np.concatenate(([0], np.cumsum(sortedKey[1:] != sortedKey[:-1])))
+            while span < depth and int(rank.max()) < n - 1:
+                second = np.zeros(n, dtype=np.int64)
+                second[:n - span] = rank[span:] + 1
+                key = rank * (n + 1) + second
+                order = np.argsort(key, kind="stable")
+                sortedKey = key[order]
+                rank = np.empty(n, dtype=np.int64)
+                rank[order] = np.concatenate(([0], np.cumsum(sortedKey[1:] != sortedKey[:-1])))
+                span *= 2
+        self.suffixArray = order
+
+    def buildLCP(self):
+        """
+        Length of the common prefix of every suffix with the previous one in the suffix array, never going
+        through a separator. The first symbols are compared at once on the packed keys, the number of equal
+        leading symbols following from the highest differing bit, and the pairs equal on all of them are compared
+        symbol by symbol on the following ones
+        """
+        n = len(self.suffixArray)
+        current, previous = self.suffixArray[1:], self.suffixArray[:-1]
+        differ = self._prefixKeys[current] ^ self._prefixKeys[previous]
+        highest = np.zeros(n - 1, dtype=np.int64)
+        for shift in (32, 16, 8, 4, 2, 1):
+            above = (differ >> shift) != 0
+            highest += np.where(above, shift, 0)
+            differ = np.where(above, differ >> shift, differ)
+        highest += differ != 0
+        common = self._width - (highest + self._bits - 1) // self._bits
+        # equal separators do not match, so no common prefix goes past the next separator
+        separators = np.flatnonzero(self._codes[:n] == 0)
+        common = np.minimum(common, separators[np.searchsorted(separators, current)] - current)
+        self.lcp = np.zeros(n, dtype=np.int64)
+        self.lcp[1:] = common
+        pairs = np.flatnonzero(common == self._width) + 1
+        for offset in range(self._width, self.maxlength - 1):
+            current, previous = self.suffixArray[pairs], self.suffixArray[pairs - 1]
+            symbols = self._codes[current + offset]
+            same = (symbols == self._codes[previous + offset]) & (symbols != 0)
+            pairs = pairs[same]
+            if not len(pairs):
+                break
+            self.lcp[pairs] += 1
+
+    def mineIntervals(self):
+        """
+        Read the frequent patterns off the LCP intervals, one pattern length at a time. The suffixes starting with
+        a pattern of length l form a run of the suffix array whose inner LCP values are at least l, so the
+        patterns of length l are the runs of at least minsup suffixes. Only the suffixes of such runs can start a
+        longer frequent pattern and are kept for the next length
+        """
+        self.frequentPatterns = {}
+        self._intervals = {}
+        minSup = max(int(np.ceil(float(self.min_sup))), 1)
+        # suffixes starting with a symbol, the separators being left out
+        ranks = np.flatnonzero(self._codes[self.suffixArray] != 0)
+        for length in range(1, self.maxlength):
+            if len(ranks) < minSup:
+                break
+            if length > 1:
+                # a suffix shorter than length has no symbol at length - 1 and is left out as well
+                ranks = ranks[self._codes[self.suffixArray[ranks] + length - 1] != 0]
+            starts = np.ones(len(ranks), dtype=bool)
+            starts[1:] = (np.diff(ranks) != 1) | (self.lcp[ranks[1:]] < length)
+            bounds = np.flatnonzero(starts)
+            sizes = np.diff(np.append(bounds, len(ranks)))
+            frequent = sizes >= minSup
+            if not frequent.any():
+                break
+            for first, size in zip(ranks[bounds[frequent]].tolist(), sizes[frequent].tolist()):
+                position = int(self.suffixArray[first])
+                pattern = self.text[position:position + length]
+                self.frequentPatterns[pattern] = size
+                self._intervals[pattern] = first
+            ranks = ranks[np.repeat(frequent, sizes)]
 
     def getPatterns(self):
         """
@@ -186,14 +290,23 @@ class PositionMining:
         :type k: dictionary of frequent patterns
         """
 
-        dic={i:len(self.table[k][i]) for i in self.table[k]}
+        dic={i:self.frequentPatterns[i] for i in self.frequentPatterns if len(i)==k}
         return dic
     
 
 
     def getPattern_positions(self,pattern):
-        length=len(pattern)
-        positions=self.table[length][pattern]
+        """
+        Positions in the concatenated sequences of the occurrences of a frequent pattern, a sequence being followed
+        by one separator position
+
+        :param pattern: a frequent pattern
+        :type pattern: str
+        :return: the start positions of its occurrences
+        :rtype: set
+        """
+        first=self._intervals[pattern]
+        positions=set(self.suffixArray[first:first+self.frequentPatterns[pattern]].tolist())
         return positions
 
     def getMemoryUSS(self):
@@ -234,45 +347,6 @@ class PositionMining:
         print("Total ExecutionTime in seconds:", self.getRuntime())
 
 
-    def join(self,db,length):
-        """
-        Generating l+1 frequent patterns using two l length frequent patterns
-
-        :param db:current l length frequent patterns table consisting of their positions
-        :type db: HashTable
-        :param length:current length of the frequent candidates generated
-        :type length: positive integer
-        """
-        for seq1 in db:
-            for seq2 in db:
-                if seq1!=seq2:
-                    if length==1:
-                        word=seq1+seq2
-                        # print(seq1,seq2,db[seq1],db[seq2])
-                        minus_1={i-1 for i in db[seq2]}
-                        positions=db[seq1].intersection(minus_1)
-                        if len(positions)>=self.min_sup:
-                            self.table[length+1].update({word:positions})
-
-
-                    else:
-                        if seq1[1:]== seq2[:-1]:
-                            word=seq1+seq2[-1]
-                            minus_1={i-1 for i in db[seq2]}
-                            positions=db[seq1].intersection(minus_1)
-                            if len(positions)>=self.min_sup:
-                                self.table[length+1].update({word:positions})
-        
-
-    def mineNext_candidates(self):
-        """
-        Mining frequent patterns along with their positions from length 1 frequent candidates
-        """
-        while self.current_candidate<self.maxlength-1:
-            curr=self.table[self.current_candidate]
-            self.join(curr,self.current_candidate)
-            self.current_candidate+=1
-
     @deprecated("It is recommended to use 'mine()' instead of 'mine()' for mining process. Starting from January 2025, 'mine()' will be completely terminated.")
     def startMine(self):
         """
@@ -285,25 +359,16 @@ class PositionMining:
         """
         Pattern mining process will start from here
         """
-        # pass
         self._startTime = _ab._time.time()
-        self.table = {i: {} for i in range(1, self.maxlength)}
         self.readData()
-
-        self.getfreqs()
-        temp = self.symbol_freq
-        self.table.update({1: temp})
-        self.current_candidate = 1
-        self.mineNext_candidates()
-        self.frequentPatterns = {}
-        for length in self.table:
-            temp = self.table[length]
-            for pattern in temp:
-                self.frequentPatterns.update({pattern: len(temp[pattern])})
+        self.encode()
+        self.buildSuffixArray()
+        self.buildLCP()
+        self.mineIntervals()
 
         process = _ab._psutil.Process(_ab._os.getpid())
         self._endTime = _ab._time.time()
         self._memoryUSS = float()
         self._memoryRSS = float()
         self._memoryUSS = process.memory_full_info().uss
-        self._memoryRSS = process.memory_info().rss
\ No newline at end of file
+        self._memoryRSS = process.memory_info().rss
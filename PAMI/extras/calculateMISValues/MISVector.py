@@ -0,0 +1,65 @@
+# This code calculates the multiple minimum support (MIS) of items from their supports as a NumPy vector, aligned with
+# the item order of an encoded database, so that a miner can look the MIS of an item up by its integer rank.
+#
+# **Importing this algorithm into a python program**
+# --------------------------------------------------------
+#
+#             from PAMI.extras.calculateMISValues.MISVector import MISVector
+#
+#             MIS = MISVector(supports, X, LS)
+#
+
+
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from typing import Union
+import numpy as _np
+
+
+def MISVector(supports, X: Union[int, float, str], LS: float) -> _np.ndarray:
+    """
+    :Description: Calculates the MIS of every item from its support. An integer X lowers the support by X, a float X
+                  scales it by X as usingBeta does, and no MIS falls below the least support LS
+
+    :param supports: support of every item, in the order of the returned vector
+    :type supports: list or numpy.ndarray
+    :param X: the difference or the ratio between the support and the MIS of an item. A string holding a '.' is read as a float, otherwise as an integer
+    :type X: int or float or str
+    :param LS: the least MIS of an item
+    :type LS: int or float
+    :return: the MIS of every item
+    :rtype: numpy.ndarray
+
+    **Importing this algorithm into a python program**
+    --------------------------------------------------------
+    .. code-block:: python
+
+            from PAMI.extras.calculateMISValues.MISVector import MISVector
+
+            MIS = MISVector([10, 4, 7], 0.5, 3)  # array([5. , 3. , 3.5])
+    """
+    if isinstance(X, str):
+        X = float(X) if '.' in X else int(X)
+    supports = _np.asarray(supports, dtype=_np.float64)
+    if isinstance(X, float):
+        values = supports * X
+    else:
+        values = supports - X
+    return _np.maximum(values, LS)
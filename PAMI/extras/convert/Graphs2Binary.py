@@ -0,0 +1,388 @@
+# Graphs2Binary converts a graph database in the "t # / v / e" text format read by the subgraph miners into a single
+# binary file. The file holds the vertices and the edges of all the graphs in global arrays, the offsets of every
+# graph into these arrays and a dictionary of the vertex and edge labels. BinaryGraphDatabase memory-maps such a
+# file, so that gSpan, TKG, MUSE and graphDatabase load it without parsing any text.
+#
+# **Importing this algorithm into a python program**
+#
+#             from PAMI.extras.convert import Graphs2Binary as g2b
+#
+#             obj = g2b.Graphs2Binary("graphs.txt", "graphs.bin")
+#
+#             obj.convert()
+#
+#             obj.printStats()
+#
+#             obj = GSpan("graphs.bin", 0.1)   # the miners recognise the binary file by its first bytes
+#
+#             obj = GSpan("graphs.bin", 0.1, csr=False)   # Vertex and Edge objects instead of the default CSR arrays
+#
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import sys
+import os
+import json
+import time
+import psutil
+import numpy as np
+from array import array
+
+# first bytes of a binary graph database
+_MAGIC = b'PAMIGRB1'
+
+# type code and numpy dtype of every array of the file, in the order they are written
+_ARRAYS = [('graphIds', 'q'), ('vertexOffsets', 'q'), ('edgeOffsets', 'q'), ('vertexIds', 'q'),
+           ('vertexLabels', 'i'), ('edgeSources', 'i'), ('edgeTargets', 'i'), ('edgeLabels', 'i'),
+           ('edgeProbabilities', 'd')]
+
+
+class Graphs2Binary:
+    """
+        **About this algorithm**
+
+        :**Description**:  This class converts a graph database in the "t # / v / e" text format into a binary file
+                           that BinaryGraphDatabase memory-maps. The text is read once, line by line, so that no graph
+                           object is built during the conversion.
+
+        :**Reference**:
+
+        :**Parameters**:    - **inputFile** (*str*) -- *Path to the graph database in text format.*
+                            - **outputFile** (*str*) -- *Path to the binary file.*
+
+        :**Attributes**:    - **getMemoryUSS** (*int*) -- *Returns the memory used by the process in USS.*
+                            - **getMemoryRSS** (*int*) -- *Returns the memory used by the process in RSS.*
+                            - **getRuntime()** (*float*) -- *Returns the time taken to execute the conversion.*
+                            - **printStats()** -- * Prints statistics about memory usage and runtime.*
+
+        :**Methods**:       - **convert()** -- *Reads the text file and writes the binary file.*
+
+        **Layout of the binary file**
+
+        The file starts with the bytes PAMIGRB1, the length of a JSON header as a little-endian uint64 and the header
+        itself. The header holds the number of graphs, vertices and edges, the vertex and edge labels in order of
+        first appearance, and the dtype, offset and length of every array. The arrays follow, each aligned to 8 bytes:
+
+            - graphIds, vertexOffsets and edgeOffsets, with one entry per graph (plus one for the offsets)
+            - vertexIds and vertexLabels, the id and the label code of every vertex
+            - edgeSources, edgeTargets and edgeLabels, every edge with its end points numbered within its graph
+            - edgeProbabilities, the existence probability of every edge of an uncertain graph database
+
+        **Execution methods**
+
+        **Terminal command**
+
+        .. code-block:: console
+
+          Format:
+
+          (.venv) $ python3 Graphs2Binary.py <inputFile> <outputFile>
+
+          Example Usage:
+
+          (.venv) $ python3 Graphs2Binary.py graphs.txt graphs.bin
+
+
+        **Calling from a python program**
+
+        .. code-block:: python
+
+                import PAMI.extras.convert.Graphs2Binary as g2b
+
+                obj = g2b.Graphs2Binary('graphs.txt', 'graphs.bin')
+
+                obj.convert()
+
+                obj.printStats()
+
+    """
+    def __init__(self, inputFile, outputFile):
+        self.inputFile = inputFile
+        self.outputFile = outputFile
+        self.start = None
+        self.end = None
+        self.pid = None
+        self.memoryUSS = float()
+        self.memoryRSS = float()
+
+    def convert(self):
+        """
+        This function reads the graphs of the text file and writes them to the binary file. Graphs without vertices
+        are skipped, as the miners skip them when reading the text.
+        """
+        self.start = time.time()
+        arrays = {name: array(code) for name, code in _ARRAYS}
+        vertexLabels, edgeLabels = {}, {}
+        uncertain = None
+        graphId, index = None, {}
+        arrays['vertexOffsets'].append(0)
+        arrays['edgeOffsets'].append(0)
+
+        def closeGraph():
+            if index:
+                arrays['graphIds'].append(graphId)
+                arrays['vertexOffsets'].append(len(arrays['vertexIds']))
+                arrays['edgeOffsets'].append(len(arrays['edgeSources']))
+
+        with open(self.inputFile, 'r') as f:
+            for line in f:
+                items = line.split()
+                if not items:
+                    continue
+                if items[0] == 't':
+                    closeGraph()
+                    graphId, index = int(items[2]), {}
+                elif items[0] == 'v':
+                    vertex = int(items[1])
+                    label = vertexLabels.setdefault(items[2], len(vertexLabels))
+                    if vertex in index:
+                        arrays['vertexLabels'][arrays['vertexOffsets'][-1] + index[vertex]] = label
+                        continue
+                    index[vertex] = len(index)
+                    arrays['vertexIds'].append(vertex)
+                    arrays['vertexLabels'].append(label)
+                elif items[0] == 'e':
+                    arrays['edgeSources'].append(index[int(items[1])])
+                    arrays['edgeTargets'].append(index[int(items[2])])
+                    arrays['edgeLabels'].append(edgeLabels.setdefault(items[3], len(edgeLabels)))
+                    if uncertain is None:
+                        uncertain = len(items) > 4
+                    if uncertain:
+                        arrays['edgeProbabilities'].append(float(items[4]))
+            closeGraph()
+
+        header = {'graphs': len(arrays['graphIds']), 'vertices': len(arrays['vertexIds']),
+                  'edges': len(arrays['edgeSources']), 'vertexLabels': list(vertexLabels),
+                  'edgeLabels': list(edgeLabels), 'arrays': {}}
+        offset = 0
+        for name, code in _ARRAYS:
+            values = arrays[name]
+            header['arrays'][name] = [np.dtype(code).str, offset, len(values)]
+            offset += (len(values) * values.itemsize + 7) & ~7
+        encoded = json.dumps(header).encode('utf-8')
+        # the arrays start on a multiple of 8 bytes after the magic, the header length and the header
+        start = (len(_MAGIC) + 8 + len(encoded) + 7) & ~7
+        encoded += b' ' * (start - len(_MAGIC) - 8 - len(encoded))
+        with open(self.outputFile, 'wb') as f:
+            f.write(_MAGIC)
+            f.write(len(encoded).to_bytes(8, 'little'))
+            f.write(encoded)
+            for name, code in _ARRAYS:
+                values = arrays[name]
+                values.tofile(f)
+                f.write(b'\0' * (-(len(values) * values.itemsize) & 7))
+
+        self.end = time.time()
+
+        self.pid = os.getpid()
+        process = psutil.Process(self.pid)
+        self.memoryUSS = process.memory_full_info().uss
+        self.memoryRSS = process.memory_info().rss
+
+    def getMemoryUSS(self):
+        """
+        Returns the memory used by the process in USS (Unique Set Size).
+
+        :return: The amount of memory (in bytes) used exclusively by the process
+        :rtype: int
+        """
+        return self.memoryUSS
+
+    def getMemoryRSS(self):
+        """
+        Returns the memory used by the process in RSS (Resident Set Size).
+
+        :return: The total memory (in bytes) used by the process in RAM.
+        :rtype: int
+        """
+        return self.memoryRSS
+
+    def getRuntime(self):
+        """
+        Returns the time taken to complete the conversion.
+
+        :return: The runtime of the conversion process in seconds.
+        :rtype: float
+        """
+        return self.end - self.start
+
+    def printStats(self):
+        """
+        Prints the resource usage statistics including memory consumption (USS and RSS) and the runtime.
+
+        :return: Prints memory usage and runtime to the console.
+        """
+        print("Memory usage (USS):", self.memoryUSS)
+        print("Memory usage (RSS):", self.memoryRSS)
+        print("Runtime:", self.end - self.start)
+
+
+class BinaryGraphDatabase:
+    """
+    :Description: A graph database written by Graphs2Binary. Its arrays are memory-mapped, so that opening the file
+                  reads only its header and a graph is read from the disk when it is accessed.
+
+    :param path: path to the binary file
+    :type path: str
+
+    :Attributes:
+
+        graphIds, vertexOffsets, edgeOffsets, vertexIds, vertexLabels, edgeSources, edgeTargets, edgeLabels,
+        edgeProbabilities: numpy.memmap
+            the arrays of the file
+        vertexLabelNames: list
+            the vertex label of every label code, as written in the text file
+        edgeLabelNames: list
+            the edge label of every label code, as written in the text file
+
+    :Methods:
+
+        isBinary(path)
+            Check whether a file is a binary graph database
+        getGraphCount()
+            Number of graphs of the database
+        graphs(vertexLabel, edgeLabel)
+            Iterate over the graphs as lists of vertices and edges
+        graphArrays(vertexLabel, edgeLabel)
+            Iterate over the graphs as slices of the arrays of the file
+    """
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            if f.read(len(_MAGIC)) != _MAGIC:
+                raise ValueError(path + " is not a binary graph database")
+            length = int.from_bytes(f.read(8), 'little')
+            header = json.loads(f.read(length).decode('utf-8'))
+        start = len(_MAGIC) + 8 + length
+        self.vertexLabelNames = header['vertexLabels']
+        self.edgeLabelNames = header['edgeLabels']
+        for name, (dtype, offset, count) in header['arrays'].items():
+            if count:
+                values = np.memmap(path, dtype=dtype, mode='r', offset=start + offset, shape=(count,))
+            else:
+                values = np.zeros(0, dtype=dtype)
+            setattr(self, name, values)
+
+    # graphs whose arrays are read at once by graphs()
+    blockSize = 4096
+
+    @staticmethod
+    def isBinary(path):
+        """
+        Check whether a file is a binary graph database by its first bytes
+
+        :param path: path to the file
+        :type path: str
+        :return: True if the file was written by Graphs2Binary
+        :rtype: bool
+        """
+        try:
+            with open(path, 'rb') as f:
+                return f.read(len(_MAGIC)) == _MAGIC
+        except (OSError, TypeError):
+            return False
+
+    def getGraphCount(self):
+        return len(self.graphIds)
+
+    def graphs(self, vertexLabel=int, edgeLabel=int):
+        """
+        Iterate over the graphs. Every label is converted once, through the label dictionary, with the functions
+        the miners apply to the labels of the text file
+
+        :param vertexLabel: converts a vertex label of the text file
+        :type vertexLabel: function
+        :param edgeLabel: converts an edge label of the text file
+        :type edgeLabel: function
+        :return: (graph id, [(vertex id, label)], [(vertex id, vertex id, label, probability)]) of every graph,
+                 the probability being None in a certain graph database
+        :rtype: generator
+        """
+        vertexLabels = [vertexLabel(label) for label in self.vertexLabelNames]
+        edgeLabels = [edgeLabel(label) for label in self.edgeLabelNames]
+        vertexOffsets = self.vertexOffsets.tolist()
+        edgeOffsets = self.edgeOffsets.tolist()
+        graphIds = self.graphIds.tolist()
+        uncertain = len(self.edgeProbabilities) > 0
+        # the arrays are copied into lists a block of graphs at a time, which costs far less than slicing the
+        # memory map for every graph and keeps only the block in memory
+        for first in range(0, len(graphIds), self.blockSize):
+            last = min(first + self.blockSize, len(graphIds))
+            vb, eb = vertexOffsets[first], edgeOffsets[first]
+            ids = self.vertexIds[vb:vertexOffsets[last]].tolist()
+            labels = [vertexLabels[label] for label in self.vertexLabels[vb:vertexOffsets[last]].tolist()]
+            sources = self.edgeSources[eb:edgeOffsets[last]].tolist()
+            targets = self.edgeTargets[eb:edgeOffsets[last]].tolist()
+            eLabels = [edgeLabels[label] for label in self.edgeLabels[eb:edgeOffsets[last]].tolist()]
+            if uncertain:
+                probabilities = self.edgeProbabilities[eb:edgeOffsets[last]].tolist()
+            else:
+                probabilities = [None] * len(sources)
+            for i in range(first, last):
+                vs, ve = vertexOffsets[i] - vb, vertexOffsets[i + 1] - vb
+                es, ee = edgeOffsets[i] - eb, edgeOffsets[i + 1] - eb
+                graphVertices = ids[vs:ve]
+                vertices = list(zip(graphVertices, labels[vs:ve]))
+                edges = [(graphVertices[v1], graphVertices[v2], label, probability) for v1, v2, label, probability in
+                         zip(sources[es:ee], targets[es:ee], eLabels[es:ee], probabilities[es:ee])]
+                yield graphIds[i], vertices, edges
+
+    def graphArrays(self, vertexLabel=int, edgeLabel=int):
+        """
+        Iterate over the graphs as numpy arrays, in the order of the parameters of CSRGraph.fromEdges, so that a graph
+        is built from the arrays of the file without any vertex or edge object. Every label is converted once, through
+        the label dictionary, and the label codes of a block of graphs are translated with one lookup
+
+        :param vertexLabel: converts a vertex label of the text file to an integer
+        :type vertexLabel: function
+        :param edgeLabel: converts an edge label of the text file to an integer
+        :type edgeLabel: function
+        :return: (graph id, vertex labels, edge sources, edge targets, edge labels, edge probabilities, vertex ids) of
+                 every graph, the end points of the edges being numbered within the graph and the probabilities being
+                 None in a certain graph database
+        :rtype: generator
+        """
+        vertexLabels = np.array([vertexLabel(label) for label in self.vertexLabelNames], dtype=np.int64)
+        edgeLabels = np.array([edgeLabel(label) for label in self.edgeLabelNames], dtype=np.int64)
+        vertexOffsets = self.vertexOffsets.tolist()
+        edgeOffsets = self.edgeOffsets.tolist()
+        graphIds = self.graphIds.tolist()
+        uncertain = len(self.edgeProbabilities) > 0
+        for first in range(0, len(graphIds), self.blockSize):
+            last = min(first + self.blockSize, len(graphIds))
+            vb, eb = vertexOffsets[first], edgeOffsets[first]
+            ids = np.asarray(self.vertexIds[vb:vertexOffsets[last]])
+            labels = vertexLabels[self.vertexLabels[vb:vertexOffsets[last]]]
+            sources = np.asarray(self.edgeSources[eb:edgeOffsets[last]])
+            targets = np.asarray(self.edgeTargets[eb:edgeOffsets[last]])
+            eLabels = edgeLabels[self.edgeLabels[eb:edgeOffsets[last]]]
+            probabilities = np.asarray(self.edgeProbabilities[eb:edgeOffsets[last]]) if uncertain else None
+            for i in range(first, last):
+                vs, ve = vertexOffsets[i] - vb, vertexOffsets[i + 1] - vb
+                es, ee = edgeOffsets[i] - eb, edgeOffsets[i + 1] - eb
+                yield (graphIds[i], labels[vs:ve], sources[es:ee], targets[es:ee], eLabels[es:ee],
+                       None if probabilities is None else probabilities[es:ee], ids[vs:ve])
+
+
+if __name__ == '__main__':
+    if len(sys.argv) == 3:
+        obj = Graphs2Binary(sys.argv[1], sys.argv[2])
+        obj.convert()
+        obj.printStats()
+    else:
+        raise ValueError("Invalid number of arguments. Args: <inputFile> <outputFile>")
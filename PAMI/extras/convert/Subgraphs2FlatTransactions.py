@@ -1,37 +1,72 @@
 # The goal of the below is to obtain flat transactions from the output of subgraph mining
 # Flat transactions are transactions that contain the list of subgraphs that are present in a graph
 #
-#   from PAMI.extras.graph import flatTransactions as ft
+#   from PAMI.extras.convert import Subgraphs2FlatTransactions as ft
 #
-#   obj = ft.FlatTransactions()
+#   obj = ft.Subgraphs2FlatTransactions()
 #
 #   flatTransactions = obj.getFlatTransactions(fidGidDictMap)
 #   (fidGidDictMap is a list of dictionaries with keys 'FID' and 'GIDs'
 #   FID is subgraph/fragment ID and GIDs are the graph IDs that contain the subgraph)
 #
 #   obj.saveFlatTransactions(oFile)
+#
+#   The flat transactions can also be written as the mappings are produced, without keeping the mappings or the
+#   flat transactions as lists:
+#
+#   obj.streamFlatTransactions(gsp_obj.iterSubgraphGraphMapping(), oFile)
+#
+#   or as gSpan reports the subgraphs, without keeping the subgraphs at all:
+#
+#   gsp_obj = GSpan(iFile, minSupport, callback=obj.addSubgraph)
+#
+#   gsp_obj.mine()
+#
+#   obj.writeFlatTransactions(oFile)
+
+from array import array
+
 
 class Subgraphs2FlatTransactions:
 
     def __init__(self):
         self.flatTransactions = {}
+        self._fragments = {}
 
-    def getFlatTransactions(self, fidGidDictMap):
+    @staticmethod
+    def _addFragment(graphToSubgraphs, fid, gids):
         """
-        fidGidMap is a list of dictionaries with keys 'FID' and 'GIDs'
-        An example of this type of output is: getSubgraphGraphMapping in GSpan class
-        from subgraphMining/basic/gspan.py in PAMI
+        Add the integer fragment id to the compact array of every graph holding it
+        """
+        for gid in gids:
+            fids = graphToSubgraphs.get(gid)
+            if fids is None:
+                fids = graphToSubgraphs[gid] = array('l')
+            fids.append(fid)
+
+    @staticmethod
+    def _fragmentsByGraph(mappings):
+        """
+        Collect the integer fragment ids of every graph in a compact array, in the order the graphs first appear.
+        The mappings are consumed one at a time, so a generator of mappings is never held as a whole
         """
         graphToSubgraphs = {}
 
-        for mapping in fidGidDictMap:
-            fid = mapping['FID']
-            gids = mapping['GIDs']
+        for mapping in mappings:
+            if isinstance(mapping, dict):
+                Subgraphs2FlatTransactions._addFragment(graphToSubgraphs, mapping['FID'], mapping['GIDs'])
+            else:
+                Subgraphs2FlatTransactions._addFragment(graphToSubgraphs, *mapping)
+
+        return graphToSubgraphs
 
-            for gid in gids:
-                if gid not in graphToSubgraphs:
-                    graphToSubgraphs[gid] = []
-                graphToSubgraphs[gid].append(fid)
+    def getFlatTransactions(self, fidGidDictMap):
+        """
+        fidGidMap is a list of dictionaries with keys 'FID' and 'GIDs', or of (FID, GIDs) pairs
+        An example of this type of output is: getSubgraphGraphMapping in GSpan class
+        from subgraphMining/basic/gspan.py in PAMI
+        """
+        graphToSubgraphs = self._fragmentsByGraph(fidGidDictMap)
 
         for gid in graphToSubgraphs:
             graphToSubgraphs[gid] = sorted(set(graphToSubgraphs[gid]))
@@ -46,3 +81,54 @@ class Subgraphs2FlatTransactions:
         with open(oFile, 'w') as f:
             for _, fids in self.flatTransactions.items():
                 f.write(f"{' '.join(map(str, fids))}\n")
+
+    def addMapping(self, fid, gids):
+        """
+        Add the mapping of a fragment to the graph ids holding it, to be written by writeFlatTransactions.
+        Only the integer fragment id is kept, in the compact array of every graph
+        """
+        self._addFragment(self._fragments, fid, gids)
+
+    def addSubgraph(self, fid, subgraph):
+        """
+        Add a frequent subgraph as reported by the callback of GSpan in subgraphMining/basic/gspan.py in PAMI,
+        the subgraph itself not being kept
+        """
+        self.addMapping(fid, subgraph.setOfGraphsIds)
+
+    def writeFlatTransactions(self, oFile, sep=' '):
+        """
+        Write the flat transactions of the mappings added so far, one line of integer fragment ids per graph,
+        as saveFlatTransactions writes them. The array of a graph is released as soon as its line is written
+
+        sep separates the fragment ids of a transaction
+        Returns the number of transactions written
+        """
+        count = 0
+
+        with open(oFile, 'w') as f:
+            for gid in list(self._fragments):
+                fids = self._fragments.pop(gid)
+                f.write(sep.join(map(str, sorted(set(fids)))) + "\n")
+                count += 1
+
+        return count
+
+    def streamFlatTransactions(self, mappings, oFile, sep=' '):
+        """
+        Write the flat transactions of the mappings straight to a file, one line of integer fragment ids per graph,
+        as saveFlatTransactions writes them. Only the fragment ids of every graph are kept, in compact arrays, and
+        the array of a graph is released as soon as its line is written
+
+        mappings is an iterable of (FID, GIDs) pairs or of dictionaries with keys 'FID' and 'GIDs', such as
+        iterSubgraphGraphMapping in GSpan class from subgraphMining/basic/gspan.py in PAMI
+        sep separates the fragment ids of a transaction
+        Returns the number of transactions written
+        """
+        for mapping in mappings:
+            if isinstance(mapping, dict):
+                self.addMapping(mapping['FID'], mapping['GIDs'])
+            else:
+                self.addMapping(*mapping)
+
+        return self.writeFlatTransactions(oFile, sep)
@@ -1,5 +1,6 @@
 import networkx as nx
 import matplotlib.pyplot as plt
+from PAMI.extras.convert.Graphs2Binary import BinaryGraphDatabase
 
 class graphDatabase:
 
@@ -10,6 +11,12 @@ class graphDatabase:
         self.edges_per_graph = None
         self.nodes_per_graph = None
 
+        if BinaryGraphDatabase.isBinary(iFile):
+            # a binary file written by Graphs2Binary is memory-mapped instead of parsed
+            for _, vertices, edges in BinaryGraphDatabase(iFile).graphs():
+                self.graphs.append({'vertices': vertices, 'edges': [(v1, v2, label) for v1, v2, label, _ in edges]})
+            return
+
         with open(iFile, 'r') as file:
             for line in file:
                 if line.startswith('t #'):
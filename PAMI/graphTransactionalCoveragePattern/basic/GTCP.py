@@ -28,21 +28,35 @@
 
 
 
-from bitarray import bitarray
+import numpy as _np
 from PAMI.subgraphMining.basic import gspan as gsp
-from PAMI.extras.stats import graphDatabase as gdb
 from PAMI.graphTransactionalCoveragePattern.basic import abstract as _ab
 
+
+def _popcount(words):
+    """
+    Number of set bits in packed uint64 words, summed over the last axis
+
+    :param words: packed bitsets, one per row
+    :type words: numpy.ndarray
+    :return: number of set bits of every row
+    :rtype: numpy.ndarray or int
+    """
+    if hasattr(_np, 'bitwise_count'):
+        return _np.bitwise_count(words).sum(axis=-1, dtype=_np.int64)
+    return _np.unpackbits(_np.ascontiguousarray(words).view(_np.uint8), axis=-1).sum(axis=-1, dtype=_np.int64)
+
 class GTCP:
-    def __init__(self,iFile,minsup,minGTC,minGTPC,maxOR=0.2):
+    def __init__(self,iFile,minsup,minGTC,minGTPC,maxOR=0.2,csr=None):
         """
             iFile : input file
             minsup : Minimum support 
             minGTC : Minimum Graph transaction coverage
             minGTPC : Minimum graph pattern coverage 
             maxOR : Maximum overlap ratio
+            csr : mine the subgraphs on CSR arrays instead of vertex and edge objects, by default for a binary database only
             Sf : subgraphsBygraphID
-            Df: Flat transactional Dataset
+            Df: Flat transactional Dataset, one row of packed uint64 words per graph with a bit per fragment
         """
 
         self.Nol = None
@@ -59,10 +73,14 @@ class GTCP:
         self.maxOR=maxOR
         self.minGTC=minGTC 
         self.minGTPC=minGTPC
-        gdb_obj=gdb.graphDatabase(self.iFile)
-        self.numGraphs=len(gdb_obj.graphs)
-        gsp_obj = gsp.GSpan(self.iFile, minsup, outputSingleVertices=False, maxNumberOfEdges=float('inf'), outputGraphIds=True)
+        self._counts = None
+        self._prefixIndex = {}
+        self._prefixCoverage = None
+        self._prefixCounts = None
+        gsp_obj = gsp.GSpan(self.iFile, minsup, outputSingleVertices=False, maxNumberOfEdges=float('inf'), outputGraphIds=True, csr=csr)
         gsp_obj.mine()
+        # gSpan has already read the database, so its graph count saves parsing the file a second time
+        self.numGraphs=gsp_obj.graphCount
         self.Sf=gsp_obj.getSubgraphGraphMapping()
         self.GetFIDBasedFlatTransactions()
         print("Subgraph mining completed")
@@ -87,7 +105,7 @@ class GTCP:
             param
                 g : Graph id
         """
-        return self.Df[g].count()/len(self.Sf)
+        return int(self._counts[g])/len(self.Sf)
 
 
     def patternCoverage(self,pattern):
@@ -96,11 +114,7 @@ class GTCP:
             param
                 pattern: pattern for which pattern coverage needs to be computed
         """
-        Csets=list(map(lambda x:self.Df[x] ,pattern))
-        newset=bitarray(len(self.Sf))
-        for coverage in Csets:
-            newset=newset | coverage
-        return newset
+        return _np.bitwise_or.reduce(self.Df[list(pattern)], axis=0)
 
     def OverlapRatio(self,pattern):
         """
@@ -113,32 +127,33 @@ class GTCP:
         lastbut=pattern[:-1]
         lastbutcoverage=self.patternCoverage(lastbut)
         lastcoverage=self.Df[lastitem]
-        
-        intersection=lastcoverage & lastbutcoverage
-        cs= (lastcoverage | lastbutcoverage).count()/len(self.Sf)
-        return intersection.count() / self.Df[lastitem].count(), cs
+
+        intersection=int(_popcount(lastcoverage & lastbutcoverage))
+        cs= int(_popcount(lastcoverage | lastbutcoverage))/len(self.Sf)
+        return intersection / int(self._counts[lastitem]), cs
 
 
     def GetFIDBasedFlatTransactions(self):
         """
             Convert into FID based transactions
         """
-        self.Df={}
-        for i in range(self.numGraphs):
-            bitset = bitarray(len(self.Sf))
-            bitset.setall(0)
-            self.Df.update({i:bitset})
-
+        self.Df=_np.zeros((self.numGraphs, (len(self.Sf) + 63) >> 6), dtype=_np.uint64)
+        rows=[]
+        fids=[]
         for fragment in self.Sf:
-            for GID in fragment["GIDs"]:
-                self.Df[GID][fragment["FID"]]=1
+            rows.extend(fragment["GIDs"])
+            fids.extend([fragment["FID"]] * len(fragment["GIDs"]))
+        fids=_np.array(fids, dtype=_np.uint64)
+        _np.bitwise_or.at(self.Df, (_np.array(rows, dtype=_np.int64), (fids >> _np.uint64(6)).astype(_np.int64)),
+                          _np.left_shift(_np.uint64(1), fids & _np.uint64(63)))
+        self._counts=_popcount(self.Df)
 
     def getallFreq1(self):
         """
             Get all the Patterns of size 1
 
         """
-        freq=[(graph,self.Coverage(graph)) for graph in self.Df if self.Coverage(graph)>=self.minGTC]
+        freq=[(graph,self.Coverage(graph)) for graph in range(self.numGraphs) if self.Coverage(graph)>=self.minGTC]
 
         sorted_list = sorted(freq, key=lambda x: x[1], reverse=True)
         final_list=list(map(lambda x: [x[0]],sorted_list))
@@ -146,34 +161,67 @@ class GTCP:
 
     def join(self,l1,l2):
         """
-            Join two patterns
+            Join two patterns. The coverage of the patterns of l1 and l2 is kept in _prefixCoverage, so that extending
+            a pattern costs one OR and one popcount, done for all the patterns sharing its prefix at once. The
+            coverage of the patterns kept in Nol is recorded for the next level
             Param 
                 l1: Pattern 1
                 l2: Pattern 2
         """
-        #patterns=[]
-        #Nol=[]
-        #temp_l=[]
-        #newpattern=[]
+        fragments=len(self.Sf)
+        index, coverage, counts = self._prefixIndex, self._prefixCoverage, self._prefixCounts
+        newIndex={}
+        newCoverage=[]
         for i in range(len(l1)):
-            for j in range(i+1,len(l2)):
-                if l1[i][:-1]==l2[j][:-1]:
-                    if self.Coverage(l1[i][-1])>=self.Coverage(l2[j][-1]):
-                        newpattern= l1[i]+[l2[j][-1]]
-                    else:
-                        newpattern=l2[j]+[l1[i][-1]]
-                    
-                    ov,cs=self.OverlapRatio(newpattern)
-                    
-                    if ov<=self.maxOR:
-                        if cs>=self.minGTPC:
-                            self.L.append((newpattern,cs))
-                        else:
-                            self.Nol.append(newpattern)
+            end=i+1
+            while end<len(l2) and l1[i][:-1]==l2[end][:-1]:
+                end+=1
+            if end==i+1:
+                continue
+            group=l2[i+1:end]
+            first=index[tuple(l1[i])]
+            others=_np.array([index[tuple(pattern)] for pattern in group])
+            firstLast=l1[i][-1]
+            otherLast=_np.array([pattern[-1] for pattern in group])
+            # the pattern with the larger coverage of its last graph is the prefix of the new pattern
+            keepFirst=self._counts[firstLast]>=self._counts[otherLast]
+            union=_np.empty((len(group), coverage.shape[1]), dtype=_np.uint64)
+            union[keepFirst]=coverage[first] | self.Df[otherLast[keepFirst]]
+            union[~keepFirst]=coverage[others[~keepFirst]] | self.Df[firstLast]
+            unioncount=_popcount(union)
+            prefixcount=_np.where(keepFirst, counts[first], counts[others])
+            lastcount=_np.where(keepFirst, self._counts[otherLast], self._counts[firstLast])
+            ovs=(prefixcount + lastcount - unioncount) / lastcount
+            css=unioncount / fragments
+
+            for k in range(len(group)):
+                if keepFirst[k]:
+                    newpattern=l1[i]+[group[k][-1]]
                 else:
-                    break
-        # return (Nol,temp_l)    
-    
+                    newpattern=group[k]+[firstLast]
+                if ovs[k]<=self.maxOR:
+                    if css[k]>=self.minGTPC:
+                        self.L.append((newpattern,float(css[k])))
+                    else:
+                        self.Nol.append(newpattern)
+                        newIndex[tuple(newpattern)]=len(newCoverage)
+                        newCoverage.append((union[k], unioncount[k]))
+        self._setPrefixCoverage(newIndex, newCoverage)
+
+    def _setPrefixCoverage(self, index, coverage):
+        """
+            Keep the coverage of the patterns to be joined at the next level
+            Param
+                index: row of every pattern in the coverage
+                coverage: (packed coverage, number of covered fragments) of every pattern
+        """
+        self._prefixIndex=index
+        if coverage:
+            self._prefixCoverage=_np.array([row for row, count in coverage], dtype=_np.uint64)
+            self._prefixCounts=_np.array([count for row, count in coverage], dtype=_np.int64)
+        else:
+            self._prefixCoverage=_np.zeros((0, self.Df.shape[1]), dtype=_np.uint64)
+            self._prefixCounts=_np.zeros(0, dtype=_np.int64)
 
     def writePatterns(self):
         outf=self.iFile.split(".")[0]+"_results.txt"
@@ -192,12 +240,18 @@ class GTCP:
         self.Nol_1=self.getallFreq1()
         l=1
         self.L=[]
+        self.Nol_1_temp=[]
+        index={}
+        coverage=[]
 
         for g in self.Nol_1:
             if self.Coverage(g[0])>=self.minGTPC:
                 self.L.append((g,self.Coverage(g[0])))
             else:
                 self.Nol_1_temp.append(g)
+                index[tuple(g)]=len(coverage)
+                coverage.append((self.Df[g[0]], self._counts[g[0]]))
+        self._setPrefixCoverage(index, coverage)
         l+=1
         self.Nol_1=self.Nol_1_temp
         self.Nol=[]
@@ -57,282 +57,10 @@ Copyright (C)  2021 Rage Uday Kiran
 from PAMI.highUtilityFrequentPattern.basic import abstract as _ab
 from typing import List, Dict, Union
 from deprecated import deprecated
+from PAMI.highUtilityPattern.basic._EFIMCore import _EFIMCore, _PruningPredicate, _MinSupport
 
 
-class _Transaction:
-    """
-    A class to store Transaction of a database
-
-    :Attributes:
-
-        items: list
-            A list of items in transaction 
-        utilities: list
-            A list of utilities of items in transaction
-        transactionUtility: int
-            represent total sum of all utilities in the database
-        prefixUtility:
-            prefix Utility values of item
-        offset:
-            an offset pointer, used by projected transactions
-        support:
-            maintains the support of the transaction
-
-    :Methods:
-
-        projectedTransaction(offsetE)
-            A method to create new Transaction from existing starting from offsetE until the end
-        getItems()
-            return items in transaction
-        getUtilities()
-            return utilities in transaction
-        getLastPosition()
-            return last position in a transaction
-        removeUnpromisingItems()
-            A method to remove items which are having low values when compared with minUtil
-        insertionSort()
-            A method to sort all items in the transaction
-        getSupport()
-            returns the support of the transaction
-    """
-    offset = 0
-    prefixUtility = 0
-    support = 1
-
-    def __init__(self, items: List[int], utilities: List[int], transactionUtility: int) -> None:
-        self.items = items
-        self.utilities = utilities
-        self.transactionUtility = transactionUtility
-        self.support = 1
-
-
-    def projectTransaction(self, offsetE: int) -> '_Transaction':
-        """
-        A method to create new Transaction from existing transaction starting from offsetE until the end
-
-        :param offsetE: an offset over the original transaction for projecting the transaction
-        :type offsetE: int
-        :return: a new transaction starting from offsetE until the end of the transaction
-        :rtype: _Transaction
-        """
-        new_transaction = _Transaction(self.items, self.utilities, self.transactionUtility)
-        utilityE = self.utilities[offsetE]
-        new_transaction.prefixUtility = self.prefixUtility + utilityE
-        new_transaction.transactionUtility = self.transactionUtility - utilityE
-        new_transaction.support = self.support
-        for i in range(self.offset, offsetE):
-            new_transaction.transactionUtility -= self.utilities[i]
-        new_transaction.offset = offsetE + 1
-        return new_transaction
-
-    def getItems(self) -> List[int]:
-        """
-        A method to return items in transaction
-
-        :return: the list of items in transaction starting from offsetE until the end of the transactions
-        :rtype: list
-        """
-        return self.items
-
-    def getUtilities(self) -> List[int]:
-        """
-        A method to return utilities in transaction
-
-        :return: the list of utilities in transaction starting from offsetE until the end of the transaction
-        :rtype: list
-        """
-        return self.utilities
-
-    def getLastPosition(self) -> int:
-        """
-        A method to return last position in a transaction
-        :return: the last position in a transaction
-        :rtype: int
-        """
-
-        return len(self.items) - 1
-
-    def getSupport(self) -> int:
-        """
-        A method to return support in a transaction
-
-        :return: the support in a transaction
-        :rtype: int
-        """
-
-        return self.support
-
-    def removeUnpromisingItems(self, oldNamesToNewNames: Dict[int, int]) -> None:
-        """
-        A method to remove items which are not present in the map passed to the function
-
-        :param oldNamesToNewNames: A map represent old names to new names
-        :type oldNamesToNewNames: map
-        :return: None
-        """
-        tempItems = []
-        tempUtilities = []
-        for idx, item in enumerate(self.items):
-            if item in oldNamesToNewNames:
-                tempItems.append(oldNamesToNewNames[item])
-                tempUtilities.append(self.utilities[idx])
-            else:
-                self.transactionUtility -= self.utilities[idx]
-        self.items = tempItems
-        self.utilities = tempUtilities
-        self.insertionSort()
-
-    def insertionSort(self) -> None:
-        """
-        A method to sort items in order
-
-        :return: None
-        """
-        for i in range(1, len(self.items)):
-            key = self.items[i]
-            utilityJ = self.utilities[i]
-            j = i - 1
-            while j >= 0 and key < self.items[j]:
-                self.items[j + 1] = self.items[j]
-                self.utilities[j + 1] = self.utilities[j]
-                j -= 1
-            self.items[j + 1] = key
-            self.utilities[j + 1] = utilityJ
-        
-
-class _Dataset:
-    """
-    A class represent the list of transactions in this dataset
-
-    :Attributes:
-
-        transactions :
-            the list of transactions in this dataset
-        maxItem:
-            the largest item name
-        
-    :methods:
-
-        createTransaction(line)
-            Create a transaction object from a line from the input file
-        getMaxItem()
-            return Maximum Item
-        getTransactions()
-            return transactions in database
-
-    """
-    transactions = []
-    maxItem = 0
-    
-    def __init__(self, datasetPath: Union[str, _ab._pd.DataFrame], sep: str) -> None:
-        self.strToInt = {}
-        self.intToStr = {}
-        self.cnt = 1
-        self.sep = sep
-        self.createItemSets(datasetPath)
-        #self.Database = []
-
-    def createItemSets(self, datasetPath: List[str]) -> None:
-        """
-        Storing the complete transactions of the database/input file in a database variable
-
-        :param datasetPath: list of paths to the input file to store
-        :type datasetPath: list
-        :return: None
-
-        """
-        self.Database = []
-        self.transactions = []
-        if isinstance(datasetPath, _ab._pd.DataFrame):
-            utilities, data, utilitySum = [], [], []
-            if datasetPath.empty:
-                print("its empty..")
-            i = datasetPath.columns.values.tolist()
-            if 'Transactions' in i:
-                data = datasetPath['Transactions'].tolist()
-            if 'Utilities' in i:
-                utilities = datasetPath['Utilities'].tolist()
-            if 'UtilitySum' in i:
-                utilitySum = datasetPath['UtilitySum'].tolist()
-            for k in range(len(data)):
-                self.transactions.append(self.createTransaction(data[k], utilities[k], utilitySum[k]))
-        if isinstance(datasetPath, str):
-            if _ab._validators.url(datasetPath):
-                data = _ab._urlopen(datasetPath)
-                for line in data:
-                    line = line.decode("utf-8")
-                    trans_list = line.strip().split(':')
-                    transactionUtility = int(trans_list[1])
-                    itemsString = trans_list[0].strip().split(self.sep)
-                    itemsString = [x for x in itemsString if x]
-                    utilityString = trans_list[2].strip().split(self.sep)
-                    utilityString = [x for x in utilityString if x]
-                    self.transactions.append(self.createTransaction(itemsString, utilityString, transactionUtility))
-            else:
-                try:
-                    with open(datasetPath, 'r', encoding='utf-8') as f:
-                        for line in f:
-                            trans_list = line.strip().split(':')
-                            transactionUtility = int(trans_list[1])
-                            itemsString = trans_list[0].strip().split(self.sep)
-                            itemsString = [x for x in itemsString if x]
-                            utilityString = trans_list[2].strip().split(self.sep)
-                            utilityString = [x for x in utilityString if x]
-                            self.transactions.append(self.createTransaction(itemsString, utilityString, transactionUtility))
-                except IOError:
-                    print("File Not Found")
-                    quit()
-
-    def createTransaction(self, items: List[str], utilities: List[str], utilitySum: int) -> _Transaction:
-        """
-        A method to create Transaction from dataset given
-
-        :param items: represent a single line of database
-        :type items: list
-        :param utilities: represent the utilities of items
-        :type utilities: list
-        :param utilitySum: represent  the utilitySum
-        :type utilitySum: int
-        :return: a Transaction from given dataset
-        :rtype: _Transaction
-        """
-        transactionUtility = utilitySum
-        itemsString = items
-        utilityString = utilities
-        items = []
-        utilities = []
-        for idx, item in enumerate(itemsString):
-            if self.strToInt.get(item) is None:
-                self.strToInt[item] = self.cnt
-                self.intToStr[self.cnt] = item
-                self.cnt += 1
-            item_int = self.strToInt.get(item)
-            if item_int > self.maxItem:
-                self.maxItem = item_int
-            items.append(item_int)
-            utilities.append(int(utilityString[idx]))
-        return _Transaction(items, utilities, transactionUtility)
-
-    def getMaxItem(self) -> int:
-        """
-        A method to return name of the largest item
-
-        :return: the name of the largest item in the dataset
-        :rtype: int
-        """
-        return self.maxItem
-
-    def getTransactions(self) -> List[_Transaction]:
-        """
-        A method to return transactions from database
-
-        :return: the list of transactions from database which have the highest utility
-        :rtype: list
-        """
-        return self.transactions
-
-
-class HUFIM(_ab._utilityPatterns):
+class HUFIM(_ab._utilityPatterns, _EFIMCore):
     """
     :Description:  HUFIM (High Utility Frequent Itemset Miner) algorithm helps us to mine High Utility Frequent ItemSets (HUFIs) from transactional databases.
 
@@ -417,22 +145,11 @@ class HUFIM(_ab._utilityPatterns):
                 Total amount of RSS memory consumed by the mining process will be retrieved from this function
         getRuntime()
                Total amount of runtime taken by the mining process will be retrieved from this function
-        backTrackingHUFIM(transactionsOfP, itemsToKeep, itemsToExplore, prefixLength)
-               A method to mine the RHUIs Recursively
-        useUtilityBinArraysToCalculateUpperBounds(transactionsPe, j, itemsToKeep)
-               A method to calculate the sub-tree utility and local utility of all items that can extend itemSet P and e
-        output(tempPosition, utility)
-               A method to output a relative-high-utility itemSet to file or memory depending on what the user chose
-        isEqual(transaction1, transaction2)
-               A method to Check if two transaction are identical
-        useUtilityBinArrayToCalculateSubtreeUtilityFirstTime(dataset)
-              A method to calculate the sub tree utility values for single items
-        sortDatabase(self, transactions)
-              A Method to sort transaction
-        sortTransaction(self, trans1, trans2)
-              A Method to sort transaction
-        useUtilityBinArrayToCalculateLocalUtilityFirstTime(self, dataset)
-             A method to calculate local utility values for single itemSets
+        The search itself runs on the shared EFIM core of highUtilityPattern/basic/_EFIMCore.py with a minimum support predicate
+        orderItems(items)
+              Items are processed in decreasing order of their utilities
+        primaryItems(itemsToKeep)
+              Items whose suffix utility reaches minUtil can start a pattern
 
     **Executing the code on terminal**
     --------------------------------------------
@@ -527,11 +244,11 @@ class HUFIM(_ab._utilityPatterns):
         if type(value) is int:
             value = int(value)
         if type(value) is float:
-            value = (len(self._dataset.getTransactions()) * value)
+            value = (self._dataset.getTransactionCount() * value)
         if type(value) is str:
             if '.' in value:
                 value = float(value)
-                value = (len(self._dataset.getTransactions()) * value)
+                value = (self._dataset.getTransactionCount() * value)
             else:
                 value = int(value)
         return value
@@ -552,51 +269,7 @@ class HUFIM(_ab._utilityPatterns):
         :return: None
         """
         self._startTime = _ab._time.time()
-        self._finalPatterns = {}
-
-        self._dataset = _Dataset(self._iFile, self._sep)
-        self._singleItemSetsSupport = _ab._defaultdict(int)
-        self._singleItemSetsUtility = _ab._defaultdict(int)
-        self._useUtilityBinArrayToCalculateLocalUtilityFirstTime(self._dataset)
-        self._minUtil = int(self._minUtil)
-        self._minSup = self._convert(self._minSup)
-        itemsToKeep = []
-        for key in self._utilityBinArrayLU.keys():
-            if self._utilityBinArrayLU[key] >= self._minUtil and self._singleItemSetsSupport[key] >= self._minSup:
-                itemsToKeep.append(key)
-        itemsToKeep = sorted(itemsToKeep, key=lambda x: self._singleItemSetsUtility[x], reverse=True)
-        currentName = 1
-        for idx, item in enumerate(itemsToKeep):
-            self._oldNamesToNewNames[item] = currentName
-            self._newNamesToOldNames[currentName] = item
-            itemsToKeep[idx] = currentName
-            currentName += 1
-        for transaction in self._dataset.getTransactions():
-            transaction.removeUnpromisingItems(self._oldNamesToNewNames)
-        self._sortDatabase(self._dataset.getTransactions())
-        emptyTransactionCount = 0
-        for transaction in self._dataset.getTransactions():
-            if len(transaction.getItems()) == 0:
-                emptyTransactionCount += 1
-        self._dataset.transactions = self._dataset.transactions[emptyTransactionCount:]
-        # calculating suffix utility values
-        totalUtility = 0
-        for item in itemsToKeep:
-            totalUtility += self._singleItemSetsUtility[self._newNamesToOldNames[item]]
-        # piItems
-        piItems = []
-        for item in itemsToKeep:
-            if totalUtility >= self._minUtil:
-                piItems.append(item)
-                totalUtility -= self._singleItemSetsUtility[self._newNamesToOldNames[item]]
-            else:
-                break
-        self._useUtilityBinArrayToCalculateSubtreeUtilityFirstTime(self._dataset)
-        itemsToExplore = []
-        for item in piItems:
-            if self._utilityBinArraySU[item] >= self._minUtil:
-                itemsToExplore.append(item)
-        self._backTrackingHUFIM(self._dataset.getTransactions(), itemsToKeep, itemsToExplore, 0)
+        self._mineEFIM()
         self._endTime = _ab._time.time()
         process = _ab._psutil.Process(_ab._os.getpid())
         self._memoryUSS = float()
@@ -605,265 +278,59 @@ class HUFIM(_ab._utilityPatterns):
         self._memoryRSS = process.memory_info().rss
         print("High Utility Frequent patterns were generated successfully using HUFIM algorithm")
 
-    def _backTrackingHUFIM(self, transactionsOfP: List[_Transaction], itemsToKeep: List[int], itemsToExplore: List[int], prefixLength: int) -> None:
+    def _pruningPredicates(self) -> List[_PruningPredicate]:
         """
-        A method to mine the HUFIs Recursively
+        Patterns are constrained by minSup on top of minUtil
 
-        :param transactionsOfP: the list of transactions containing the current prefix P
-        :type transactionsOfP: list
-        :param itemsToKeep: the list of secondary items in the p-projected database
-        :type itemsToKeep: list
-        :param itemsToExplore: the list of primary items in the p-projected database
-        :type itemsToExplore: list
-        :param prefixLength: current prefixLength
-        :type prefixLength: int
-        :return: None
-        """
-        # print("###############")
-        # print("P is", [self.dataset.intToStr.get(x) for x in self.temp[:prefixLength]])
-        # print("items to explore", [self.dataset.intToStr.get(x) for x in [self.newNamesToOldNames[y] for y  in itemsToExplore]])
-        # print("items to keep", [self.dataset.intToStr.get(x) for x in [self.newNamesToOldNames[y] for y in itemsToKeep]])
-        # print("--------------")
-        self._candidateCount += len(itemsToExplore)
-        for idx, e in enumerate(itemsToExplore):
-            # print("exploring item", self.dataset.intToStr.get(self.newNamesToOldNames[e]))
-            transactionsPe = []
-            utilityPe = 0
-            supportPe = 0
-            previousTransaction = []
-            consecutiveMergeCount = 0
-            for transaction in transactionsOfP:
-                items = transaction.getItems()
-                if e in items:
-                    positionE = items.index(e)
-                    if transaction.getLastPosition() == positionE:
-                        utilityPe += transaction.getUtilities()[positionE] + transaction.prefixUtility
-                        supportPe += transaction.getSupport()
-                    else:
-                        projectedTransaction = transaction.projectTransaction(positionE)
-                        utilityPe += projectedTransaction.prefixUtility
-                        if previousTransaction == []:
-                            previousTransaction = projectedTransaction
-                        elif self._isEqual(projectedTransaction, previousTransaction):
-                            if consecutiveMergeCount == 0:
-                                items = previousTransaction.items[previousTransaction.offset:]
-                                utilities = previousTransaction.utilities[previousTransaction.offset:]
-                                support = previousTransaction.getSupport()
-                                itemsCount = len(items)
-                                positionPrevious = 0
-                                positionProjection = projectedTransaction.offset
-                                while positionPrevious < itemsCount:
-                                    utilities[positionPrevious] += projectedTransaction.utilities[positionProjection]
-                                    positionPrevious += 1
-                                    positionProjection += 1
-                                previousTransaction.prefixUtility += projectedTransaction.prefixUtility
-                                sumUtilities = previousTransaction.prefixUtility
-                                previousTransaction = _Transaction(items, utilities, previousTransaction.transactionUtility + projectedTransaction.transactionUtility)
-                                previousTransaction.prefixUtility = sumUtilities
-                                previousTransaction.support = support
-                                previousTransaction.support += projectedTransaction.getSupport()
-                            else:
-                                positionPrevious = 0
-                                positionProjected = projectedTransaction.offset
-                                itemsCount = len(previousTransaction.items)
-                                while positionPrevious < itemsCount:
-                                    previousTransaction.utilities[positionPrevious] += projectedTransaction.utilities[
-                                        positionProjected]
-                                    positionPrevious += 1
-                                    positionProjected += 1
-                                previousTransaction.transactionUtility += projectedTransaction.transactionUtility
-                                previousTransaction.prefixUtility += projectedTransaction.prefixUtility
-                                previousTransaction.support += projectedTransaction.getSupport()
-                            consecutiveMergeCount += 1
-                        else:
-                            transactionsPe.append(previousTransaction)
-                            supportPe += previousTransaction.getSupport()
-                            previousTransaction = projectedTransaction
-                            consecutiveMergeCount = 0
-                    transaction.offset = positionE
-            if previousTransaction != []:
-                transactionsPe.append(previousTransaction)
-                supportPe += previousTransaction.getSupport()
-            # print("support is", supportPe)
-            self._temp[prefixLength] = self._newNamesToOldNames[e]
-            if (utilityPe >= self._minUtil) and (supportPe >= self._minSup):
-                self._output(prefixLength, utilityPe, supportPe)
-            if supportPe >= self._minSup:
-                self._useUtilityBinArraysToCalculateUpperBounds(transactionsPe, idx, itemsToKeep)
-                newItemsToKeep = []
-                newItemsToExplore = []
-                for l in range(idx + 1, len(itemsToKeep)):
-                    itemK = itemsToKeep[l]
-                    if self._utilityBinArraySU[itemK] >= self._minUtil:
-                        newItemsToExplore.append(itemK)
-                        newItemsToKeep.append(itemK)
-                    elif self._utilityBinArrayLU[itemK] >= self._minUtil:
-                        newItemsToKeep.append(itemK)
-                if len(transactionsPe) != 0:
-                    self._backTrackingHUFIM(transactionsPe, newItemsToKeep, newItemsToExplore, prefixLength + 1)
-
-    def _useUtilityBinArraysToCalculateUpperBounds(self, transactionsPe: List[_Transaction], j: int, itemsToKeep: List[int]) -> None:
+        :return: the pruning predicates
+        :rtype: list
         """
-        A method to  calculate the subtree utility and local utility of all items that can extend itemSet P U {e}
-
-        :Attributes:
+        self._minSup = self._convert(self._minSup)
+        return [_MinSupport(self._minSup)]
 
-        :param transactionsPe: transactions the projected database for P U {e}
-        :type transactionsPe: list or Dataset
-        :param j:the position of j in the list of promising items
-        :type j:int
-        :param itemsToKeep :the list of promising items
-        :type itemsToKeep: list or Dataset
-        :return: None
+    def _orderItems(self, items: List[int]) -> List[int]:
         """
-        for i in range(j + 1, len(itemsToKeep)):
-            item = itemsToKeep[i]
-            self._utilityBinArrayLU[item] = 0
-            self._utilityBinArraySU[item] = 0
-        for transaction in transactionsPe:
-            sumRemainingUtility = 0
-            i = len(transaction.getItems()) - 1
-            while i >= transaction.offset:
-                item = transaction.getItems()[i]
-                if item in itemsToKeep:
-                    sumRemainingUtility += transaction.getUtilities()[i]
-                    self._utilityBinArraySU[item] += sumRemainingUtility + transaction.prefixUtility
-                    self._utilityBinArrayLU[item] += transaction.transactionUtility + transaction.prefixUtility
-                i -= 1
-
-    def _output(self, tempPosition: int, utility: int, support: int):
-        """
-        Method to print itemSets
-
-        :Attributes:
+        Sort the promising items in decreasing order of their utilities
 
-        :param tempPosition: position of last item
-        :type tempPosition : int
-        :param utility: total utility of itemSet
-        :type utility: int
-        :param support: support of an itemSet
-        :type support: int
-        """
-        self._patternCount += 1
-        s1 = str()
-        for i in range(0, tempPosition+1):
-            s1 += self._dataset.intToStr.get((self._temp[i]))
-            if i != tempPosition:
-                s1 += "\t"
-        self._finalPatterns[s1] = [utility, support]
-
-    def _isEqual(self, transaction1: _Transaction, transaction2: _Transaction) -> bool:
-        """
-        A method to Check if two transaction are identical
-
-        :param  transaction1: the first transaction
-        :type  transaction1: Trans
-        :param  transaction2: the second transaction
-        :type  transaction2: Trans
-        :return : whether both are identical or not
-        :rtype: bool
-        """
-        length1 = len(transaction1.items) - transaction1.offset
-        length2 = len(transaction2.items) - transaction2.offset
-        if length1 != length2:
-            return False
-        position1 = transaction1.offset
-        position2 = transaction2.offset
-        while position1 < len(transaction1.items):
-            if transaction1.items[position1] != transaction2.items[position2]:
-                return False
-            position1 += 1
-            position2 += 1
-        return True
-
-    def _useUtilityBinArrayToCalculateSubtreeUtilityFirstTime(self, dataset: _Dataset) -> None:
+        :param items: promising items
+        :type items: list
+        :return: sorted items
+        :rtype: list
         """
-        Scan the initial database to calculate the subtree utility of each item using a utility-bin array
+        return sorted(items, key=lambda x: self._singleItemSetsUtility[x], reverse=True)
 
-        :param dataset: the transaction database
-        :type dataset: Dataset
-        :return : None
-        """
-        for transaction in dataset.getTransactions():
-            sumSU = 0
-            i = len(transaction.getItems()) - 1
-            while i >= 0:
-                item = transaction.getItems()[i]
-                currentUtility = transaction.getUtilities()[i]
-                sumSU += currentUtility
-                if item in self._utilityBinArraySU.keys():
-                    self._utilityBinArraySU[item] += sumSU
-                else:
-                    self._utilityBinArraySU[item] = sumSU
-                i -= 1
-
-    def _sortDatabase(self, transactions: List[_Transaction]) -> None:
+    def _primaryItems(self, itemsToKeep: List[int]) -> List[int]:
         """
-        A Method to sort transaction
+        Only the items whose utility, summed with the utilities of the items following them, reaches minUtil can start a pattern
 
-        :param transactions: transactions of items
-        :type transactions: list
-        :return: None
+        :param itemsToKeep: promising items
+        :type itemsToKeep: list
+        :return: the primary items
+        :rtype: list
         """
-        compareItems = _ab._functools.cmp_to_key(self._sortTransaction)
-        transactions.sort(key=compareItems)
+        totalUtility = sum(self._itemUtilities[item] for item in itemsToKeep)
+        piItems = []
+        for item in itemsToKeep:
+            if totalUtility < self._minUtil:
+                break
+            piItems.append(item)
+            totalUtility -= self._itemUtilities[item]
+        return super()._primaryItems(piItems)
 
-    def _sortTransaction(self, trans1: _Transaction, trans2: _Transaction) -> int:
-        """
-        A Method to sort transaction
-
-        :param trans1: the first transaction
-        :type trans1: Trans
-        :param trans2:the second transaction
-        :type trans2: Trans
-        :return: sorted transaction
-        :rtype: int
-        """
-        transItemsX = trans1.getItems()
-        transItemsY = trans2.getItems()
-        pos1 = len(transItemsX) - 1
-        pos2 = len(transItemsY) - 1
-        if len(transItemsX) < len(transItemsY):
-            while pos1 >= 0:
-                sub = transItemsY[pos2] - transItemsX[pos1]
-                if sub != 0:
-                    return sub
-                pos1 -= 1
-                pos2 -= 1
-            return -1
-        elif len(transItemsX) > len(transItemsY):
-            while pos2 >= 0:
-                sub = transItemsY[pos2] - transItemsX[pos1]
-                if sub != 0:
-                    return sub
-                pos1 -= 1
-                pos2 -= 1
-            return 1
-        else:
-            while pos2 >= 0:
-                sub = transItemsY[pos2] - transItemsX[pos1]
-                if sub != 0:
-                    return sub
-                pos1 -= 1
-                pos2 -= 1
-            return 0
-
-    def _useUtilityBinArrayToCalculateLocalUtilityFirstTime(self, dataset: _Dataset) -> None:
+    def _patternValue(self, utility: int, support: int, utilitySum: int) -> List[int]:
         """
-        A method to calculate local utility of single itemSets
+        Value stored for a high utility frequent itemSet in the final patterns
 
-        :param dataset: the transaction database
-        :type dataset: databases
-        :return: None
+        :param utility: total utility of itemSet
+        :type utility: int
+        :param support: support of itemSet
+        :type support: int
+        :param utilitySum: summed utilities of the items of the itemSet
+        :type utilitySum: int
+        :return: utility and support of the itemSet
+        :rtype: list
         """
-        for transaction in dataset.getTransactions():
-            for idx, item in enumerate(transaction.getItems()):
-                self._singleItemSetsSupport[item] += 1
-                self._singleItemSetsUtility[item] += transaction.getUtilities()[idx]
-                if item in self._utilityBinArrayLU:
-                    self._utilityBinArrayLU[item] += transaction.transactionUtility
-                else:
-                    self._utilityBinArrayLU[item] = transaction.transactionUtility
+        return [utility, support]
 
     def getPatternsAsDataFrame(self) -> _ab._pd.DataFrame:
         """
@@ -56,35 +56,10 @@ from PAMI.highUtilityPattern.basic import abstract as _ab
 from deprecated import deprecated
 
 
-class _Element:
-    """
-    A class represents an Element of a utility list.
-
-    :Attributes :
-
-        ts : int
-            keep tact of transaction id
-        nu : int
-            non-closed itemSet utility
-        nru : int
-             non-closed remaining utility
-        pu : int
-            prefix utility
-        ppos: int
-            position of previous item in the list
-    """
-
-    def __init__(self, tid, nu, nru, pu, ppos):
-        self.tid = tid
-        self.nu = nu
-        self.nru = nru
-        self.pu = pu
-        self.ppos = ppos
-
-
 class _CUList:
     """
-    A class represents a UtilityList
+    A class represents a UtilityList. The elements are stored as parallel integer arrays (structure of arrays)
+    instead of one object per element, the i-th element being (tid[i], nu[i], nru[i], pu[i], ppos[i]).
 
     :Attributes :
 
@@ -100,12 +75,23 @@ class _CUList:
             the sum of closed remaining utilities
         sumCpu: long
             the sum of closed prefix utilities
-        elements: list
-            the list of elements 
+        tid: numpy.ndarray
+            transaction ids of the elements in increasing order
+        nu: numpy.ndarray
+            non-closed itemSet utilities of the elements
+        nru: numpy.ndarray
+            non-closed remaining utilities of the elements
+        pu: numpy.ndarray
+            prefix utilities of the elements
+        ppos: numpy.ndarray
+            positions of the elements in the list of the previous item
+
     :Methods :
 
-        addElement(element)
+        addElement(tid, nu, nru, pu, ppos)
             Method to add an element to this utility list and update the sums at the same time.
+        freeze()
+            Method to convert the element buffers into numpy arrays once the list is built
     """
 
     def __init__(self, item):
@@ -115,17 +101,47 @@ class _CUList:
         self.sumCu = 0
         self.sumCru = 0
         self.sumCpu = 0
-        self.elements = []
+        self.tid = _ab.array('q')
+        self.nu = _ab.array('q')
+        self.nru = _ab.array('q')
+        self.pu = _ab.array('q')
+        self.ppos = _ab.array('q')
 
-    def addElements(self, element):
+    def __len__(self):
+        return len(self.tid)
+
+    def addElement(self, tid, nu, nru, pu, ppos):
         """
         A method to add new element to CUList
-        :param element: element to be added to CUList
-        :type element: Element
+
+        :param tid: transaction id of the element
+        :type tid: int
+        :param nu: non-closed itemSet utility
+        :type nu: int
+        :param nru: non-closed remaining utility
+        :type nru: int
+        :param pu: prefix utility
+        :type pu: int
+        :param ppos: position of the element in the list of the previous item
+        :type ppos: int
         """
-        self.sumnu += element.nu
-        self.sumnru += element.nru
-        self.elements.append(element)
+        self.sumnu += nu
+        self.sumnru += nru
+        self.tid.append(tid)
+        self.nu.append(nu)
+        self.nru.append(nru)
+        self.pu.append(pu)
+        self.ppos.append(ppos)
+
+    def freeze(self):
+        """
+        A method to convert the element buffers into numpy arrays without copying them
+        """
+        self.tid = _ab._np.frombuffer(self.tid, dtype=_ab._np.int64)
+        self.nu = _ab._np.frombuffer(self.nu, dtype=_ab._np.int64)
+        self.nru = _ab._np.frombuffer(self.nru, dtype=_ab._np.int64)
+        self.pu = _ab._np.frombuffer(self.pu, dtype=_ab._np.int64)
+        self.ppos = _ab._np.frombuffer(self.ppos, dtype=_ab._np.int64)
 
 
 class _Pair:
@@ -181,6 +197,8 @@ class HMiner(_ab._utilityPatterns):
             huis created
         neighbors: map
             keep track of nighboues of elements
+        blockSize: int
+            maximum number of (element, candidate) cells joined at once by construcCUL
 
     :Methods:
 
@@ -200,13 +218,9 @@ class HMiner(_ab._utilityPatterns):
             Total amount of runtime taken by the mining process will be retrieved from this function
         Explore_SearchTree(prefix, uList, minUtil)
             A method to find all high utility itemSets
-        UpdateCLosed(x, culs, st, excul, newT, ex, ey_ts, length)
-            A method to update closed values
         saveitemSet(prefix, prefixLen, item, utility)
             A method to save itemSets
-        updateElement(z, culs, st, excul, newT, ex, duppos, ey_ts)
-            A method to updates vales for duplicates
-        construcCUL(x, culs, st, minUtil, length, exnighbors)
+        construcCUL(x, culs, st, minUtil, length)
             A method to construct CUL's database
 
     **Executing the code on terminal:**
@@ -274,6 +288,7 @@ class HMiner(_ab._utilityPatterns):
     _sep = "\t"
     _memoryUSS = float()
     _memoryRSS = float()
+    _blockSize = 1 << 20
 
     def __init__(self, iFile1, minUtil, sep="\t"):
         super().__init__(iFile1, minUtil, sep)
@@ -406,28 +421,27 @@ class HMiner(_ab._utilityPatterns):
             tx_key1 = tuple(tx_key)
             if len(revisedTrans) > 0:
                 if tx_key1 not in hashTable.keys():
-                    hashTable[tx_key1] = len(mapItemsToCUList[revisedTrans[len(revisedTrans) - 1].item].elements)
+                    hashTable[tx_key1] = len(mapItemsToCUList[revisedTrans[len(revisedTrans) - 1].item])
                     for i in range(len(revisedTrans) - 1, -1, -1):
                         pair = revisedTrans[i]
                         cuListoFItems = mapItemsToCUList.get(pair.item)
-                        element = _Element(tid, pair.utility, ru, 0, 0)
                         if i > 0:
-                            element.ppos = len(mapItemsToCUList[revisedTrans[i - 1].item].elements)
+                            ppos = len(mapItemsToCUList[revisedTrans[i - 1].item])
                         else:
-                            element.ppos = - 1
-                        cuListoFItems.addElements(element)
+                            ppos = - 1
+                        cuListoFItems.addElement(tid, pair.utility, ru, 0, ppos)
                         ru += pair.utility
                 else:
                     pos = hashTable[tx_key1]
                     ru = 0
                     for i in range(len(revisedTrans) - 1, -1, -1):
                         cuListoFItems = mapItemsToCUList[revisedTrans[i].item]
-                        cuListoFItems.elements[pos].nu += revisedTrans[i].utility
-                        cuListoFItems.elements[pos].nru += ru
+                        cuListoFItems.nu[pos] += revisedTrans[i].utility
+                        cuListoFItems.nru[pos] += ru
                         cuListoFItems.sumnu += revisedTrans[i].utility
                         cuListoFItems.sumnru += ru
                         ru += revisedTrans[i].utility
-                        pos = cuListoFItems.elements[pos].ppos
+                        pos = cuListoFItems.ppos[pos]
                     # EUCS
             for i in range(len(revisedTrans) - 1, -1, -1):
                 pair = revisedTrans[i]
@@ -443,6 +457,8 @@ class HMiner(_ab._utilityPatterns):
                     else:
                         mapFMAPItem[pairAfter.item] = twuSUm + newTwu
             tid += 1
+        for uList in listOfCUList:
+            uList.freeze()
         self._ExploreSearchTree([], listOfCUList, minutil)
         self._endTime = _ab._time.time()
         process = _ab._psutil.Process(_ab._os.getpid())
@@ -476,7 +492,14 @@ class HMiner(_ab._utilityPatterns):
 
     def _construcCUL(self, x, culs, st, minutil, length):
         """
-        A method to construct CUL's database
+        A method to construct CUL's database.
+
+        The elements of x are joined with every candidate list at once: the common transactions are found by a
+        binary search of x.tid in the sorted tids of each candidate, and the utilities of a block of elements are
+        computed as (elements x candidates) matrices. Elements whose projected transaction covers every remaining
+        candidate are merged into the closed utilities, and elements with the same projected transaction are merged
+        into a single element of each candidate list, as in the element by element join of HMiner.
+
         :parm x: Compact utility list
         :type x: Node
         :parm culs:list of Compact utility list
@@ -490,148 +513,124 @@ class HMiner(_ab._utilityPatterns):
         :return: projectd database of list X
         :rtype: list
         """
-        excul = []
-        lau = []
-        cutil = []
-        ey_tid = []
-        for i in range(0, len(culs)):
-            uList = _CUList(culs[i].item)
-            excul.append(uList)
-            lau.append(0)
-            cutil.append(0)
-            ey_tid.append(0)
-        sz = len(culs) - (st + 1)
-        exSZ = sz
+        _np = _ab._np
+        mapOfTWUF = self._mapFMAP[x.item]
+        columns = []
         for j in range(st + 1, len(culs)):
-            mapOfTWUF = self._mapFMAP[x.item]
-            if mapOfTWUF is not None:
-                twuf = mapOfTWUF.get(culs[j].item)
-                if twuf is not None and twuf < minutil:
-                    excul[j] = None
-                    exSZ = sz - 1
-                else:
-                    uList = _CUList(culs[j].item)
-                    excul[j] = uList
-                    ey_tid[j] = 0
-                    lau[j] = x.sumCu + x.sumCru + x.sumnu + x.sumnru
-                    cutil[j] = x.sumCu + x.sumCru
+            twuf = mapOfTWUF.get(culs[j].item)
+            if twuf is None or twuf >= minutil:
+                columns.append(j)
+        cutil = x.sumCu + x.sumCru + int(x.nu.sum()) + int(x.nru.sum())
+        if len(columns) == 0 or cutil < minutil:
+            return []
+        m = len(columns)
+        alive = _np.ones(m, dtype=bool)
+        lau = _np.full(m, x.sumCu + x.sumCru + x.sumnu + x.sumnru, dtype=_np.int64)
+        lengths = _np.zeros(m, dtype=_np.int64)
+        sums = _np.zeros((5, m), dtype=_np.int64)
+        created = []
+        updates = []
         hashTable = {}
-        for ex in x.elements:
-            newT = []
-            for j in range(st + 1, len(culs)):
-                if excul[j] is None:
-                    continue
-                eylist = culs[j].elements
-                while ey_tid[j] < len(eylist) and eylist[ey_tid[j]].tid < ex.tid:
-                    ey_tid[j] = ey_tid[j] + 1
-                if ey_tid[j] < len(eylist) and eylist[ey_tid[j]].tid == ex.tid:
-                    newT.append(j)
-                else:
-                    lau[j] = lau[j] - ex.nu - ex.nru
-                    if lau[j] < minutil:
-                        excul[j] = None
-                        exSZ = exSZ - 1
-            if len(newT) == exSZ:
-                self._UpdateCLosed(x, culs, st, excul, newT, ex, ey_tid, length)
-            else:
-                if len(newT) == 0:
-                    continue
-                ru = 0
-                newT1 = tuple(newT)
-                if newT1 not in hashTable.keys():
-                    hashTable[newT1] = len(excul[newT[len(newT) - 1]].elements)
-                    for i in range(len(newT) - 1, -1, -1):
-                        cuListoFItems = excul[newT[i]]
-                        y = culs[newT[i]].elements[ey_tid[newT[i]]]
-                        element = _Element(ex.tid, ex.nu + y.nu - ex.pu, ru, ex.nu, 0)
-                        if i > 0:
-                            element.ppos = len(excul[newT[i - 1]].elements)
-                        else:
-                            element.ppos = - 1
-                        cuListoFItems.addElements(element)
-                        ru += y.nu - ex.pu
+        step = max(1, self._blockSize // m)
+        for start in range(0, len(x), step):
+            tid = x.tid[start:start + step]
+            nu = x.nu[start:start + step]
+            nru = x.nru[start:start + step]
+            pu = x.pu[start:start + step]
+            rows = len(tid)
+            match = _np.zeros((rows, m), dtype=bool)
+            ynu = _np.zeros((rows, m), dtype=_np.int64)
+            for k in _np.flatnonzero(alive):
+                ey = culs[columns[k]]
+                pos = _np.searchsorted(ey.tid, tid)
+                found = pos < len(ey)
+                found[found] = ey.tid[pos[found]] == tid[found]
+                match[:, k] = found
+                ynu[found, k] = ey.nu[pos[found]]
+            # LA-prune: a candidate is dropped from the first element at which its remaining upper bound falls below
+            # minutil, which also shrinks the number of candidates needed for a closed merge from that element on.
+            remaining = lau - _np.cumsum(_np.where(match, 0, (nu + nru)[:, None]), axis=0)
+            below = (remaining < minutil) & alive
+            killed = below.any(axis=0)
+            killRow = _np.where(killed, below.argmax(axis=0), rows)
+            exSZ = int(alive.sum()) - _np.cumsum(_np.bincount(killRow[killed], minlength=rows))
+            lau = remaining[-1]
+            alive &= ~killed
+            active = match & (_np.arange(rows)[:, None] < killRow)
+            count = active.sum(axis=1)
+            gain = _np.where(active, ynu - pu[:, None], 0)
+            rest = _np.where(active, _np.cumsum(gain[:, ::-1], axis=1)[:, ::-1] - gain, 0)
+            prefix = _np.where(active, nu[:, None], 0)
+            closed = count == exSZ
+            if closed.any():
+                sums[2] += (prefix + gain)[closed].sum(axis=0)
+                sums[3] += rest[closed].sum(axis=0)
+                sums[4] += prefix[closed].sum(axis=0)
+            open_ = _np.flatnonzero(~closed & (count > 0))
+            if len(open_) == 0:
+                continue
+            packed = _np.packbits(active[open_], axis=1)
+            keys = _np.ascontiguousarray(packed).view(_np.dtype((_np.void, packed.shape[1]))).ravel()
+            _, first, inverse = _np.unique(keys, return_index=True, return_inverse=True)
+            order = _np.argsort(inverse.ravel(), kind='stable')
+            bounds = _np.searchsorted(inverse.ravel()[order], _np.arange(len(first)))
+            gnu = _np.add.reduceat((prefix + gain)[open_][order], bounds, axis=0)
+            gnru = _np.add.reduceat(rest[open_][order], bounds, axis=0)
+            gpu = _np.add.reduceat(prefix[open_][order], bounds, axis=0)
+            sums[0] += gnu.sum(axis=0)
+            sums[1] += gnru.sum(axis=0)
+            newGroups = []
+            for g in _np.argsort(first):
+                key = packed[first[g]].tobytes()
+                if key in hashTable:
+                    cols, pos = hashTable[key]
+                    updates.append((cols, pos, gnu[g, cols], gnru[g, cols], gpu[g, cols]))
                 else:
-                    dppos = hashTable[newT1]
-                    self._updateElement(x, culs, st, excul, newT, ex, dppos, ey_tid)
-            for j in range(st + 1, len(culs)):
-                cutil[j] = cutil[j] + ex.nu + ex.nru
-        filter_culs = []
-        for j in range(st + 1, len(culs)):
-            if cutil[j] < minutil or excul[j] is None:
+                    newGroups.append(g)
+            if len(newGroups) == 0:
                 continue
-            else:
-                if length > 1:
-                    excul[j].sumCu += culs[j].sumCu + x.sumCu - x.sumCpu
-                    excul[j].sumCru += culs[j].sumCru
-                    excul[j].sumCpu += x.sumCu
-                filter_culs.append(excul[j])
+            newGroups = _np.array(newGroups)
+            pattern = active[open_[first[newGroups]]]
+            positions = lengths + _np.cumsum(pattern, axis=0) - 1
+            lengths += pattern.sum(axis=0)
+            last = _np.maximum.accumulate(_np.where(pattern, _np.arange(m), -1), axis=1)
+            previous = _np.hstack((_np.full((len(newGroups), 1), -1), last[:, :-1]))
+            ppos = _np.where(previous >= 0,
+                             _np.take_along_axis(positions, _np.maximum(previous, 0), axis=1), -1)
+            r, k = _np.nonzero(pattern)
+            created.append((k, positions[r, k], tid[open_[first[newGroups]]][r], gnu[newGroups][r, k],
+                            gnru[newGroups][r, k], gpu[newGroups][r, k], ppos[r, k]))
+            splits = _np.searchsorted(r, _np.arange(1, len(newGroups)))
+            for g, cols, pos in zip(newGroups, _np.split(k, splits), _np.split(positions[r, k], splits)):
+                hashTable[packed[first[g]].tobytes()] = (cols, pos)
+        if len(created) > 0:
+            col, pos, etid, enu, enru, epu, eppos = (_np.concatenate(a) for a in zip(*created))
+            order = _np.lexsort((pos, col))
+            etid, enu, enru, epu, eppos = etid[order], enu[order], enru[order], epu[order], eppos[order]
+        else:
+            etid = enu = enru = epu = eppos = _np.zeros(0, dtype=_np.int64)
+        offsets = _np.concatenate(([0], _np.cumsum(lengths)))
+        for cols, pos, unu, unru, upu in updates:
+            index = offsets[cols] + pos
+            _np.add.at(enu, index, unu)
+            _np.add.at(enru, index, unru)
+            _np.add.at(epu, index, upu)
+        filter_culs = []
+        for k in _np.flatnonzero(alive):
+            j = columns[k]
+            uList = _CUList(culs[j].item)
+            begin, end = offsets[k], offsets[k + 1]
+            uList.tid, uList.nu, uList.nru = etid[begin:end], enu[begin:end], enru[begin:end]
+            uList.pu, uList.ppos = epu[begin:end], eppos[begin:end]
+            uList.sumnu, uList.sumnru = int(sums[0, k]), int(sums[1, k])
+            uList.sumCu, uList.sumCru, uList.sumCpu = int(sums[2, k]), int(sums[3, k]), int(sums[4, k])
+            if length > 1:
+                uList.sumCu += culs[j].sumCu + x.sumCu - x.sumCpu
+                uList.sumCru += culs[j].sumCru
+                uList.sumCpu += x.sumCu
+            filter_culs.append(uList)
         return filter_culs
 
-    def _UpdateCLosed(self, x, culs, st, excul, newT, ex, ey_tid, length):
-        """
-        A method to update closed values
-        :parm x: Compact utility list
-        :type x: lists
-        :parm culs:list of Compact utility list
-        :type culs:lists
-        :parm st: starting pos of culs
-        :type st:int
-        :parm excul: list of culs
-        :type excul: list
-        :parm newT:transaction to be updated
-        :type newT:list
-        :parm ex: element ex
-        :type ex:element
-        :parm ey_tid:list of tss
-        :type ey_tid:ts
-        :parm length: length of x
-        :type length:int
-        """
-        nru = 0
-        for j in range(len(newT) - 1, -1, -1):
-            ey = culs[newT[j]]
-            eyy = ey.elements[ey_tid[newT[j]]]
-            excul[newT[j]].sumCu += ex.nu + eyy.nu - ex.pu
-            excul[newT[j]].sumCru += nru
-            excul[newT[j]].sumCpu += ex.nu
-            nru = nru + eyy.nu - ex.pu
-
-    def _updateElement(self, z, culs, st, excul, newT, ex, duppos, ey_tid):
-        """
-        A method to updates vales for duplicates
-
-        :Attributes:
-
-        :parm z: Compact utility list
-        :type z: lists
-        :parm culs:list of Compact utility list
-        :type culs:lists
-        :parm st: starting pos of culs
-        :type st:int
-        :parm excul:list of culs
-        :type excul:list
-        :parm newT:transaction to be updated
-        :type newT:list
-        :parm ex: element ex
-        :type ex:element
-        :parm duppos: position of z in excul
-        :type duppos:int
-        :parm ey_tid:list of tss
-        :type ey_tid:ts
-        """
-        nru = 0
-        pos = duppos
-        for j in range(len(newT) - 1, -1, -1):
-            ey = culs[newT[j]]
-            eyy = ey.elements[ey_tid[newT[j]]]
-            excul[newT[j]].elements[pos].nu += ex.nu + eyy.nu - ex.pu
-            excul[newT[j]].sumnu += ex.nu + eyy.nu - ex.pu
-            excul[newT[j]].elements[pos].nru += nru
-            excul[newT[j]].sumnru += nru
-            excul[newT[j]].elements[pos].pu += ex.nu
-            nru = nru + eyy.nu - ex.pu
-            pos = excul[newT[j]].elements[pos].ppos
-
     def _saveitemSet(self, prefix, prefixLen, item, utility):
         """
         A method to save itemSets
@@ -379,6 +379,10 @@ class UPGrowth(_ab._utilityPatterns):
             A list to store the phuis
         MapItemToTwu : map
             A map to store the twu of each item in database
+        itemTids : map
+            A map to store the sorted array of transaction ids of each promising item
+        itemUtilities : map
+            A map to store the utilities of each promising item, aligned with itemTids
 
     :Methods:
 
@@ -390,6 +394,8 @@ class UPGrowth(_ab._utilityPatterns):
             A Method to Construct conditional pattern base
         UPGrowth( tree, alpha)
             A Method to Mine UP Tree recursively
+        joinUtilityList(prefix, item)
+            A Method to compute the utility list of a candidate from the utility list of its prefix
         PrintStats()
             A Method to print number of phuis
         save(oFile)
@@ -465,7 +471,9 @@ class UPGrowth(_ab._utilityPatterns):
     _NumberOfNodes = 0
     _ParentNumberOfNodes = 0
     _MapItemToMinimumUtility = {}
-    _MapItemsetsToUtilities = _ab._defaultdict(int)
+    _MapItemsetsToUtilities = {}
+    _itemTids = {}
+    _itemUtilities = {}
     _phuis = []
     _Database = []
     _MapItemToTwu = {}
@@ -539,7 +547,8 @@ class UPGrowth(_ab._utilityPatterns):
                     self._MapItemToTwu[Item] += transactionUtility
                 else:
                     self._MapItemToTwu[Item] = transactionUtility
-        for line in self._Database:
+        self._itemTids, self._itemUtilities = {}, {}
+        for tid, line in enumerate(self._Database):
             line = line.split("\n")[0]
             transaction = line.strip().split(':')
             items = transaction[0].split(self._sep)
@@ -553,6 +562,11 @@ class UPGrowth(_ab._utilityPatterns):
                     element = _UPItem(Item, utility)
                     revisedTransaction.append(element)
                     remainingUtility += utility
+                    if Item not in self._itemTids:
+                        self._itemTids[Item] = _ab.array('q')
+                        self._itemUtilities[Item] = _ab.array('q')
+                    self._itemTids[Item].append(tid)
+                    self._itemUtilities[Item].append(utility)
                     if Item in self._MapItemToMinimumUtility:
                         minItemUtil = self._MapItemToMinimumUtility[Item]
                         if minItemUtil >= utility:
@@ -564,32 +578,26 @@ class UPGrowth(_ab._utilityPatterns):
         tree.createHeaderList(self._MapItemToTwu)
         alpha = []
         self._finalPatterns = {}
+        self._phuis = []
         # print("number of nodes in parent tree", self.ParentNumberOfNodes)
         self._UPGrowth(tree, alpha)
         # self.phuis = sorted(self.phuis, key=lambda x: len(x))
         # print(self.phuis[0:10])
-        for line in self._Database:
-            line = line.split("\n")[0]
-            transaction = line.strip().split(':')
-            items = transaction[0].split(self._sep)
-            utilities = transaction[2].split(self._sep)
-            mapItemToUtility = {}
-            for idx, item in enumerate(items):
-                Item = int(item)
-                utility = int(utilities[idx])
-                if self._MapItemToTwu[Item] >= self._minUtil:
-                    mapItemToUtility[Item] = utility
-            for itemset in self._phuis:
-                l = len(itemset)
-                count = 0
-                utility = 0
-                for item in itemset:
-                    item = int(item)
-                    if item in mapItemToUtility:
-                        utility += mapItemToUtility[item]
-                        count += 1
-                if count == l:
-                    self._MapItemsetsToUtilities[tuple(itemset)] += utility
+        for item in self._itemTids:
+            self._itemTids[item] = _ab._np.frombuffer(self._itemTids[item], dtype=_ab._np.int64)
+            self._itemUtilities[item] = _ab._np.frombuffer(self._itemUtilities[item], dtype=_ab._np.int64)
+        self._MapItemsetsToUtilities = {}
+        stack = []
+        for itemset in self._phuis:
+            while len(stack) > 0 and stack[-1][0] != tuple(itemset[:-1]):
+                stack.pop()
+            if len(stack) == 0:
+                for i in range(len(itemset) - 1):
+                    stack.append((tuple(itemset[:i + 1]),) +
+                                 self._joinUtilityList(stack[-1] if len(stack) > 0 else None, itemset[i]))
+            tids, utilities = self._joinUtilityList(stack[-1] if len(stack) > 0 else None, itemset[-1])
+            stack.append((tuple(itemset), tids, utilities))
+            self._MapItemsetsToUtilities[tuple(itemset)] = int(utilities.sum())
 
         for itemset in self._phuis:
             util = self._MapItemsetsToUtilities[tuple(itemset)]
@@ -607,6 +615,23 @@ class UPGrowth(_ab._utilityPatterns):
         self._memoryRSS = process.memory_info().rss
         print("High Utility patterns were generated successfully using UPGrowth algorithm")
 
+    def _joinUtilityList(self, prefix: tuple, item: int) -> tuple:
+        """
+        A Method to compute the utility list of a candidate from the utility list of its prefix. The lists are stored as
+        sorted transaction id and utility arrays and joined by a merge-intersection of the transaction ids.
+        :param prefix: (itemset, tids, utilities) of the prefix of the candidate, or None for a single item
+        :type prefix: tuple
+        :param item: last item of the candidate
+        :type item: int
+        :return: transaction ids containing the candidate and the utilities of the candidate in these transactions
+        :rtype: tuple
+        """
+        if prefix is None:
+            return self._itemTids[item], self._itemUtilities[item]
+        common, prefixIndex, itemIndex = _ab._np.intersect1d(prefix[1], self._itemTids[item], assume_unique=True,
+                                                              return_indices=True)
+        return common, prefix[2][prefixIndex] + self._itemUtilities[item][itemIndex]
+
     def _UPGrowth(self, tree: _UPTree, alpha: list) -> None:
         """
         A Method to Mine UP Tree recursively
@@ -0,0 +1,895 @@
+# Shared EFIM search engine. EFIM and its constrained variants (RHUIM, HUFIM and SHUFIM) run on this core and only
+# differ in the pruning predicates they plug into it, so every optimization of the search is shared by all of them.
+#
+# **Plugging a constraint into an EFIM based miner**
+# --------------------------------------------------------
+#
+#             from PAMI.highUtilityPattern.basic import _EFIMCore as _core
+#
+#             class MyMiner(_ab._utilityPatterns, _core._EFIMCore):
+#
+#                 def _pruningPredicates(self):
+#
+#                     return [_core._MinSupport(self._minSup)]
+#
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+     Copyright (C)  2021 Rage Uday Kiran
+
+"""
+
+from PAMI.highUtilityPattern.basic import abstract as _ab
+from typing import List, Dict, Union, Optional, Tuple, Iterable, Generator
+
+
+class _Transaction:
+    """
+    A class to store Transaction of a database
+
+    :Attributes:
+
+        items: list
+            A list of items in transaction
+        utilities: list
+            A list of utilities of items in transaction
+        transactionUtility: int
+            represent total sum of all utilities in the database
+        prefixUtility:
+            prefix Utility values of item
+        offset:
+            an offset pointer, used by projected transactions
+        support:
+            number of transactions of the original database merged into this transaction
+
+    :Methods:
+
+        projectedTransaction(offsetE):
+            A method to create new Transaction from existing starting from offsetE until the end
+        getItems():
+            return items in transaction
+        getUtilities():
+            return utilities in transaction
+        getSupport():
+            return the support of the transaction
+    """
+    __slots__ = ('items', 'utilities', 'transactionUtility', 'prefixUtility', 'offset', 'support')
+
+    def __init__(self, items: list, utilities: list, transactionUtility: int) -> None:
+        self.items = items
+        self.utilities = utilities
+        self.transactionUtility = transactionUtility
+        self.prefixUtility = 0
+        self.offset = 0
+        self.support = 1
+
+    def projectTransaction(self, offsetE: int) -> '_Transaction':
+        """
+        A method to create new Transaction from existing transaction starting from offsetE until the end
+
+        :param offsetE: an offset over the original transaction for projecting the transaction
+        :type offsetE: int
+        :return: a new transaction after projecting the transaction starting from offsetE until the end of the transaction
+        :rtype: _Transaction
+        """
+        newTransaction = _Transaction(self.items, self.utilities,
+                                      self.transactionUtility - sum(self.utilities[self.offset:offsetE + 1]))
+        newTransaction.prefixUtility = self.prefixUtility + self.utilities[offsetE]
+        newTransaction.support = self.support
+        newTransaction.offset = offsetE + 1
+        return newTransaction
+
+    def getItems(self) -> list:
+        """
+        A method to return items in transaction
+
+        :return: list of items in transaction
+        :rtype: list
+        """
+        return self.items
+
+    def getUtilities(self) -> list:
+        """
+        A method to return utilities in transaction
+
+        :return: list of utilities in transaction
+        :rtype: list
+        """
+        return self.utilities
+
+    def getSupport(self) -> int:
+        """
+        A method to return support of a transaction (number of transactions in the original database having the items present in this transaction)
+
+        :return: support of the transaction
+        :rtype: int
+        """
+        return self.support
+
+
+class _Dataset:
+    """
+    A utility database read in two streaming passes. The first pass computes the transaction-weighted utility, support
+    and utility of every item keeping only per-item counters in memory. The second pass (encode) keeps the promising
+    items only and stores the pruned transactions in compact arrays, so memory scales with the pruned database.
+    A database given by URL is downloaded once into a temporary file that both passes read.
+
+    :Attributes:
+
+        transactions :
+            the list of transactions created from the encoded database
+        maxItem:
+            the largest item name
+        transactionCount:
+            number of transactions in the database
+        itemTWU:
+            transaction-weighted utility of every item, indexed by its name
+        itemSupport:
+            support of every item, indexed by its name
+        itemUtility:
+            utility of every item, indexed by its name
+        items, utilities, offsets, transactionUtilities:
+            the encoded database. The items and utilities of transaction i are stored at offsets[i]:offsets[i + 1]
+
+    :methods:
+
+        createItemsets(datasetPath):
+            First pass over the database
+        encode(promisingItems):
+            Second pass over the database
+        createTransactions(oldNamesToNewNames):
+            Create renamed transaction objects from the encoded database
+        getMaxItem():
+            return Maximum Item
+        getTransactionCount():
+            return the number of transactions in the database
+        getTransactions():
+            return transactions in database
+
+    """
+    transactions = []
+    maxItem = 0
+    _chunkSize = 1 << 20
+
+    def __init__(self, datasetPath: Union[str, _ab._pd.DataFrame], sep: str) -> None:
+        self.strToInt = {}
+        self.intToStr = {}
+        self.transactions = []
+        self.maxItem = 0
+        self.cnt = 1
+        self.sep = sep
+        self.transactionCount = 0
+        self.itemTWU = [0]
+        self.itemSupport = [0]
+        self.itemUtility = [0]
+        self.items = None
+        self.utilities = None
+        self.offsets = None
+        self.transactionUtilities = None
+        self._datasetPath = datasetPath
+        self._spool = None
+        if isinstance(datasetPath, str) and _ab._validators.url(datasetPath):
+            self._spool = _ab._tempfile.TemporaryFile()
+            _ab._shutil.copyfileobj(_ab._urlopen(datasetPath), self._spool)
+        self.createItemsets(datasetPath)
+
+    def _readRecords(self) -> Generator[Tuple[list, list, int], None, None]:
+        """
+        Stream the transactions of the database, reading files in chunks of about _chunkSize bytes
+
+        :return: items, utilities and transaction utility of every transaction
+        :rtype: generator
+        """
+        datasetPath = self._datasetPath
+        if isinstance(datasetPath, _ab._pd.DataFrame):
+            utilities, data, transactionUtility = [], [], []
+            if datasetPath.empty:
+                print("its empty..")
+            i = datasetPath.columns.values.tolist()
+            if 'Transactions' in i:
+                data = datasetPath['Transactions'].tolist()
+            if 'Utilities' in i:
+                utilities = datasetPath['Utilities'].tolist()
+            elif 'Patterns' in i:
+                utilities = datasetPath['Patterns'].tolist()
+            if 'UtilitySum' in i:
+                transactionUtility = datasetPath['UtilitySum'].tolist()
+            elif 'utilitySum' in i:
+                transactionUtility = datasetPath['utilitySum'].tolist()
+            for k in range(len(data)):
+                yield data[k], utilities[k], int(transactionUtility[k])
+        if isinstance(datasetPath, str):
+            if self._spool is not None:
+                self._spool.seek(0)
+                lines = self._spool.readlines(self._chunkSize)
+                while lines:
+                    for line in lines:
+                        record = self._parseLine(line.decode("utf-8"))
+                        if record is not None:
+                            yield record
+                    lines = self._spool.readlines(self._chunkSize)
+            else:
+                try:
+                    with open(datasetPath, 'r', encoding='utf-8') as f:
+                        lines = f.readlines(self._chunkSize)
+                        while lines:
+                            for line in lines:
+                                record = self._parseLine(line)
+                                if record is not None:
+                                    yield record
+                            lines = f.readlines(self._chunkSize)
+                except IOError:
+                    print("File Not Found")
+                    quit()
+
+    def _parseLine(self, line: str) -> Optional[Tuple[list, list, int]]:
+        """
+        Parse one "items:transactionUtility:utilities" line of the input file
+
+        :param line: a line of the input file
+        :type line: str
+        :return: items, utilities and transaction utility of the line, None for lines without utilities
+        :rtype: tuple
+        """
+        trans_list = line.strip().split(':')
+        if len(trans_list) < 3:
+            return None
+        itemsString = [x for x in trans_list[0].strip().split(self.sep) if x]
+        utilityString = [x for x in trans_list[2].strip().split(self.sep) if x]
+        return itemsString, utilityString, int(trans_list[1])
+
+    def createItemsets(self, datasetPath: Union[str, _ab._pd.DataFrame]) -> None:
+        """
+        First pass over the database: name the items and compute their transaction-weighted utility, support and utility
+
+        :param datasetPath: It represents the peth for the dataset
+        :type datasetPath: str
+        :return: None
+        """
+        strToInt = self.strToInt
+        itemTWU = self.itemTWU
+        itemSupport = self.itemSupport
+        itemUtility = self.itemUtility
+        for itemsString, utilityString, transactionUtility in self._readRecords():
+            self.transactionCount += 1
+            for idx, item in enumerate(itemsString):
+                item_int = strToInt.get(item)
+                if item_int is None:
+                    item_int = self.cnt
+                    strToInt[item] = item_int
+                    self.intToStr[item_int] = item
+                    self.cnt += 1
+                    itemTWU.append(0)
+                    itemSupport.append(0)
+                    itemUtility.append(0)
+                itemTWU[item_int] += transactionUtility
+                itemSupport[item_int] += 1
+                itemUtility[item_int] += int(utilityString[idx])
+        self.maxItem = self.cnt - 1
+
+    def encode(self, promisingItems: Iterable[int]) -> None:
+        """
+        Second pass over the database: store the promising items of every transaction in compact arrays. The utilities
+        of the dropped items are subtracted from the transaction utilities
+
+        :param promisingItems: names of the items to keep
+        :type promisingItems: iterable
+        :return: None
+        """
+        promising = set(self.intToStr[item] for item in promisingItems)
+        strToInt = self.strToInt
+        self.items = _ab.array('q')
+        self.utilities = _ab.array('q')
+        self.offsets = _ab.array('q', [0])
+        self.transactionUtilities = _ab.array('q')
+        for itemsString, utilityString, transactionUtility in self._readRecords():
+            kept = 0
+            for idx, item in enumerate(itemsString):
+                utility = int(utilityString[idx])
+                if item in promising:
+                    self.items.append(strToInt[item])
+                    self.utilities.append(utility)
+                    kept += 1
+                else:
+                    transactionUtility -= utility
+            if kept != 0:
+                self.offsets.append(len(self.items))
+                self.transactionUtilities.append(transactionUtility)
+
+    def createTransactions(self, oldNamesToNewNames: dict) -> List[_Transaction]:
+        """
+        Create the transactions of the encoded database with their items renamed and sorted. Items missing from the map
+        are dropped, as are the transactions left empty
+
+        :param oldNamesToNewNames: A map represent old names to new names
+        :type oldNamesToNewNames: dict
+        :return: the transactions
+        :rtype: list
+        """
+        items = self.items
+        utilities = self.utilities
+        offsets = self.offsets
+        transactions = []
+        for i in range(len(self.transactionUtilities)):
+            transactionUtility = self.transactionUtilities[i]
+            tempItems = []
+            for position in range(offsets[i], offsets[i + 1]):
+                newName = oldNamesToNewNames.get(items[position])
+                if newName is None:
+                    transactionUtility -= utilities[position]
+                else:
+                    tempItems.append((newName, utilities[position]))
+            if len(tempItems) != 0:
+                tempItems.sort()
+                transactions.append(_Transaction([item for item, _ in tempItems],
+                                                 [utility for _, utility in tempItems], transactionUtility))
+        self.items = self.utilities = self.offsets = self.transactionUtilities = None
+        if self._spool is not None:
+            self._spool.close()
+            self._spool = None
+        self.transactions = transactions
+        return transactions
+
+    def getMaxItem(self) -> int:
+        """
+        A method to return name of the largest item
+
+        :return: the largest item
+        :rtype: int
+        """
+        return self.maxItem
+
+    def getTransactionCount(self) -> int:
+        """
+        A method to return the number of transactions in the database
+
+        :return: the number of transactions
+        :rtype: int
+        """
+        return self.transactionCount
+
+    def getTransactions(self) -> list:
+        """
+        A method to return transactions from database
+
+        :return: the list of transactions from database
+        :rtype: list
+        """
+        return self.transactions
+
+
+class _PruningPredicate:
+    """
+    :Description: Base class of the pruning predicates plugged into the EFIM core. Every hook receives the running miner
+                  as its first argument and, unless overridden, prunes nothing.
+
+    :Methods:
+
+        neighbourhood(miner)
+            Neighbours of every item (old names) that restrict both the patterns and their upper bounds, or None
+        keepItem(miner, item)
+            Whether a single item (old name) may take part in any pattern
+        primaryItems(miner, itemsToKeep)
+            Filter the items that may start a pattern
+        keepPattern(miner, utility, support, utilitySum)
+            Whether a high utility itemSet is reported
+        growPattern(miner, support)
+            Whether the projected database of an itemSet is explored any further
+        restrictExtensions(miner, item, extensions)
+            The set of items that may extend a prefix after appending item to it, or None for no restriction
+        exploreExtension(miner, item, subtreeUtility, utilitySum)
+            Whether an extension with the given subtree utility is explored
+        keepExtension(miner, item, localUtility, utilitySum)
+            Whether an extension with the given local utility is kept in the projected database
+    """
+
+    def neighbourhood(self, miner) -> Optional[Dict[int, set]]:
+        return None
+
+    def keepItem(self, miner, item: int) -> bool:
+        return True
+
+    def primaryItems(self, miner, itemsToKeep: List[int]) -> List[int]:
+        return itemsToKeep
+
+    def keepPattern(self, miner, utility: int, support: int, utilitySum: int) -> bool:
+        return True
+
+    def growPattern(self, miner, support: int) -> bool:
+        return True
+
+    def restrictExtensions(self, miner, item: int, extensions: Optional[set]) -> Optional[set]:
+        return extensions
+
+    def exploreExtension(self, miner, item: int, subtreeUtility: int, utilitySum: int) -> bool:
+        return True
+
+    def keepExtension(self, miner, item: int, localUtility: int, utilitySum: int) -> bool:
+        return True
+
+
+class _MinSupport(_PruningPredicate):
+    """
+    :Description: Only report itemSets occurring in at least minSup transactions. Support is anti-monotone, so the
+                  projected database of an infrequent itemSet is not explored.
+
+    :param minSup: minimum support count
+    :type minSup: int or float
+    """
+
+    def __init__(self, minSup: Union[int, float]) -> None:
+        self.minSup = minSup
+
+    def keepItem(self, miner, item: int) -> bool:
+        return miner._singleItemSetsSupport[item] >= self.minSup
+
+    def keepPattern(self, miner, utility: int, support: int, utilitySum: int) -> bool:
+        return support >= self.minSup
+
+    def growPattern(self, miner, support: int) -> bool:
+        return support >= self.minSup
+
+
+class _MinRelativeUtility(_PruningPredicate):
+    """
+    :Description: Only report itemSets whose utility is at least minUR percent of the summed utilities of their items.
+                  Extensions are pruned with the subtree and local utility ratios of the extended itemSet.
+
+    :param minUR: minimum utility ratio in percent
+    :type minUR: float
+    """
+
+    def __init__(self, minUR: float) -> None:
+        self.minUR = float(minUR)
+
+    def keepPattern(self, miner, utility: int, support: int, utilitySum: int) -> bool:
+        return utility / utilitySum * 100 >= self.minUR
+
+    def exploreExtension(self, miner, item: int, subtreeUtility: int, utilitySum: int) -> bool:
+        return subtreeUtility / (utilitySum + miner._itemUtilities[item]) * 100 >= self.minUR
+
+    def keepExtension(self, miner, item: int, localUtility: int, utilitySum: int) -> bool:
+        return localUtility / (utilitySum + miner._itemUtilities[item]) * 100 >= self.minUR
+
+
+class _Neighbourhood(_PruningPredicate):
+    """
+    :Description: Only report itemSets whose items are neighbours of each other. The local and subtree utilities of an
+                  item are restricted to the utilities of its neighbours.
+
+    :param neighbours: the neighbours of every item
+    :type neighbours: dict
+    """
+
+    def __init__(self, neighbours: Dict[str, List[str]]) -> None:
+        self.neighbours = neighbours
+
+    def neighbourhood(self, miner) -> Dict[int, set]:
+        strToInt = miner._dataset.strToInt
+        neighbourhood = {}
+        for item, neighbours in self.neighbours.items():
+            if item in strToInt:
+                neighbourhood[strToInt[item]] = {strToInt[x] for x in neighbours if x in strToInt}
+        return neighbourhood
+
+    def primaryItems(self, miner, itemsToKeep: List[int]) -> List[int]:
+        primaryItems = []
+        for idx, item in enumerate(itemsToKeep):
+            neighbours = miner._itemNeighbours[item]
+            cumulativeUtility = miner._itemUtilities[item]
+            for nextItem in itemsToKeep[idx + 1:]:
+                if nextItem in neighbours:
+                    cumulativeUtility += miner._itemUtilities[nextItem]
+            if cumulativeUtility >= miner._minUtil:
+                primaryItems.append(item)
+        return primaryItems
+
+    def restrictExtensions(self, miner, item: int, extensions: Optional[set]) -> set:
+        if extensions is None:
+            return miner._itemNeighbours[item]
+        return extensions & miner._itemNeighbours[item]
+
+
+class _EFIMCore:
+    """
+    :Description: The EFIM search shared by EFIM and its constrained variants. A miner mixes this class into its
+                  abstract base, calls _mineEFIM() from mine() and customizes the search through the hooks below.
+
+    :Attributes:
+
+        utilityBinArrayLU: list
+            local utility of the items, indexed by their new names
+        utilityBinArraySU: list
+            subtree utility of the items, indexed by their new names
+        oldNamesToNewNames: dict
+            A map which contains old names, new names of items as key value pairs
+        newNamesToOldNames: dict
+            A map which contains new names, old names of items as key value pairs
+        singleItemSetsSupport: dict
+            support of every single item (old names)
+        singleItemSetsUtility: dict
+            utility of every single item (old names)
+        itemUtilities: list
+            utility of every promising single item, indexed by its new name
+        itemNeighbours: list
+            neighbours of every promising item (new names) when a neighbourhood predicate is plugged in, else None
+
+    :Methods:
+
+        _pruningPredicates()
+            The pruning predicates of the miner
+        _createDataset()
+            Read the input database
+        _orderItems(items)
+            Processing order of the promising items
+        _primaryItems(itemsToKeep)
+            Items that may start a pattern
+        _patternValue(utility, support, utilitySum)
+            Value stored for a pattern in the final patterns
+        _mineEFIM()
+            Run the search
+    """
+
+    def _pruningPredicates(self) -> List[_PruningPredicate]:
+        """
+        The pruning predicates plugged into the search. Called once the database is read
+
+        :return: list of predicates
+        :rtype: list
+        """
+        return []
+
+    def _createDataset(self) -> _Dataset:
+        """
+        Read the input database
+
+        :return: the transaction database
+        :rtype: _Dataset
+        """
+        return _Dataset(self._iFile, self._sep)
+
+    def _orderItems(self, items: List[int]) -> List[int]:
+        """
+        Sort the promising items in the order they are processed, by default in ascending order of local utility
+
+        :param items: promising items (old names)
+        :type items: list
+        :return: the sorted items
+        :rtype: list
+        """
+        return sorted(items, key=lambda x: self._utilityBinArrayLU[x])
+
+    def _primaryItems(self, itemsToKeep: List[int]) -> List[int]:
+        """
+        Filter the promising items that may start a pattern
+
+        :param itemsToKeep: promising items (new names)
+        :type itemsToKeep: list
+        :return: the primary items
+        :rtype: list
+        """
+        for predicate in self._predicates:
+            itemsToKeep = predicate.primaryItems(self, itemsToKeep)
+        return itemsToKeep
+
+    def _patternValue(self, utility: int, support: int, utilitySum: int) -> Union[int, str, list]:
+        """
+        Value stored in the final patterns for a high utility itemSet
+
+        :param utility: utility of the itemSet
+        :type utility: int
+        :param support: support of the itemSet
+        :type support: int
+        :param utilitySum: summed utilities of the items of the itemSet
+        :type utilitySum: int
+        :return: the stored value
+        """
+        return utility
+
+    def _mineEFIM(self) -> None:
+        """
+        Read the database, compute the promising items and run the EFIM search with the plugged in predicates
+
+        :return: None
+        """
+        self._dataset = self._createDataset()
+        self._minUtil = int(self._minUtil)
+        self._predicates = self._pruningPredicates()
+        self._neighbours = None
+        for predicate in self._predicates:
+            neighbourhood = predicate.neighbourhood(self)
+            if neighbourhood is not None:
+                self._neighbours = neighbourhood
+        self._candidateCount = 0
+        self._patternCount = 0
+        self._finalPatterns = {}
+        self._oldNamesToNewNames = {}
+        self._newNamesToOldNames = {}
+        self._useUtilityBinArrayToCalculateLocalUtilityFirstTime(self._dataset)
+        itemsToKeep = []
+        for item, localUtility in self._utilityBinArrayLU.items():
+            if localUtility >= self._minUtil and all(p.keepItem(self, item) for p in self._predicates):
+                itemsToKeep.append(item)
+        itemsToKeep = self._orderItems(itemsToKeep)
+        self._itemUtilities = [0] * (len(itemsToKeep) + 1)
+        for currentName, item in enumerate(itemsToKeep, 1):
+            self._oldNamesToNewNames[item] = currentName
+            self._newNamesToOldNames[currentName] = item
+            self._itemUtilities[currentName] = self._singleItemSetsUtility[item]
+        itemsToKeep = list(range(1, len(itemsToKeep) + 1))
+        self._itemNeighbours = None
+        if self._neighbours is not None:
+            self._itemNeighbours = [frozenset()]
+            for item in itemsToKeep:
+                neighbours = self._neighbours.get(self._newNamesToOldNames[item], ())
+                self._itemNeighbours.append(
+                    frozenset(self._oldNamesToNewNames[x] for x in neighbours if x in self._oldNamesToNewNames))
+        transactions = self._dataset.createTransactions(self._oldNamesToNewNames)
+        self._sortDatabase(transactions)
+        self._dataset.transactions = transactions
+        self._utilityBinArrayLU = [0] * (len(itemsToKeep) + 1)
+        self._utilityBinArraySU = [0] * (len(itemsToKeep) + 1)
+        self._useUtilityBinArrayToCalculateSubtreeUtilityFirstTime(self._dataset)
+        itemsToExplore = []
+        for item in self._primaryItems(itemsToKeep):
+            if self._utilityBinArraySU[item] >= self._minUtil:
+                itemsToExplore.append(item)
+        if len(transactions) != 0:
+            self._backTrackingEFIM(transactions, itemsToKeep, itemsToExplore, 0, 0, None)
+
+    def _backTrackingEFIM(self, transactionsOfP: list, itemsToKeep: list, itemsToExplore: list, prefixLength: int,
+                          utilitySumP: int, extensionsOfP: Optional[set]) -> None:
+        """
+        A method to mine the HUIs Recursively
+
+        :param transactionsOfP: the list of transactions containing the current prefix P
+        :type transactionsOfP: list
+        :param itemsToKeep: the list of secondary items in the p-projected database
+        :type itemsToKeep: list
+        :param itemsToExplore: the list of primary items in the p-projected database
+        :type itemsToExplore: list
+        :param prefixLength: current prefixLength
+        :type prefixLength: int
+        :param utilitySumP: summed utilities of the items in P
+        :type utilitySumP: int
+        :param extensionsOfP: items allowed to extend P, None when unrestricted
+        :type extensionsOfP: set or None
+        :return: None
+        """
+        self._candidateCount += len(itemsToExplore)
+        predicates = self._predicates
+        bisect = _ab._bisect.bisect_left
+        for e in itemsToExplore:
+            transactionsPe = []
+            utilityPe = 0
+            supportPe = 0
+            previousTransaction = None
+            consecutiveMergeCount = 0
+            for transaction in transactionsOfP:
+                items = transaction.items
+                positionE = bisect(items, e, transaction.offset)
+                if positionE == len(items) or items[positionE] != e:
+                    continue
+                if positionE == len(items) - 1:
+                    utilityPe += transaction.utilities[positionE] + transaction.prefixUtility
+                    supportPe += transaction.support
+                    continue
+                projectedTransaction = transaction.projectTransaction(positionE)
+                utilityPe += projectedTransaction.prefixUtility
+                supportPe += projectedTransaction.support
+                if previousTransaction is None:
+                    previousTransaction = projectedTransaction
+                elif self._isEqual(projectedTransaction, previousTransaction):
+                    if consecutiveMergeCount == 0:
+                        offset = previousTransaction.offset
+                        mergedTransaction = _Transaction(previousTransaction.items[offset:],
+                                                         previousTransaction.utilities[offset:],
+                                                         previousTransaction.transactionUtility)
+                        mergedTransaction.prefixUtility = previousTransaction.prefixUtility
+                        mergedTransaction.support = previousTransaction.support
+                        previousTransaction = mergedTransaction
+                    utilities = previousTransaction.utilities
+                    projectedUtilities = projectedTransaction.utilities
+                    offset = projectedTransaction.offset
+                    for i in range(len(utilities)):
+                        utilities[i] += projectedUtilities[offset + i]
+                    previousTransaction.transactionUtility += projectedTransaction.transactionUtility
+                    previousTransaction.prefixUtility += projectedTransaction.prefixUtility
+                    previousTransaction.support += projectedTransaction.support
+                    consecutiveMergeCount += 1
+                else:
+                    transactionsPe.append(previousTransaction)
+                    previousTransaction = projectedTransaction
+                    consecutiveMergeCount = 0
+            if previousTransaction is not None:
+                transactionsPe.append(previousTransaction)
+            utilitySumPe = utilitySumP + self._itemUtilities[e]
+            self._temp[prefixLength] = e
+            if utilityPe >= self._minUtil and all(p.keepPattern(self, utilityPe, supportPe, utilitySumPe) for p in predicates):
+                self._output(prefixLength, utilityPe, supportPe, utilitySumPe)
+            if len(transactionsPe) == 0 or not all(p.growPattern(self, supportPe) for p in predicates):
+                continue
+            extensionsOfPe = extensionsOfP
+            for predicate in predicates:
+                extensionsOfPe = predicate.restrictExtensions(self, e, extensionsOfPe)
+            candidates = itemsToKeep[bisect(itemsToKeep, e) + 1:]
+            if extensionsOfPe is not None:
+                candidates = [item for item in candidates if item in extensionsOfPe]
+            if len(candidates) == 0:
+                continue
+            self._useUtilityBinArraysToCalculateUpperBounds(transactionsPe, candidates)
+            newItemsToKeep = []
+            newItemsToExplore = []
+            for itemK in candidates:
+                subtreeUtility = self._utilityBinArraySU[itemK]
+                localUtility = self._utilityBinArrayLU[itemK]
+                if subtreeUtility >= self._minUtil and all(
+                        p.exploreExtension(self, itemK, subtreeUtility, utilitySumPe) for p in predicates):
+                    newItemsToExplore.append(itemK)
+                    newItemsToKeep.append(itemK)
+                elif localUtility >= self._minUtil and all(
+                        p.keepExtension(self, itemK, localUtility, utilitySumPe) for p in predicates):
+                    newItemsToKeep.append(itemK)
+            self._backTrackingEFIM(transactionsPe, newItemsToKeep, newItemsToExplore, prefixLength + 1,
+                                   utilitySumPe, extensionsOfPe)
+
+    def _useUtilityBinArraysToCalculateUpperBounds(self, transactionsPe: list, candidates: list) -> None:
+        """
+        A method to  calculate the subtree utility and local utility of all items that can extend itemSet P U {e}
+
+        :param transactionsPe: transactions the projected database for P U {e}
+        :type transactionsPe: list
+        :param candidates: the promising items that can extend P U {e}
+        :type candidates: list
+        :return: None
+        """
+        utilityBinArraySU = self._utilityBinArraySU
+        utilityBinArrayLU = self._utilityBinArrayLU
+        for item in candidates:
+            utilityBinArrayLU[item] = 0
+            utilityBinArraySU[item] = 0
+        candidates = set(candidates)
+        itemNeighbours = self._itemNeighbours
+        for transaction in transactionsPe:
+            items = transaction.items
+            utilities = transaction.utilities
+            prefixUtility = transaction.prefixUtility
+            localUtility = transaction.transactionUtility + prefixUtility
+            sumRemainingUtility = 0
+            for i in range(len(items) - 1, transaction.offset - 1, -1):
+                item = items[i]
+                if item in candidates:
+                    utilityBinArrayLU[item] += localUtility
+                    if itemNeighbours is None:
+                        sumRemainingUtility += utilities[i]
+                        utilityBinArraySU[item] += sumRemainingUtility + prefixUtility
+                    else:
+                        neighbours = itemNeighbours[item]
+                        remainingUtility = utilities[i]
+                        for k in range(i + 1, len(items)):
+                            if items[k] in neighbours and items[k] in candidates:
+                                remainingUtility += utilities[k]
+                        utilityBinArraySU[item] += remainingUtility + prefixUtility
+
+    def _output(self, tempPosition: int, utility: int, support: int, utilitySum: int) -> None:
+        """
+        Method to store a high utility itemSet in the final patterns
+
+        :param tempPosition: position of last item
+        :type tempPosition : int
+        :param utility: total utility of itemSet
+        :type utility: int
+        :param support: support of itemSet
+        :type support: int
+        :param utilitySum: summed utilities of the items of the itemSet
+        :type utilitySum: int
+        :return: None
+        """
+        self._patternCount += 1
+        s1 = "\t".join(self._dataset.intToStr[self._newNamesToOldNames[self._temp[i]]] for i in range(tempPosition + 1))
+        self._finalPatterns[s1] = self._patternValue(utility, support, utilitySum)
+
+    def _isEqual(self, transaction1: _Transaction, transaction2: _Transaction) -> bool:
+        """
+        A method to Check if two transaction are identical
+
+        :param  transaction1: the first transaction
+        :type  transaction1: Trans
+        :param  transaction2:    the second transaction
+        :type  transaction2: Trans
+        :return : whether both are identical or not
+        :rtype: bool
+        """
+        if len(transaction1.items) - transaction1.offset != len(transaction2.items) - transaction2.offset:
+            return False
+        return transaction1.items[transaction1.offset:] == transaction2.items[transaction2.offset:]
+
+    def _useUtilityBinArrayToCalculateLocalUtilityFirstTime(self, dataset: _Dataset) -> None:
+        """
+        A method to calculate the local utility, utility and support of single itemSets. The transaction-weighted
+        utilities of the first pass over the database decide which items the second pass encodes. With a neighbourhood,
+        the local utility of an item is then narrowed down to its utility plus the utilities of its neighbours
+
+        :param dataset: the transaction database
+        :type dataset: _Dataset
+        :return: None
+        """
+        self._utilityBinArrayLU = {}
+        self._singleItemSetsSupport = _ab._defaultdict(int)
+        self._singleItemSetsUtility = _ab._defaultdict(int)
+        for item in range(1, dataset.getMaxItem() + 1):
+            self._singleItemSetsSupport[item] = dataset.itemSupport[item]
+            self._singleItemSetsUtility[item] = dataset.itemUtility[item]
+            if dataset.itemTWU[item] >= self._minUtil and all(p.keepItem(self, item) for p in self._predicates):
+                self._utilityBinArrayLU[item] = dataset.itemTWU[item]
+        dataset.encode(self._utilityBinArrayLU.keys())
+        neighbourhood = self._neighbours
+        if neighbourhood is None:
+            return
+        self._utilityBinArrayLU = dict.fromkeys(self._utilityBinArrayLU, 0)
+        items = dataset.items
+        utilities = dataset.utilities
+        offsets = dataset.offsets
+        for i in range(len(offsets) - 1):
+            start, end = offsets[i], offsets[i + 1]
+            for idx in range(start, end):
+                item = items[idx]
+                localUtility = utilities[idx]
+                neighbours = neighbourhood.get(item)
+                if neighbours:
+                    for k in range(start, end):
+                        if items[k] != item and items[k] in neighbours:
+                            localUtility += utilities[k]
+                self._utilityBinArrayLU[item] += localUtility
+
+    def _useUtilityBinArrayToCalculateSubtreeUtilityFirstTime(self, dataset: _Dataset) -> None:
+        """
+        Scan the initial database to calculate the subtree utility of each item using a utility-bin array
+
+        :param dataset: the transaction database
+        :type dataset: _Dataset
+        :return: None
+        """
+        utilityBinArraySU = self._utilityBinArraySU
+        itemNeighbours = self._itemNeighbours
+        for transaction in dataset.getTransactions():
+            items = transaction.items
+            utilities = transaction.utilities
+            if itemNeighbours is None:
+                sumSU = 0
+                for i in range(len(items) - 1, -1, -1):
+                    sumSU += utilities[i]
+                    utilityBinArraySU[items[i]] += sumSU
+            else:
+                for i, item in enumerate(items):
+                    neighbours = itemNeighbours[item]
+                    sumSU = utilities[i]
+                    for k in range(i + 1, len(items)):
+                        if items[k] in neighbours:
+                            sumSU += utilities[k]
+                    utilityBinArraySU[item] += sumSU
+
+    def _sortDatabase(self, transactions: list) -> None:
+        """
+        A Method to sort transactions in descending order of their items read from the last one, so that transactions
+        sharing a suffix are adjacent and their projections can be merged
+
+        :param transactions: transaction of items
+        :type transactions: list
+        :return: None
+        """
+        transactions.sort(key=lambda transaction: transaction.items[::-1], reverse=True)
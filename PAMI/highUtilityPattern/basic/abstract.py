@@ -20,6 +20,7 @@ import validators as _validators
 from urllib.request import urlopen as _urlopen
 import csv as _csv
 import pandas as _pd
+import numpy as _np
 from collections import defaultdict as _defaultdict
 from itertools import combinations as _c
 import os as _os
@@ -27,6 +28,9 @@ import os.path as _ospath
 import psutil as _psutil
 from array import *
 import functools as _functools
+import bisect as _bisect
+import shutil as _shutil
+import tempfile as _tempfile
 import sys as _sys
 
 class _utilityPatterns(_ABC):
@@ -54,7 +54,7 @@ Copyright (C)  2021 Rage Uday Kiran
 
 """
 
-import abstract as _hus
+from PAMI.highUtilityPatternsInStreams import abstract as _hus
 import pandas as pd
 from functools import reduce
 from operator import and_ 
@@ -308,7 +308,7 @@ class _HUSTree:
 
         :type utility: int
         """
-        transaction.sort(key = lambda x: x[0])
+        transaction.sort()
         currentNode = self.root
         self.windowUtility += utility
         for item in transaction:
@@ -402,6 +402,12 @@ class HUPMS(_hus._highUtilityPatternStreamMining):
                    Minimum utility threshold
     :param  sep: str :
                    This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.
+    :param  incremental: bool :
+                   If True, the high-utility itemsets of the previous window are kept with their per-pane utilities and only
+                   the itemsets contained in the inserted or expired pane are re-explored after each slide.
+    :param  callback: function :
+                   Receives the (startIndex, endIndex) window and its list of ('+'/'-', itemset, utility) deltas after every
+                   window in incremental mode.
 
 
 
@@ -538,8 +544,8 @@ class HUPMS(_hus._highUtilityPatternStreamMining):
     __windowSize = 0
     __paneSize = 0
 
-    def __init__(self, iFile, oFile, minUtil, windowSize, paneSize, sep = ","):
-        super().__init__(iFile, minUtil, windowSize, paneSize, sep)
+    def __init__(self, iFile, oFile, minUtil, windowSize, paneSize, sep = ",", incremental = False, callback = None):
+        super().__init__(iFile, minUtil, windowSize, paneSize, sep, incremental, callback)
         self._oFile = oFile
 
     def _createItemsets(self):
@@ -685,7 +691,7 @@ class HUPMS(_hus._highUtilityPatternStreamMining):
      
         return reduce(and_, [i in superset for i in subset])
 
-    def treeGenerations(self, root, netUtil, candidatePattern, curItem = None):
+    def treeGenerations(self, root, netUtil, candidatePattern, curItem = None, touched = None):
         """
         Generates the tree of the high utility patterns
 
@@ -704,14 +710,26 @@ class HUPMS(_hus._highUtilityPatternStreamMining):
         :param curItem: list of items in the current itemsets
 
         :type curItem: list
+
+        :param touched: ids of the inserted or expired transactions containing curItem. If given, only the itemsets contained in one of these transactions are generated
+
+        :type touched: set
         """
 
         if root is None:
             return
 
+        if curItem is None:
+            curItem = []
 
         for item in reversed(root.headerTable.orderedItems):
             if root.headerTable.table[item][0] >= netUtil:
+                itemTouched = None
+                if touched is not None:
+                    itemTouched = touched & self._changedIndex.get(item, set())
+                    if not itemTouched:
+                        continue
+
                 prefixBranches = []
 
                 tempNode = root.headerTable.table[item][1]
@@ -745,7 +763,7 @@ class HUPMS(_hus._highUtilityPatternStreamMining):
                     candidatePattern[len(newItemset)].append(newItemset)
 
                 if len(conditionalTree.headerTable.table) != 0:
-                    self.treeGenerations(conditionalTree, netUtil, candidatePattern, newItemset)
+                    self.treeGenerations(conditionalTree, netUtil, candidatePattern, newItemset, itemTouched)
 
     @deprecated("It is recommended to use 'mine()' instead of 'mine()' for mining process. Starting from January 2025, 'mine()' will be completely terminated.")
     def startMine(self):
@@ -791,31 +809,46 @@ class HUPMS(_hus._highUtilityPatternStreamMining):
 
         startIndex = 0
         endIndex = self.__windowSize * self.__paneSize
+        self.__finalPatterns = {}
+        self._paneUtilities = {}
+        touched = None
 
         while endIndex <= len(self._transactions):
 
             filteredItemsets = {}
 
-            self.treeGenerations(self.__tree, self._minUtil, filteredItemsets)
+            self.treeGenerations(self.__tree, self._minUtil, filteredItemsets, [], touched)
 
-            results = []
+            if self._incremental:
+                self._slidePaneUtilities(filteredItemsets, transactionwiseUtility, startIndex, endIndex, self._minUtil)
+                self.__finalPatterns[(startIndex, endIndex)] = [[list(itemSet), sum(paneUtility)]
+                                                                for itemSet, paneUtility in self._paneUtilities.items()]
 
-            for itemSetLen in filteredItemsets:
-                for itemSet in filteredItemsets[itemSetLen]:
-                    itemSetUtility = 0
-                    for transId in range(startIndex, endIndex):
-                        if self.contains(list(transactionwiseUtility[transId].keys()), itemSet):
-                            for item in itemSet:
-                                itemSetUtility += transactionwiseUtility[transId][item]
+            else:
+                results = []
+
+                for itemSetLen in filteredItemsets:
+                    for itemSet in filteredItemsets[itemSetLen]:
+                        itemSetUtility = 0
+                        for transId in range(startIndex, endIndex):
+                            if self.contains(list(transactionwiseUtility[transId].keys()), itemSet):
+                                for item in itemSet:
+                                    itemSetUtility += transactionwiseUtility[transId][item]
 
-                    if itemSetUtility >= self._minUtil:
-                        results.append([itemSet, itemSetUtility])
+                        if itemSetUtility >= self._minUtil:
+                            results.append([itemSet, itemSetUtility])
 
-            self.__finalPatterns[(startIndex, endIndex)] = results
+                self.__finalPatterns[(startIndex, endIndex)] = results
 
             if endIndex >= len(self._transactions):
                 break
 
+            if self._incremental:
+                changedTids = list(range(startIndex, startIndex + self.__paneSize)) + \
+                              list(range(endIndex, endIndex + self.__paneSize))
+                self._changedIndex = self._indexTransactions(transactionwiseUtility, changedTids)
+                touched = set(changedTids)
+
             self.__tree.removeBatch()
 
             for i in range(0, self.__paneSize):
@@ -22,7 +22,7 @@
 #
 
 
-import abstract as _hus
+from PAMI.highUtilityPatternsInStreams import abstract as _hus
 import pandas as pd
 from functools import reduce
 from operator import and_
@@ -295,7 +295,10 @@ class _SHUTree:
         :type itemUtility: str
         """
         # print("Transaction", transaction, itemUtility, self.localTree)
-        transaction.sort(key = lambda x: x[0])
+        # items and their utilities are sorted together, in the order of headerTable.orderedItems
+        order = sorted(range(len(transaction)), key = lambda x: transaction[x])
+        transaction = [transaction[x] for x in order]
+        itemUtility = [itemUtility[x] for x in order]
         currentNode = self.root
         self.windowUtility += utility
 
@@ -441,6 +444,12 @@ class SHUGrowth(_hus._highUtilityPatternStreamMining):
                    Minimum utility threshold
     :param  sep: str :
                    This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.
+    :param  incremental: bool :
+                   If True, the high-utility itemsets of the previous window are kept with their per-pane utilities and only
+                   the itemsets contained in the inserted or expired pane are re-explored after each slide.
+    :param  callback: function :
+                   Receives the (startIndex, endIndex) window and its list of ('+'/'-', itemset, utility) deltas after every
+                   window in incremental mode.
 
 
     :Attributes:
@@ -579,8 +588,8 @@ class SHUGrowth(_hus._highUtilityPatternStreamMining):
     __windowSize = 0
     __paneSize = 0
 
-    def __init__(self, iFile, oFile, minUtil, windowSize, paneSize, sep = ","):
-        super().__init__(iFile, minUtil, windowSize, paneSize, sep)
+    def __init__(self, iFile, oFile, minUtil, windowSize, paneSize, sep = ",", incremental = False, callback = None):
+        super().__init__(iFile, minUtil, windowSize, paneSize, sep, incremental, callback)
         self._oFile = oFile
 
     def _createItemsets(self):
@@ -652,7 +661,9 @@ class SHUGrowth(_hus._highUtilityPatternStreamMining):
 
     def createPrefixBranch(self, root):
         """
-        Creates the prefix branch of the node
+        Creates the prefix branch of the node. Every item of the branch is given the prefix utility of the node, which
+        bounds the utility of any itemset made of the node's item and items of the branch in the transactions through
+        the node
 
         :param root: pointer to the root node of the sub-tree
 
@@ -674,18 +685,8 @@ class SHUGrowth(_hus._highUtilityPatternStreamMining):
 
         chosenItemset = stack[0]
         lastUtil = sum(chosenItemset.utility)
-        curBacthes = [i for i, e in enumerate(chosenItemset.utility) if e != 0]
 
-        otherUtilites = []
-
-        for i in range(1, len(stack)-1):
-            curItemset = stack[i]
-            epu = lastUtil
-
-            for j in range(i-1, 0, -1):
-                epu -= self.minPathUtil(j, stack)
-            
-            otherUtilites.append(epu)
+        otherUtilites = [lastUtil] * (len(stack) - 2)
 
         return stack, lastUtil, otherUtilites
 
@@ -762,7 +763,7 @@ class SHUGrowth(_hus._highUtilityPatternStreamMining):
      
         return reduce(and_, [i in superset for i in subset])
 
-    def treeGenerations(self, root, netUtil, candidatePattern, curItem =None):
+    def treeGenerations(self, root, netUtil, candidatePattern, curItem = None, touched = None):
         """
         Generates the tree of the high utility patterns
 
@@ -781,14 +782,26 @@ class SHUGrowth(_hus._highUtilityPatternStreamMining):
         :param curItem: List of items in the current itemsets
 
         :type curItem: list
+
+        :param touched: ids of the inserted or expired transactions containing curItem. If given, only the itemsets contained in one of these transactions are generated
+
+        :type touched: set
         """
 
         if root is None:
             return
 
+        if curItem is None:
+            curItem = []
 
         for item in reversed(root.headerTable.orderedItems):
             if root.headerTable.table[item][0] >= netUtil:
+                itemTouched = None
+                if touched is not None:
+                    itemTouched = touched & self._changedIndex.get(item, set())
+                    if not itemTouched:
+                        continue
+
                 prefixBranches = []
 
                 tempNode = root.headerTable.table[item][1]
@@ -824,7 +837,7 @@ class SHUGrowth(_hus._highUtilityPatternStreamMining):
                     candidatePattern[len(newItemset)].append(newItemset)
 
                 if len(conditionalTree.headerTable.table) != 0:
-                    self.treeGenerations(conditionalTree, netUtil, candidatePattern, newItemset)
+                    self.treeGenerations(conditionalTree, netUtil, candidatePattern, newItemset, itemTouched)
 
     @deprecated("It is recommended to use 'mine()' instead of 'mine()' for mining process. Starting from January 2025, 'mine()' will be completely terminated.")
     def startMine(self):
@@ -871,31 +884,46 @@ class SHUGrowth(_hus._highUtilityPatternStreamMining):
 
         startIndex = 0
         endIndex = self.__windowSize * self.__paneSize
+        self.__finalPatterns = {}
+        self._paneUtilities = {}
+        touched = None
 
         while endIndex <= len(self._transactions):
 
             filteredItemsets = {}
 
-            self.treeGenerations(self.__tree, self._minUtil, filteredItemsets)
+            self.treeGenerations(self.__tree, self._minUtil, filteredItemsets, [], touched)
+
+            if self._incremental:
+                self._slidePaneUtilities(filteredItemsets, transactionwiseUtility, startIndex, endIndex, self._minUtil)
+                self.__finalPatterns[(startIndex, endIndex)] = [[list(itemSet), sum(paneUtility)]
+                                                                for itemSet, paneUtility in self._paneUtilities.items()]
 
-            results = []
+            else:
+                results = []
 
-            for itemSetLen in filteredItemsets:
-                for itemSet in filteredItemsets[itemSetLen]:
-                    itemSetUtility = 0
-                    for transId in range(startIndex, endIndex):
-                        if self.contains(list(transactionwiseUtility[transId].keys()), itemSet):
-                            for item in itemSet:
-                                itemSetUtility += transactionwiseUtility[transId][item]
+                for itemSetLen in filteredItemsets:
+                    for itemSet in filteredItemsets[itemSetLen]:
+                        itemSetUtility = 0
+                        for transId in range(startIndex, endIndex):
+                            if self.contains(list(transactionwiseUtility[transId].keys()), itemSet):
+                                for item in itemSet:
+                                    itemSetUtility += transactionwiseUtility[transId][item]
 
-                    if itemSetUtility >= self._minUtil:
-                        results.append([itemSet, itemSetUtility])
+                        if itemSetUtility >= self._minUtil:
+                            results.append([itemSet, itemSetUtility])
 
-            self.__finalPatterns[(startIndex, endIndex)] = results
+                self.__finalPatterns[(startIndex, endIndex)] = results
 
             if endIndex >= len(self._transactions):
                 break
 
+            if self._incremental:
+                changedTids = list(range(startIndex, startIndex + self.__paneSize)) + \
+                              list(range(endIndex, endIndex + self.__paneSize))
+                self._changedIndex = self._indexTransactions(transactionwiseUtility, changedTids)
+                touched = set(changedTids)
+
             self.__tree.removeBatch()
 
             for i in range(0, self.__paneSize):
@@ -56,6 +56,14 @@ class _highUtilityPatternStreamMining(_ABC):
             To store the total amount of USS memory consumed by the program
         memoryRSS : float
             To store the total amount of RSS memory consumed by the program
+        incremental : bool
+            If True, the itemsets of the previous window are kept with their per-pane utilities and only the
+            part of the search space touched by the inserted or expired pane is re-explored after each slide
+        callback : function
+            Called after every window as callback(window, deltas) when running in incremental mode, where window is
+            the (startIndex, endIndex) pair and deltas is a list of ('+', itemset, utility) and ('-', itemset, utility)
+            tuples. A '+' delta carries the current utility of a new or updated itemset and a '-' delta the last
+            utility of an itemset that is no longer high-utility
 
     :Methods:
 
@@ -76,7 +84,7 @@ class _highUtilityPatternStreamMining(_ABC):
 
     """
 
-    def __init__(self, iFile, minUtil, windowSize, paneSize, sep = "\t"):
+    def __init__(self, iFile, minUtil, windowSize, paneSize, sep = "\t", incremental = False, callback = None):
         """
         :param iFile: Input file name or path of the input file
         :type iFile: str
@@ -84,6 +92,10 @@ class _highUtilityPatternStreamMining(_ABC):
         :type minUtil: int 
         :param sep: separator used to distinguish items from each other. The default separator is tab space. However, users can override the default separator
         :type sep: str
+        :param incremental: re-explore only the itemsets touched by the inserted or expired pane after each slide
+        :type incremental: bool
+        :param callback: function receiving the (startIndex, endIndex) window and its list of +/- deltas
+        :type callback: function
 
         """
 
@@ -98,6 +110,10 @@ class _highUtilityPatternStreamMining(_ABC):
         self._memoryUSS = float()
         self._memoryRSS = float()
         self._finalPatterns = {}
+        self._incremental = incremental
+        self._callback = callback
+        self._paneUtilities = {}
+        self._changedIndex = {}
 
     @_abstractmethod
     def startMine(self):
@@ -141,4 +157,131 @@ class _highUtilityPatternStreamMining(_ABC):
     def getRuntime(self):
         """Total amount of runtime taken by the program will be retrieved from this function"""
 
-        pass
\ No newline at end of file
+        pass
+
+    def _indexTransactions(self, transactionwiseUtility, tids):
+        """
+        Builds the item to transaction ids index of the given transactions
+
+        :param transactionwiseUtility: list of item to utility dictionaries of every transaction
+        :type transactionwiseUtility: list
+        :param tids: ids of the transactions to be indexed
+        :type tids: iterable
+        :return: dictionary of items as keys and set of transaction ids containing the item as values
+        :rtype: dict
+        """
+
+        index = _defaultdict(set)
+        for tid in tids:
+            for item in transactionwiseUtility[tid]:
+                index[item].add(tid)
+        return index
+
+    def _itemsetUtility(self, itemset, transactionwiseUtility, tids):
+        """
+        Calculates the utility of the itemset in the given transactions
+
+        :param itemset: items of the itemset
+        :type itemset: tuple
+        :param transactionwiseUtility: list of item to utility dictionaries of every transaction
+        :type transactionwiseUtility: list
+        :param tids: ids of the transactions to be scanned
+        :type tids: iterable
+        :return: utility of the itemset
+        :rtype: float
+        """
+
+        utility = 0
+        for tid in tids:
+            curTrans = transactionwiseUtility[tid]
+            if all(item in curTrans for item in itemset):
+                utility += sum(curTrans[item] for item in itemset)
+        return utility
+
+    def _paneUtilityVector(self, itemset, transactionwiseUtility, startIndex):
+        """
+        Calculates the utility of the itemset in every pane of the window starting at startIndex
+
+        :param itemset: items of the itemset
+        :type itemset: tuple
+        :param transactionwiseUtility: list of item to utility dictionaries of every transaction
+        :type transactionwiseUtility: list
+        :param startIndex: index of the first transaction of the window
+        :type startIndex: int
+        :return: list of utilities of the itemset, one per pane
+        :rtype: list
+        """
+
+        paneSize = int(self._paneSize)
+        vector = []
+        for pane in range(int(self._windowSize)):
+            paneStart = startIndex + pane * paneSize
+            vector.append(self._itemsetUtility(itemset, transactionwiseUtility, range(paneStart, paneStart + paneSize)))
+        return vector
+
+    def _changedTids(self, itemset):
+        """
+        Returns the ids of the inserted or expired transactions containing the itemset
+
+        :param itemset: items of the itemset
+        :type itemset: tuple
+        :return: set of transaction ids
+        :rtype: set
+        """
+
+        tids = None
+        for item in itemset:
+            if item not in self._changedIndex:
+                return set()
+            tids = set(self._changedIndex[item]) if tids is None else tids & self._changedIndex[item]
+            if not tids:
+                break
+        return tids if tids is not None else set()
+
+    def _slidePaneUtilities(self, candidatePatterns, transactionwiseUtility, startIndex, endIndex, minUtil):
+        """
+        Moves the stored itemsets to the window [startIndex, endIndex) and adds the new high-utility candidates.
+
+        The per-pane utilities of a stored itemset are shifted by one pane and only the utility in the inserted pane
+        is computed. The candidates are expected to be restricted to the itemsets contained in an inserted or expired
+        transaction, as the utility of every other itemset is unchanged by the slide.
+
+        :param candidatePatterns: candidate itemsets grouped by their length
+        :type candidatePatterns: dict
+        :param transactionwiseUtility: list of item to utility dictionaries of every transaction
+        :type transactionwiseUtility: list
+        :param startIndex: index of the first transaction of the window
+        :type startIndex: int
+        :param endIndex: index after the last transaction of the window
+        :type endIndex: int
+        :param minUtil: minimum utility threshold
+        :type minUtil: float
+        :return: list of ('+', itemset, utility) and ('-', itemset, utility) deltas
+        :rtype: list
+        """
+
+        deltas = []
+        paneStart = endIndex - int(self._paneSize)
+        for itemset in list(self._paneUtilities):
+            vector = self._paneUtilities[itemset]
+            expired = vector.pop(0)
+            inserted = self._itemsetUtility(itemset, transactionwiseUtility,
+                                            [tid for tid in self._changedTids(itemset) if tid >= paneStart])
+            vector.append(inserted)
+            if sum(vector) < minUtil:
+                del self._paneUtilities[itemset]
+                deltas.append(('-', list(itemset), expired + sum(vector) - inserted))
+            elif expired != inserted:
+                deltas.append(('+', list(itemset), sum(vector)))
+        for itemSetLen in candidatePatterns:
+            for itemSet in candidatePatterns[itemSetLen]:
+                itemset = tuple(sorted(itemSet))
+                if itemset in self._paneUtilities:
+                    continue
+                vector = self._paneUtilityVector(itemset, transactionwiseUtility, startIndex)
+                if sum(vector) >= minUtil:
+                    self._paneUtilities[itemset] = vector
+                    deltas.append(('+', list(itemset), sum(vector)))
+        if self._callback is not None:
+            self._callback((startIndex, endIndex), deltas)
+        return deltas
@@ -1,4 +1,3 @@
-
 #  Copyright (C)  2024 Rage Uday Kiran
 #
 #      This program is free software: you can redistribute it and/or modify
@@ -15,16 +14,21 @@
 #      along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 from PAMI.multipleMinimumSupportBasedSequentialPattern.basic import abstract as _ab
+from PAMI.sequentialPattern.basic.PrefixSpan import PrefixSpan as _PrefixSpan
+from PAMI.sequentialPattern.basic._parallelMiner import _TaskPool
+from PAMI.extras.calculateMISValues.MISVector import MISVector as _MISVector
 import sys
 sys.setrecursionlimit(10000)
 
-class MMSBprefixSpan(_ab._sequentialPatterns):
+class MMSBprefixSpan(_PrefixSpan):
     """
         Multiple Minimum Support Based prefix Span is one of the fundamental algorithm to discover multiple Minimum Support Based sequential frequent patterns in a transactional database.
         This program employs prefix Span property (or downward closure property) to  reduce the search space effectively.
         This algorithm employs depth-first search technique to find the complete set of frequent patterns in a
         transactional database.
-        And use MIS to find the interesting paterns that have low support
+        And use MIS to find the interesting paterns that have low support.
+        The database is encoded with the items renumbered in ascending order of their MIS, so that the MIS of a pattern
+        is the MIS of its smallest item rank.
         Reference:
         ----------
            J. Pei, J. Han, B. Mortazavi-Asl, J. Wang, H. Pinto, Q. Chen, U. Dayal, M. Hsu: Mining Sequential Patterns by Pattern-Growth: The PrefixSpan Approach. IEEE Trans. Knowl. Data Eng. 16(11): 1424-1440 (2004)
@@ -51,24 +55,24 @@ class MMSBprefixSpan(_ab._sequentialPatterns):
                 To store the total amount of USS memory consumed by the program
             memoryRSS : float
                 To store the total amount of RSS memory consumed by the program
-            Database : list
-                To store the transactions of a database in list
             maxLength:int
-                to store the maximum length of sequence pattern
+                to store the maximum number of itemsets of a sequence pattern
             maxGap   :int
                 to store the maximum gap of sequence pattern
-                gap means the length of interval between two itemsets
-            MIS:dict
-                to store the each items MIS
+                gap means the difference between the positions of the itemsets of a sequence matching two consecutive itemsets of the pattern
+            MIS:numpy.ndarray
+                to store the MIS of every item, indexed by its rank
             X:int or float
                 to calculate MIS for each items
+            workers:int
+                Number of processes mining the subtrees of the frequent items in parallel
         Methods:
         -------
             mine()
                 Mining process will start from here
             getPatterns()
                 Complete set of patterns will be retrieved with this function
-            savePatterns(oFile)
+            save(oFile)
                 Complete set of frequent patterns will be loaded in to a output file
             getPatternsAsDataFrame()
                 Complete set of frequent patterns will be loaded in to a dataframe
@@ -78,10 +82,10 @@ class MMSBprefixSpan(_ab._sequentialPatterns):
                 Total amount of RSS memory consumed by the mining process will be retrieved from this function
             getRuntime()
                 Total amount of runtime taken by the mining process will be retrieved from this function
-            candidateToFrequent(candidateList)
-                Generates frequent patterns from the candidate patterns
-            frequentToCandidate(frequentList, length)
-                Generates candidate patterns from the frequent patterns
+            makeSupDatabase(sequences, positions, lastItemset)
+                Counts the frequent extensions of a prefix over its projected database
+            makeNext(sequences, positions, pattern, minRank)
+                Grows every frequent extension of a pattern depth-first
 
 
         Executing the code on terminal:
@@ -104,11 +108,11 @@ class MMSBprefixSpan(_ab._sequentialPatterns):
         Sample run of the importing code:
         ---------------------------------
             import PAMI.multipleMinimumSupportBasedSequentialPattern.basic.MMSBprefixSpan as alg
-            obj = alg.MMSBprefixSpan(iFile, minSup)
+            obj = alg.MMSBprefixSpan(iFile, minSup, X)
             obj.mine()
             frequentPatterns = obj.getPatterns()
             print("Total number of Frequent Patterns:", len(frequentPatterns))
-            obj.savePatterns(oFile)
+            obj.save(oFile)
             Df = obj.getPatternInDataFrame()
             memUSS = obj.getMemoryUSS()
             print("Total Memory in USS:", memUSS)
@@ -120,8 +124,8 @@ class MMSBprefixSpan(_ab._sequentialPatterns):
         --------
             The complete program was written by Suzuki Shota under the supervision of Professor Rage Uday Kiran.
     """
-    def __init__(self,iFile, minSup,X, sep="\t",maxlen=float("inf"),maxGap=float("inf")):
-        super().__init__( iFile, minSup, sep)
+    def __init__(self,iFile, minSup,X, sep="\t",maxlen=float("inf"),maxGap=float("inf"), workers=1):
+        super().__init__( iFile, minSup, sep, workers=workers)
 
 
         self._startTime = float()
@@ -130,454 +134,203 @@ class MMSBprefixSpan(_ab._sequentialPatterns):
 
         self._memoryUSS = float()
         self._memoryRSS = float()
-        self._Database = []
-        self._sepDatabase={}
-        self._maxLength=maxlen
-        self._maxGap=maxGap
-        self._MIS={}
+        self._maxLength=float(maxlen)
+        self._maxGap=float(maxGap)
+        self._MIS=_ab._np.zeros(0)
         self._X=X
 
-    def _creatingItemSets(self):
-        """
-            Storing the complete transactions of the database/input file in a database variable
+    def _itemsetsOf(self, line):
         """
-        self._Database = []
-
-        if isinstance(self._iFile, _ab._pd.DataFrame):
-            temp = []
-            if self._iFile.empty:
-                print("its empty..")
-            i = self._iFile.columns.values.tolist()
-            if 'Transactions' in i:
-                temp = self._iFile['Transactions'].tolist()
-
-            for k in temp:
-                self._Database.append(set(k))
-        if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
-                data = _ab._urlopen(self._iFile)
-                for line in data:
-                    line.strip()
-                    line = line.decode("utf-8")
-                    temp = [i.rstrip() for i in line.split(self._sep)]
-                    temp = [x for x in temp if x]
-                    self._Database.append(set(temp))
-            else:
-                try:
-                    with open(self._iFile, 'r', encoding='utf-8') as f:
-                        for line in f:
-                            line.strip()
-                            temp = [i.rstrip() for i in line.split(self._sep+'-1'+self._sep)]
-                            temp = [x for x in temp if x ]
-
-                            seq = []
-                            for j in temp:
-                                if len(j)>1:
-                                   for i in list(sorted(set(j.split(self._sep)))):
-                                       seq.append(i)
-                                   seq.append(-1)
-
-                                else:
-                                    seq.append(i)
-                                    seq.append(-1)
-                            self._Database.append(seq)
-
-
-                except IOError:
-                    print("File Not Found")
-                    quit()
+        Itemsets of one line of the input database, the items being separated by sep and the itemsets by -1. The -2
+        closing the sequence is not an item
 
-    def _convert(self, value):
+        :param line: the line
+        :type line: str
+        :return: the items of every itemset
+        :rtype: generator
         """
-        To convert the user specified minSup value
-        :param value: user specified minSup value
-        :return: converted type
+        itemsets = line.rstrip().rsplit(self._sepSeq, 1)
+        if len(itemsets) == 2 and itemsets[1].strip() == "-2":
+            line = itemsets[0]
+        itemset = []
+        for item in line.split(self._sep):
+            item = item.strip()
+            if item == self._sepSeq:
+                yield itemset
+                itemset = []
+            elif item:
+                itemset.append(item)
+        yield itemset
+
+    def _itemOrder(self, names, support):
         """
-        if type(value) is int:
-            value = int(value)
-        if type(value) is float:
-            value = (len(self._Database) * value)
-        if type(value) is str:
-            if '.' in value:
-                value = float(value)
-                value = (len(self._Database) * value)
-            else:
-                value = int(value)
-        return value
-    def makeNext(self,sepDatabase,startrow,baseMIS):
-        """
-         To get next pattern by adding head word to next sequence of startrow
-        :param sepDatabase: dict
-            what words and rows startrow have to add it
-        :param startrow:
-            the patterns get before
-        :param baseMIS:
-            base MIS
+        Names of the frequent items in the order of their ranks, ascending MIS first and lexical order among equal
+        MIS, and the MIS vector of the ranks
+
+        :param names: name of every item
+        :type names: list
+        :param support: support of every item
+        :type support: numpy.ndarray
+        :return: the names of the frequent items, indexed by rank
+        :rtype: list
         """
-        for head in sepDatabase.keys():
-            newrow=[i for i in startrow]
-
-            if len(sepDatabase[head])>=self._minSup:
-                newMIS=baseMIS
-                if newrow!=[]:
-                    newrow.append(-1)
-                newrow.append(head)
-                newrow.append(-1)
-                if str(newrow) not in self._finalPatterns:
-                    if baseMIS>self._MIS[head]:
-                        newMIS=self._MIS[head]
-                    if len(sepDatabase[head])>=newMIS:
-                        self._finalPatterns[str(newrow)]=len(sepDatabase[head])
-                    give = [head]
-                    sepDatabase[head] = self.makeSupDatabase(sepDatabase[head], give)
-                    newrow.pop()
-                    seqDatabase, seqDatabaseSame = self.makeSeqDatabaseSame(sepDatabase[head], newrow)
-                    if len(seqDatabase) != 0:
-                        self.makeNext(seqDatabase, newrow,newMIS)
-                    if len(seqDatabaseSame) != 0:
-                        self.makeNextSame(seqDatabaseSame, newrow,newMIS)
-                elif len(sepDatabase[head]) > self._finalPatterns[str(newrow)]:
-                    if baseMIS > self._MIS[head]:
-                        newMIS = self._MIS[head]
-                    if len(sepDatabase[head]) >= newMIS:
-                        self._finalPatterns[str(newrow)] = len(sepDatabase[head])
-                    give = [head]
-                    sepDatabase[head] = self.makeSupDatabase(sepDatabase[head], give)
-                    newrow.pop()
-                    seqDatabase, seqDatabaseSame = self.makeSeqDatabaseSame(sepDatabase[head],newrow)
-                    if len(seqDatabase) != 0:
-                        self.makeNext(seqDatabase, newrow,newMIS)
-                    if len(seqDatabaseSame) != 0:
-                        self.makeNextSame(seqDatabaseSame, newrow,newMIS)
-
+        frequent = _ab._np.flatnonzero(support >= self._minSup)
+        MIS = _MISVector(support[frequent], self._X, self._minSup)
+        order = sorted(range(len(frequent)), key=lambda x: (MIS[x], names[frequent[x]]))
+        self._MIS = MIS[order]
+        return [names[frequent[x]] for x in order]
 
-
-    def makeSupDatabase(self,database,head):
+    def _occurrenceExtensions(self, positions):
         """
-         To delete not frequent words without words in latest sequence
-        :param database: list
-            database of lines have same startrow and head word
-        :param head:list
-         words in latest sequence
-        :return: changed database
+        Support of every item at the given positions, counted once per sequence, and all those positions of every
+        frequent item
 
+        :param positions: positions of the candidate items, possibly repeated
+        :type positions: numpy.ndarray
+        :return: (item, support, sequences, positions) of every frequent item
+        :rtype: list
         """
-
-        supDatabase={}
-        alreadyInData=[]
-        newDatabase = []
-        for line in database:
-            alreadyInLine = []
-            for data in line:
-                    if data not in alreadyInLine:
-                        if data not in alreadyInData:
-                            supDatabase[data]=1
-                            alreadyInData.append(data)
-                        else:
-                            supDatabase[data]+=1
-                        alreadyInLine.append(data)
-        for line in database:
-                newLine=[]
-                for i in line:
-                    if supDatabase[i]>=self._minSup or i in head:
-                        if len(newLine)>1:
-                            if newLine[-1]!=-1 or i!=-1:
-                                newLine.append(i)
-                        else:
-                            newLine.append(i)
-                newDatabase.append(newLine)
-
-        return newDatabase
-
-    def makeNextSame(self,sepDatabase,startrow,baseMIS):
+        size = len(self._items)
+        keys = _ab._np.unique(self._items[positions].astype(_ab._np.int64) * size + positions)
+        items, positions = keys // size, keys % size
+        sequences = self._sequenceOf[positions]
+        pairs = _ab._np.unique(items * self._sequenceCount + sequences)
+        support = _ab._np.bincount(pairs // self._sequenceCount, minlength=len(self._itemNames))
+        extensions = []
+        for item in _ab._np.flatnonzero(support >= self._minSup).tolist():
+            low, high = _ab._np.searchsorted(items, [item, item + 1])
+            extensions.append((item, int(support[item]), sequences[low:high], positions[low:high]))
+        return extensions
+
+    def makeSupDatabase(self, sequences, positions, lastItemset):
         """
-         To get next pattern by adding head word to latest sequence of startrow
-        :param sepDatabase: dict
-            what words and rows startrow have to add it
-        :param startrow:
-            the patterns get before
-        :param baseMIS: base MIS
+        Count the frequent extensions of a prefix over its projected database. Without a gap constraint this is the
+        pseudo-projection of PrefixSpan. With a maximum gap every occurrence of the prefix is kept, as a gap-respecting
+        extension may only be reachable from a later occurrence than the first one
+
+        :param sequences: index of the sequence of every occurrence of the prefix
+        :type sequences: numpy.ndarray
+        :param positions: position of the last item of the prefix in every occurrence
+        :type positions: numpy.ndarray
+        :param lastItemset: items of the last itemset of the prefix, empty for the empty prefix
+        :type lastItemset: tuple
+        :return: (item, isSequenceExtension, support, sequences, positions) of every frequent extension
+        :rtype: list
         """
-        
-        for head in sepDatabase.keys():
-
-            if len(sepDatabase[head])>=self._minSup:
-                newMIS=baseMIS
-                newrow = startrow.copy()
-                newrow.append(head)
-                newrow.append(-1)
-                if str(newrow) not in self._finalPatterns.keys():
-                    if baseMIS>self._MIS[head]:
-                        newMIS=self._MIS[head]
-                    if len(sepDatabase[head])>=newMIS:
-                        self._finalPatterns[str(newrow)]=len(sepDatabase[head])
-                    if -1 in startrow:
-                        give = self.getSameSeq(startrow)
-                    else:
-                        give = startrow.copy()
-                    give.append(head)
-                    sepDatabase[head] = self.makeSupDatabase(sepDatabase[head], give)
-                    print(newrow)
-                    print(len(sepDatabase[head]))
-                    newrow.pop()
-                    seqDatabase, seqDatabaseSame = self.makeSeqDatabaseSame(sepDatabase[head], newrow)
-                    if len(seqDatabase) != 0:
-                        self.makeNext(seqDatabase, newrow,newMIS)
-                    if len(seqDatabaseSame) != 0:
-                        self.makeNextSame(seqDatabaseSame, newrow,newMIS)
-                elif len(sepDatabase[head])>self._finalPatterns[str(newrow)]:
-                    if baseMIS>self._MIS[head]:
-                        newMIS=self._MIS[head]
-                    if len(sepDatabase[head])>=newMIS:
-                        self._finalPatterns[str(newrow)]=len(sepDatabase[head])
-                    if -1 in startrow:
-                        give = self.getSameSeq(startrow)
-                    else:
-                        give = startrow.copy()
-                    give.append(head)
-                    sepDatabase[head] = self.makeSupDatabase(sepDatabase[head], give)
-                    newrow.pop()
-                    seqDatabase,seqDatabaseSame=self.makeSeqDatabaseSame(sepDatabase[head], newrow)
-                    if len(seqDatabase) != 0:
-                        self.makeNext(seqDatabase, newrow,newMIS)
-                    if len(seqDatabaseSame) != 0:
-                        self.makeNextSame(seqDatabaseSame, newrow,newMIS)
-
-
-
-
-
-
-    def makeNewMIS(self,value):
+        if self._maxGap == float("inf"):
+            return super().makeSupDatabase(sequences, positions, lastItemset)
+        if not lastItemset:
+            return [(item, True, support, nextSequences, nextPositions) for item, support, nextSequences, nextPositions
+                    in self._occurrenceExtensions(_ab._np.arange(len(self._items)))]
+        current = self._itemsetOf[positions].astype(_ab._np.int64)
+        lastOfSequence = self._itemsetOf[self._sequenceBounds[sequences + 1] - 1].astype(_ab._np.int64)
+        reach = _ab._np.minimum(current + int(self._maxGap), lastOfSequence)
+        rows, later = self._suffixes(self._itemsetBounds[current + 1], self._itemsetBounds[reach + 1])
+        extensions = [(item, True, support, nextSequences, nextPositions) for item, support, nextSequences,
+                      nextPositions in self._occurrenceExtensions(later)]
+        # the items of an itemset follow in ascending order, so the itemset extensions of an occurrence are the items
+        # after it in its own itemset
+        rows, same = self._suffixes(positions + 1, self._itemsetBounds[current + 1])
+        extensions += [(item, False, support, nextSequences, nextPositions) for item, support, nextSequences,
+                       nextPositions in self._occurrenceExtensions(same)]
+        return extensions
+
+    def makeNext(self, sequences, positions, pattern, minRank):
+        """
+        To grow every frequent extension of a pattern depth-first. An extension is a pattern when its support reaches
+        the MIS of its smallest item rank
+
+        :param sequences: indexes of the projected sequences of the pattern
+        :type sequences: numpy.ndarray
+        :param positions: position where the pattern ends in every projected sequence
+        :type positions: numpy.ndarray
+        :param pattern: the pattern as a tuple of itemsets of item ranks
+        :type pattern: tuple
+        :param minRank: smallest item rank of the pattern
+        :type minRank: int
         """
-                To convert the user specified minSup value
-                :param value: user specified minSup value
-                :return: converted type
-                """
-        if type(self._X) is int:
-            value=value-self._X
-        if type(self._X) is float:
-            value = (value * self._X)
-        if type(self._X) is str:
-            if '.' in self._X:
-                self._X = float(self._X)
-                value = (value * self._X)
+        lastItemset = pattern[-1]
+        for item, isSequence, support, nextSequences, nextPositions in self.makeSupDatabase(sequences, positions,
+                                                                                           lastItemset):
+            if isSequence:
+                if len(pattern) >= self._maxLength:
+                    continue
+                nextPattern = pattern + ((item,),)
             else:
-                self._X = int(self._X)
-                value = value - self._X
-        
-        return value
+                nextPattern = pattern[:-1] + (lastItemset + (item,),)
+            nextRank = min(minRank, item)
+            if support >= self._MIS[nextRank]:
+                self._patterns.append((nextPattern, support))
+            self.makeNext(nextSequences, nextPositions, nextPattern, nextRank)
 
-    def makeMISList(self,seqDatabase):
+    def _decode(self, pattern):
         """
-        make MIS list for each items
-        :param seqDatabase:dict the items and their support
-                
-        """
-        for key,value in seqDatabase.items():
-            value=len(value)
-            if value>=self._minSup:
-                newValue=self.makeNewMIS(value)
-                if newValue>self._minSup:
-                    self._MIS[key]=newValue
-                else:
-                    self._MIS[key]=self._minSup
-
+        Name of a pattern in the final patterns: the items of every itemset followed by -1
 
-
-    def makeSeqDatabaseFirst(self,database):
-        """
-        To make 1 length sequence dataset list which start from same word. It was stored only 1 from 1 line.
-        :param database:
-                To store the transactions of a database in list
+        :param pattern: the pattern as a tuple of itemsets of item ranks
+        :type pattern: tuple
+        :return: the pattern name
+        :rtype: str
         """
-        startrow=[]
-        seqDatabase={}
-        for line in database:
-            alreadyInLine=[]
-            for data in range(len(line)):
-                if line[data] not in alreadyInLine and line[data]!=-1:
-                    if line[data] not in seqDatabase.keys():
-                        seqDatabase[line[data]]=[]
-                        seqDatabase[line[data]].append(line[data+1:])
-                        alreadyInLine.append(line[data])
-                    else:
-                        seqDatabase[line[data]].append(line[data+1:])
-                        alreadyInLine.append(line[data])
-        self.makeMISList(seqDatabase)
-        print("finish making")
-        if len(seqDatabase)>0:
-            self.makeNext(seqDatabase,startrow,100000000000000)
+        row = []
+        for itemset in pattern:
+            row.extend(sorted(self._itemNames[item] for item in itemset))
+            row.append(-1)
+        return str(row)
 
-    def serchSame(self,database,startrow,give):
+    def _mineTask(self, task):
         """
-         To get 2 or more length patterns in same sequence.
-        :param database: list
-            To store the transactions of a database in list which have same startrow and head word
-        :param startrow: list
-            the patterns get before
-        :param give: list
-            the word in latest sequence of startrow
-        :return:
+        Mine the subtree of one frequent item, a task of the process pool
+
+        :param task: the item with its projected sequences and positions
+        :type task: tuple
+        :return: (pattern, support) of every pattern of the subtree below the item
+        :rtype: list
         """
-        sepDatabaseSame= {startrow[-1]: []}
-        for line in database:
-            addLine=0
-            i=0
-            if len(line)>1:
-                while line[i]!=-1:
-                    if line[i]==startrow[-1]:
-                        sepDatabaseSame[startrow[-1]].append(line[i+1:])
-                        addLine=1
-                        break
-                    i+=1
-                if addLine!=1:
-                    ok=[]
-                    while i <len(line):
-                        if line[i]==-1:
-                            ok=[]
-                        elif line[i]==startrow[-1]:
-                            ok.append("sk1")
-                        for x in give:
-                            if x==line[i]:
-                                ok.append(x)
-                        if len(ok)==1+len(give):
-                            sepDatabaseSame[startrow[-1]].append(line[i+1:])
-                            break
-                        i+=1
-        #startrow2=[startrow[0]]
-        startrow.append(-1)
-        return sepDatabaseSame[startrow[-2]]
+        item, sequences, positions = task
+        self._patterns = []
+        self.makeNext(sequences, positions, ((item,),), item)
+        return self._patterns
 
-    def getSameSeq(self,startrow):
+    def _mine(self):
         """
-         To get words in latest sequence
-        :param startrow:
-         the patterns get before
-        :return:
+        Read the database and mine every pattern from the empty prefix, the subtree of every frequent item being an
+        independent task of the process pool
         """
-        give = []
-        newrow = startrow.copy()
-        while newrow[-1] != -1:
-            y = newrow.pop()
-            give.append(y)
-        return give
-
+        self._finalPatterns = {}
+        self._creatingItemSets()
+        self._sequenceOf = _ab._np.repeat(_ab._np.arange(self._sequenceCount), _ab._np.diff(self._sequenceBounds))
+        sequences = _ab._np.arange(self._sequenceCount, dtype=_ab._np.int64)
+        patterns = []
+        tasks = []
+        for item, isSequence, support, nextSequences, nextPositions in self.makeSupDatabase(sequences, sequences, ()):
+            if support >= self._MIS[item]:
+                patterns.append((((item,),), support))
+            size = int((self._sequenceBounds[nextSequences + 1] - nextPositions).sum())
+            tasks.append((size, (item, nextSequences, nextPositions)))
+        with _TaskPool(self, self._workers) as pool:
+            pool.run(tasks, patterns.extend)
+        self._finalPatterns = {self._decode(pattern): support for pattern, support in patterns}
 
-    def makeSeqDatabaseSame(self,database,startrow):
+    def startMine(self):
         """
-            To make sequence dataset list which start from same word(head). It was stored only 1 from 1 line.
-            And it separated by having head in latest sequence of startrow or not.
-
-            :param database:
-                    To store the transactions of a database in list
-            :param startrow: list
-                    the patterns get before
-
-            """
-        seqDatabase={}
-        seqDatabaseSame={}
-        seqLength=startrow.count(-1)+1
-        for line in database:
-            if len(line)>1:
-                alreadyInLine=[]
-                i = 0
-                while line[i] != -1:
-                        if line[i] not in seqDatabaseSame:
-                            if -1 in startrow:
-                                give=self.getSameSeq(startrow)
-                            else:
-                                give=startrow.copy()
-                            newrow= [startrow[-1], line[i]]
-                            seqDatabaseSame[line[i]] = self.serchSame(database, newrow,give)
-
-                        i += 1
-                same=0
-                seqCount=0
-                if self._maxLength>seqLength:
-                    while len(line)>i and self._maxGap>seqCount:
-                        if line[i]!=-1:
-                            if line[i] not in alreadyInLine:
-                                if line[i] not in seqDatabase:
-                                    seqDatabase[line[i]]=[]
-                                seqDatabase[line[i]].append(line[i + 1:])
-                                alreadyInLine.append(line[i])
-                            if line[i]==startrow[-1]:
-                                same=1
-
-
-                            elif same==1 and line[i] not in seqDatabaseSame:
-                                if -1 in startrow:
-                                    give=self.getSameSeq(startrow)
-                                else:
-                                    give=startrow.copy()
-                                newrow= [startrow[-1], line[i]]
-                                seqDatabaseSame[line[i]] = self.serchSame(database, newrow,give)
-
-                        else:
-                            same=0
-                            seqCount+=1
-                        i+=1
-
-        return seqDatabase,seqDatabaseSame
-
-
-
+            Frequent pattern mining process will start from here
+        """
+        self.mine()
 
-    def startMine(self):
+    def mine(self):
         """
             Frequent pattern mining process will start from here
         """
-        self._Database = []
         self._startTime = _ab._time.time()
-        self._creatingItemSets()
-        self._Database=self.makeSupDatabase(self._Database,"")
-        self._minSup = self._convert(self._minSup)
-        self.makeSeqDatabaseFirst(self._Database)
+        self._mine()
         self._endTime = _ab._time.time()
         process = _ab._psutil.Process(_ab._os.getpid())
         self._memoryUSS = float()
         self._memoryRSS = float()
         self._memoryUSS = process.memory_full_info().uss
         self._memoryRSS = process.memory_info().rss
-        print("Frequent patterns were generated successfully using Apriori algorithm ")
-
-    def getMemoryUSS(self):
-        """Total amount of USS memory consumed by the mining process will be retrieved from this function
-        :return: returning USS memory consumed by the mining process
-        :rtype: float
-        """
-
-        return self._memoryUSS
-
-    def getMemoryRSS(self):
-        """Total amount of RSS memory consumed by the mining process will be retrieved from this function
-        :return: returning RSS memory consumed by the mining process
-        :rtype: float
-        """
-
-        return self._memoryRSS
-
-    def getRuntime(self):
-        """Calculating the total amount of runtime taken by the mining process
-        :return: returning total amount of runtime taken by the mining process
-        :rtype: float
-        """
-
-        return self._endTime - self._startTime
-
-    def getPatternsAsDataFrame(self):
-        """Storing final frequent patterns in a dataframe
-        :return: returning frequent patterns in a dataframe
-        :rtype: pd.DataFrame
-        """
-
-        dataFrame = {}
-        data = []
-        for a, b in self._finalPatterns.items():
-            data.append([a, b])
-            dataFrame = _ab._pd.DataFrame(data, columns=['Patterns', 'Support'])
-        return dataFrame
+        print("Frequent patterns were generated successfully using MMSBprefixSpan algorithm ")
 
     def save(self, outFile):
         """Complete set of frequent patterns will be loaded in to a output file
@@ -590,13 +343,6 @@ class MMSBprefixSpan(_ab._sequentialPatterns):
             s1 = x + ":" + str(y)
             writer.write("%s \n" % s1)
 
-    def getPatterns(self):
-        """ Function to send the set of frequent patterns after completion of the mining process
-        :return: returning frequent patterns
-        :rtype: dict
-        """
-        return self._finalPatterns
-
     def printResults(self):
         print("Total number of Frequent Patterns:", len(self.getPatterns()))
         print("Total Memory in USS:", self.getMemoryUSS())
@@ -606,19 +352,19 @@ class MMSBprefixSpan(_ab._sequentialPatterns):
 
 if __name__ == "__main__":
     _ap = str()
-    if len(_ab._sys.argv) >= 4 or len(_ab._sys.argv) <= 7:
+    if len(_ab._sys.argv) >= 5 and len(_ab._sys.argv) <= 8:
+        if len(_ab._sys.argv) == 8:
+            _ap = MMSBprefixSpan(_ab._sys.argv[1], _ab._sys.argv[3], _ab._sys.argv[4],_ab._sys.argv[5],_ab._sys.argv[6],_ab._sys.argv[7])
         if len(_ab._sys.argv) == 7:
             _ap = MMSBprefixSpan(_ab._sys.argv[1], _ab._sys.argv[3], _ab._sys.argv[4],_ab._sys.argv[5],_ab._sys.argv[6])
         if len(_ab._sys.argv) == 6:
-            _ap = MMSBprefixSpan(_ab._sys.argv[1], _ab._sys.argv[3], _ab._sys.argv[4],_ab._sys.argv[5],_ab._sys.argv[6])
-        if len(_ab._sys.argv) == 5:
             _ap = MMSBprefixSpan(_ab._sys.argv[1], _ab._sys.argv[3], _ab._sys.argv[4],_ab._sys.argv[5])
-        if len(_ab._sys.argv) == 4:
+        if len(_ab._sys.argv) == 5:
             _ap = MMSBprefixSpan(_ab._sys.argv[1], _ab._sys.argv[3],_ab._sys.argv[4])
         _ap.mine()
         _Patterns = _ap.getPatterns()
         print("Total number of Frequent Patterns:", len(_Patterns))
-        _ap.savePatterns(_ab._sys.argv[2])
+        _ap.save(_ab._sys.argv[2])
         _memUSS = _ap.getMemoryUSS()
         print("Total Memory in USS:", _memUSS)
         _memRSS = _ap.getMemoryRSS()
@@ -59,9 +59,137 @@ import pandas as pd
 from deprecated import deprecated
 
 from PAMI.sequentialPattern.basic import abstract as _ab
+from PAMI.sequentialPattern.basic._parallelMiner import _TaskPool
 
 _ab._sys.setrecursionlimit(10000)
 
+
+class _HashNode:
+    """
+    A node of the candidate hash tree. An interior node sends the candidates to its children by the item at its depth,
+    a leaf keeps the candidates themselves
+
+    :Attributes:
+
+        children : dict
+            child node of every item, None for a leaf
+        candidates : list
+            (index, items, elements) of the candidates of a leaf
+    """
+    __slots__ = ('children', 'candidates')
+
+    def __init__(self):
+        self.children = None
+        self.candidates = []
+
+
+class _HashTree:
+    """
+    :Description: Hash tree over the candidates of one level of GSP. A node at depth d hashes the candidates on their
+                  d-th item and a leaf is split once it holds more than leafSize candidates. A sequence reaches a leaf
+                  only through items which may follow each other under the time constraints, so that a single pass
+                  over the database counts every candidate of the level.
+
+    :Attributes:
+
+        length : int
+            number of items of every candidate
+        leafSize : int
+            largest number of candidates of a leaf before it is split
+
+    :Methods:
+
+        insert(index, items, elements)
+            Add a candidate to the tree
+        leaves(sequence, window, span)
+            Leaves reached by the items of a sequence
+    """
+
+    def __init__(self, length, leafSize=8):
+        self._length = length
+        self._leafSize = leafSize
+        self._root = _HashNode()
+
+    def insert(self, index, items, elements):
+        """
+        Add a candidate to the tree
+
+        :param index: index of the candidate
+        :type index: int
+        :param items: items of the candidate in order
+        :type items: list
+        :param elements: itemsets of the candidate
+        :type elements: list
+        """
+        node = self._root
+        depth = 0
+        while node.children is not None:
+            node = node.children.setdefault(items[depth], _HashNode())
+            depth += 1
+        node.candidates.append((index, items, elements))
+        if len(node.candidates) > self._leafSize and depth < self._length:
+            self._split(node, depth)
+
+    def _split(self, node, depth):
+        """
+        Turn a full leaf into an interior node hashing on the item at its depth
+
+        :param node: the leaf
+        :type node: _HashNode
+        :param depth: depth of the leaf
+        :type depth: int
+        """
+        candidates = node.candidates
+        node.children = {}
+        node.candidates = []
+        for candidate in candidates:
+            node.children.setdefault(candidate[1][depth], _HashNode()).candidates.append(candidate)
+        if depth + 1 < self._length:
+            for child in node.children.values():
+                if len(child.candidates) > self._leafSize:
+                    self._split(child, depth + 1)
+
+    def leaves(self, sequence, window, span):
+        """
+        Leaves reached by a sequence. From an item at position p the next item of a contained candidate lies between
+        p - window and p + span
+
+        :param sequence: itemsets of the sequence
+        :type sequence: list
+        :param window: largest distance between the items of one itemset of a candidate
+        :type window: int
+        :param span: largest distance from an item to the next item of a candidate
+        :type span: int or float
+        :return: the leaves reached
+        :rtype: list
+        """
+        found = {}
+        seen = set()
+        length = len(sequence)
+        stack = []
+        if self._root.children is None:
+            return [self._root]
+        for position, itemset in enumerate(sequence):
+            for item in itemset:
+                child = self._root.children.get(item)
+                if child is not None and (id(child), position) not in seen:
+                    seen.add((id(child), position))
+                    stack.append((child, position))
+        while stack:
+            node, position = stack.pop()
+            if node.children is None:
+                found[id(node)] = node
+                continue
+            last = length - 1 if position + span >= length else int(position + span)
+            for other in range(max(0, position - window), last + 1):
+                for item in sequence[other]:
+                    child = node.children.get(item)
+                    if child is not None and (id(child), other) not in seen:
+                        seen.add((id(child), other))
+                        stack.append((child, other))
+        return list(found.values())
+
+
 class GSP(_ab._sequentialPatterns):
     """
     :Description:
@@ -81,6 +209,14 @@ class GSP(_ab._sequentialPatterns):
                     Example: minSup=10 will be treated as integer, while minSup=10.0 will be treated as float
     :param  sep: str :
                    This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.
+    :param  workers: int :
+                   Number of processes counting the candidates of every first item in parallel. The default counts in this process.
+    :param  minGap: int :
+                   An itemset of a pattern starts more than minGap itemsets after the end of the previous one. The default is 0.
+    :param  maxGap: int :
+                   An itemset of a pattern ends at most maxGap itemsets after the start of the previous one. The default is no limit.
+    :param  window: int :
+                   The items of one itemset of a pattern may be spread over window + 1 consecutive itemsets of a sequence. The default is 0.
 
     :Attributes:
 
@@ -114,6 +250,14 @@ class GSP(_ab._sequentialPatterns):
                 To store the datas in same sequence separated by sequence, rownumber, length.
             _seqSep   :str
                 separator to separate each itemset
+            _sequences : list
+                the sequences of the database as lists of itemsets
+            _minGap : int
+                smallest gap between consecutive itemsets of a pattern
+            _maxGap : int or float
+                largest distance from the start of an itemset of a pattern to the end of the next one
+            _window : int
+                largest spread of one itemset of a pattern
 
     :Methods:
 
@@ -135,6 +279,8 @@ class GSP(_ab._sequentialPatterns):
                 Generates frequent patterns from the candidate patterns
             frequentToCandidate(frequentList, length)
                 Generates candidate patterns from the frequent patterns
+            countCandidates(candidates)
+                Counts all candidates of a level in one pass over the database with a hash tree
 
     **Methods to execute code on terminal**
     -------------------------------------------
@@ -202,6 +348,14 @@ class GSP(_ab._sequentialPatterns):
     _Database = []
     _xLenDatabase={}
     _xLenDatabaseSame = {}
+    _sequences = []
+
+    def __init__(self, iFile, minSup, sep="\t", sepSeq="-1", workers=1, minGap=0, maxGap=float("inf"), window=0):
+        super().__init__(iFile, minSup, sep, sepSeq, workers)
+        self._minGap = int(minGap)
+        self._maxGap = float(maxGap)
+        self._window = int(window)
+
     def _creatingItemSets(self):
         """
         Storing the complete transactions of the database/input file in a database variable
@@ -336,55 +490,141 @@ class GSP(_ab._sequentialPatterns):
             
             
         
+    def _cover(self, element, sequence, start):
+        """
+        End of the shortest run of itemsets from start which together hold the element, within the time window
+
+        :param element: itemset of a pattern
+        :type element: set
+        :param sequence: itemsets of a sequence
+        :type sequence: list
+        :param start: first itemset of the run
+        :type start: int
+        :return: last itemset of the run, None when the window is too small
+        :rtype: int
+        """
+        needed = element - sequence[start]
+        end = start
+        while needed:
+            end += 1
+            if end - start > self._window or end >= len(sequence):
+                return None
+            needed = needed - sequence[end]
+        return end
+
+    def contains(self, elements, sequence):
+        """
+        To check the pattern is included in the sequence under the window and gap constraints
+
+        :param elements: itemsets of the pattern
+        :type elements: list
+        :param sequence: itemsets of the sequence
+        :type sequence: list
+        :return: True when the sequence holds the pattern
+        :rtype: bool
+        """
+        failed = set()
+
+        def place(index, lastStart, lastEnd):
+            if index == len(elements):
+                return True
+            first = 0 if index == 0 else lastEnd + self._minGap + 1
+            for start in range(first, len(sequence)):
+                if index and start - lastStart > self._maxGap:
+                    break
+                if (index, start) in failed:
+                    continue
+                end = self._cover(elements[index], sequence, start)
+                if end is None or (index and end - lastStart > self._maxGap):
+                    continue
+                if place(index + 1, start, end):
+                    return True
+                failed.add((index, start))
+            return False
+
+        return place(0, -1, -1)
+
     def getSup(self,pattern):
         """
         count up the support of the pattern
         :param pattern:list the candidate pattern
         :return:  sup:int  the support of the pattern
         """
-        sup=0
-        pattern=self.list_split(pattern)
-        for seq in self._Database:
-            
-            sup+=self.checkPattern(pattern,seq)
-        return sup
+        elements = [set(element) for element in self.list_split(pattern)]
+        return sum(1 for seq in self._sequences if self.contains(elements, seq))
         
-    def make2LenDatabase(self):
+    def make2LenDatabase(self, pool=None):
         """
         To make 2 length frequent patterns by joining two one length patterns by breadth-first search technique  and update xlen Database to sequential database
+        :param pool: process pool counting the candidates, the candidates are counted in this process when not given
+        :type pool: _TaskPool
         :return:  nextPatterns:List  the patterns found
        
         """
         self._xLenDatabase = {}
         keyList=[i for i in self._finalPatterns.keys()]
         keyNumber=0
-        nextPatterns=[]
+        candidates=[]
         
         for key1 in keyList:
-            newPattern1=[key1,self._sepSeq,key1]
-            sup=self.getSup(newPattern1)
-            if sup>=self._minSup:
-                self._finalPatterns[tuple(newPattern1)]=sup
-                nextPatterns.append(newPattern1)
+            candidates.append([key1,self._sepSeq,key1])
             keyNumber+=1
             for key2 in keyList[keyNumber:]:
-                newPattern1=[key1,self._sepSeq,key2]
-                sup=self.getSup(newPattern1)
-                if sup>=self._minSup:
-                    self._finalPatterns[tuple(newPattern1)]=sup
-                    nextPatterns.append(newPattern1)
-                newPattern2=[key2,self._sepSeq,key1]
-                sup=self.getSup(newPattern2)
-                if sup>=self._minSup:
-                    self._finalPatterns[tuple(newPattern2)]=sup
-                    nextPatterns.append(newPattern2)
-                newPattern3=list(sorted(set([key1,key2])))
-                sup=self.getSup(newPattern3)
-                if sup>=self._minSup:
-                    self._finalPatterns[tuple(newPattern3)]=sup
-                    nextPatterns.append(newPattern3)
+                candidates.append([key1,self._sepSeq,key2])
+                candidates.append([key2,self._sepSeq,key1])
+                candidates.append(list(sorted(set([key1,key2]))))
+        return self.countCandidates(candidates, pool)
+
+    def countCandidates(self, candidates, pool=None):
+        """
+        Count the support of the candidates and keep the frequent ones. Every task of the process pool counts its
+        candidates in one pass over the database. The candidates sharing their first item go to the same task, so
+        with a single worker the whole level is counted in one pass
+        :param candidates: list the candidate patterns
+        :param pool: process pool counting the candidates, the candidates are counted in this process when not given
+        :type pool: _TaskPool
+        :return:  nextPatterns:list  the frequent candidates
+        """
+        groups = {}
+        for pattern in candidates:
+            groups.setdefault(pattern[0], []).append(pattern)
+        frequent = []
+        if pool is None:
+            pool = _TaskPool(self, 1)
+        tasks = [[] for _ in range(max(1, min(self._workers, len(groups))))]
+        for group in sorted(groups.values(), key=len, reverse=True):
+            min(tasks, key=len).extend(group)
+        pool.run([(len(task), task) for task in tasks if task], frequent.extend)
+        nextPatterns=[]
+        for pattern, sup in frequent:
+            self._finalPatterns[tuple(pattern)]=sup
+            nextPatterns.append(pattern)
         return nextPatterns
 
+    def _mineTask(self, candidates):
+        """
+        Count the candidates of one task of the process pool. The candidates are put in a hash tree and every sequence
+        of the database descends the tree once, checking only the candidates of the leaves it reaches
+
+        :param candidates: candidates of the same length
+        :type candidates: list
+        :return: (pattern, support) of every frequent candidate
+        :rtype: list
+        """
+        length = sum(1 for item in candidates[0] if item != self._sepSeq)
+        tree = _HashTree(length)
+        for index, pattern in enumerate(candidates):
+            tree.insert(index, [item for item in pattern if item != self._sepSeq],
+                        [set(element) for element in self.list_split(pattern)])
+        span = max(self._window, self._maxGap)
+        counts = [0] * len(candidates)
+        for seq in self._sequences:
+            for leaf in tree.leaves(seq, self._window, span):
+                for index, items, elements in leaf.candidates:
+                    if self.contains(elements, seq):
+                        counts[index] += 1
+        return [(pattern, sup) for pattern, sup in zip(candidates, counts) if sup >= self._minSup]
+
     def makeCandidateDatabase(self,patterns):
         """
         make the database to find new candidate
@@ -438,21 +678,16 @@ class GSP(_ab._sequentialPatterns):
         
             
     
-    def makexLenDatabase(self,patterns):
+    def makexLenDatabase(self,patterns, pool=None):
         """
         To make 3 or more length frequent patterns from pattern which the latest word is in different seq  by depth-first search technique  and update xlenDatabase to sequential database
 
         :param patterns: patterns
+        :param pool: process pool counting the candidates, the candidates are counted in this process when not given
+        :type pool: _TaskPool
         
         """
-        patterns=self.makeCandidate(patterns)
-        nextPatterns=[]
-        for pattern in patterns:
-                sup=self.getSup(pattern)
-                if sup>=self._minSup:
-                    self._finalPatterns[tuple(pattern)]=sup
-                    nextPatterns.append(pattern)
-        return nextPatterns
+        return self.countCandidates(self.makeCandidate(patterns), pool)
                     
     def startMine(self) -> None:
         self.mine()
@@ -464,11 +699,13 @@ class GSP(_ab._sequentialPatterns):
         self._Database = []
         self._startTime = _ab._time.time()
         self._creatingItemSets()
+        self._sequences = [[set(itemset) for itemset in seq] for seq in self._Database]
         self._minSup = self._convert(self._minSup)
         self.make1LenDatabase()
-        nextPatterns=self.make2LenDatabase()
-        while len(nextPatterns)>0:
-            nextPatterns= self.makexLenDatabase(nextPatterns)
+        with _TaskPool(self, self._workers) as pool:
+            nextPatterns=self.make2LenDatabase(pool)
+            while len(nextPatterns)>0:
+                nextPatterns= self.makexLenDatabase(nextPatterns, pool)
         self._endTime = _ab._time.time()
         process = _ab._psutil.Process(_ab._os.getpid())
         self._memoryUSS = float()
@@ -58,7 +58,7 @@ from deprecated import deprecated
 
 #from PAMI.sequentialPatternMining.basic import abstract as _ab
 from PAMI.sequentialPattern.basic import abstract as _ab
-import copy
+from PAMI.sequentialPattern.basic._parallelMiner import _TaskPool
 import re
 _ab._sys.setrecursionlimit(10000)
 
@@ -80,6 +80,8 @@ class PrefixSpan(_ab._sequentialPatterns):
                     Example: minSup=10 will be treated as integer, while minSup=10.0 will be treated as float
     :param  sep: str :
                    This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.
+    :param  workers: int :
+                   Number of processes mining the subtrees of the frequent items in parallel. The default mines in this process.
 
     :Attributes:
 
@@ -105,8 +107,14 @@ class PrefixSpan(_ab._sequentialPatterns):
             To store the total amount of USS memory consumed by the program
         memoryRSS : float
             To store the total amount of RSS memory consumed by the program
-        Database : list
-            To store the transactions of a database in list
+        itemNames : list
+            To store the names of the frequent items in lexical order, indexed by their rank
+        items : numpy.ndarray
+            To store the encoded database as one flat array of item ranks
+        itemsetBounds : numpy.ndarray
+            To store the start position of every itemset in the encoded database
+        sequenceBounds : numpy.ndarray
+            To store the start position of every sequence in the encoded database
 
     :Methods:
 
@@ -124,10 +132,10 @@ class PrefixSpan(_ab._sequentialPatterns):
             Total amount of RSS memory consumed by the mining process will be retrieved from this function
         getRuntime()
             Total amount of runtime taken by the mining process will be retrieved from this function
-        candidateToFrequent(candidateList)
-            Generates frequent patterns from the candidate patterns
-        frequentToCandidate(frequentList, length)
-            Generates candidate patterns from the frequent patterns
+        makeSupDatabase(sequences, positions, lastItemset)
+            Counts the frequent extensions of a prefix over its pseudo-projected database
+        makeNext(sequences, positions, pattern)
+            Grows every frequent extension of a pattern depth-first
 
     **Methods to execute code on terminal**
     ------------------------------------------
@@ -191,57 +199,106 @@ class PrefixSpan(_ab._sequentialPatterns):
     _sep = " "
     _memoryUSS = float()
     _memoryRSS = float()
-    _Database = []
-    _sepDatabase={}
-    def _creatingItemSets(self):
+
+    def _readLines(self):
         """
-        Storing the complete transactions of the database/input file in a database variable
+        Lines of the input database, one sequence per line with its itemsets separated by ':'
         """
-        self._Database = []
-
         if isinstance(self._iFile, _ab._pd.DataFrame):
-            temp = []
             if self._iFile.empty:
                 print("its empty..")
-            i = self._iFile.columns.values.tolist()
-            if 'Transactions' in i:
-                temp = self._iFile['Transactions'].tolist()
-
-            for k in temp:
-                self._Database.append(set(k))
+            elif 'Transactions' in self._iFile.columns:
+                for line in self._iFile['Transactions']:
+                    yield line if isinstance(line, str) else ':'.join(line)
         if isinstance(self._iFile, str):
             if _ab._validators.url(self._iFile):
-                data = _ab._urlopen(self._iFile)
-                for line in data:
-                    line.strip()
-                    line = line.decode("utf-8")
-                    temp = [i.rstrip() for i in line.split(self._sep)]
-                    temp = [x for x in temp if x]
-                    self._Database.append(set(temp))
+                for line in _ab._urlopen(self._iFile):
+                    yield line.decode("utf-8")
             else:
                 try:
                     with open(self._iFile, 'r', encoding='utf-8') as f:
                         for line in f:
-                            line.strip()
-                            temp = [i.rstrip() for i in line.split(':')]
-                            temp = [x for x in temp if x ]
+                            yield line
+                except IOError:
+                    print("File Not Found")
+                    quit()
 
-                            seq = []
-                            for i in temp:
-                                if len(i)>1:
-                                   for j in list(sorted(set(i.split()))):
-                                       seq.append(j)
-                                   seq.append(":")
+    def _itemsetsOf(self, line):
+        """
+        Itemsets of one line of the input database, separated by ':'
 
-                                else:
-                                    seq.append(i)
-                                    seq.append(":")
-                            self._Database.append(seq)
+        :param line: the line
+        :type line: str
+        :return: the items of every itemset
+        :rtype: generator
+        """
+        for itemset in line.split(':'):
+            yield itemset.split()
 
+    def _itemOrder(self, names, support):
+        """
+        Names of the frequent items in the order of their ranks, here the lexical order
 
-                except IOError:
-                    print("File Not Found")
-                    quit()
+        :param names: name of every item
+        :type names: list
+        :param support: support of every item
+        :type support: numpy.ndarray
+        :return: the names of the frequent items, indexed by rank
+        :rtype: list
+        """
+        return sorted(names[item] for item in _ab._np.flatnonzero(support >= self._minSup))
+
+    def _creatingItemSets(self):
+        """
+        Storing the complete sequences of the database/input file as one immutable encoded database. Infrequent items
+        are dropped, the frequent ones are renamed to their rank in the item order and every sequence is laid out as a
+        slice of the flat item array, itemset after itemset, with the items of an itemset in ascending order
+        """
+        itemIds = {}
+        names = []
+        items, itemsets, sequences = _ab._array('i'), _ab._array('i'), _ab._array('i')
+        itemsetCount = 0
+        sequenceCount = 0
+        for line in self._readLines():
+            for itemset in self._itemsetsOf(line):
+                if not itemset:
+                    continue
+                for name in set(itemset):
+                    item = itemIds.get(name)
+                    if item is None:
+                        item = itemIds[name] = len(names)
+                        names.append(name)
+                    items.append(item)
+                    itemsets.append(itemsetCount)
+                    sequences.append(sequenceCount)
+                itemsetCount += 1
+            sequenceCount += 1
+        self._sequenceCount = sequenceCount
+        self._minSup = self._convert(self._minSup)
+
+        items = _ab._np.frombuffer(items, dtype=_ab._np.int32).astype(_ab._np.int64)
+        itemsets = _ab._np.frombuffer(itemsets, dtype=_ab._np.int32)
+        sequences = _ab._np.frombuffer(sequences, dtype=_ab._np.int32)
+        support = _ab._np.bincount(_ab._np.unique(items * max(sequenceCount, 1) + sequences) // max(sequenceCount, 1),
+                                   minlength=len(names))
+        self._itemNames = self._itemOrder(names, support)
+        rank = _ab._np.full(len(names) + 1, -1, dtype=_ab._np.int64)
+        for newName, name in enumerate(self._itemNames):
+            rank[itemIds[name]] = newName
+        items = rank[items]
+        keep = items >= 0
+        items, itemsets, sequences = items[keep], itemsets[keep], sequences[keep]
+        order = _ab._np.lexsort((items, itemsets))
+        self._items = items[order].astype(_ab._np.int32)
+        itemsets = itemsets[order]
+        sequences = sequences[order]
+        # itemsets left empty by the dropped items disappear with the renumbering
+        changes = _ab._np.flatnonzero(itemsets[1:] != itemsets[:-1]) + 1
+        self._itemsetOf = _ab._np.zeros(len(self._items), dtype=_ab._np.int32)
+        self._itemsetOf[changes] = 1
+        self._itemsetOf = _ab._np.cumsum(self._itemsetOf, dtype=_ab._np.int32)
+        self._itemsetBounds = _ab._np.concatenate(([0], changes, [len(self._items)])).astype(_ab._np.int64)
+        self._sequenceBounds = _ab._np.searchsorted(sequences, _ab._np.arange(sequenceCount + 1)).astype(_ab._np.int64)
 
     def _convert(self, value):
         """
@@ -253,284 +310,171 @@ class PrefixSpan(_ab._sequentialPatterns):
         if type(value) is int:
             value = int(value)
         if type(value) is float:
-            value = (len(self._Database) * value)
+            value = (self._sequenceCount * value)
         if type(value) is str:
             if '.' in value:
                 value = float(value)
-                value = (len(self._Database) * value)
+                value = (self._sequenceCount * value)
             else:
                 value = int(value)
         return value
-    def makeNext(self,sepDatabase,startrow):
-        """
-        To get next pattern by adding head word to next sequence of startrow
-
-        :param sepDatabase: dict
-            what words and rows startrow have to add it.
-        :param startrow:
-            the patterns get before
-        """
-        for head in sepDatabase.keys():
-            newrow=[i for i in startrow]
-
-            if len(sepDatabase[head])>=self._minSup:
-                if newrow:
-                    newrow.append(":")
-                newrow.append(head)
-                newrow.append(":")
-                if str(newrow) not in self._finalPatterns:
-                    self._finalPatterns[str(newrow)]=len(sepDatabase[head])
-                    give = [head]
-                    sepDatabase[head] = self.makeSupDatabase(sepDatabase[head], give)
-                    newrow.pop()
-                    self.makeSeqDatabaseSame(sepDatabase[head], newrow)
-                elif len(sepDatabase[head]) > self._finalPatterns[str(newrow)]:
-                    self._finalPatterns[str(newrow)] = len(sepDatabase[head])
-                    give = [head]
-                    sepDatabase[head] = self.makeSupDatabase(sepDatabase[head], give)
-                    newrow.pop()
-                    self.makeSeqDatabaseSame(sepDatabase[head], newrow)
-
-
-
-    def makeSupDatabase(self,database,head):
-        """
-        To delete not frequent words without words in the latest sequence
-
-        :param database: list
-            database of lines having same startrow and head word
-        :param head:list
-         words in the latest sequence
-        :return: changed database
-        """
-
-        supDatabase={}
-        alreadyInData=[]
-        newDatabase = []
-        for line in database:
-            alreadyInLine = []
-            for data in line:
-                    if data not in alreadyInLine:
-                        if data not in alreadyInData:
-                            supDatabase[data]=1
-                            alreadyInData.append(data)
-                        else:
-                            supDatabase[data]+=1
-                        alreadyInLine.append(data)
-        for line in database:
-                newLine=[]
-                for i in line:
-                    if supDatabase[i]>=self._minSup or i in head:
-                        if len(newLine)>1:
-                            if newLine[-1]!= ":" or i!= ":":
-                                newLine.append(i)
-                        else:
-                            newLine.append(i)
-                newDatabase.append(newLine)
-
-        return newDatabase
-
-    def makeNextSame(self,sepDatabase,startrow):
-        """
-         To get next pattern by adding head word to the latest sequence of startrow
-
-        :param sepDatabase: dict
-            what words and rows startrow have to add it
-        :param startrow:
-            the patterns get before
-        """
-        for head in sepDatabase.keys():
-
-            if len(sepDatabase[head])>=self._minSup:
-                newrow = startrow.copy()
-                newrow.append(head)
-                newrow.append(":")
-                if str(newrow) not in self._finalPatterns.keys():
-                    self._finalPatterns[str(newrow)]=len(sepDatabase[head])
-                    if ":" in startrow:
-                        give = self.getSameSeq(startrow)
-                    else:
-                        give = startrow.copy()
-                    give.append(head)
-                    sepDatabase[head] = self.makeSupDatabase(sepDatabase[head], give)
-                    newrow.pop()
-                    self.makeSeqDatabaseSame(sepDatabase[head], newrow)
-                elif len(sepDatabase[head])>self._finalPatterns[str(newrow)]:
-                    self._finalPatterns[str(newrow)] = len(sepDatabase[head])
-                    if ":" in startrow:
-                        give = self.getSameSeq(startrow)
-                    else:
-                        give = startrow.copy()
-                    give.append(head)
-                    sepDatabase[head] = self.makeSupDatabase(sepDatabase[head], give)
-                    newrow.pop()
-                    self.makeSeqDatabaseSame(sepDatabase[head], newrow)
-    def makeSeqDatabaseFirst(self,database):
-        """
-        To make 1 length sequence dataset list which start from same word. It was stored only 1 from 1 line.
-
-        :param database:
-            To store the transactions of a database in list
-        """
-        startrow=[]
-        seqDatabase={}
-
-        for line in database:
-            alreadyInLine=[]
-            for data in range(len(line)):
-                if line[data] not in alreadyInLine and line[data]!=":":
-                    if line[data] not in seqDatabase.keys():
-                        seqDatabase[line[data]]=[]
-                        seqDatabase[line[data]].append(line[data+1:])
-                        alreadyInLine.append(line[data])
-                    else:
-                        seqDatabase[line[data]].append(line[data+1:])
-                        alreadyInLine.append(line[data])
-
-        if len(seqDatabase)>0:
-            self.makeNext(seqDatabase,startrow)
-
-    def serchSame(self,database,startrow,give):
-        """
-        To get 2 or more length patterns in same sequence.
-
-        :param database: list
-            To store the transactions of a database in list which have same startrow and head word
-        :param startrow: list
-            the patterns get before
-        :param give: list
-            the word in the latest sequence of startrow
-        """
-        sepDatabaseSame= {startrow[-1]: []}
-        for line in database:
-            addLine=0
-            i=0
-            if len(line)>1:
-                while line[i]!=":":
-                    if line[i]==startrow[-1]:
-                        sepDatabaseSame[startrow[-1]].append(line[i+1:])
-                        addLine=1
-                        break
-                    i+=1
-                if addLine!=1:
-                    ok=[]
-                    while i <len(line):
-                        if line[i]==":":
-                            ok=[]
-                        elif line[i]==startrow[-1]:
-                            ok.append("sk1")
-                        for x in give:
-                            if x==line[i]:
-                                ok.append(x)
-                        if len(ok)==1+len(give):
-                            sepDatabaseSame[startrow[-1]].append(line[i+1:])
-                            break
-                        i+=1
-        startrow2=[startrow[0]]
-        startrow.append(":")
-        if str(startrow) not in self._finalPatterns.keys():
-                self.makeNextSame(sepDatabaseSame,startrow2)
-        elif self._finalPatterns[str(startrow)]<len(sepDatabaseSame[startrow[-2]]):
-            self.makeNextSame(sepDatabaseSame,startrow2)
-        return sepDatabaseSame[startrow[-2]]
-
-    def getSameSeq(self,startrow):
-        """
-         To get words in the latest sequence
-        :param startrow: the patterns get before
-
-        """
-        give = []
-        newrow = startrow.copy()
-        while newrow[-1] != ":":
-            y = newrow.pop()
-            give.append(y)
-        return give
-
-    def makeSeqDatabaseSame(self,database,startrow):
-        """
-        To make sequence dataset list which start from same word(head). It was stored only 1 from 1 line.
-        And it separated by having head in the latest sequence of startrow or not.
-
-        :param database:
-                To store the transactions of a database in list
-        :param startrow: the patterns get before
-
-        """
-        seqDatabase={}
-        seqDatabaseSame={}
-        for line in database:
-            if len(line)>1:
-                alreadyInLine=[]
-                i = 0
-                while line[i] != ":":
-                        if line[i] not in seqDatabaseSame:
-                            if ":" in startrow:
-                                give=self.getSameSeq(startrow)
-                            else:
-                                give=startrow.copy()
-                            newrow= [startrow[-1], line[i]]
-                            seqDatabaseSame[line[i]] = self.serchSame(database, newrow,give)
-
-                        i += 1
-                same=0
-                while len(line)>i:
-                    if line[i]!=":":
-                        if line[i] not in alreadyInLine:
-                            if line[i] not in seqDatabase:
-                                seqDatabase[line[i]]=[]
-                            seqDatabase[line[i]].append(line[i + 1:])
-                            alreadyInLine.append(line[i])
-                        if line[i]==startrow[-1]:
-                            same=1
-
-                        elif same==1 and line[i] not in seqDatabaseSame:
-                            if ":" in startrow:
-                                give=self.getSameSeq(startrow)
-                            else:
-                                give=startrow.copy()
-                            newrow= [startrow[-1], line[i]]
-                            seqDatabaseSame[line[i]] = self.serchSame(database, newrow,give)
-
-                    else:
-                        same=0
-                    i+=1
-
-
-        if len(seqDatabase)!=0:
-            self.makeNext(seqDatabase,startrow)
-        if len(seqDatabaseSame)!=0:
-            self.makeNextSame(seqDatabaseSame,startrow)
 
+    def _suffixes(self, starts, ends):
+        """
+        Positions of the encoded database covered by the suffix slices [starts, ends) of the projected sequences
+
+        :param starts: first position of every slice
+        :type starts: numpy.ndarray
+        :param ends: end position of every slice
+        :type ends: numpy.ndarray
+        :return: the projected sequence of every position and the positions
+        :rtype: tuple
+        """
+        lengths = _ab._np.maximum(ends - starts, 0)
+        rows = _ab._np.repeat(_ab._np.arange(len(starts)), lengths)
+        offsets = _ab._np.cumsum(lengths) - lengths
+        return rows, _ab._np.arange(int(lengths.sum())) - _ab._np.repeat(offsets - starts, lengths)
+
+    def _countExtensions(self, rows, positions, rowCount):
+        """
+        Support of every item at the given positions, counted once per projected sequence with a bincount, and the
+        first such position of every frequent item in every projected sequence
+
+        :param rows: projected sequence of every position
+        :type rows: numpy.ndarray
+        :param positions: positions of the candidate items, ascending within every projected sequence
+        :type positions: numpy.ndarray
+        :param rowCount: number of projected sequences
+        :type rowCount: int
+        :return: (item, support, rows, positions) of every frequent item
+        :rtype: list
+        """
+        keys = self._items[positions].astype(_ab._np.int64) * rowCount + rows
+        keys, first = _ab._np.unique(keys, return_index=True)
+        support = _ab._np.bincount(keys // rowCount, minlength=len(self._itemNames))
+        extensions = []
+        for item in _ab._np.flatnonzero(support >= self._minSup).tolist():
+            low, high = _ab._np.searchsorted(keys, [item * rowCount, (item + 1) * rowCount])
+            extensions.append((item, int(support[item]), keys[low:high] % rowCount, positions[first[low:high]]))
+        return extensions
+
+    def makeSupDatabase(self, sequences, positions, lastItemset):
+        """
+        Count the frequent extensions of a prefix over its pseudo-projected database. Nothing is copied: a projected
+        database is the index of every sequence holding the prefix and the position where the prefix first ends in it
+
+        :param sequences: indexes of the projected sequences
+        :type sequences: numpy.ndarray
+        :param positions: position of the last item of the prefix in every projected sequence
+        :type positions: numpy.ndarray
+        :param lastItemset: items of the last itemset of the prefix, empty for the empty prefix
+        :type lastItemset: tuple
+        :return: (item, isSequenceExtension, support, sequences, positions) of every frequent extension
+        :rtype: list
+        """
+        rowCount = len(sequences)
+        ends = self._sequenceBounds[sequences + 1]
+        if not lastItemset:
+            rows, suffix = self._suffixes(self._sequenceBounds[sequences], ends)
+            return [(item, True, support, sequences[found], first)
+                    for item, support, found, first in self._countExtensions(rows, suffix, rowCount)]
+        current = self._itemsetOf[positions]
+        rows, suffix = self._suffixes(self._itemsetBounds[current], ends)
+        later = self._itemsetOf[suffix] != current[rows]
+        extensions = [(item, True, support, sequences[found], first)
+                      for item, support, found, first in self._countExtensions(rows[later], suffix[later], rowCount)]
+        # an itemset extension adds an item greater than the last one to an itemset holding the whole last itemset
+        suffixItems = self._items[suffix]
+        if len(suffix):
+            groups = _ab._np.concatenate(([0], _ab._np.flatnonzero(_ab._np.diff(self._itemsetOf[suffix])) + 1))
+            held = _ab._np.add.reduceat(_ab._np.isin(suffixItems, lastItemset).astype(_ab._np.int32), groups)
+            holding = _ab._np.repeat(held == len(lastItemset), _ab._np.diff(_ab._np.append(groups, len(suffix))))
+            candidates = holding & (suffixItems > lastItemset[-1])
+            extensions += [(item, False, support, sequences[found], first) for item, support, found, first in
+                           self._countExtensions(rows[candidates], suffix[candidates], rowCount)]
+        return extensions
+
+    def makeNext(self, sequences, positions, pattern):
+        """
+        To grow every frequent extension of a pattern depth-first over the pseudo-projected databases
+
+        :param sequences: indexes of the projected sequences of the pattern
+        :type sequences: numpy.ndarray
+        :param positions: position where the pattern first ends in every projected sequence
+        :type positions: numpy.ndarray
+        :param pattern: the pattern as a tuple of itemsets of item ranks
+        :type pattern: tuple
+        """
+        lastItemset = pattern[-1] if pattern else ()
+        for item, isSequence, support, nextSequences, nextPositions in self.makeSupDatabase(sequences, positions,
+                                                                                           lastItemset):
+            if isSequence:
+                nextPattern = pattern + ((item,),)
+            else:
+                nextPattern = pattern[:-1] + (lastItemset + (item,),)
+            self._patterns.append((nextPattern, support))
+            self.makeNext(nextSequences, nextPositions, nextPattern)
+
+    def _decode(self, pattern):
+        """
+        Name of a pattern in the final patterns: its items with every itemset closed by ':'
 
+        :param pattern: the pattern as a tuple of itemsets of item ranks
+        :type pattern: tuple
+        :return: the pattern name
+        :rtype: str
+        """
+        row = []
+        for itemset in pattern:
+            row.extend(self._itemNames[item] for item in itemset)
+            row.append(":")
+        return str(row)
+
+    def _mineTask(self, task):
+        """
+        Mine the subtree of one frequent item, a task of the process pool
+
+        :param task: the item with its projected sequences and positions
+        :type task: tuple
+        :return: (pattern, support) of every pattern of the subtree below the item
+        :rtype: list
+        """
+        item, sequences, positions = task
+        self._patterns = []
+        self.makeNext(sequences, positions, ((item,),))
+        return self._patterns
+
+    def _mine(self):
+        """
+        Read the database and mine every frequent pattern from the empty prefix, the subtree of every frequent item
+        being an independent task of the process pool
+        """
+        self._finalPatterns = {}
+        self._creatingItemSets()
+        sequences = _ab._np.arange(self._sequenceCount, dtype=_ab._np.int64)
+        patterns = []
+        tasks = []
+        for item, isSequence, support, nextSequences, nextPositions in self.makeSupDatabase(sequences, sequences, ()):
+            patterns.append((((item,),), support))
+            size = int((self._sequenceBounds[nextSequences + 1] - nextPositions).sum())
+            tasks.append((size, (item, nextSequences, nextPositions)))
+        with _TaskPool(self, self._workers) as pool:
+            pool.run(tasks, patterns.extend)
+        self._finalPatterns = {self._decode(pattern): support for pattern, support in patterns}
+
+    @deprecated("It is recommended to use 'mine()' instead of 'startMine()' for mining process. Starting from January 2025, 'startMine()' will be completely terminated.")
     def startMine(self):
         """
         Frequent pattern mining process will start from here
         """
-        self._Database = []
-        self._startTime = _ab._time.time()
-        self._creatingItemSets()
-        self._Database=self.makeSupDatabase(self._Database,"")
-        self._minSup = self._convert(self._minSup)
-        self.makeSeqDatabaseFirst(self._Database)
-        self._endTime = _ab._time.time()
-        process = _ab._psutil.Process(_ab._os.getpid())
-        self._memoryUSS = float()
-        self._memoryRSS = float()
-        self._memoryUSS = process.memory_full_info().uss
-        self._memoryRSS = process.memory_info().rss
-        print("Frequent patterns were generated successfully using prefixSpan algorithm ")
+        self.mine()
 
     def mine(self):
         """
         Frequent pattern mining process will start from here
         """
-        self._Database = []
         self._startTime = _ab._time.time()
-        self._creatingItemSets()
-        self._Database=self.makeSupDatabase(self._Database,"")
-        self._minSup = self._convert(self._minSup)
-        self.makeSeqDatabaseFirst(self._Database)
+        self._mine()
         self._endTime = _ab._time.time()
         process = _ab._psutil.Process(_ab._os.getpid())
         self._memoryUSS = float()
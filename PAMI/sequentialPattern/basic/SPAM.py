@@ -58,6 +58,7 @@ import pandas as pd
 from deprecated import deprecated
 
 from PAMI.sequentialPattern.basic import abstract as _ab
+from PAMI.sequentialPattern.basic._parallelMiner import _TaskPool
 _ab._sys.setrecursionlimit(10000)
 
 class SPAM(_ab._sequentialPatterns):
@@ -77,6 +78,8 @@ class SPAM(_ab._sequentialPatterns):
                     Example: minSup=10 will be treated as integer, while minSup=10.0 will be treated as float
     :param  sep: str :
                    This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.
+    :param  workers: int :
+                   Number of processes mining the subtrees of the frequent items in parallel. The default mines in this process.
 
     :Attributes:
 
@@ -105,7 +108,12 @@ class SPAM(_ab._sequentialPatterns):
             Database : list
                 To store the sequences of a database in list
             _idDatabase : dict
-                To store the sequences of a database by bit map
+                To store the bitmap of every frequent item
+            _bitmaps : numpy.ndarray
+                Packed uint64 matrix holding one row of bitmap words per frequent item
+            _offsets : numpy.ndarray
+                Word offset of every sequence inside a bitmap row. Each sequence takes ceil(length / 64) words, so
+                its bits are sized to its own length
             _maxSeqLen:
                 the maximum length of subsequence in sequence.
             _seqSep   :str
@@ -118,11 +126,13 @@ class SPAM(_ab._sequentialPatterns):
             _convert(value):
                 To convert the user specified minSup value
             make2BitDatabase():
-                To make 1 length frequent patterns by breadth-first search technique   and update Database to sequential database
+                To make 1 length frequent patterns by breadth-first search technique   and pack their bitmaps into a uint64 matrix
             DfsPruning(items,sStep,iStep):
                 the main algorithm of spam. This can search sstep and istep items and find next patterns, its sstep, and its istep. And call this function again by using them. Recursion until there are no more items available for exploration.
             Sstep(s):
                 To convert bit to ssteo bit.The first time you get 1, you set it to 0 and subsequent ones to 1.(like 010101=>001111, 00001001=>00000111)
+            countSup(n):
+                To count the sequences with at least one bit set in a bitmap, or in every row of a bitmap matrix
             mine()
                 Mining process will start from here
             getPatterns()
@@ -203,8 +213,12 @@ class SPAM(_ab._sequentialPatterns):
     _memoryRSS = float()
     _Database = []
     _idDatabase={}
+    _bitmaps = None
+    _offsets = None
+    _wordStart = None
     _maxSeqLen=0
     _sepSeq=""
+    _blockWords = 1 << 22
     def _creatingItemSets(self):
         """
         Storing the complete sequences of the database/input file in a database variable
@@ -284,39 +298,51 @@ class SPAM(_ab._sequentialPatterns):
 
     def make2BitDatabase(self):
         """
-        To make 1 length frequent patterns by breadth-first search technique   and update Database to sequential database
+        To make 1 length frequent patterns by breadth-first search technique   and pack their bitmaps into a uint64 matrix.
+        Bit p of sequence s is bit p % 64 of word offsets[s] + p // 64 in the row of an item.
         """
-        self._maxSeqLen=max([len(i) for i in self._Database])
-        lineNumber=0
-        idDatabase={}
-        for line in self._Database:
-            seqNumber=1
-            for seq in line:
-
+        self._maxSeqLen = max([len(i) for i in self._Database])
+        words = _ab._np.array([max(1, (len(line) + 63) >> 6) for line in self._Database], dtype=_ab._np.int64)
+        self._offsets = _ab._np.zeros(len(words) + 1, dtype=_ab._np.int64)
+        _ab._np.cumsum(words, out=self._offsets[1:])
+        self._wordStart = _ab._np.repeat(self._offsets[:-1], words)
+        itemIds = {}
+        names = []
+        support = []
+        lastSequence = []
+        items, positions = [], []
+        for lineNumber, line in enumerate(self._Database):
+            base = int(self._offsets[lineNumber])
+            for seqNumber, seq in enumerate(line):
                 for data in seq:
-                    if data in idDatabase:
-                        while lineNumber+1!=len(idDatabase[data]):
-                            idDatabase[data].append(0)
-                        idDatabase[data][lineNumber]+=int(2**(self._maxSeqLen-seqNumber))
-
-                    else:
-                        idDatabase[data]=[]
-                        while lineNumber+1!=len(idDatabase[data]):
-                            idDatabase[data].append(0)
-                        idDatabase[data][lineNumber]+=(int(2 ** (self._maxSeqLen-seqNumber)))
-
-                seqNumber+=1
-            lineNumber+=1
-        for key,val in idDatabase.items():
-
-            sup=self.countSup(val)
-            while lineNumber+1!=len(idDatabase[key]):
-                            idDatabase[key].append(0)
-            if sup>=self._minSup:
-                self._finalPatterns[str(key)+self._sep+"-2"]=sup
-                self._idDatabase[str(key)]=val
-
-    def DfsPruning(self,items,sStep,iStep):
+                    item = itemIds.get(data)
+                    if item is None:
+                        item = len(names)
+                        itemIds[data] = item
+                        names.append(str(data))
+                        support.append(0)
+                        lastSequence.append(-1)
+                    if lastSequence[item] != lineNumber:
+                        lastSequence[item] = lineNumber
+                        support[item] += 1
+                    items.append(item)
+                    positions.append((base + (seqNumber >> 6)) << 6 | (seqNumber & 63))
+        frequent = [item for item in range(len(names)) if support[item] >= self._minSup]
+        row = _ab._np.full(len(names), -1, dtype=_ab._np.int64)
+        row[frequent] = _ab._np.arange(len(frequent))
+        items = row[_ab._np.array(items, dtype=_ab._np.int64)]
+        positions = _ab._np.array(positions, dtype=_ab._np.int64)[items >= 0]
+        items = items[items >= 0]
+        totalWords = int(self._offsets[-1])
+        self._bitmaps = _ab._np.zeros((len(frequent), totalWords), dtype=_ab._np.uint64)
+        _ab._np.bitwise_or.at(self._bitmaps.reshape(-1), items * totalWords + (positions >> 6),
+                              _ab._np.left_shift(_ab._np.uint64(1), (positions & 63).astype(_ab._np.uint64)))
+        for item in frequent:
+            self._finalPatterns[names[item] + self._sep + "-2"] = support[item]
+        self._Database = [names[item] for item in frequent]
+        self._idDatabase = {key: self._bitmaps[index] for index, key in enumerate(self._Database)}
+
+    def DfsPruning(self, items, sStep, iStep, bitmap=None):
         """
         the main algorithm of spam. This can search sstep and istep items and find next patterns, its sstep, and its istep. And call this function again by using them. Recursion until there are no more items available for exploration.
 
@@ -325,92 +351,104 @@ class SPAM(_ab._sequentialPatterns):
         items : str
             The pattrens I got before
         sStep : list
-            Items presumed to have "sstep" relationship with "items".(sstep is What appears later like a-b and a-c)
+            Indexes of the items presumed to have "sstep" relationship with "items".(sstep is What appears later like a-b and a-c)
         iStep : list
-            Items presumed to have "istep" relationship with "items"(istep is What appears in same time like ab and ac)
+            Indexes of the items presumed to have "istep" relationship with "items"(istep is What appears in same time like ab and ac)
+        bitmap : numpy.ndarray
+            The bitmap of "items". It is looked up in _idDatabase when not given.
 
         """
-        Snext=[]
-        Inext=[]
-        ns = self.Sstep(self._idDatabase[items])
-        for i in sStep:
-            nnext=[]
-            for k in  range(len(self._idDatabase[items])):
-                nandi=ns[k] & self._idDatabase[i][k]
-                nnext.append(nandi)
-
-
-            sup=self.countSup(nnext)
-            if sup>=self._minSup:
-                key=items+self._sep+self._sepSeq+self._sep+i
-                self._finalPatterns[key+self._sep+self._sepSeq+self._sep+"-2"]=sup
-                self._idDatabase[key]=nnext
-                Snext.append(i)
-
-        for i in Snext:
-            key = items+self._sep+self._sepSeq+self._sep+i
-            self.DfsPruning(key,Snext,[k for k in Snext if self._Database.index(i)<self._Database.index(k)])
-        for i in iStep:
-            nnext = []
-
-            for k in range(len(self._idDatabase[items])):
-                nandi = self._idDatabase[items][k] & self._idDatabase[i][k]
-                nnext.append(nandi)
-            sup=self.countSup(nnext)
-            if sup>=self._minSup:
-                key=items+self._sep+str(i)
-                self._finalPatterns[key+self._sep+self._sepSeq+self._sep+"-2"]=sup
-                self._idDatabase[key]=nnext
-                Inext.append(i)
-        for i in Inext:
-            key = items +self._sep +str(i)
-            self.DfsPruning(key,Snext,[k for k in Inext if self._Database.index(i)<self._Database.index(k)])
-
-    def Sstep(self,s):
+        if bitmap is None:
+            bitmap = self._idDatabase[items]
+        Snext, sBitmaps, sSupports = self._extend(self.Sstep(bitmap), sStep)
+        for i in range(len(Snext)):
+            key = items + self._sep + self._sepSeq + self._sep + self._Database[Snext[i]]
+            self._finalPatterns[key + self._sep + self._sepSeq + self._sep + "-2"] = sSupports[i]
+        for i in range(len(Snext)):
+            key = items + self._sep + self._sepSeq + self._sep + self._Database[Snext[i]]
+            self.DfsPruning(key, Snext, Snext[i + 1:], sBitmaps[i])
+        del sBitmaps
+        Inext, iBitmaps, iSupports = self._extend(bitmap, iStep)
+        for i in range(len(Inext)):
+            key = items + self._sep + self._Database[Inext[i]]
+            self._finalPatterns[key + self._sep + self._sepSeq + self._sep + "-2"] = iSupports[i]
+        for i in range(len(Inext)):
+            key = items + self._sep + self._Database[Inext[i]]
+            self.DfsPruning(key, Snext, Inext[i + 1:], iBitmaps[i])
+
+    def _mineTask(self, i):
         """
-        To convert bit to Sstep bit.The first time you get 1, you set it to 0 and subsequent ones to 1.(like 010101=>001111, 00001001=>00000111)
-
-
-        :param s:list
-            to store each bit sequence
-        :return:
-            nextS:list to store the bit sequence converted by sstep
+        Mine the subtree of one frequent item, a task of the process pool
 
+        :param i: index of the item
+        :type i: int
+        :return: the patterns of the subtree
+        :rtype: dict
         """
-        nextS=[]
-        for bins in s:
-            binS=str(bin(bins))
+        self._finalPatterns = {}
+        allItems = list(range(len(self._Database)))
+        self.DfsPruning(self._Database[i], allItems, allItems[i + 1:])
+        return self._finalPatterns
 
+    def _extend(self, bitmap, candidates):
+        """
+        ANDs the bitmap with the rows of all candidate items at once and keeps the frequent ones
 
-            LenNum=2
-            for i in range(len(binS)-2):
-                if binS[LenNum] == "1":
+        :param bitmap: bitmap of the prefix, already S-step transformed for sequence extensions
+        :type bitmap: numpy.ndarray
+        :param candidates: indexes of the candidate items
+        :type candidates: list
+        :return: the frequent candidates with their bitmaps and supports
+        """
+        frequent, bitmaps, supports = [], [], []
+        if len(candidates) == 0 or not bitmap.any():
+            return frequent, bitmaps, supports
+        block = max(1, self._blockWords // bitmap.shape[0])
+        for start in range(0, len(candidates), block):
+            rows = candidates[start:start + block]
+            nnext = self._bitmaps[rows] & bitmap
+            sup = self.countSup(nnext)
+            for k in _ab._np.flatnonzero(sup >= self._minSup):
+                frequent.append(rows[k])
+                bitmaps.append(nnext[k])
+                supports.append(int(sup[k]))
+        return frequent, bitmaps, supports
+
+    def Sstep(self, s):
+        """
+        To convert bit to Sstep bit.The first time you get 1, you set it to 0 and subsequent ones to 1.(like 010101=>001111, 00001001=>00000111)
+        The transform runs on all sequences at once: inside every sequence the words after its first non-zero word
+        become all ones and the first non-zero word keeps only the bits above its lowest set bit.
 
-                    binS = binS[:LenNum] + "0" + binS[LenNum + 1:]
-                    while len(binS)-1!=LenNum:
-                        LenNum += 1
-                        binS = binS[:LenNum] + "1" + binS[LenNum + 1:]
-                    break
-                LenNum+=1
-            nextS.append(int(binS, 0))
 
+        :param s: numpy.ndarray
+            to store each bit sequence
+        :return:
+            nextS: numpy.ndarray to store the bit sequence converted by sstep
 
+        """
+        nonZero = s != 0
+        lowest = s & (~s + _ab._np.uint64(1))
+        nextS = ~(lowest | (lowest - _ab._np.uint64(1)))
+        nextS[~nonZero] = 0
+        if s.shape[0] != self._offsets.shape[0] - 1:
+            before = _ab._np.cumsum(nonZero) - nonZero
+            before -= before[self._wordStart]
+            nextS[before > 0] = _ab._np.uint64(0xFFFFFFFFFFFFFFFF)
         return nextS
 
-    def countSup(self,n):
+    def countSup(self, n):
         """
         count support
 
-        :param n:list
-                to store each bit sequence
+        :param n: numpy.ndarray
+                bitmap of one pattern, or a matrix with one bitmap per row
         :return:
-            count: int support of this list
+            count: int support of this bitmap, or an array with the support of every row
         """
-        count=0
-        for i in n:
-            if "1" in str(bin(i)):
-                count+=1
-        return count
+        if n.shape[-1] != self._offsets.shape[0] - 1:
+            n = _ab._np.bitwise_or.reduceat(n, self._offsets[:-1], axis=-1)
+        return _ab._np.count_nonzero(n, axis=-1)
 
     def startMine(self) -> None:
         self.mine()
@@ -420,18 +458,16 @@ class SPAM(_ab._sequentialPatterns):
         Frequent pattern mining process will start from here
         """
         self._Database = []
+        self._finalPatterns = {}
         self._startTime = _ab._time.time()
         self._creatingItemSets()
         self._minSup = self._convert(self._minSup)
         self.make2BitDatabase()
-        self._Database = [i for i in self._idDatabase.keys()]
-        for i in self._Database:
-            x=[]
-            for j in self._Database:
-                if self._Database.index(i)<self._Database.index(j):
-                    x.append(j)
-
-            self.DfsPruning(i,self._Database,x)
+        support = self.countSup(self._bitmaps) if len(self._Database) else []
+        patterns = self._finalPatterns
+        with _TaskPool(self, self._workers) as pool:
+            pool.run([(int(support[i]), i) for i in range(len(self._Database))], patterns.update)
+        self._finalPatterns = patterns
         self._endTime = _ab._time.time()
         process = _ab._psutil.Process(_ab._os.getpid())
         self._memoryUSS = float()
@@ -0,0 +1,345 @@
+# Shared SPADE search engine. SPADE, SPADEPlus and bitSPADE run on this core, which keeps the vertical database as
+# integer-encoded id-lists: every item and every pattern is stored as a pair of sorted int32 arrays holding the
+# sequence id (sid) and the itemset id (eid) of its occurrences, and temporal joins are vectorized merges of two such
+# pairs. Patterns are tuples of integer item ids while mining and are only decoded to item names on output.
+#
+# **Running a SPADE based miner on the core**
+# --------------------------------------------------------
+#
+#             from PAMI.sequentialPattern.basic._SPADECore import _SPADECore
+#
+#             class MyMiner(_ab._sequentialPatterns, _SPADECore):
+#
+#                 def mine(self):
+#
+#                     self._mineSPADE()
+#
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+     Copyright (C)  2021 Rage Uday Kiran
+
+"""
+
+from PAMI.sequentialPattern.basic import abstract as _ab
+from PAMI.sequentialPattern.basic._parallelMiner import _TaskPool
+from typing import List, Dict, Tuple, Union, Generator
+
+_ab._sys.setrecursionlimit(10000)
+
+
+class _SPADECore:
+    """
+    :Description: The SPADE search shared by SPADE, SPADEPlus and bitSPADE. A miner mixes this class into its
+                  abstract base and calls _mineSPADE() from mine(). The optional constraints _maxGap (largest eid
+                  distance between two consecutive itemsets of an occurrence) and _maxLen (largest number of items of
+                  a pattern) default to no constraint.
+
+    :Attributes:
+
+        itemNames: list
+            name of every item, indexed by its integer id
+        idLists: dict
+            (sids, eids) arrays of every frequent item, keyed by its integer id
+        sequenceCount: int
+            number of sequences in the database
+        patterns: list
+            (pattern, support) of every frequent pattern, with patterns as tuples of itemsets of integer ids
+
+    :Methods:
+
+        _mineSPADE()
+            Read the database and run the search, on self._workers processes
+        make1LenDatabase()
+            Build the id-lists of the frequent items in a single hashed scan of the database
+        sequenceJoin(first, second)
+            Occurrences of second that follow an occurrence of first
+        itemsetJoin(first, second)
+            Occurrences shared by first and second
+        getSupport(idList)
+            Number of distinct sequences of an id-list
+    """
+
+    _maxGap = float("inf")
+    _maxLen = float("inf")
+
+    def _readLines(self) -> Generator[str, None, None]:
+        """
+        Lines of the input database, one sequence per line
+
+        :return: generator of lines
+        """
+        if isinstance(self._iFile, _ab._pd.DataFrame):
+            if self._iFile.empty:
+                print("its empty..")
+            elif 'Transactions' in self._iFile.columns:
+                for line in self._iFile['Transactions']:
+                    yield str(line)
+        if isinstance(self._iFile, str):
+            if _ab._validators.url(self._iFile):
+                for line in _ab._urlopen(self._iFile):
+                    yield line.decode("utf-8")
+            else:
+                try:
+                    with open(self._iFile, 'r', encoding='utf-8') as f:
+                        for line in f:
+                            yield line
+                except IOError:
+                    print("File Not Found")
+                    quit()
+
+    def _convert(self, value: Union[int, float, str]) -> Union[int, float]:
+        """
+        To convert the user specified minSup value
+
+        :param value: user specified minSup value
+        :type value: int or float or str
+        :return: converted type
+        :rtype: int or float
+        """
+        if type(value) is int:
+            value = int(value)
+        if type(value) is float:
+            value = (self._sequenceCount * value)
+        if type(value) is str:
+            if '.' in value:
+                value = float(value)
+                value = (self._sequenceCount * value)
+            else:
+                value = int(value)
+        return value
+
+    def make1LenDatabase(self) -> None:
+        """
+        Build the id-lists of the frequent items in a single scan. Item names are mapped to integer ids through a
+        dictionary while reading, and the (item, sid, eid) triples are grouped per item with one sort
+        """
+        itemIds = {}
+        self._itemNames = []
+        items, sids, eids = _ab._array('i'), _ab._array('i'), _ab._array('i')
+        self._sequenceCount = 0
+        for line in self._readLines():
+            itemsets = [x for x in (i.rstrip() for i in line.split(self._sepSeq)) if x]
+            for eid, itemset in enumerate(itemsets):
+                for name in set(itemset.split()):
+                    item = itemIds.get(name)
+                    if item is None:
+                        item = itemIds[name] = len(self._itemNames)
+                        self._itemNames.append(name)
+                    items.append(item)
+                    sids.append(self._sequenceCount)
+                    eids.append(eid)
+            self._sequenceCount += 1
+        self._minSup = self._convert(self._minSup)
+
+        items = _ab._np.frombuffer(items, dtype=_ab._np.int32)
+        sids = _ab._np.frombuffer(sids, dtype=_ab._np.int32)
+        eids = _ab._np.frombuffer(eids, dtype=_ab._np.int32)
+        order = _ab._np.lexsort((eids, sids, items))
+        items, sids, eids = items[order], sids[order], eids[order]
+        bounds = _ab._np.flatnonzero(_ab._np.diff(items)) + 1
+        starts = _ab._np.concatenate(([0], bounds)).astype(_ab._np.int64)
+        ends = _ab._np.concatenate((bounds, [len(items)])).astype(_ab._np.int64)
+        self._idLists = {}
+        for start, end in zip(starts.tolist(), ends.tolist()):
+            if start == end:
+                continue
+            idList = (sids[start:end], eids[start:end])
+            support = self.getSupport(idList)
+            if support >= self._minSup:
+                self._idLists[int(items[start])] = idList
+
+    @staticmethod
+    def getSupport(idList: Tuple[_ab._np.ndarray, _ab._np.ndarray]) -> int:
+        """
+        Number of distinct sequences of an id-list
+
+        :param idList: sorted (sids, eids) arrays
+        :type idList: tuple
+        :return: support of the id-list
+        :rtype: int
+        """
+        sids = idList[0]
+        if len(sids) == 0:
+            return 0
+        return 1 + int(_ab._np.count_nonzero(sids[1:] != sids[:-1]))
+
+    def sequenceJoin(self, first: Tuple[_ab._np.ndarray, _ab._np.ndarray],
+                     second: Tuple[_ab._np.ndarray, _ab._np.ndarray]) -> Tuple[_ab._np.ndarray, _ab._np.ndarray]:
+        """
+        Occurrences of second that come after an occurrence of first in the same sequence, at most _maxGap itemsets
+        later
+
+        :param first: sorted (sids, eids) arrays of the earlier pattern
+        :type first: tuple
+        :param second: sorted (sids, eids) arrays of the later pattern
+        :type second: tuple
+        :return: the joined (sids, eids) arrays
+        :rtype: tuple
+        """
+        firstSids, firstEids = first
+        secondSids, secondEids = second
+        if len(firstSids) == 0 or len(secondSids) == 0:
+            return firstSids[:0], firstEids[:0]
+        if self._maxGap == float("inf"):
+            # only the first occurrence of every sequence of first matters
+            starts = _ab._np.concatenate(([0], _ab._np.flatnonzero(firstSids[1:] != firstSids[:-1]) + 1))
+            sequences = firstSids[starts]
+            position = _ab._np.minimum(_ab._np.searchsorted(sequences, secondSids), len(sequences) - 1)
+            keep = (sequences[position] == secondSids) & (secondEids > firstEids[starts][position])
+        else:
+            # the latest occurrence of first before every occurrence of second is the closest one
+            firstKeys = firstSids.astype(_ab._np.int64) << 32 | firstEids
+            secondKeys = secondSids.astype(_ab._np.int64) << 32 | secondEids
+            position = _ab._np.searchsorted(firstKeys, secondKeys) - 1
+            found = position >= 0
+            position = _ab._np.maximum(position, 0)
+            keep = found & (firstSids[position] == secondSids) & (secondEids - firstEids[position] <= self._maxGap)
+        return secondSids[keep], secondEids[keep]
+
+    @staticmethod
+    def itemsetJoin(first: Tuple[_ab._np.ndarray, _ab._np.ndarray],
+                    second: Tuple[_ab._np.ndarray, _ab._np.ndarray]) -> Tuple[_ab._np.ndarray, _ab._np.ndarray]:
+        """
+        Occurrences that first and second share, i.e. the same itemset of the same sequence
+
+        :param first: sorted (sids, eids) arrays
+        :type first: tuple
+        :param second: sorted (sids, eids) arrays
+        :type second: tuple
+        :return: the joined (sids, eids) arrays
+        :rtype: tuple
+        """
+        firstKeys = first[0].astype(_ab._np.int64) << 32 | first[1]
+        secondKeys = second[0].astype(_ab._np.int64) << 32 | second[1]
+        keys = _ab._np.intersect1d(firstKeys, secondKeys, assume_unique=True)
+        return (keys >> 32).astype(_ab._np.int32), (keys & 0xFFFFFFFF).astype(_ab._np.int32)
+
+    def _enumerate(self, pattern: tuple, length: int, atoms: list) -> None:
+        """
+        Mine the equivalence class of the atoms, all frequent extensions of the same prefix. An atom is
+        (item, isSequenceExtension, idList)
+
+        :param pattern: the prefix of the atoms
+        :type pattern: tuple
+        :param length: number of items of the prefix
+        :type length: int
+        :param atoms: the frequent atoms of the prefix
+        :type atoms: list
+        """
+        for index in range(len(atoms)):
+            self._mineAtom(pattern, length, atoms, index)
+
+    def _mineAtom(self, pattern: tuple, length: int, atoms: list, index: int) -> None:
+        """
+        Record the pattern of one atom and mine its own class, built by joining the atom with its siblings
+
+        :param pattern: the prefix of the atoms
+        :type pattern: tuple
+        :param length: number of items of the prefix
+        :type length: int
+        :param atoms: the frequent atoms of the prefix
+        :type atoms: list
+        :param index: index of the atom in atoms
+        :type index: int
+        """
+        item, isSequence, idList = atoms[index]
+        length += 1
+        if isSequence:
+            atomPattern = pattern + ((item,),)
+        else:
+            atomPattern = pattern[:-1] + (pattern[-1] + (item,),)
+        self._patterns.append((atomPattern, self.getSupport(idList)))
+        if length >= self._maxLen:
+            return
+        nextAtoms = []
+        atoms, candidates = self._joinCandidates(atoms)
+        for otherItem, otherIsSequence, otherIdList in atoms:
+            # P+a and P+b give P+{a, b} when both extend the same itemset
+            if otherIsSequence == isSequence and otherItem > item:
+                joined = self.itemsetJoin(idList, otherIdList)
+                if self.getSupport(joined) >= self._minSup:
+                    nextAtoms.append((otherItem, False, joined))
+        for otherItem, otherIdList in candidates:
+            joined = self.sequenceJoin(idList, otherIdList)
+            if self.getSupport(joined) >= self._minSup:
+                nextAtoms.append((otherItem, True, joined))
+        if nextAtoms:
+            self._enumerate(atomPattern, length, nextAtoms)
+
+    def _joinCandidates(self, atoms: list) -> Tuple[list, list]:
+        """
+        The atoms joined with an atom to build its class: its siblings for the itemset extensions and the (item,
+        idList) candidates of the sequence extensions. A miner restricting the extensions of a pattern filters them
+        here, before any join
+
+        :param atoms: the frequent atoms of the prefix
+        :type atoms: list
+        :return: the sibling atoms and the sequence extension candidates
+        :rtype: tuple
+        """
+        if self._maxGap == float("inf"):
+            # P+a followed by b has to follow P, so only the sequence extensions of P are candidates
+            return atoms, [(otherItem, otherIdList) for otherItem, otherIsSequence, otherIdList in atoms
+                           if otherIsSequence]
+        # a gap constrained occurrence of P+a followed by b need not be one of P followed by b
+        return atoms, list(self._idLists.items())
+
+    def _mineTask(self, index: int) -> list:
+        """
+        Mine the subtree of one frequent item, a task of the process pool
+
+        :param index: index of the item among the atoms of the empty prefix
+        :type index: int
+        :return: (pattern, support) of every pattern of the subtree
+        :rtype: list
+        """
+        self._patterns = []
+        self._mineAtom((), 0, self._rootAtoms, index)
+        return self._patterns
+
+    def _decode(self, pattern: tuple) -> str:
+        """
+        Name of a pattern in the final patterns: the item itself for a single item, else the items of every itemset
+        in lexical order, each itemset closed by the itemset separator
+
+        :param pattern: pattern as a tuple of itemsets of integer ids
+        :type pattern: tuple
+        :return: the pattern name
+        :rtype: str
+        """
+        if len(pattern) == 1 and len(pattern[0]) == 1:
+            return self._itemNames[pattern[0][0]]
+        row = []
+        for itemset in pattern:
+            row.extend(sorted(self._itemNames[item] for item in itemset))
+            row.append(self._sepSeq)
+        return str(tuple(row))
+
+    def _mineSPADE(self) -> None:
+        """
+        Read the database and mine every frequent pattern, the subtree of every frequent item being an independent
+        task of the process pool
+        """
+        self._finalPatterns = {}
+        self.make1LenDatabase()
+        self._rootAtoms = [(item, True, idList) for item, idList in self._idLists.items()]
+        patterns = []
+        with _TaskPool(self, self._workers) as pool:
+            pool.run([(len(idList[0]), index) for index, (item, isSequence, idList) in enumerate(self._rootAtoms)],
+                     patterns.extend)
+        self._finalPatterns = {self._decode(pattern): support for pattern, support in patterns}
@@ -0,0 +1,139 @@
+# Process pool shared by the sequential pattern and subgraph miners. A miner splits its search into independent
+# tasks, usually the subtree of every frequent 1-sequence or edge, and the pool runs them on worker processes. The
+# workers are forked after the miner has read and encoded its database, so they share it read-only instead of
+# receiving a copy. Tasks are handed out largest projected size first and their results are merged into a single
+# sink in the parent process.
+#
+# **Running the tasks of a miner in parallel**
+# --------------------------------------------------------
+#
+#             from PAMI.sequentialPattern.basic._parallelMiner import _TaskPool
+#
+#             class MyMiner(_ab._sequentialPatterns):
+#
+#                 def _mineTask(self, task):
+#
+#                     return patternsOfTheSubtree(task)
+#
+#                 def mine(self):
+#
+#                     with _TaskPool(self, self._workers) as pool:
+#
+#                         pool.run([(size, task) for ...], self._patterns.extend)
+#
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+     Copyright (C)  2021 Rage Uday Kiran
+
+"""
+
+import multiprocessing as _multiprocessing
+from concurrent.futures import ProcessPoolExecutor as _ProcessPoolExecutor, as_completed as _as_completed
+from typing import Any, Callable, List, Tuple
+
+# the miner of the worker process, set once when the worker starts
+_miner = None
+
+
+def _initWorker(miner) -> None:
+    """
+    Keep the miner in the worker. With the fork start method the miner and its encoded database are inherited from
+    the parent without being copied
+
+    :param miner: the miner running the tasks
+    """
+    global _miner
+    _miner = miner
+
+
+def _runTask(task: Any) -> Any:
+    """
+    Run one task of the miner of the worker
+
+    :param task: the task
+    :return: the result of the task
+    """
+    return _miner._mineTask(task)
+
+
+class _TaskPool:
+    """
+    :Description: Runs the independent tasks of a miner on a pool of worker processes. The miner implements
+                  _mineTask(task), which returns the result of one task. With a single worker the tasks run in the
+                  calling process and no pool is started.
+
+    :Attributes:
+
+        miner: object
+            the miner running the tasks
+        workers: int
+            number of worker processes
+
+    :Methods:
+
+        run(tasks, sink)
+            Run the tasks and pass every result to the sink
+    """
+
+    def __init__(self, miner, workers: int) -> None:
+        self._miner = miner
+        self._workers = max(1, int(workers))
+        self._pool = None
+
+    def __enter__(self) -> '_TaskPool':
+        return self
+
+    def __exit__(self, *args) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def _getPool(self) -> _ProcessPoolExecutor:
+        """
+        Start the workers on first use, forked where the platform allows it so that they share the encoded database
+
+        :return: the process pool
+        """
+        if self._pool is None:
+            if 'fork' in _multiprocessing.get_all_start_methods():
+                context = _multiprocessing.get_context('fork')
+            else:
+                context = _multiprocessing.get_context()
+            self._pool = _ProcessPoolExecutor(max_workers=self._workers, mp_context=context,
+                                              initializer=_initWorker, initargs=(self._miner,))
+        return self._pool
+
+    def run(self, tasks: List[Tuple[int, Any]], sink: Callable[[Any], None]) -> None:
+        """
+        Run the tasks, largest first so that the long subtrees do not end up last on a single worker, and pass every
+        result to the sink as soon as it is ready
+
+        :param tasks: (size, task) pairs, size being an estimate of the work of the task such as its projected size
+        :type tasks: list
+        :param sink: called in this process with the result of every task
+        :type sink: function
+        """
+        if self._workers == 1 or len(tasks) <= 1:
+            for size, task in tasks:
+                sink(self._miner._mineTask(task))
+            return
+        pool = self._getPool()
+        ordered = sorted(range(len(tasks)), key=lambda x: -tasks[x][0])
+        futures = [pool.submit(_runTask, tasks[index][1]) for index in ordered]
+        for future in _as_completed(futures):
+            sink(future.result())
@@ -31,6 +31,8 @@ from abc import ABC as _ABC, abstractmethod as _abstractmethod
 import time as _time
 import csv as _csv
 import pandas as _pd
+import numpy as _np
+from array import array as _array
 from collections import defaultdict as _defaultdict
 from itertools import combinations as _c
 import os as _os
@@ -73,6 +75,8 @@ class _sequentialPatterns(_ABC):
             To store the total amount of RSS memory consumed by the program
         seqSep   :str
                 separator to separate each itemset
+        workers : int
+            number of processes mining independent parts of the search
 
     :Methods:
 
@@ -92,7 +96,7 @@ class _sequentialPatterns(_ABC):
             This function outputs the total runtime of a mining algorithm
     """
 
-    def __init__(self, iFile, minSup, sep="\t",sepSeq="-1"):
+    def __init__(self, iFile, minSup, sep="\t",sepSeq="-1", workers=1):
         """
         :param iFile: Input file name or path of the input file
         :type iFile: str or DataFrame
@@ -103,6 +107,10 @@ class _sequentialPatterns(_ABC):
         :type minSup: int or float or str
         :param sep: separator used to distinguish items from each other. The default separator is tab space. However, users can override the default separator
         :type sep: str
+        :param sepSeq: separator used to distinguish the itemsets of a sequence
+        :type sepSeq: str
+        :param workers: number of processes mining independent parts of the search. The default runs in this process
+        :type workers: int
         """
 
         self._iFile = iFile
@@ -115,6 +123,7 @@ class _sequentialPatterns(_ABC):
         self._startTime = float()
         self._endTime = float()
         self._sepSeq=sepSeq
+        self._workers = workers
 
     @_abstractmethod
     def startMine(self):
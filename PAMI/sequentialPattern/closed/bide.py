@@ -0,0 +1,497 @@
+# BIDE discovers the closed sequential patterns of a sequence database, the frequent sequences having no super-sequence
+# with the same support. It grows the patterns over the pseudo-projected database of PrefixSpan and checks their closure
+# with bi-directional extensions instead of keeping the patterns found so far, pruning with BackScan every prefix
+# which cannot lead to a closed pattern.
+#
+# **Importing this algorithm into a python program**
+# --------------------------------------------------------
+#
+#             from PAMI.sequentialPattern.closed import bide as alg
+#
+#             obj = alg.BIDE(iFile, minSup)
+#
+#             obj.mine()
+#
+#             closedPatterns = obj.getPatterns()
+#
+#             print("Total number of Closed Sequential Patterns:", len(closedPatterns))
+#
+#             obj.save(oFile)
+#
+#             Df = obj.getPatternsAsDataFrame()
+#
+#             memUSS = obj.getMemoryUSS()
+#
+#             print("Total Memory in USS:", memUSS)
+#
+#             memRSS = obj.getMemoryRSS()
+#
+#             print("Total Memory in RSS", memRSS)
+#
+#             run = obj.getRuntime()
+#
+#             print("Total ExecutionTime in seconds:", run)
+#
+
+
+__copyright__ = """
+Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+     Copyright (C)  2021 Rage Uday Kiran
+
+"""
+
+from bisect import bisect_left as _bisect_left, bisect_right as _bisect_right
+from PAMI.sequentialPattern.basic import abstract as _ab
+from PAMI.sequentialPattern.basic.PrefixSpan import PrefixSpan as _PrefixSpan
+from PAMI.sequentialPattern.basic._parallelMiner import _TaskPool
+
+
+class BIDE(_PrefixSpan):
+    """
+    :Description:
+        * BIDE discovers the closed sequential patterns, the frequent sequences having no super-sequence with the same support.
+        * Patterns are grown depth-first over the integer-encoded pseudo-projected database of PrefixSpan.
+        * The closure of a pattern is checked with forward and backward extensions and BackScan prunes the prefixes which cannot lead to a closed pattern, so no candidate set is kept in memory.
+
+    :Reference:   J. Wang, J. Han: BIDE: Efficient Mining of Frequent Closed Sequences. Proceedings of the 20th International Conference on Data Engineering (ICDE 2004), pp. 79-90
+
+    :param  iFile: str :
+                   Name of the Input file to mine complete set of closed sequential patterns
+    :param  oFile: str :
+                   Name of the output file to store complete set of closed sequential patterns
+    :param  minSup: float or int or str :
+                    minSup measure constraints the minimum number of transactions in a database where a pattern must appear
+                    Example: minSup=10 will be treated as integer, while minSup=10.0 will be treated as float
+    :param  sep: str :
+                   This variable is used to distinguish items from one another in a transaction. The default seperator is tab space. However, the users can override their default separator.
+    :param  workers: int :
+                   Number of processes mining the subtrees of the frequent items in parallel. The default mines in this process.
+
+    :Attributes:
+
+        iFile : str
+            Input file name or path of the input file
+        oFile : str
+            Name of the output file or the path of output file
+        minSup : float or int or str
+            The user can specify minSup either in count or proportion of database size.
+            If the program detects the data type of minSup is integer, then it treats minSup is expressed in count.
+            Otherwise, it will be treated as float.
+            Example: minSup=10 will be treated as integer, while minSup=10.0 will be treated as float
+        startTime : float
+            To record the start time of the mining process
+        endTime : float
+            To record the completion time of the mining process
+        finalPatterns : dict
+            Storing the complete set of closed patterns in a dictionary variable
+        memoryUSS : float
+            To store the total amount of USS memory consumed by the program
+        memoryRSS : float
+            To store the total amount of RSS memory consumed by the program
+        sequenceItemsets : list
+            To store the itemsets of every sequence as sets of item ranks
+        itemPositions : list
+            To store, for every sequence, the ascending itemset indexes holding each item
+
+    :Methods:
+
+        mine()
+            Mining process will start from here
+        getPatterns()
+            Complete set of patterns will be retrieved with this function
+        save(oFile)
+            Complete set of closed patterns will be loaded in to a output file
+        getPatternsAsDataFrame()
+            Complete set of closed patterns will be loaded in to a dataframe
+        getMemoryUSS()
+            Total amount of USS memory consumed by the mining process will be retrieved from this function
+        getMemoryRSS()
+            Total amount of RSS memory consumed by the mining process will be retrieved from this function
+        getRuntime()
+            Total amount of runtime taken by the mining process will be retrieved from this function
+        makeNext(sequences, positions, pattern, support)
+            Checks a pattern and grows its frequent extensions depth-first
+
+    **Methods to execute code on terminal**
+    ------------------------------------------
+    .. code-block:: console
+
+
+       Format:
+
+       (.venv) $ python3 bide.py <inputFile> <outputFile> <minSup>
+
+       Example usage:
+
+       (.venv) $ python3 bide.py sampleDB.txt patterns.txt 10
+
+
+               .. note:: minSup will be considered in support count or frequency
+
+
+    **Importing this algorithm into a python program**
+    -----------------------------------------------------
+    .. code-block:: python
+
+            from PAMI.sequentialPattern.closed import bide as alg
+
+            obj = alg.BIDE(iFile, minSup)
+
+            obj.mine()
+
+            closedPatterns = obj.getPatterns()
+
+            print("Total number of Closed Sequential Patterns:", len(closedPatterns))
+
+            obj.save(oFile)
+
+            Df = obj.getPatternsAsDataFrame()
+
+            memUSS = obj.getMemoryUSS()
+
+            print("Total Memory in USS:", memUSS)
+
+            memRSS = obj.getMemoryRSS()
+
+            print("Total Memory in RSS", memRSS)
+
+            run = obj.getRuntime()
+
+            print("Total ExecutionTime in seconds:", run)
+
+    """
+
+    _sequenceItemsets = []
+    _itemPositions = []
+
+    def _creatingItemSets(self):
+        """
+        Encode the database as PrefixSpan does and keep, for every sequence, its itemsets and the itemsets holding each
+        item, which the extension checks scan
+        """
+        super()._creatingItemSets()
+        self._sequenceItemsets = []
+        self._itemPositions = []
+        items = self._items.tolist()
+        itemsetOf = self._itemsetOf.tolist()
+        bounds = self._sequenceBounds.tolist()
+        for s in range(self._sequenceCount):
+            itemsets = []
+            positions = {}
+            base = None
+            for position in range(bounds[s], bounds[s + 1]):
+                if base is None:
+                    base = itemsetOf[position]
+                index = itemsetOf[position] - base
+                if index == len(itemsets):
+                    itemsets.append(set())
+                itemsets[index].add(items[position])
+                positions.setdefault(items[position], []).append(index)
+            self._sequenceItemsets.append(itemsets)
+            self._itemPositions.append(positions)
+
+    def _first(self, s, itemset, after):
+        """
+        First itemset of a sequence after the given one holding the whole itemset
+
+        :param s: index of the sequence
+        :type s: int
+        :param itemset: items of the pattern itemset
+        :type itemset: tuple
+        :param after: the itemset index to look after
+        :type after: int
+        :return: the itemset index, None when there is none
+        :rtype: int
+        """
+        occurrences = self._itemPositions[s][itemset[0]]
+        itemsets = self._sequenceItemsets[s]
+        for index in occurrences[_bisect_right(occurrences, after):]:
+            if itemsets[index].issuperset(itemset):
+                return index
+        return None
+
+    def _last(self, s, itemset, before):
+        """
+        Last itemset of a sequence before the given one holding the whole itemset
+
+        :param s: index of the sequence
+        :type s: int
+        :param itemset: items of the pattern itemset
+        :type itemset: tuple
+        :param before: the itemset index to look before
+        :type before: int
+        :return: the itemset index, None when there is none
+        :rtype: int
+        """
+        occurrences = self._itemPositions[s][itemset[0]]
+        itemsets = self._sequenceItemsets[s]
+        for index in reversed(occurrences[:_bisect_left(occurrences, before)]):
+            if itemsets[index].issuperset(itemset):
+                return index
+        return None
+
+    def _instances(self, s, pattern):
+        """
+        The first instance of the pattern in a sequence, where every prefix ends as early as possible, the last
+        instance, where every suffix starts as late as possible, and the last-in-first instance, the latest one ending
+        with the first instance
+
+        :param s: index of the sequence
+        :type s: int
+        :param pattern: the pattern as a tuple of itemsets of item ranks
+        :type pattern: tuple
+        :return: itemset index of every pattern itemset in the three instances
+        :rtype: tuple
+        """
+        first = []
+        after = -1
+        for itemset in pattern:
+            after = self._first(s, itemset, after)
+            first.append(after)
+        last = [0] * len(pattern)
+        lastInFirst = [0] * len(pattern)
+        before = len(self._sequenceItemsets[s])
+        beforeFirst = first[-1] + 1
+        for j in range(len(pattern) - 1, -1, -1):
+            before = last[j] = self._last(s, pattern[j], before)
+            beforeFirst = lastInFirst[j] = self._last(s, pattern[j], beforeFirst)
+        return first, last, lastInFirst
+
+    def _occursBetween(self, s, item, low, high, itemset):
+        """
+        Whether an itemset strictly between low and high holds the item, together with the given itemset if any
+
+        :param s: index of the sequence
+        :type s: int
+        :param item: the item
+        :type item: int
+        :param low: itemset index before the range
+        :type low: int
+        :param high: itemset index after the range
+        :type high: int
+        :param itemset: items required next to the item, None for a new itemset
+        :type itemset: tuple
+        :return: True when the item occurs in the range
+        :rtype: bool
+        """
+        occurrences = self._itemPositions[s].get(item)
+        if occurrences is None:
+            return False
+        itemsets = self._sequenceItemsets[s]
+        for index in occurrences[_bisect_right(occurrences, low):]:
+            if index >= high:
+                return False
+            if itemset is None or itemsets[index].issuperset(itemset):
+                return True
+        return False
+
+    def _sharedInsertion(self, pattern, sequences, instances, bounds, itemset):
+        """
+        Whether one item can be inserted in the same place of the pattern in every sequence. The candidate items are
+        those of the first sequence and every further sequence keeps only those it holds in its own range, so the
+        instances of the later sequences are only computed while some candidate is left
+
+        :param pattern: the pattern as a tuple of itemsets of item ranks
+        :type pattern: tuple
+        :param sequences: indexes of the sequences holding the pattern
+        :type sequences: list
+        :param instances: first, last and last-in-first instances of the sequences computed so far, None for the others
+        :type instances: list
+        :param bounds: gives the exclusive (low, high) itemset range of the insertion from a sequence and its instances
+        :type bounds: function
+        :param itemset: the pattern itemset receiving the item, None for an item in a new itemset
+        :type itemset: tuple
+        :return: True when an item fits in every sequence
+        :rtype: bool
+        """
+        candidates = None
+        for t, s in enumerate(sequences):
+            if instances[t] is None:
+                instances[t] = self._instances(s, pattern)
+            low, high = bounds(s, instances[t])
+            if candidates is None:
+                candidates = set()
+                for index in range(low + 1, high):
+                    current = self._sequenceItemsets[s][index]
+                    if itemset is None:
+                        candidates.update(current)
+                    elif current.issuperset(itemset):
+                        candidates.update(current.difference(itemset))
+            else:
+                candidates = {item for item in candidates if self._occursBetween(s, item, low, high, itemset)}
+            if not candidates:
+                return False
+        return True
+
+    def _backScan(self, pattern, sequences, instances):
+        """
+        BackScan pruning: an item found in the semi-maximum period of some pattern itemset in every sequence extends
+        every pattern grown from this prefix with the same support, so the whole subtree holds no closed pattern
+
+        :param pattern: the pattern as a tuple of itemsets of item ranks
+        :type pattern: tuple
+        :param sequences: indexes of the sequences holding the pattern
+        :type sequences: list
+        :param instances: first, last and last-in-first instances of the sequences computed so far
+        :type instances: list
+        :return: True when the subtree can be pruned
+        :rtype: bool
+        """
+        for j in range(len(pattern)):
+            if self._sharedInsertion(pattern, sequences, instances,
+                                     lambda s, instance: (instance[0][j - 1] if j else -1, instance[2][j]), None):
+                return True
+            if j + 1 < len(pattern) and self._sharedInsertion(
+                    pattern, sequences, instances,
+                    lambda s, instance: (instance[0][j - 1] if j else -1, instance[2][j + 1]), pattern[j]):
+                return True
+        return False
+
+    def _backwardExtension(self, pattern, sequences, instances):
+        """
+        Backward extension check: an item found in the maximum period of some pattern itemset in every sequence is a
+        super-sequence with the same support
+
+        :param pattern: the pattern as a tuple of itemsets of item ranks
+        :type pattern: tuple
+        :param sequences: indexes of the sequences holding the pattern
+        :type sequences: list
+        :param instances: first, last and last-in-first instances of the sequences computed so far
+        :type instances: list
+        :return: True when the pattern has a backward extension
+        :rtype: bool
+        """
+        for j in range(len(pattern)):
+            if self._sharedInsertion(pattern, sequences, instances,
+                                     lambda s, instance: (instance[0][j - 1] if j else -1, instance[1][j]), None):
+                return True
+            if self._sharedInsertion(pattern, sequences, instances,
+                                     lambda s, instance: (instance[0][j - 1] if j else -1, instance[1][j + 1]
+                                                          if j + 1 < len(pattern) else
+                                                          len(self._sequenceItemsets[s])), pattern[j]):
+                return True
+        return False
+
+    def makeNext(self, sequences, positions, pattern, support):
+        """
+        Check a pattern and grow its frequent extensions depth-first. The pattern is closed when no forward extension
+        keeps its support and it has no backward extension
+
+        :param sequences: indexes of the projected sequences of the pattern
+        :type sequences: numpy.ndarray
+        :param positions: position where the pattern first ends in every projected sequence
+        :type positions: numpy.ndarray
+        :param pattern: the pattern as a tuple of itemsets of item ranks
+        :type pattern: tuple
+        :param support: support of the pattern
+        :type support: int
+        """
+        sequenceList = sequences.tolist()
+        instances = [None] * len(sequenceList)
+        if self._backScan(pattern, sequenceList, instances):
+            return
+        lastItemset = pattern[-1]
+        extensions = self.makeSupDatabase(sequences, positions, lastItemset)
+        if all(extension[2] < support for extension in extensions) and \
+                not self._backwardExtension(pattern, sequenceList, instances):
+            self._patterns.append((pattern, support))
+        for item, isSequence, nextSupport, nextSequences, nextPositions in extensions:
+            if isSequence:
+                nextPattern = pattern + ((item,),)
+            else:
+                nextPattern = pattern[:-1] + (lastItemset + (item,),)
+            self.makeNext(nextSequences, nextPositions, nextPattern, nextSupport)
+
+    def _mineTask(self, task):
+        """
+        Mine the closed patterns of the subtree of one frequent item, a task of the process pool
+
+        :param task: the item with its support, projected sequences and positions
+        :type task: tuple
+        :return: (pattern, support) of every closed pattern of the subtree
+        :rtype: list
+        """
+        item, support, sequences, positions = task
+        self._patterns = []
+        self.makeNext(sequences, positions, ((item,),), support)
+        return self._patterns
+
+    def _mine(self):
+        """
+        Read the database and mine the closed patterns, the subtree of every frequent item being an independent task
+        of the process pool
+        """
+        self._finalPatterns = {}
+        self._creatingItemSets()
+        sequences = _ab._np.arange(self._sequenceCount, dtype=_ab._np.int64)
+        patterns = []
+        tasks = []
+        for item, isSequence, support, nextSequences, nextPositions in self.makeSupDatabase(sequences, sequences, ()):
+            size = int((self._sequenceBounds[nextSequences + 1] - nextPositions).sum())
+            tasks.append((size, (item, support, nextSequences, nextPositions)))
+        with _TaskPool(self, self._workers) as pool:
+            pool.run(tasks, patterns.extend)
+        self._finalPatterns = {self._decode(pattern): support for pattern, support in patterns}
+
+    def startMine(self):
+        """
+        Closed sequential pattern mining process will start from here
+        """
+        self.mine()
+
+    def mine(self):
+        """
+        Closed sequential pattern mining process will start from here
+        """
+        self._startTime = _ab._time.time()
+        self._mine()
+        self._endTime = _ab._time.time()
+        process = _ab._psutil.Process(_ab._os.getpid())
+        self._memoryUSS = float()
+        self._memoryRSS = float()
+        self._memoryUSS = process.memory_full_info().uss
+        self._memoryRSS = process.memory_info().rss
+        print("Closed sequential patterns were generated successfully using BIDE algorithm ")
+
+    def printResults(self):
+        """
+        This function is used to print the results
+        """
+        print("Total number of Closed Sequential Patterns:", len(self.getPatterns()))
+        print("Total Memory in USS:", self.getMemoryUSS())
+        print("Total Memory in RSS", self.getMemoryRSS())
+        print("Total ExecutionTime in ms:", self.getRuntime())
+
+
+if __name__ == "__main__":
+    _ap = str()
+    if len(_ab._sys.argv) == 4 or len(_ab._sys.argv) == 5:
+        if len(_ab._sys.argv) == 5:
+            _ap = BIDE(_ab._sys.argv[1], _ab._sys.argv[3], _ab._sys.argv[4])
+        if len(_ab._sys.argv) == 4:
+            _ap = BIDE(_ab._sys.argv[1], _ab._sys.argv[3])
+        _ap.mine()
+        _Patterns = _ap.getPatterns()
+        print("Total number of Closed Sequential Patterns:", len(_Patterns))
+        _ap.save(_ab._sys.argv[2])
+        _memUSS = _ap.getMemoryUSS()
+        print("Total Memory in USS:", _memUSS)
+        _memRSS = _ap.getMemoryRSS()
+        print("Total Memory in RSS", _memRSS)
+        _run = _ap.getRuntime()
+        print("Total ExecutionTime in ms:", _run)
+    else:
+        print("Error! The number of input parameters do not match the total number of parameters provided")
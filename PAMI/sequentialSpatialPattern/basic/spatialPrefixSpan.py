@@ -15,16 +15,22 @@
 #      along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import PAMI.sequentialSpatialPattern.basic.abstract as _ab
+from PAMI.sequentialPattern.basic._SPADECore import _SPADECore
 import sys
-import copy
+import numpy as _np
 sys.setrecursionlimit(10000)
 
-class spatialPrefixSpan(_ab._sequentialSpatialPatterns):
+class spatialPrefixSpan(_ab._sequentialSpatialPatterns, _SPADECore):
     """
         Prifix Span is one of the fundamental algorithm to discover sequential frequent patterns in a transactional database.
         This program employs Prifix Span property (or downward closure property) to  reduce the search space effectively.
         This algorithm employs depth-first search technique to find the complete set of frequent patterns in a
         transactional database.
+        An item only extends a pattern when every item of the pattern is listed among its neighbours. The database is
+        encoded once into (sid, eid) id-lists and the neighbourhood into a CSR matrix whose row of an item holds the
+        items it may be followed by. The items allowed after a pattern are the intersection of the rows of its items,
+        computed once per pattern and kept on the depth-first path, and every other extension is dropped before any
+        id-list join.
         Reference:
         ----------
            J. Pei, J. Han, B. Mortazavi-Asl, J. Wang, H. Pinto, Q. Chen, U. Dayal, M. Hsu: Mining Sequential Patterns by Pattern-Growth: The PrefixSpan Approach. IEEE Trans. Knowl. Data Eng. 16(11): 1424-1440 (2004)
@@ -51,15 +57,19 @@ class spatialPrefixSpan(_ab._sequentialSpatialPatterns):
                 To store the total amount of USS memory consumed by the program
             memoryRSS : float
                 To store the total amount of RSS memory consumed by the program
-            Database : list
-                To store the transactions of a database in list
             maxLength:int
-                to store the maximum length of sequence pattern
+                to store the maximum length of sequence pattern, counted in itemsets
             maxGap   :int
                 to store the maximum gap of sequence pattern
                 gap means the length of interval between two itemsets
+            workers : int
+                number of processes mining the subtrees of the frequent items in parallel
             NeighboursMap:dict
                 to store the neighbor map(which place is neighbor)
+            followers: tuple
+                CSR (indptr, indices) matrix of the encoded items, the row of an item holding the items listing it as a neighbour
+            masks: list
+                the items allowed after every pattern of the depth-first path, as sorted arrays
         Methods:
         -------
             mine()
@@ -76,10 +86,10 @@ class spatialPrefixSpan(_ab._sequentialSpatialPatterns):
                 Total amount of RSS memory consumed by the mining process will be retrieved from this function
             getRuntime()
                 Total amount of runtime taken by the mining process will be retrieved from this function
-            candidateToFrequent(candidateList)
-                Generates frequent patterns from the candidate patterns
-            frequentToCandidate(frequentList, length)
-                Generates candidate patterns from the frequent patterns
+            make1LenDatabase()
+                Build the id-lists of the frequent items that have neighbours, encoded in lexical order
+            makeFollowers()
+                Build the CSR matrix of the items that may follow every item
             mapNeighbours()
                 read the neighbor file and make neighbor map.
 
@@ -106,13 +116,13 @@ class spatialPrefixSpan(_ab._sequentialSpatialPatterns):
                 python3 PrefixSpan.py sampleDB.txt output.txt neighbor.txt 10 "\t" 2 3
         Sample run of the importing code:
         ---------------------------------
-            import PAMI.frequentPattern.basic.PrefixSpan as alg
-            obj = alg.PrefixSpan(iFile, nFile,minSup)
+            import PAMI.sequentialSpatialPattern.basic.spatialPrefixSpan as alg
+            obj = alg.spatialPrefixSpan(iFile, nFile,minSup)
             obj.mine()
             frequentPatterns = obj.getPatterns()
             print("Total number of Frequent Patterns:", len(frequentPatterns))
-            obj.savePatterns(oFile)
-            Df = obj.getPatternInDataFrame()
+            obj.save(oFile)
+            Df = obj.getPatternsAsDataFrame()
             memUSS = obj.getMemoryUSS()
             print("Total Memory in USS:", memUSS)
             memRSS = obj.getMemoryRSS()
@@ -123,7 +133,9 @@ class spatialPrefixSpan(_ab._sequentialSpatialPatterns):
         --------
             The complete program was written by Suzuki Shota under the supervision of Professor Rage Uday Kiran.
     """
-    def __init__(self,iFile,nFile, minSup, sep="\t",maxlen=float("inf"),maxGap=float("inf")):
+    _sepSeq = "-1"
+
+    def __init__(self,iFile,nFile, minSup, sep="\t",maxlen=float("inf"),maxGap=float("inf"),workers=1):
         super().__init__( iFile,nFile, minSup, sep)
 
 
@@ -132,11 +144,12 @@ class spatialPrefixSpan(_ab._sequentialSpatialPatterns):
         self._finalPatterns = {}
         self._memoryUSS = float()
         self._memoryRSS = float()
-        self._Database = []
-        self._sepDatabase={}
         self._maxLength=maxlen
         self._maxGap=maxGap
+        self._workers=workers
         self._NeighboursMap = {}
+        self._followers = None
+        self._masks = []
     def _mapNeighbours(self):
         """
             A function to map items to their Neighbours
@@ -147,13 +160,12 @@ class spatialPrefixSpan(_ab._sequentialSpatialPatterns):
             if self._nFile.empty:
                 print("its empty..")
             i = self._nFile.columns.values.tolist()
-            if 'item' in i:
+            if 'items' in i:
                 items = self._nFile['items'].tolist()
             if 'Neighbours' in i:
                 data = self._nFile['Neighbours'].tolist()
             for k in range(len(items)):
                 self._NeighboursMap[items[k]] = data[k]
-            # print(self.Database)
         if isinstance(self._nFile, str):
             if _ab._validators.url(self._nFile):
                 data = _ab._urlopen(self._nFile)
@@ -162,7 +174,7 @@ class spatialPrefixSpan(_ab._sequentialSpatialPatterns):
                     line = line.decode("utf-8")
                     temp = [i.rstrip() for i in line.split(self._sep)]
                     temp = [x for x in temp if x]
-                    if temp[0] in self._Database.keys():
+                    if temp:
                         self._NeighboursMap[temp[0]] = temp[1:]
             else:
                 try:
@@ -171,338 +183,159 @@ class spatialPrefixSpan(_ab._sequentialSpatialPatterns):
                             line.strip()
                             temp = [i.rstrip() for i in line.split(self._sep)]
                             temp = [x for x in temp if x]
-                            self._NeighboursMap[temp[0]] = temp[1:]
+                            if temp:
+                                self._NeighboursMap[temp[0]] = temp[1:]
                 except IOError:
                     print("File Not Found")
                     quit()
-    def _creatingItemSets(self):
+
+    def _readLines(self):
         """
-            Storing the complete transactions of the database/input file in a database variable
+            Lines of the input database without the -2 closing every sequence
         """
-        self._Database = []
-
-        if isinstance(self._iFile, _ab._pd.DataFrame):
-            temp = []
-            if self._iFile.empty:
-                print("its empty..")
-            i = self._iFile.columns.values.tolist()
-            if 'Transactions' in i:
-                temp = self._iFile['Transactions'].tolist()
-
-            for k in temp:
-                self._Database.append(set(k))
-        if isinstance(self._iFile, str):
-            if _ab._validators.url(self._iFile):
-                data = _ab._urlopen(self._iFile)
-                for line in data:
-                    line.strip()
-                    line = line.decode("utf-8")
-                    temp = [i.rstrip() for i in line.split(self._sep)]
-                    temp = [x for x in temp if x]
-                    self._Database.append(set(temp))
+        for line in super()._readLines():
+            itemsets = line.rstrip().rsplit(self._sepSeq, 1)
+            if len(itemsets) == 2 and itemsets[1].strip() == "-2":
+                yield itemsets[0]
             else:
-                try:
-                    with open(self._iFile, 'r', encoding='utf-8') as f:
-                        for line in f:
-                            line.strip()
-                            temp = [i.rstrip() for i in line.split('-1')]
-                            temp = [x for x in temp if x ]
-                            temp.pop()
-
-                            seq = []
-                            for i in temp:
-                                if len(i)>1:
-                                   for j in list(sorted(set(i.split()))):
-                                       seq.append(j)
-                                   seq.append(-1)
-
-                                else:
-                                    seq.append(i)
-                                    seq.append(-1)
-                            self._Database.append(seq)
+                yield line
 
-
-                except IOError:
-                    print("File Not Found")
-                    quit()
-
-    def _convert(self, value):
+    def make1LenDatabase(self):
         """
-        To convert the user specified minSup value
-        :param value: user specified minSup value
-        :return: converted type
+            Build the id-lists of the frequent items as SPADE does. The items without a line in the neighbourhood
+            file never extend a pattern and are left out, and the others are renumbered in lexical order, the order
+            of the items of an itemset in a pattern
         """
-        if type(value) is int:
-            value = int(value)
-        if type(value) is float:
-            value = (len(self._Database) * value)
-        if type(value) is str:
-            if '.' in value:
-                value = float(value)
-                value = (len(self._Database) * value)
-            else:
-                value = int(value)
-        return value
-    def makeNext(self,sepDatabase,startrow):
+        super().make1LenDatabase()
+        order = sorted((item for item in self._idLists if self._itemNames[item] in self._NeighboursMap),
+                       key=lambda x: self._itemNames[x])
+        self._itemNames = [self._itemNames[item] for item in order]
+        self._idLists = {newItem: self._idLists[item] for newItem, item in enumerate(order)}
+        self.makeFollowers()
+
+    def makeFollowers(self):
         """
-         To get next pattern by adding head word to next sequence of startrow
-        :param sepDatabase: dict
-            what words and rows startrow have to add it
-        :param startrow:
-            the patterns get before
+            Build the CSR matrix of the encoded items whose row of an item y holds, in order, every item x listing y
+            as a neighbour, the items that may come after y in a pattern
         """
-        for head in sepDatabase.keys():
-            if head not in self._NeighboursMap.keys():
+        items = {name: item for item, name in enumerate(self._itemNames)}
+        rows, columns = [], []
+        for name, neighbours in self._NeighboursMap.items():
+            item = items.get(name)
+            if item is None:
                 continue
-            newrow=[i for i in startrow]
-            checkrow={i for i in startrow if i!=-1}
-
-            if len(sepDatabase[head])>=self._minSup  and checkrow.issubset(self._NeighboursMap[head]):
-                if newrow:
-                    newrow.append(-1)
-                newrow.append(head)
-                newrow.append(-1)
-                if str(newrow) not in self._finalPatterns:
-                    self._finalPatterns[str(newrow)]=len(sepDatabase[head])
-                    give = [head]
-                    sepDatabase[head] = self.makeSupDatabase(sepDatabase[head], give)
-                    newrow.pop()
-                    self.makeSeqDatabaseSame(sepDatabase[head], newrow)
-                elif len(sepDatabase[head]) > self._finalPatterns[str(newrow)]:
-                    self._finalPatterns[str(newrow)] = len(sepDatabase[head])
-                    give = [head]
-                    sepDatabase[head] = self.makeSupDatabase(sepDatabase[head], give)
-                    newrow.pop()
-                    self.makeSeqDatabaseSame(sepDatabase[head], newrow)
-
-
-
-    def makeSupDatabase(self,database,head):
+            for neighbour in set(neighbours):
+                other = items.get(neighbour)
+                if other is not None:
+                    rows.append(other)
+                    columns.append(item)
+        rows = _np.asarray(rows, dtype=_np.int64)
+        columns = _np.asarray(columns, dtype=_np.int64)
+        order = _np.lexsort((columns, rows))
+        indptr = _np.zeros(len(self._itemNames) + 1, dtype=_np.int64)
+        _np.cumsum(_np.bincount(rows, minlength=len(self._itemNames)), out=indptr[1:])
+        self._followers = (indptr, columns[order])
+
+    def _follow(self, mask, item):
         """
-         To delete not frequent words without words in latest sequence
-        :param database: list
-            database of lines have same startrow and head word
-        :param head:list
-         words in latest sequence
-        :return: changed database
-
+            The items allowed after a pattern extended with item: those of the mask of the pattern that also list
+            item as a neighbour
+
+            :param mask: sorted items allowed after the pattern, or None for the empty pattern
+            :type mask: numpy.ndarray
+            :param item: the extending item
+            :type item: int
+            :return: the sorted items allowed after the extended pattern
+            :rtype: numpy.ndarray
         """
+        indptr, indices = self._followers
+        row = indices[indptr[item]:indptr[item + 1]]
+        if mask is None:
+            return row
+        return _np.intersect1d(mask, row, assume_unique=True)
 
-        supDatabase={}
-        alreadyInData=[]
-        newDatabase = []
-
-        for line in database:
-            alreadyInLine = []
-            for data in line:
-                    if data not in alreadyInLine:
-                        if data not in alreadyInData:
-                            supDatabase[data]=1
-                            alreadyInData.append(data)
-                        else:
-                            supDatabase[data]+=1
-                        alreadyInLine.append(data)
-        for line in database:
-                newLine=[]
-                for i in line:
-                    if supDatabase[i]>=self._minSup or i in head:
-                        if len(newLine)>1:
-                            if newLine[-1]!=-1 or i!=-1:
-                                newLine.append(i)
-                        else:
-                            newLine.append(i)
-                newDatabase.append(newLine)
-
-        return newDatabase
-
-    def makeNextSame(self,sepDatabase,startrow):
+    def _joinCandidates(self, atoms):
         """
-         To get next pattern by adding head word to latest sequence of startrow
-        :param sepDatabase: dict
-            what words and rows startrow have to add it
-        :param startrow:
-            the patterns get before
-        """
-        for head in sepDatabase.keys():
-            if head not in self._NeighboursMap.keys():
-                continue
-            checkrow = {i for i in startrow if i != -1}
-            if len(sepDatabase[head])>=self._minSup and checkrow.issubset(self._NeighboursMap[head]):
-                newrow = startrow.copy()
-                newrow.append(head)
-                newrow.append(-1)
-
-                if str(newrow) not in self._finalPatterns.keys():
-                    self._finalPatterns[str(newrow)]=len(sepDatabase[head])
-                    if -1 in startrow:
-                        give = self.getSameSeq(startrow)
-                    else:
-                        give = startrow.copy()
-                    give.append(head)
-                    sepDatabase[head] = self.makeSupDatabase(sepDatabase[head], give)
-                    newrow.pop()
-                    self.makeSeqDatabaseSame(sepDatabase[head], newrow)
-                elif len(sepDatabase[head])>self._finalPatterns[str(newrow)]:
-                    self._finalPatterns[str(newrow)] = len(sepDatabase[head])
-                    if -1 in startrow:
-                        give = self.getSameSeq(startrow)
-                    else:
-                        give = startrow.copy()
-                    give.append(head)
-                    sepDatabase[head] = self.makeSupDatabase(sepDatabase[head], give)
-                    newrow.pop()
-                    self.makeSeqDatabaseSame(sepDatabase[head], newrow)
-
-
-
+            The siblings and sequence extension candidates of the SPADE join, restricted to the items allowed after
+            the pattern being grown. No sequence extension is left once the pattern has maxLength itemsets
 
-
-
-
-
-    def makeSeqDatabaseFirst(self,database):
+            :param atoms: the frequent atoms of the prefix
+            :type atoms: list
+            :return: the sibling atoms and the sequence extension candidates
+            :rtype: tuple
         """
-        To make 1 length sequence dataset list which start from same word. It was stored only 1 from 1 line.
-        :param database:
-                To store the transactions of a database in list
+        mask, itemsets = self._masks[-1]
+        atoms, candidates = super()._joinCandidates(atoms)
+        if itemsets >= self._maxLength:
+            candidates = []
+        return self._allowed(mask, atoms), self._allowed(mask, candidates)
+
+    @staticmethod
+    def _allowed(mask, group):
         """
-        startrow=[]
-        seqDatabase={}
-
-        for line in database:
-            alreadyInLine=[]
-            for data in range(len(line)):
-                if line[data] not in alreadyInLine and line[data]!=-1:
-                    if line[data] not in seqDatabase.keys():
-                        seqDatabase[line[data]]=[]
-                        seqDatabase[line[data]].append(line[data+1:])
-                        alreadyInLine.append(line[data])
-                    else:
-                        seqDatabase[line[data]].append(line[data+1:])
-                        alreadyInLine.append(line[data])
-
-        if len(seqDatabase)>0:
-            self.makeNext(seqDatabase,startrow)
-
-    def serchSame(self,database,startrow,give):
+            The atoms or candidates of a group whose item is in the mask
+
+            :param mask: sorted allowed items
+            :type mask: numpy.ndarray
+            :param group: atoms or candidates, the item coming first
+            :type group: list
+            :return: the allowed ones, in order
+            :rtype: list
         """
-         To get 2 or more length patterns in same sequence.
-        :param database: list
-            To store the transactions of a database in list which have same startrow and head word
-        :param startrow: list
-            the patterns get before
-        :param give: list
-            the word in latest sequence of startrow
-        :return:
+        if not group or not len(mask):
+            return []
+        items = _np.fromiter((x[0] for x in group), dtype=_np.int64, count=len(group))
+        found = mask[_np.minimum(_np.searchsorted(mask, items), len(mask) - 1)] == items
+        return [x for x, keep in zip(group, found.tolist()) if keep]
+
+    def _mineAtom(self, pattern, length, atoms, index):
+        """
+            Grow one atom as SPADE does, with the items allowed after its pattern on top of the mask stack
+
+            :param pattern: the prefix of the atoms
+            :type pattern: tuple
+            :param length: number of items of the prefix
+            :type length: int
+            :param atoms: the frequent atoms of the prefix
+            :type atoms: list
+            :param index: index of the atom in atoms
+            :type index: int
         """
-        sepDatabaseSame= {startrow[-1]: []}
-        for line in database:
-            addLine=0
-            i=0
-            if len(line)>1:
-                while line[i]!=-1:
-                    if line[i]==startrow[-1]:
-                        sepDatabaseSame[startrow[-1]].append(line[i+1:])
-                        addLine=1
-                        break
-                    i+=1
-                if addLine!=1:
-                    ok=[]
-                    while i <len(line):
-                        if line[i]==-1:
-                            ok=[]
-                        elif line[i]==startrow[-1]:
-                            ok.append("sk1")
-                        for x in give:
-                            if x==line[i]:
-                                ok.append(x)
-                        if len(ok)==1+len(give):
-                            sepDatabaseSame[startrow[-1]].append(line[i+1:])
-                            break
-                        i+=1
-        startrow2=[startrow[0]]
-        startrow.append(-1)
-        if str(startrow) not in self._finalPatterns.keys():
-                self.makeNextSame(sepDatabaseSame,startrow2)
-        elif self._finalPatterns[str(startrow)]<len(sepDatabaseSame[startrow[-2]]):
-            self.makeNextSame(sepDatabaseSame,startrow2)
-        return sepDatabaseSame[startrow[-2]]
-
-    def getSameSeq(self,startrow):
+        item, isSequence = atoms[index][0], atoms[index][1]
+        mask = self._follow(self._masks[-1][0], item)
+        self._masks.append((mask, len(pattern) + isSequence))
+        try:
+            super()._mineAtom(pattern, length, atoms, index)
+        finally:
+            self._masks.pop()
+
+    def _mineTask(self, index):
         """
-         To get words in latest sequence
-        :param startrow:
-         the patterns get before
-        :return:
+            Mine the subtree of one frequent item, a task of the process pool
+
+            :param index: index of the item among the atoms of the empty prefix
+            :type index: int
+            :return: (pattern, support) of every pattern of the subtree
+            :rtype: list
         """
-        give = []
-        newrow = startrow.copy()
-        while newrow[-1] != -1:
-            y = newrow.pop()
-            give.append(y)
-        return give
+        self._masks = [(None, 0)]
+        return super()._mineTask(index)
 
+    def _decode(self, pattern):
+        """
+            Name of a pattern in the final patterns: the list of the items of every itemset in lexical order, each
+            itemset closed by -1
 
-    def makeSeqDatabaseSame(self,database,startrow):
+            :param pattern: pattern as a tuple of itemsets of integer ids
+            :type pattern: tuple
+            :return: the pattern name
+            :rtype: str
         """
-            To make sequence dataset list which start from same word(head). It was stored only 1 from 1 line.
-            And it separated by having head in latest sequence of startrow or not.
-
-            :param database:
-                    To store the transactions of a database in list
-            :param startrow: list
-                    the patterns get before
-
-            """
-        seqDatabase={}
-        seqDatabaseSame={}
-        seqLength=startrow.count(-1)+1
-        for line in database:
-            if len(line)>1:
-                alreadyInLine=[]
-                i = 0
-                while line[i] != -1:
-                        if line[i] not in seqDatabaseSame:
-                            if -1 in startrow:
-                                give=self.getSameSeq(startrow)
-                            else:
-                                give=startrow.copy()
-                            newrow= [startrow[-1], line[i]]
-                            seqDatabaseSame[line[i]] = self.serchSame(database, newrow,give)
-
-                        i += 1
-                same=0
-                seqCount=0
-                if self._maxLength>seqLength:
-                    while len(line)>i and self._maxGap>seqCount:
-                        if line[i]!=-1:
-                            if line[i] not in alreadyInLine:
-                                if line[i] not in seqDatabase:
-                                    seqDatabase[line[i]]=[]
-                                seqDatabase[line[i]].append(line[i + 1:])
-                                alreadyInLine.append(line[i])
-                            if line[i]==startrow[-1]:
-                                same=1
-
-
-                            elif same==1 and line[i] not in seqDatabaseSame:
-                                if -1 in startrow:
-                                    give=self.getSameSeq(startrow)
-                                else:
-                                    give=startrow.copy()
-                                newrow= [startrow[-1], line[i]]
-                                seqDatabaseSame[line[i]] = self.serchSame(database, newrow,give)
-
-                        else:
-                            same=0
-                            seqCount+=1
-                        i+=1
-
-
-        if len(seqDatabase)!=0:
-            self.makeNext(seqDatabase,startrow)
-        if len(seqDatabaseSame)!=0:
-            self.makeNextSame(seqDatabaseSame,startrow)
+        row = []
+        for itemset in pattern:
+            row.extend(sorted(self._itemNames[item] for item in itemset))
+            row.append(-1)
+        return str(row)
 
     def startMine(self) -> None:
         self.mine()
@@ -511,13 +344,9 @@ class spatialPrefixSpan(_ab._sequentialSpatialPatterns):
         """
             Frequent pattern mining process will start from here
         """
-        self._Database = []
         self._startTime = _ab._time.time()
-        self._creatingItemSets()
-        self._Database=self.makeSupDatabase(self._Database,"")
-        self._minSup = self._convert(self._minSup)
         self._mapNeighbours()
-        self.makeSeqDatabaseFirst(self._Database)
+        self._mineSPADE()
         self._endTime = _ab._time.time()
         process = _ab._psutil.Process(_ab._os.getpid())
         self._memoryUSS = float()
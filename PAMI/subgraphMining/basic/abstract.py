@@ -1,11 +1,16 @@
 from abc import ABC, abstractmethod
 from .graph import Graph
+from .csrGraph import CSRGraph
+from .canonicalCode import CanonicalCodes
 from .dfsCode import DFSCode
 from .frequentSubgraph import FrequentSubgraph
 from .vertex import Vertex
 from .edge import Edge
+from .embedding import Embedding
+from .graphIdBitmap import GraphIdBitmap
 from .extendedEdge import ExtendedEdge
 from .sparseTriangularMatrix import SparseTriangularMatrix
+from PAMI.extras.convert.Graphs2Binary import BinaryGraphDatabase
 import time
 import math
 import matplotlib.pyplot as plt
@@ -0,0 +1,208 @@
+# gSpan is a subgraph mining algorithm that uses DFS and DFS codes to mine subgraphs
+#
+# **Importing this algorithm into a python program**
+#
+#             from PAMI.subgraphMining.basic import gspan as alg
+#
+#             obj = alg.GSpan(iFile, minSupport)
+#
+#             obj.mine()
+#
+#             obj.run()
+#
+#             frequentGraphs = obj.getFrequentSubgraphs()
+#
+#             memUSS = obj.getMemoryUSS()
+#
+#             obj.save(oFile)
+#
+#             print("Total Memory in USS:", memUSS)
+#
+#             memRSS = obj.getMemoryRSS()
+#
+#             print("Total Memory in RSS", memRSS)
+#
+#             run = obj.getRuntime()
+#
+#             print("Total ExecutionTime in seconds:", run)
+#
+
+
+__copyright__ = """
+ Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from collections import OrderedDict
+
+
+def _smallerThan(x, y):
+    """
+    The order of ExtendedEdge.smallerThan on (v1, v2, vLabel1, vLabel2, edgeLabel) tuples
+    """
+    x1, x2, y1, y2 = x[0], x[1], y[0], y[1]
+    xForward = x1 < x2
+    yForward = y1 < y2
+    if xForward and yForward:
+        pairSmaller = x2 < y2 or (x2 == y2 and x1 > y1)
+    elif not xForward and not yForward:
+        pairSmaller = x1 < y1 or (x1 == y1 and x2 < y2)
+    elif xForward:
+        pairSmaller = x2 <= y1
+    else:
+        pairSmaller = x1 < y2
+    if pairSmaller:
+        return True
+    return x1 == y1 and x2 == y2 and x[2:] < y[2:]
+
+
+def _extensionKey(ee, rightMost):
+    """
+    A key ordering the rightmost path extensions of a code as ExtendedEdge.smallerThan does: backward edges first by
+    their target, then forward edges from the deepest vertex of the rightmost path, then by labels. None if the edge
+    is no such extension
+    """
+    v1, v2 = ee[0], ee[1]
+    if v1 == rightMost and v2 < v1:
+        return (0, v2) + ee[2:]
+    if v2 == rightMost + 1 and v1 < v2:
+        return (1, -v1) + ee[2:]
+    return None
+
+
+def isMinimal(code):
+    """
+    :Description: Checks that a DFS code is the minimum DFS code of the graph it describes. The minimum code is
+                  grown one edge at a time as the smallest rightmost path extension over the embeddings of the part
+                  grown so far in the graph of the code, and the check stops at the first step where that extension
+                  is smaller than the edge of the code. The embeddings are extended along with the minimum code
+                  instead of being searched again at every step.
+
+    :param code: the code as a flat tuple of (v1, v2, vLabel1, vLabel2, edgeLabel) for every edge
+    :type code: tuple
+    :return: True if the code is canonical
+    :rtype: bool
+    """
+    edges = [code[i:i + 5] for i in range(0, len(code), 5)]
+    if not edges:
+        return True
+    labels = {}
+    adjacency = {}
+    for v1, v2, vLabel1, vLabel2, edgeLabel in edges:
+        labels[v1] = vLabel1
+        labels[v2] = vLabel2
+        adjacency.setdefault(v1, []).append((v2, edgeLabel))
+        adjacency.setdefault(v2, []).append((v1, edgeLabel))
+
+    # The smallest first edge is read with its smaller label first, and embedded both ways on a tie
+    minEdge = min((0, 1) + (labels[u], labels[x], edgeLabel) if labels[u] <= labels[x]
+                  else (0, 1) + (labels[x], labels[u], edgeLabel) for u, x, _, _, edgeLabel in edges)
+    if _smallerThan(minEdge, edges[0]):
+        return False
+    embeddings = [[u, x] for u in adjacency for x, edgeLabel in adjacency[u]
+                  if labels[u] == minEdge[2] and labels[x] == minEdge[3] and edgeLabel == minEdge[4]]
+    rightMost = 1
+    rightMostPath = [0, 1]
+    codeEdges = {(0, 1), (1, 0)}
+
+    for ee in edges[1:]:
+        target = _extensionKey(ee, rightMost)
+        preOfRightMost = rightMostPath[-2] if len(rightMostPath) > 1 else None
+        minKey = None
+        found = []
+        for embedding in embeddings:
+            inverse = {x: v for v, x in enumerate(embedding)}
+            mappedRm = embedding[rightMost]
+            for x, edgeLabel in adjacency[mappedRm]:
+                v = inverse.get(x)
+                if v is not None and v in rightMostPath and v != preOfRightMost and (rightMost, v) not in codeEdges:
+                    key = (0, v, labels[mappedRm], labels[x], edgeLabel)
+                    if minKey is None or key < minKey:
+                        minKey, found = key, [embedding]
+                    elif key == minKey:
+                        found.append(embedding)
+            for v in reversed(rightMostPath):
+                mappedV = embedding[v]
+                for x, edgeLabel in adjacency[mappedV]:
+                    if x not in inverse:
+                        key = (1, -v, labels[mappedV], labels[x], edgeLabel)
+                        if minKey is None or key < minKey:
+                            minKey, found = key, [embedding + [x]]
+                        elif key == minKey:
+                            found.append(embedding + [x])
+            if target is not None and minKey is not None and minKey < target:
+                return False
+        if minKey is None:
+            return True
+        if minKey[0] == 0:
+            minEdge = (rightMost, minKey[1]) + minKey[2:]
+        else:
+            minEdge = (-minKey[1], rightMost + 1) + minKey[2:]
+        if _smallerThan(minEdge, ee):
+            return False
+
+        embeddings = found
+        v1, v2 = minEdge[0], minEdge[1]
+        codeEdges.add((v1, v2))
+        codeEdges.add((v2, v1))
+        if v1 < v2:
+            rightMost = v2
+            while rightMostPath and rightMostPath[-1] > v1:
+                rightMostPath.pop()
+            rightMostPath.append(v2)
+    return True
+
+
+class CanonicalCodes:
+    """
+    :Description: Checks that DFS codes are canonical and keeps the result of the last checked codes in a least
+                  recently used cache, keyed by the code as a flat tuple of integers. The result only depends on the
+                  code, so a cache may be shared by the runs of a miner on the same database.
+
+    :Attributes:
+
+        maxSize: int
+            the number of codes kept in the cache
+        hits: int
+            the number of checks answered from the cache
+
+    :Methods:
+
+        isCanonical(c)
+            Checks that a DFS code is canonical
+    """
+
+    def __init__(self, maxSize=65536):
+        self.maxSize = maxSize
+        self.hits = 0
+        self._cache = OrderedDict()
+
+    def isCanonical(self, c):
+        """
+        :param c: a DFS code
+        :type c: DFSCode
+        :return: True if the code is the minimum DFS code of its graph
+        :rtype: bool
+        """
+        key = tuple(x for ee in c.getEeList() for x in (ee.v1, ee.v2, ee.vLabel1, ee.vLabel2, ee.edgeLabel))
+        result = self._cache.get(key)
+        if result is not None:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return result
+        result = isMinimal(key)
+        self._cache[key] = result
+        if len(self._cache) > self.maxSize:
+            self._cache.popitem(last=False)
+        return result
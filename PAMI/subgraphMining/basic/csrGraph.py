@@ -0,0 +1,448 @@
+# gSpan is a subgraph mining algorithm that uses DFS and DFS codes to mine subgraphs
+#
+# **Importing this algorithm into a python program**
+#
+#             from PAMI.subgraphMining.basic import gspan as alg
+#
+#             obj = alg.GSpan(iFile, minSupport)
+#
+#             obj.mine()
+#
+#             obj.run()
+#
+#             frequentGraphs = obj.getFrequentSubgraphs()
+#
+#             memUSS = obj.getMemoryUSS()
+#
+#             obj.save(oFile)
+#
+#             print("Total Memory in USS:", memUSS)
+#
+#             memRSS = obj.getMemoryRSS()
+#
+#             print("Total Memory in RSS", memRSS)
+#
+#             run = obj.getRuntime()
+#
+#             print("Total ExecutionTime in seconds:", run)
+#
+
+
+__copyright__ = """
+ Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from bisect import bisect_left, bisect_right
+
+import numpy as np
+
+
+class CSRGraph:
+    """
+    A graph of the database stored as compressed sparse row arrays instead of Vertex and Edge objects. The vertices
+    are numbered 0 to n - 1 and the neighbours of vertex v are the entries offsets[v] to offsets[v + 1] of the
+    neighbour arrays, sorted by label and then by id, so the neighbours of a given label are a slice found by binary
+    search. Every edge is stored from both of its ends, and the neighbour, its label and the edge label of every entry
+    are one row of a single array, so the neighbours of a vertex are read with one slice.
+
+    :Attributes:
+
+        id: int
+            the id of the graph
+        vertexIds: numpy.ndarray
+            the id of every vertex in the graph it was built from
+        vertexLabels: numpy.ndarray
+            the label of every vertex
+        offsets: numpy.ndarray
+            the start of the neighbours of every vertex, followed by the number of neighbour entries
+        adjacency: numpy.ndarray
+            the (id, label, edge label) of every neighbour entry
+        neighbours: numpy.ndarray
+            the neighbour ids, a column of adjacency
+        neighbourLabels: numpy.ndarray
+            the label of every neighbour, a column of adjacency
+        edgeLabels: numpy.ndarray
+            the label of the edge to every neighbour, a column of adjacency
+        edgeProbabilities: numpy.ndarray
+            the existence probability of the edge to every neighbour in an uncertain graph, None otherwise
+        entryPositions: numpy.ndarray
+            the position of every neighbour entry in the entries the graph was built from, if kept, None otherwise
+
+    :Methods:
+
+        fromGraph(graph)
+            Builds the CSR arrays of a graph made of Vertex and Edge objects
+        fromEdges(iD, vertexLabels, sources, targets, edgeLabels, edgeProbabilities, vertexIds)
+            Builds the CSR arrays of a graph from its edges, each given once
+        readText(path, vertexLabel, edgeLabel)
+            Reads the graphs of a text file straight into CSR arrays
+        getConnectedLabels()
+            The labels of the vertices with at least one neighbour
+        removeInfrequentLabels(labels)
+            Removes the vertices with the given labels and their edges
+        removeInfrequentEntries(graphs, minSup, vertexPairs, edgeLabels)
+            Removes the edges of infrequent vertex label pairs and infrequent edge labels from graphs
+        getNeighbours(v)
+            The (id, label, edge label) of every neighbour of a vertex
+        getNeighboursWithLabel(v, label)
+            The (id, edge label) of every neighbour of a vertex with the given label
+        getEdges()
+            The edges of a graph built by fromEdges, in the order they were given
+    """
+
+    def __init__(self, iD, vertexLabels, sources, targets, edgeLabels, edgeProbabilities=None, vertexIds=None,
+                 entryOrder=False):
+        """
+        :param iD: the id of the graph
+        :type iD: int
+        :param vertexLabels: the label of every vertex, vertices being numbered from 0
+        :type vertexLabels: list or numpy.ndarray
+        :param sources: the vertex of every neighbour entry, an edge being listed from both of its ends
+        :type sources: list or numpy.ndarray
+        :param targets: the neighbour of every entry
+        :type targets: list or numpy.ndarray
+        :param edgeLabels: the edge label of every entry
+        :type edgeLabels: list or numpy.ndarray
+        :param edgeProbabilities: the existence probability of the edge of every entry
+        :type edgeProbabilities: list or numpy.ndarray
+        :param vertexIds: the original id of every vertex, the vertex numbers by default
+        :type vertexIds: list or numpy.ndarray
+        :param entryOrder: keep the position of every entry in the given entries
+        :type entryOrder: bool
+        """
+        self.id = iD
+        entryPositions = np.arange(len(sources), dtype=np.int64) if entryOrder else None
+        self._setArrays(vertexLabels, sources, targets, edgeLabels, edgeProbabilities, vertexIds, entryPositions)
+
+    def _setArrays(self, vertexLabels, sources, targets, edgeLabels, edgeProbabilities, vertexIds, entryPositions):
+        """
+        Sorts the neighbour entries and sets the arrays of the graph, the parameters being those of __init__ and the
+        position of every entry, or None
+        """
+        self.vertexLabels = np.asarray(vertexLabels, dtype=np.int64)
+        n = len(self.vertexLabels)
+        self.vertexIds = np.arange(n, dtype=np.int64) if vertexIds is None else np.asarray(vertexIds, dtype=np.int64)
+        sources = np.asarray(sources, dtype=np.int64)
+        targets = np.asarray(targets, dtype=np.int64)
+        targetLabels = self.vertexLabels[targets]
+        order = np.lexsort((targets, targetLabels, sources))
+        self.offsets = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=n), out=self.offsets[1:])
+        self.adjacency = np.stack((targets, targetLabels, np.asarray(edgeLabels, dtype=np.int64)), axis=1)[order]
+        self.neighbours = self.adjacency[:, 0]
+        self.neighbourLabels = self.adjacency[:, 1]
+        self.edgeLabels = self.adjacency[:, 2]
+        self.edgeProbabilities = None
+        if edgeProbabilities is not None:
+            self.edgeProbabilities = np.asarray(edgeProbabilities, dtype=np.float64)[order]
+        self.entryPositions = None if entryPositions is None else entryPositions[order]
+        self.edgeCount = len(self.neighbours) // 2
+        labelOrder = np.argsort(self.vertexLabels, kind='stable')
+        self._labelOrder = labelOrder.astype(np.int32)
+        self._sortedLabels = self.vertexLabels[labelOrder]
+
+    @classmethod
+    def fromGraph(cls, graph):
+        """
+        Builds the CSR arrays of a graph made of Vertex and Edge objects, numbering its vertices in id order
+
+        :param graph: the graph
+        :type graph: Graph
+        :return: the graph in CSR form
+        :rtype: CSRGraph
+        """
+        vertices = sorted(graph.vMap.values(), key=lambda vertex: vertex.getId())
+        index = {vertex.getId(): i for i, vertex in enumerate(vertices)}
+        sources, targets, edgeLabels, edgeProbabilities = [], [], [], []
+        for i, vertex in enumerate(vertices):
+            for e in vertex.getEdgeList():
+                sources.append(i)
+                targets.append(index[e.another(vertex.getId())])
+                edgeLabels.append(e.getEdgeLabel())
+                edgeProbabilities.append(getattr(e, 'existenceProbability', None))
+        if not edgeProbabilities or edgeProbabilities[0] is None:
+            edgeProbabilities = None
+        return cls(graph.getId(), [vertex.getLabel() for vertex in vertices], sources, targets, edgeLabels,
+                   edgeProbabilities, [vertex.getId() for vertex in vertices])
+
+    @classmethod
+    def fromEdges(cls, iD, vertexLabels, sources, targets, edgeLabels, edgeProbabilities=None, vertexIds=None,
+                  entryOrder=False):
+        """
+        Builds the CSR arrays of a graph from its edges, each given once with its end points numbered from 0 in the
+        order of the vertices. Every edge is stored from both of its ends, the entries of a vertex keeping the order
+        of its edges among the neighbours of the same label and id
+
+        :param iD: the id of the graph
+        :type iD: int
+        :param vertexLabels: the label of every vertex
+        :type vertexLabels: list or numpy.ndarray
+        :param sources: the first end point of every edge
+        :type sources: list or numpy.ndarray
+        :param targets: the second end point of every edge
+        :type targets: list or numpy.ndarray
+        :param edgeLabels: the label of every edge
+        :type edgeLabels: list or numpy.ndarray
+        :param edgeProbabilities: the existence probability of every edge
+        :type edgeProbabilities: list or numpy.ndarray
+        :param vertexIds: the id of every vertex, the vertex numbers by default
+        :type vertexIds: list or numpy.ndarray
+        :param entryOrder: keep the order and the end points of the edges, for getEdges
+        :type entryOrder: bool
+        :return: the graph in CSR form
+        :rtype: CSRGraph
+        """
+        sources = np.asarray(sources, dtype=np.int64)
+        targets = np.asarray(targets, dtype=np.int64)
+        # the two entries of an edge are consecutive, the entry from its first end point first
+        entrySources = np.stack((sources, targets), axis=1).ravel()
+        entryTargets = np.stack((targets, sources), axis=1).ravel()
+        edgeLabels = np.repeat(np.asarray(edgeLabels, dtype=np.int64), 2)
+        if edgeProbabilities is not None:
+            edgeProbabilities = np.repeat(np.asarray(edgeProbabilities, dtype=np.float64), 2)
+        return cls(iD, vertexLabels, entrySources, entryTargets, edgeLabels, edgeProbabilities, vertexIds, entryOrder)
+
+    @classmethod
+    def readText(cls, path, vertexLabel=int, edgeLabel=int, entryOrder=False):
+        """
+        Reads the graphs of a text file in the "t # / v / e" format straight into CSR arrays. Only the vertices and
+        edges of the graph being read are held in lists, no Vertex or Edge object is built. An edge line with a fifth
+        column gives the existence probability of the edge
+
+        :param path: path to the text file
+        :type path: str
+        :param vertexLabel: converts a vertex label of the text file
+        :type vertexLabel: function
+        :param edgeLabel: converts an edge label of the text file
+        :type edgeLabel: function
+        :param entryOrder: keep the order and the end points of the edges, for getEdges
+        :type entryOrder: bool
+        :return: the graphs of the file, graphs without vertices being skipped
+        :rtype: generator
+        """
+        gId, index = None, {}
+        vertexIds, vertexLabels, sources, targets, edgeLabels, edgeProbabilities = [], [], [], [], [], []
+        with open(path, 'r') as f:
+            for line in f:
+                items = line.split()
+                if not items:
+                    continue
+                if items[0] == 't':
+                    if index:
+                        yield cls.fromEdges(gId, vertexLabels, sources, targets, edgeLabels,
+                                            edgeProbabilities or None, vertexIds, entryOrder)
+                    gId, index = int(items[2]), {}
+                    vertexIds, vertexLabels, sources, targets, edgeLabels, edgeProbabilities = [], [], [], [], [], []
+                elif items[0] == 'v':
+                    vId = int(items[1])
+                    label = vertexLabel(items[2])
+                    if vId in index:
+                        vertexLabels[index[vId]] = label
+                        continue
+                    index[vId] = len(vertexIds)
+                    vertexIds.append(vId)
+                    vertexLabels.append(label)
+                elif items[0] == 'e':
+                    sources.append(index[int(items[1])])
+                    targets.append(index[int(items[2])])
+                    edgeLabels.append(edgeLabel(items[3]))
+                    if len(items) > 4:
+                        edgeProbabilities.append(float(items[4]))
+        if index:
+            yield cls.fromEdges(gId, vertexLabels, sources, targets, edgeLabels, edgeProbabilities or None, vertexIds,
+                                entryOrder)
+
+    def getId(self):
+        return self.id
+
+    def getVertexCount(self):
+        return len(self.vertexLabels)
+
+    def getEdgeCount(self):
+        return self.edgeCount
+
+    def getVertexIds(self):
+        return range(len(self.vertexLabels))
+
+    def getVLabel(self, v):
+        return int(self.vertexLabels[v])
+
+    def findAllWithLabel(self, targetLabel):
+        start, end = np.searchsorted(self._sortedLabels, (targetLabel, targetLabel + 1))
+        return self._labelOrder[start:end].tolist()
+
+    def getNeighbours(self, v):
+        """
+        :param v: a vertex
+        :type v: int
+        :return: the [id, label, edge label] of every neighbour of the vertex, by label and then by id
+        :rtype: list
+        """
+        start, end = self.offsets[v:v + 2].tolist()
+        return self.adjacency[start:end].tolist()
+
+    def _labelSlice(self, v, label):
+        """
+        :return: the first and past the last neighbour entries of the vertex v with the given label
+        :rtype: tuple
+        """
+        start, end = self.offsets[v:v + 2].tolist()
+        # The slices are short, so they are searched as lists rather than with numpy calls
+        labels = self.neighbourLabels[start:end].tolist()
+        low = bisect_left(labels, label)
+        return start + low, start + bisect_right(labels, label, low)
+
+    def getNeighboursWithLabel(self, v, label):
+        """
+        :param v: a vertex
+        :type v: int
+        :param label: a vertex label
+        :type label: int
+        :return: the [id, edge label] of every neighbour of the vertex with the label, by id
+        :rtype: list
+        """
+        start, end = self._labelSlice(v, label)
+        return self.adjacency[start:end, ::2].tolist()
+
+    def _find(self, v1, v2):
+        """
+        :return: the neighbour entry of v2 in the neighbours of v1, -1 if they are not neighbours
+        :rtype: int
+        """
+        start, end = self._labelSlice(v1, self.vertexLabels[v2])
+        position = start + bisect_left(self.neighbours[start:end].tolist(), v2)
+        if position < end and self.neighbours[position] == v2:
+            return position
+        return -1
+
+    def isNeighboring(self, v1, v2):
+        return self._find(v1, v2) >= 0
+
+    def getEdgeLabel(self, v1, v2):
+        position = self._find(v1, v2)
+        return int(self.edgeLabels[position]) if position >= 0 else -1
+
+    def getEdges(self):
+        """
+        The edges of a graph built by fromEdges with entryOrder, in the order and with the end points they were given
+
+        :return: the first end point, second end point, label and existence probability of every edge, the end
+                 points being vertex numbers and the probabilities None in a certain graph
+        :rtype: tuple
+        """
+        first = np.flatnonzero(self.entryPositions % 2 == 0)
+        first = first[np.argsort(self.entryPositions[first])]
+        probabilities = None if self.edgeProbabilities is None else self.edgeProbabilities[first]
+        return self._sources()[first], self.neighbours[first], self.edgeLabels[first], probabilities
+
+    def getConnectedLabels(self):
+        """
+        :return: the label of every vertex with at least one neighbour, in vertex order
+        :rtype: list
+        """
+        return self.vertexLabels[self.offsets[1:] > self.offsets[:-1]].tolist()
+
+    def _sources(self):
+        """
+        :return: the vertex of every neighbour entry
+        :rtype: numpy.ndarray
+        """
+        return np.repeat(np.arange(len(self.vertexLabels)), np.diff(self.offsets))
+
+    def _labelPairs(self):
+        """
+        :return: the smaller and the larger of the two vertex labels of every neighbour entry
+        :rtype: tuple
+        """
+        sourceLabels = self.vertexLabels[self._sources()]
+        return np.minimum(sourceLabels, self.neighbourLabels), np.maximum(sourceLabels, self.neighbourLabels)
+
+    def _keep(self, vertices, entries):
+        """
+        Rebuilds the arrays of the graph with the given vertices and neighbour entries only, the vertices being
+        renumbered in the same order
+
+        :param vertices: True for every vertex kept
+        :type vertices: numpy.ndarray
+        :param entries: True for every neighbour entry kept, an entry to a removed vertex being removed as well
+        :type entries: numpy.ndarray
+        """
+        sources = self._sources()
+        entries = entries & vertices[sources] & vertices[self.neighbours]
+        rank = np.cumsum(vertices) - 1
+        edgeProbabilities = None if self.edgeProbabilities is None else self.edgeProbabilities[entries]
+        entryPositions = None if self.entryPositions is None else self.entryPositions[entries]
+        self._setArrays(self.vertexLabels[vertices], rank[sources[entries]], rank[self.neighbours[entries]],
+                        self.edgeLabels[entries], edgeProbabilities, self.vertexIds[vertices], entryPositions)
+
+    def removeInfrequentLabels(self, labels):
+        """
+        Removes the vertices with the given labels and the edges to them, as Graph.removeInfrequentLabel does for
+        one label, rebuilding the arrays once
+
+        :param labels: the labels
+        :type labels: list
+        """
+        self._keep(~np.isin(self.vertexLabels, list(labels)), np.ones(len(self.neighbours), dtype=bool))
+
+    @staticmethod
+    def removeInfrequentEntries(graphs, minSup, vertexPairs=True, edgeLabels=True):
+        """
+        Removes the edges whose pair of vertex labels or whose edge label occurs in fewer than minSup graphs, as the
+        removeInfrequentVertexPairs of the miners does on Vertex and Edge objects. The label pairs and the edge labels
+        of every graph are counted once per graph, and the arrays of a graph are rebuilt once
+
+        :param graphs: the graphs
+        :type graphs: list
+        :param minSup: the minimum number of graphs
+        :type minSup: int
+        :param vertexPairs: remove the edges of infrequent vertex label pairs
+        :type vertexPairs: bool
+        :param edgeLabels: remove the edges of infrequent edge labels
+        :type edgeLabels: bool
+        :return: the number of neighbour entries removed for their vertex label pair and for their edge label
+        :rtype: tuple
+        """
+        pairSupport, edgeLabelSupport = {}, {}
+        for g in graphs:
+            for pair in set(zip(*[labels.tolist() for labels in g._labelPairs()])):
+                pairSupport[pair] = pairSupport.get(pair, 0) + 1
+            for label in set(g.edgeLabels.tolist()):
+                edgeLabelSupport[label] = edgeLabelSupport.get(label, 0) + 1
+
+        pairsRemoved = labelsRemoved = 0
+        for g in graphs:
+            if len(g.neighbours) == 0:
+                continue
+            infrequentPair = np.zeros(len(g.neighbours), dtype=bool)
+            if vertexPairs:
+                low, high = g._labelPairs()
+                lowLabels, lowIndex = np.unique(low, return_inverse=True)
+                highLabels, highIndex = np.unique(high, return_inverse=True)
+                lowLabels, highLabels = lowLabels.tolist(), highLabels.tolist()
+                keys, inverse = np.unique(lowIndex * len(highLabels) + highIndex, return_inverse=True)
+                support = [pairSupport[(lowLabels[key // len(highLabels)], highLabels[key % len(highLabels)])]
+                           for key in keys.tolist()]
+                infrequentPair = (np.array(support) < minSup)[inverse]
+            infrequentLabel = np.zeros(len(g.neighbours), dtype=bool)
+            if edgeLabels:
+                labels, inverse = np.unique(g.edgeLabels, return_inverse=True)
+                support = [edgeLabelSupport[label] for label in labels.tolist()]
+                infrequentLabel = (np.array(support) < minSup)[inverse] & ~infrequentPair
+            pairsRemoved += int(infrequentPair.sum())
+            labelsRemoved += int(infrequentLabel.sum())
+            if infrequentPair.any() or infrequentLabel.any():
+                g._keep(np.ones(len(g.vertexLabels), dtype=bool), ~(infrequentPair | infrequentLabel))
+        return pairsRemoved, labelsRemoved
@@ -0,0 +1,80 @@
+# gSpan is a subgraph mining algorithm that uses DFS and DFS codes to mine subgraphs
+#
+# **Importing this algorithm into a python program**
+#
+#             from PAMI.subgraphMining.basic import gspan as alg
+#
+#             obj = alg.GSpan(iFile, minSupport)
+#
+#             obj.mine()
+#
+#             obj.run()
+#
+#             frequentGraphs = obj.getFrequentSubgraphs()
+#
+#             memUSS = obj.getMemoryUSS()
+#
+#             obj.save(oFile)
+#
+#             print("Total Memory in USS:", memUSS)
+#
+#             memRSS = obj.getMemoryRSS()
+#
+#             print("Total Memory in RSS", memRSS)
+#
+#             run = obj.getRuntime()
+#
+#             print("Total ExecutionTime in seconds:", run)
+#
+
+
+__copyright__ = """
+ Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+class Embedding:
+    """
+    One embedding of a DFS code in a graph of the database, stored as in the projections of the original gSpan: the
+    graph edge matched by the last edge of the code and a pointer to the embedding of the code without that edge.
+    The embeddings of the children of a code share the records of their parent, so the embedding list of a code
+    costs one record per embedding.
+    """
+    __slots__ = ('graphId', 'v1', 'v2', 'prev')
+
+    def __init__(self, graphId, v1, v2, prev=None):
+        self.graphId = graphId
+        self.v1 = v1
+        self.v2 = v2
+        self.prev = prev
+
+    def getGraphId(self):
+        return self.graphId
+
+    def getVertexMap(self, dfsCode):
+        """
+        The graph vertex matched by every vertex of the DFS code, read back along the parent pointers
+
+        :param dfsCode: the DFS code this is an embedding of
+        :type dfsCode: DFSCode
+        :return: the graph vertex ids, indexed by the vertices of the DFS code
+        :rtype: list
+        """
+        vertexMap = [None] * (dfsCode.getRightMost() + 1)
+        record = self
+        for ee in reversed(dfsCode.getEeList()):
+            vertexMap[ee.v1] = record.v1
+            vertexMap[ee.v2] = record.v2
+            record = record.prev
+        return vertexMap
@@ -78,6 +78,7 @@ class Graph:
 
         self.vertices = []
         self.neighborCache = {}
+        self.adjacencyCache = {}
         self.mapLabelToVertexIds = {}
         self.edgeCount = 0
 
@@ -108,6 +109,7 @@ class Graph:
         The function precalculates the neighbors of each vertex in a graph and stores them in a cache.
         """
         self.neighborCache = {}
+        self.adjacencyCache = {}
         self.edgeCount = 0
 
         for vertexId, vertex in self.vMap.items():
@@ -115,11 +117,12 @@ class Graph:
 
             for edge in vertex.getEdgeList():
                 neighborVertex = self.vMap[edge.another(vertexId)]
-                neighbors.append(neighborVertex)
+                neighbors.append((neighborVertex, edge.getEdgeLabel()))
 
-            neighbors.sort(key=lambda x: x.id)
+            neighbors.sort(key=lambda x: x[0].id)
 
-            self.neighborCache[vertexId] = neighbors
+            self.neighborCache[vertexId] = [x for x, _ in neighbors]
+            self.adjacencyCache[vertexId] = [(x.id, x.vLabel, edgeLabel) for x, edgeLabel in neighbors]
             self.edgeCount += len(neighbors)
 
         self.edgeCount //= 2    
@@ -157,6 +160,21 @@ class Graph:
             neighbors = []
         return neighbors
     
+    def getVertexIds(self):
+        return [vertex.getId() for vertex in self.vertices]
+
+    def getNeighbours(self, v):
+        """
+        The (id, label, edge label) of every neighbour of a vertex, by id, as CSRGraph.getNeighbours returns them
+        """
+        return self.adjacencyCache.get(v, [])
+
+    def getNeighboursWithLabel(self, v, label):
+        """
+        The (id, edge label) of every neighbour of a vertex with the given label, by id
+        """
+        return [(x, edgeLabel) for x, xLabel, edgeLabel in self.adjacencyCache.get(v, []) if xLabel == label]
+    
     def getVLabel(self, v):
         return self.vMap[v].getLabel()
     
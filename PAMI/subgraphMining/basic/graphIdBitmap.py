@@ -0,0 +1,144 @@
+# gSpan is a subgraph mining algorithm that uses DFS and DFS codes to mine subgraphs
+#
+# **Importing this algorithm into a python program**
+#
+#             from PAMI.subgraphMining.basic import gspan as alg
+#
+#             obj = alg.GSpan(iFile, minSupport)
+#
+#             obj.mine()
+#
+#             obj.run()
+#
+#             frequentGraphs = obj.getFrequentSubgraphs()
+#
+#             memUSS = obj.getMemoryUSS()
+#
+#             obj.save(oFile)
+#
+#             print("Total Memory in USS:", memUSS)
+#
+#             memRSS = obj.getMemoryRSS()
+#
+#             print("Total Memory in RSS", memRSS)
+#
+#             run = obj.getRuntime()
+#
+#             print("Total ExecutionTime in seconds:", run)
+#
+
+
+__copyright__ = """
+ Copyright (C)  2021 Rage Uday Kiran
+
+     This program is free software: you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation, either version 3 of the License, or
+     (at your option) any later version.
+
+     This program is distributed in the hope that it will be useful,
+     but WITHOUT ANY WARRANTY; without even the implied warranty of
+     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+     GNU General Public License for more details.
+
+     You should have received a copy of the GNU General Public License
+     along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+from array import array
+from bisect import bisect_left
+from collections.abc import Set
+
+
+class GraphIdBitmap:
+    """
+    A set of graph ids stored as a roaring bitmap. The ids are split by their upper bits into chunks of 65536, and the
+    lower 16 bits of the ids of a chunk are kept in a sorted array of 16-bit integers while the chunk holds at most
+    4096 of them, in a 65536-bit bitmap once it holds more. gSpan adds the ids of an extension in increasing order,
+    which appends to the last array container. The bitmap iterates over its ids in increasing order and compares
+    equal to a set holding the same ids.
+
+    :Methods:
+
+        add(graphId)
+            Add an id
+    """
+    __slots__ = ('_containers', '_size')
+
+    # ids of a chunk above which its array container becomes a bitmap container
+    arrayLimit = 4096
+
+    def __init__(self, graphIds=()):
+        self._containers = {}
+        self._size = 0
+        for graphId in graphIds:
+            self.add(graphId)
+
+    def add(self, graphId):
+        """
+        Add an id to the bitmap
+
+        :param graphId: the id
+        :type graphId: int
+        """
+        high, low = graphId >> 16, graphId & 0xFFFF
+        container = self._containers.get(high)
+        if container is None:
+            self._containers[high] = array('H', (low,))
+        elif type(container) is array:
+            if low > container[-1]:
+                container.append(low)
+            else:
+                position = bisect_left(container, low)
+                if position < len(container) and container[position] == low:
+                    return
+                container.insert(position, low)
+            if len(container) > self.arrayLimit:
+                bitmap = bytearray(8192)
+                for value in container:
+                    bitmap[value >> 3] |= 1 << (value & 7)
+                self._containers[high] = bitmap
+        else:
+            mask = 1 << (low & 7)
+            if container[low >> 3] & mask:
+                return
+            container[low >> 3] |= mask
+        self._size += 1
+
+    def __len__(self):
+        return self._size
+
+    def __contains__(self, graphId):
+        container = self._containers.get(graphId >> 16)
+        if container is None:
+            return False
+        low = graphId & 0xFFFF
+        if type(container) is array:
+            position = bisect_left(container, low)
+            return position < len(container) and container[position] == low
+        return bool(container[low >> 3] & (1 << (low & 7)))
+
+    def __iter__(self):
+        for high in sorted(self._containers):
+            container = self._containers[high]
+            base = high << 16
+            if type(container) is array:
+                for low in container:
+                    yield base | low
+            else:
+                for byte, bits in enumerate(container):
+                    while bits:
+                        bit = bits & -bits
+                        yield base | (byte << 3) | (bit.bit_length() - 1)
+                        bits ^= bit
+
+    def __eq__(self, other):
+        if isinstance(other, GraphIdBitmap):
+            return self._size == other._size and list(self) == list(other)
+        if isinstance(other, Set):
+            return self._size == len(other) and all(graphId in other for graphId in self)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return 'GraphIdBitmap(%s)' % list(self)
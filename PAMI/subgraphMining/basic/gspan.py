@@ -24,10 +24,24 @@
 #
 #             print("Total ExecutionTime in seconds:", run)
 #
+#             The subgraphs can also be passed on as they are found instead of being kept, for instance to write
+#             the flat transactions of a large result:
+#
+#             from PAMI.extras.convert import Subgraphs2FlatTransactions as ft
+#
+#             flat = ft.Subgraphs2FlatTransactions()
+#
+#             obj = alg.GSpan(iFile, minSupport, callback=flat.addSubgraph)
+#
+#             obj.mine()
+#
+#             flat.writeFlatTransactions(oFile)
+#
 
 
 
 from PAMI.subgraphMining.basic import abstract as _ab
+from PAMI.sequentialPattern.basic._parallelMiner import _TaskPool
 
 class GSpan(_ab._gSpan):
 
@@ -35,10 +49,23 @@ class GSpan(_ab._gSpan):
     eliminate_infrequent_vertex_pairs = True
     eliminate_infrequent_edge_labels = True
     edge_count_pruning = True
+    # Shared by the runs of every miner, the result of a check only depending on the code
+    canonicalCodes = _ab.CanonicalCodes()
 
-    def __init__(self, iFile, minSupport, outputSingleVertices=True, maxNumberOfEdges=float('inf'), outputGraphIds=False) -> None:
+    def __init__(self, iFile, minSupport, outputSingleVertices=True, maxNumberOfEdges=float('inf'), outputGraphIds=False, workers=1, csr=None,
+                 requiredVertexLabels=None, forbiddenVertexLabels=None, requiredEdgeLabels=None, forbiddenEdgeLabels=None,
+                 maxNumberOfVertices=float('inf'), maxDegree=float('inf'), callback=None) -> None:
         """
-        Initialize variables
+        Initialize variables. With more than one worker the subtrees of the frequent edges are mined on worker
+        processes. With csr the graphs are read straight into CSR arrays, pruned and mined on them, without any
+        vertex and edge object. By default csr is used for a binary database written by Graphs2Binary only, csr=False
+        keeping the vertex and edge objects for it.
+        The constraints, given with the labels of the input file, are applied while the subgraphs are generated:
+        an extension with a forbidden vertex or edge label, a vertex beyond maxNumberOfVertices or a vertex degree
+        beyond maxDegree is never generated, and only the subgraphs holding every required vertex and edge label
+        are reported, the branches that cannot gain the missing labels within the size limits being cut.
+        With a callback every frequent subgraph is passed to it as callback(fid, subgraph) as soon as it is found,
+        fid being the index it would have in frequentSubgraphs, and is not kept in frequentSubgraphs
         """
         
         self.minSup = minSupport
@@ -59,6 +86,20 @@ class GSpan(_ab._gSpan):
         self.outputSingleVertices = outputSingleVertices
         self.maxNumberOfEdges = maxNumberOfEdges
         self.outputGraphIds = outputGraphIds
+        self._workers = workers
+        self._csr = _ab.BinaryGraphDatabase.isBinary(iFile) if csr is None else csr
+        self._graphDb = None
+        self.requiredVertexLabels = requiredVertexLabels or ()
+        self.forbiddenVertexLabels = forbiddenVertexLabels or ()
+        self.requiredEdgeLabels = requiredEdgeLabels or ()
+        self.forbiddenEdgeLabels = forbiddenEdgeLabels or ()
+        self.maxNumberOfVertices = maxNumberOfVertices
+        self.maxDegree = maxDegree
+        self.callback = callback
+        self._requiredVertexLabels = frozenset()
+        self._forbiddenVertexLabels = frozenset()
+        self._requiredEdgeLabels = frozenset()
+        self._forbiddenEdgeLabels = frozenset()
         self._memoryUSS = float()
         self._memoryRSS = float()
 
@@ -86,6 +127,11 @@ class GSpan(_ab._gSpan):
         # Calculate minimum support as a number of graphs
         self.minSup = _ab.math.ceil(self.minSup * len(graphDb))
 
+        self._requiredVertexLabels = self._constraintLabels(self.requiredVertexLabels, self.label_mapping)
+        self._forbiddenVertexLabels = self._constraintLabels(self.forbiddenVertexLabels, self.label_mapping)
+        self._requiredEdgeLabels = self._constraintLabels(self.requiredEdgeLabels, self.edge_label_mapping)
+        self._forbiddenEdgeLabels = self._constraintLabels(self.forbiddenEdgeLabels, self.edge_label_mapping)
+
         # Mining
         self.gSpan(graphDb, self.outputSingleVertices)
 
@@ -107,8 +153,6 @@ class GSpan(_ab._gSpan):
 
         self._memoryRSS = process.memory_info().rss
 
-        self.patternCount = len(self.frequentSubgraphs)
-
 
     def save(self, oFile):
         """
@@ -162,8 +206,16 @@ class GSpan(_ab._gSpan):
         containing the graph data that needs to be read and processed.
         :return: The `readGraphs` method reads graph data from a file specified by the `path` parameter. It
         parses the data to create a list of graph objects and returns this list. Each graph object contains
-        information about vertices and edges within the graph.
+        information about vertices and edges within the graph. A binary file written by Graphs2Binary is
+        memory-mapped instead of parsed. With csr every graph is read straight into CSR arrays.
         """
+        if _ab.BinaryGraphDatabase.isBinary(path):
+            return self.readBinaryGraphs(path)
+        if self._csr:
+            graphDatabase = list(_ab.CSRGraph.readText(path, lambda label: int(label) if label.isdigit() else self.get_label(label),
+                                                       lambda label: int(label) if label.isdigit() else self.get_edge_label(label)))
+            self.graphCount = len(graphDatabase)
+            return graphDatabase
         with open(path, 'r') as br:
             graphDatabase = []
             vMap = {}
@@ -208,6 +260,37 @@ class GSpan(_ab._gSpan):
         self.graphCount = len(graphDatabase)
         return graphDatabase
 
+    def readBinaryGraphs(self, path):
+        """
+        Builds the graphs of a binary graph database written by Graphs2Binary. The labels are mapped as readGraphs
+        maps them, once per label of the dictionary of the file. With csr, the default for a binary database, every
+        graph is built straight from the memory-mapped arrays of the file, the Vertex and Edge objects being built
+        only with csr=False
+
+        :param path: path to the binary file
+        :type path: str
+        :return: the graphs of the database
+        :rtype: list
+        """
+        vertexLabel = lambda label: int(label) if label.isdigit() else self.get_label(label)
+        edgeLabel = lambda label: int(label) if label.isdigit() else self.get_edge_label(label)
+        if self._csr:
+            graphDatabase = [_ab.CSRGraph.fromEdges(*arrays) for arrays in
+                             _ab.BinaryGraphDatabase(path).graphArrays(vertexLabel, edgeLabel)]
+            self.graphCount = len(graphDatabase)
+            return graphDatabase
+        graphDatabase = []
+        for gId, vertices, edges in _ab.BinaryGraphDatabase(path).graphs(vertexLabel, edgeLabel):
+            vMap = {vId: _ab.Vertex(vId, vLabel) for vId, vLabel in vertices}
+            for v1, v2, eLabel, _ in edges:
+                e = _ab.Edge(v1, v2, eLabel)
+                vMap[v1].addEdge(e)
+                vMap[v2].addEdge(e)
+            graphDatabase.append(_ab.Graph(gId, vMap))
+
+        self.graphCount = len(graphDatabase)
+        return graphDatabase
+
     def get_label(self, label_char):
         if label_char not in self.label_mapping:
             self.label_mapping[label_char] = self.current_label
@@ -338,10 +421,11 @@ class GSpan(_ab._gSpan):
         return extensions
 
 
-    def rightMostPathExtensions(self, c: _ab.DFSCode, graphDb, graphIds):
+    def rightMostPathExtensions(self, c: _ab.DFSCode, graphDb, graphIds, embeddings=None):
         """
         The function `rightMostPathExtensions` generates extensions for a given DFS code by considering
-        rightmost paths in a graph database.
+        rightmost paths in a graph database. The embeddings of the code are extended one edge further, so no
+        isomorphism is searched again, and the embeddings of every extension are returned for its own children.
         
         :param c: The parameter `c` in the `rightMostPathExtensions` method is of type `_ab.DFSCode`. It
         seems to represent a Depth-First Search code used in graph algorithms. The method is responsible
@@ -354,75 +438,226 @@ class GSpan(_ab._gSpan):
         list of graph identifiers. These identifiers are used to retrieve specific graphs from the
         `graphDb` database in order to perform operations on them within the function. Each ID in the
         `graphIds` list corresponds to an identifier.
+        :param embeddings: the embeddings of `c` in the graphs of `graphIds`, as returned for `c` by the call
+        extending its parent. Only the empty code has none
+        :type embeddings: list
         :return: The function `rightMostPathExtensions` returns a dictionary `extensions` containing
-        extended edges as keys and sets of graph IDs as values.
+        extended edges as keys and bitmaps of graph IDs as values, and a dictionary mapping the same extended edges
+        to their lists of embeddings. Extensions found to be infrequent while scanning are left out.
         """
-        extensions = {}
+        # The graph ids, the embeddings and the graph scanned last of every extension, the ids and the embeddings
+        # being None once the extension is dropped
+        found = {}
+        minSup = self.minSup
+        # Graphs of the parent not scanned yet, the current one included. An extension whose support cannot reach
+        # minSup with them is dropped, and is not created again since fewer graphs remain every time
+        remaining = len(graphIds) + 1
+        previous = None
+        forbiddenVertexLabels = self._forbiddenVertexLabels
+        forbiddenEdgeLabels = self._forbiddenEdgeLabels
         if c.isEmpty():
+            # An edge has two vertices of degree one
+            if self.maxNumberOfVertices < 2 or self.maxDegree < 1:
+                graphIds = ()
             for iD in graphIds:
+                remaining -= 1
                 g = graphDb[iD]
                 # Skip graphs if pruning based on edge count is enabled and applicable
                 if GSpan.edge_count_pruning and c.size >= g.getEdgeCount():
                     self.pruneByEdgeCount += 1
                     continue
-                for v in g.vertices:
-                    for e in v.getEdgeList():
-                        # Organize the vertex labels to maintain consistent ordering
-                        v1L = g.getVLabel(e.v1)
-                        v2L = g.getVLabel(e.v2)
-                        if v1L < v2L:
-                            ee1 = _ab.ExtendedEdge(0, 1, v1L, v2L, e.getEdgeLabel())
-                        else:
-                            ee1 = _ab.ExtendedEdge(0, 1, v2L, v1L, e.getEdgeLabel())
-
-                        # Add the new or existing extensions to the dictionary                       
-                        setOfGraphIds = extensions.get(ee1, set())
-                        setOfGraphIds.add(iD)
-                        extensions[ee1] = setOfGraphIds
+                for vId in g.getVertexIds():
+                    vL = g.getVLabel(vId)
+                    for x, xL, eL in g.getNeighbours(vId):
+                        # The edge is matched from its end with the smaller label, from both ends on a tie
+                        if vL > xL:
+                            continue
+                        if vL in forbiddenVertexLabels or xL in forbiddenVertexLabels or eL in forbiddenEdgeLabels:
+                            continue
+                        key = (0, 1, vL, xL, eL)
+                        entry = found.get(key)
+                        if entry is None or entry[2] != iD:
+                            entry = self._addGraphId(found, entry, key, iD, remaining, minSup)
+                        if entry[1] is not None:
+                            entry[1].append(_ab.Embedding(iD, vId, x))
         else:
-            # For non-empty DFS codes, extend based on the rightmost path of each graph
+            # For non-empty DFS codes, extend every embedding from the rightmost path. The embeddings of a graph
+            # are consecutive, so the graphs still to be scanned are counted as the graph id changes
             rightMost = c.getRightMost()
-            for iD in graphIds:
+            rightMostPath = c.getRightMostPath()
+            # The constraints on the size of the subgraph restrict the vertices an edge may be added to
+            degrees = self._degrees(c)
+            maxDegree = self.maxDegree
+            backwardTargets = {v for v in rightMostPath if c.notPreOfRm(v) and not c.containEdge(rightMost, v)
+                               and degrees[v] < maxDegree}
+            if degrees[rightMost] >= maxDegree:
+                backwardTargets = set()
+            if rightMost + 2 > self.maxNumberOfVertices or maxDegree < 1:
+                forwardSources = []
+            else:
+                forwardSources = [v for v in rightMostPath if degrees[v] < maxDegree]
+            # An embedded vertex carries the label of the code vertex it is mapped from
+            vLabels = c.getAllVLabels()
+            for embedding in embeddings:
+                iD = embedding.getGraphId()
+                if iD != previous:
+                    previous = iD
+                    remaining -= 1
                 g = graphDb[iD]
                 if GSpan.edge_count_pruning and c.size >= g.getEdgeCount():
                     self.pruneByEdgeCount += 1
                     continue
-                isoms = self.subgraphIsomorphisms(c, g)
-                for isom in isoms:
-                    invertedIsom = {}
-                    for key, value in isom.items():
-                        invertedIsom[value] = key
-                    mappedRM = isom.get(rightMost)
-                    mappedRMLabel = g.getVLabel(mappedRM)
-                    for x in g.getAllNeighbors(mappedRM):
-                        invertedX = invertedIsom.get(x.getId())
-                        if invertedX is not None and c.onRightMostPath(invertedX) and \
-                        c.notPreOfRm(invertedX) and not c.containEdge(rightMost, invertedX):
-                            
-                            ee = _ab.ExtendedEdge(rightMost, invertedX, mappedRMLabel, x.getLabel(),
-                                            g.getEdgeLabel(mappedRM, x.getId()))
-
-                            if ee not in extensions:
-                                extensions[ee] = set()
-                            extensions[ee].add(g.getId())
-
-                    mappedVertices = isom.values()
-                    for v in c.getRightMostPath():
-                        mappedV = isom[v]
-                        mappedVLabel = g.getVLabel(mappedV)
-                        for x in g.getAllNeighbors(mappedV):
-                            if x.getId() not in mappedVertices:
-                                ee = _ab.ExtendedEdge(v, rightMost + 1, mappedVLabel, x.getLabel(),
-                                                g.getEdgeLabel(mappedV, x.getId()))
-
-                                if ee not in extensions:
-                                    extensions[ee] = set()
-                                extensions[ee].add(g.getId())
-        return extensions
+                isom = embedding.getVertexMap(c)
+                invertedIsom = {value: key for key, value in enumerate(isom)}
+                mappedRM = isom[rightMost]
+                mappedRMLabel = vLabels[rightMost]
+                for x, xL, eL in g.getNeighbours(mappedRM):
+                    invertedX = invertedIsom.get(x)
+                    if invertedX in backwardTargets and eL not in forbiddenEdgeLabels:
+                        key = (rightMost, invertedX, mappedRMLabel, xL, eL)
+                        entry = found.get(key)
+                        if entry is None or entry[2] != iD:
+                            entry = self._addGraphId(found, entry, key, iD, remaining, minSup)
+                        if entry[1] is not None:
+                            entry[1].append(_ab.Embedding(iD, mappedRM, x, embedding))
+
+                for v in forwardSources:
+                    mappedV = isom[v]
+                    mappedVLabel = vLabels[v]
+                    for x, xL, eL in g.getNeighbours(mappedV):
+                        if x not in invertedIsom:
+                            if xL in forbiddenVertexLabels or eL in forbiddenEdgeLabels:
+                                continue
+                            key = (v, rightMost + 1, mappedVLabel, xL, eL)
+                            entry = found.get(key)
+                            if entry is None or entry[2] != iD:
+                                entry = self._addGraphId(found, entry, key, iD, remaining, minSup)
+                            if entry[1] is not None:
+                                entry[1].append(_ab.Embedding(iD, mappedV, x, embedding))
+        extendedEdges = {key: _ab.ExtendedEdge(*key) for key, entry in found.items() if entry[0] is not None}
+        return ({extendedEdges[key]: found[key][0] for key in extendedEdges},
+                {extendedEdges[key]: found[key][1] for key in extendedEdges})
+
+
+    @staticmethod
+    def _addGraphId(found, entry, key, iD, remaining, minSup):
+        """
+        Count a graph in the support of an extension met for the first time in this graph, unless the graphs left to
+        scan cannot make it frequent, in which case the extension is dropped
+
+        :param found: the graph ids, the embeddings and the graph scanned last of every extension
+        :type found: dict
+        :param entry: the entry of the extension in found, None if it has not been met yet
+        :type entry: list
+        :param key: the extension
+        :type key: tuple
+        :param iD: the graph being scanned
+        :type iD: int
+        :param remaining: the graphs left to scan, this one included
+        :type remaining: int
+        :param minSup: the minimum support
+        :type minSup: int
+        :return: the entry of the extension, whose embeddings are None if it is dropped
+        :rtype: list
+        """
+        if entry is None:
+            entry = found[key] = [None, None, iD] if remaining < minSup else [_ab.GraphIdBitmap(), [], iD]
+        else:
+            entry[2] = iD
+            if entry[0] is not None and len(entry[0]) + remaining < minSup:
+                entry[0] = entry[1] = None
+        if entry[0] is not None:
+            entry[0].add(iD)
+        return entry
+
+    @staticmethod
+    def _constraintLabels(labels, mapping):
+        """
+        Map the labels of a constraint, given as in the input file, to the labels the graphs are mined with
+
+        :param labels: the labels of the constraint
+        :type labels: iterable
+        :param mapping: the labels given to the labels of the input file that are not digits
+        :type mapping: dict
+        :return: the mined labels
+        :rtype: frozenset
+        """
+        mapped = set()
+        for label in labels:
+            if isinstance(label, str) and label.isdigit():
+                label = int(label)
+            mapped.add(mapping.get(label, label) if isinstance(label, str) else label)
+        return frozenset(mapped)
+
+    @staticmethod
+    def _degrees(c: _ab.DFSCode):
+        """
+        The degree of every vertex of a DFS code
+
+        :param c: the DFS code
+        :type c: _ab.DFSCode
+        :return: the degrees, indexed by the vertices of the code
+        :rtype: list
+        """
+        degrees = [0] * (c.getRightMost() + 1)
+        for ee in c.getEeList():
+            degrees[ee.v1] += 1
+            degrees[ee.v2] += 1
+        return degrees
 
+    def _missingRequiredLabels(self, c: _ab.DFSCode):
+        """
+        The number of required vertex labels and of required edge labels a DFS code does not hold yet
+        """
+        missingVertexLabels = len(self._requiredVertexLabels.difference(c.getAllVLabels()))
+        missingEdgeLabels = len(self._requiredEdgeLabels.difference(ee.edgeLabel for ee in c.getEeList()))
+        return missingVertexLabels, missingEdgeLabels
+
+    def _hasRequiredLabels(self, c: _ab.DFSCode):
+        """
+        Whether a DFS code holds every required vertex and edge label, and is to be reported
+        """
+        if not self._requiredVertexLabels and not self._requiredEdgeLabels:
+            return True
+        return self._missingRequiredLabels(c) == (0, 0)
+
+    def _canGainRequiredLabels(self, c: _ab.DFSCode):
+        """
+        Whether the extensions of a DFS code can still gain its missing required labels. Every added edge brings at
+        most one new vertex and one new edge label, so the edges and the vertices left within maxNumberOfEdges and
+        maxNumberOfVertices bound the labels that can be gained
+        """
+        if not self._requiredVertexLabels and not self._requiredEdgeLabels:
+            return True
+        missingVertexLabels, missingEdgeLabels = self._missingRequiredLabels(c)
+        edgesLeft = self.maxNumberOfEdges - 1 - c.size
+        verticesLeft = self.maxNumberOfVertices - c.getRightMost() - 1
+        return max(missingVertexLabels, missingEdgeLabels) <= edgesLeft and missingVertexLabels <= verticesLeft
+
+    def _graphHasRequiredLabels(self, g):
+        """
+        Whether a graph holds every required vertex and edge label
 
+        :param g: the graph, as vertex and edge objects or as CSR arrays
+        :return: True if the graph holds them all
+        :rtype: bool
+        """
+        vertexLabels = set()
+        edgeLabels = set()
+        for v in g.getVertexIds():
+            vertexLabels.add(g.getVLabel(v))
+            for x, xL, eL in g.getNeighbours(v):
+                edgeLabels.add(eL)
+        return self._requiredVertexLabels <= vertexLabels and self._requiredEdgeLabels <= edgeLabels
+
+    def _isAllowedSingleVertex(self, label):
+        """
+        Whether the subgraph made of a single vertex with this label satisfies the constraints
+        """
+        return (label not in self._forbiddenVertexLabels and self.maxNumberOfVertices >= 1
+                and not self._requiredEdgeLabels and self._requiredVertexLabels <= {label})
 
-    def gspanDFS(self, c: _ab.DFSCode, graphDb, subgraphId):
+    def gspanDFS(self, c: _ab.DFSCode, graphDb, subgraphId, embeddings=None):
         """
         The `gspanDFS` function recursively explores graph patterns using the gSpan algorithm to find
         frequent subgraphs in a graph database.
@@ -435,53 +670,69 @@ class GSpan(_ab._gSpan):
         operating on.
         :param subgraphId: The `subgraphId` parameter in the `gspanDFS` method refers to an
         ID represents a specific subgraph within the graph database `graphDb`. 
+        :param embeddings: the embeddings of `c` in the graph database, None for the empty code
+        :type embeddings: list
         :return: The `gspanDFS` method is a recursive function that is called within itself to explore the graph 
-        structure and find frequent subgraphs. The function does not have a return value, but it modifies 
-        the `self.frequentSubgraphs` list by appending new frequent subgraphs found during the DFS traversal.
+        structure and find frequent subgraphs. The function does not have a return value, but it reports
+        the frequent subgraphs found during the DFS traversal through `_report`.
         """
 
         if c.size == self.maxNumberOfEdges - 1:
             return
-        extensions = self.rightMostPathExtensions(c, graphDb, subgraphId)
+        extensions, projections = self.rightMostPathExtensions(c, graphDb, subgraphId, embeddings)
 
         for extension, newGraphIds in extensions.items():
             sup = len(newGraphIds)
+            # The embeddings of an extension are only kept until its subtree is mined
+            newEmbeddings = projections.pop(extension)
             
             if sup >= self.minSup:
                 newC = c.copy()
                 newC.add(extension)
                 
                 if self.isCanonical(newC):
-                    subgraph = _ab.FrequentSubgraph(newC, newGraphIds, sup)
-                    self.frequentSubgraphs.append(subgraph)
+                    if self._hasRequiredLabels(newC):
+                        self._report(_ab.FrequentSubgraph(newC, newGraphIds, sup))
+
+                    if self._canGainRequiredLabels(newC):
+                        self.gspanDFS(newC, graphDb, newGraphIds, newEmbeddings)
+
+
+    def _report(self, subgraph):
+        """
+        Reports a frequent subgraph, passing it to the callback with its fid or keeping it in frequentSubgraphs
+
+        :param subgraph: the frequent subgraph
+        :type subgraph: FrequentSubgraph
+        """
+        if self.callback is None:
+            self.frequentSubgraphs.append(subgraph)
+        else:
+            self.callback(self.patternCount, subgraph)
+        self.patternCount += 1
 
-                    self.gspanDFS(newC, graphDb, newGraphIds)
+    def _reportAll(self, subgraphs):
+        """
+        Reports the frequent subgraphs of a subtree mined as a task
 
+        :param subgraphs: the frequent subgraphs
+        :type subgraphs: list
+        """
+        for subgraph in subgraphs:
+            self._report(subgraph)
 
     def isCanonical(self, c: _ab.DFSCode):
         """
-        The function `isCanonical` checks if a given DFS code is canonical by comparing it with its
-        rightmost path extensions.
+        The function `isCanonical` checks if a given DFS code is canonical by growing the minimum DFS code of its
+        graph one rightmost path extension at a time and stopping at the first extension smaller than the code.
+        Checked codes are kept in a bounded least recently used cache.
         
         :param c: The parameter `c` is an instance of the `_ab.DFSCode` class
         :type c: _ab.DFSCode
         :return: a boolean value. It returns True if the input DFSCode `c` is canonical, and False if it is
         not canonical.
         """
-        canC = _ab.DFSCode()
-        for i in range(c.size):
-            extensions = self.rightMostPathExtensionsFromSingle(canC, _ab.Graph(-1, None, c))
-            minEe = None
-            for ee in extensions.keys():
-                if minEe is None or ee.smallerThan(minEe):
-                    minEe = ee
-
-            if minEe is not None and minEe.smallerThan(c.getAt(i)):
-                return False
-            
-            if minEe is not None:
-                canC.add(minEe)
-        return True
+        return GSpan.canonicalCodes.isCanonical(c)
     
 
     def gSpan(self, graphDb, outputSingleVertices):
@@ -497,26 +748,87 @@ class GSpan(_ab._gSpan):
         if outputSingleVertices or GSpan.eliminate_infrequent_vertices:
             self.findAllOnlyOneVertex(graphDb, outputSingleVertices)
 
-        for g in graphDb:
-            g.precalculateVertexList()
+        if not self._csr:
+            for g in graphDb:
+                g.precalculateVertexList()
 
         if GSpan.eliminate_infrequent_vertex_pairs or GSpan.eliminate_infrequent_edge_labels:
             self.removeInfrequentVertexPairs(graphDb)
 
         graphIds = set()
         for i, g in enumerate(graphDb):
-            if g.vertices is not None and len(g.vertices) != 0:
+            if self._csr:
+                if g.getVertexCount() == 0:
+                    self.emptyGraphsRemoved += 1
+                    continue
+            elif g.vertices is not None and len(g.vertices) != 0:
                 if self.infrequentVerticesRemovedCount > 0:
                     g.precalculateVertexList()
 
-                graphIds.add(i)
                 g.precalculateVertexNeighbors()
                 g.precalculateLabelsToVertices()
             else:
                 self.emptyGraphsRemoved += 1
+                continue
+            # A subgraph holding every required label only occurs in the graphs holding them all
+            if self._requiredVertexLabels or self._requiredEdgeLabels:
+                if not self._graphHasRequiredLabels(g):
+                    continue
+            graphIds.add(i)
 
         if len(self.frequentVertexLabels) != 0:
-            self.gspanDFS(_ab.DFSCode(), graphDb, graphIds)
+            if self._workers > 1 and self.maxNumberOfEdges > 1:
+                self.gspanParallel(graphDb, graphIds)
+            else:
+                self.gspanDFS(_ab.DFSCode(), graphDb, graphIds)
+
+    def gspanParallel(self, graphDb, graphIds):
+        """
+        Mines the frequent edges in this process and the subtree of every frequent edge as a task of the worker
+        processes. The workers are forked once the graph database is read and pruned, so they share it instead of
+        receiving a copy with every task, and an idle worker takes the largest subtree still waiting.
+
+        :param graphDb: the graph database
+        :param graphIds: the ids of the graphs that are not empty
+        :type graphIds: set
+        """
+        extensions, projections = self.rightMostPathExtensions(_ab.DFSCode(), graphDb, graphIds)
+        tasks = []
+        for extension, newGraphIds in extensions.items():
+            sup = len(newGraphIds)
+            if sup >= self.minSup:
+                newC = _ab.DFSCode()
+                newC.add(extension)
+                if not self.isCanonical(newC):
+                    continue
+                if self._hasRequiredLabels(newC):
+                    self._report(_ab.FrequentSubgraph(newC, newGraphIds, sup))
+                if self._canGainRequiredLabels(newC):
+                    # The number of embeddings estimates the work of the subtree
+                    tasks.append((len(projections[extension]), (newC, newGraphIds, projections[extension])))
+        self._graphDb = graphDb
+        with _TaskPool(self, self._workers) as pool:
+            pool.run(tasks, self._reportAll)
+        self._graphDb = None
+
+    def _mineTask(self, task):
+        """
+        Mines the subtree of a frequent edge
+
+        :param task: the DFS code of the edge, the ids of the graphs holding it and its embeddings
+        :type task: tuple
+        :return: the frequent subgraphs of the subtree, the edge itself excluded, reported by the calling process
+        :rtype: list
+        """
+        c, graphIds, embeddings = task
+        found, self.frequentSubgraphs = self.frequentSubgraphs, []
+        callback, patternCount, self.callback = self.callback, self.patternCount, None
+        try:
+            self.gspanDFS(c, self._graphDb, graphIds, embeddings)
+            return self.frequentSubgraphs
+        finally:
+            self.frequentSubgraphs = found
+            self.callback, self.patternCount = callback, patternCount
 
 
     class Pair:
@@ -550,7 +862,13 @@ class GSpan(_ab._gSpan):
         """
         self.frequentVertexLabels = []
         labelM = {} 
+        # the infrequent labels of every CSR graph, removed at once
+        infrequentLabels = {}
         for g in graphDb:
+            if self._csr:
+                for vLabel in g.getConnectedLabels():
+                    labelM.setdefault(vLabel, set()).add(g.getId())
+                continue
             for v in g.getNonPrecalculatedAllVertices():
                 if v.getEdgeList():
                     vLabel = v.getLabel()
@@ -560,15 +878,19 @@ class GSpan(_ab._gSpan):
             sup = len(tempSupG)
             if sup >= self.minSup:
                 self.frequentVertexLabels.append(label)
-                if outputFrequentVertices:
+                if outputFrequentVertices and self._isAllowedSingleVertex(label):
                     tempD = _ab.DFSCode()
                     tempD.add(_ab.ExtendedEdge(0, 0, label, label, -1))
-                    self.frequentSubgraphs.append(_ab.FrequentSubgraph(tempD, tempSupG, sup))
+                    self._report(_ab.FrequentSubgraph(tempD, tempSupG, sup))
             elif GSpan.eliminate_infrequent_vertices:
                 for graphId in tempSupG:
-                    g = graphDb[graphId]
-                    g.removeInfrequentLabel(label)
+                    if self._csr:
+                        infrequentLabels.setdefault(graphId, []).append(label)
+                    else:
+                        graphDb[graphId].removeInfrequentLabel(label)
                     self.infrequentVerticesRemovedCount += 1
+        for graphId, labels in infrequentLabels.items():
+            graphDb[graphId].removeInfrequentLabels(labels)
 
 
     def removeInfrequentVertexPairs(self, graphDb):
@@ -579,6 +901,13 @@ class GSpan(_ab._gSpan):
         :param graphDb: The `graphDb` parameter  refers to a graph database that the algorithm is 
         operating on.
         """
+        if self._csr:
+            pairsRemoved, labelsRemoved = _ab.CSRGraph.removeInfrequentEntries(
+                graphDb, self.minSup, GSpan.eliminate_infrequent_vertex_pairs, GSpan.eliminate_infrequent_edge_labels)
+            self.infrequentVertexPairsRemoved += pairsRemoved
+            self.edgeRemovedByLabel += labelsRemoved
+            return
+
         alreadySeenPair = None
         matrix = None
         mapEdgeLabelToSupport = None
@@ -694,6 +1023,15 @@ class GSpan(_ab._gSpan):
             mappings.append(mapping)
         return mappings
 
+    def iterSubgraphGraphMapping(self):
+        """
+        Yield the mapping of every subgraph to the graph IDs it belongs to as an (FID, GIDs) pair, the integer FID
+        being the one of getSubgraphGraphMapping. It walks frequentSubgraphs once mining is over; to write the
+        mappings without keeping the subgraphs, mine with callback=Subgraphs2FlatTransactions().addSubgraph instead.
+        """
+        for i, subgraph in enumerate(self.frequentSubgraphs):
+            yield i, subgraph.setOfGraphsIds
+
     def saveSubgraphsByGraphId(self, oFile):
         """
         Save subgraphs by graph ID as a flat transaction, such that each row represents the graph ID and each row can contain multiple subgraph IDs.
@@ -1,18 +1,21 @@
 from abc import ABC, abstractmethod
 from .graph import Graph
+from PAMI.subgraphMining.basic.csrGraph import CSRGraph
+from PAMI.subgraphMining.basic.canonicalCode import CanonicalCodes
 from .DFSCode import DfsCode
-from .DFSThread import DfsThread
 from .frequentSubgraph import FrequentSubgraph
 from .vertex import Vertex
 from .edge import Edge
 from .extendedEdge import ExtendedEdge
 from .sparseTriangularMatrix import SparseTriangularMatrix
+from PAMI.extras.convert.Graphs2Binary import BinaryGraphDatabase
 from queue import PriorityQueue
 import time
 import math
 import matplotlib.pyplot as plt
 import psutil as _psutil
 import os as _os
+import multiprocessing as _multiprocessing
 import time
 
 
@@ -38,6 +38,7 @@ class Graph:
 
         self.vertices = []
         self.neighborCache = {}
+        self.adjacencyCache = {}
         self.mapLabelToVertexIds = {}
         self.edgeCount = 0
 
@@ -71,6 +72,7 @@ class Graph:
         Precalculates and caches the neighbor vertices for each vertex.
         """
         self.neighborCache = {}
+        self.adjacencyCache = {}
         self.edgeCount = 0
 
         for vertexId, vertex in self.vMap.items():
@@ -78,11 +80,12 @@ class Graph:
 
             for edge in vertex.getEdgeList():
                 neighborVertex = self.vMap[edge.another(vertexId)]
-                neighbors.append(neighborVertex)
+                neighbors.append((neighborVertex, edge.getEdgeLabel()))
 
-            neighbors.sort(key=lambda x: x.id)
+            neighbors.sort(key=lambda x: x[0].id)
 
-            self.neighborCache[vertexId] = neighbors
+            self.neighborCache[vertexId] = [x for x, _ in neighbors]
+            self.adjacencyCache[vertexId] = [(x.id, x.vLabel, edgeLabel) for x, edgeLabel in neighbors]
             self.edgeCount += len(neighbors)
 
         self.edgeCount //= 2    
@@ -125,6 +128,24 @@ class Graph:
             neighbors = []
         return neighbors
     
+    def getVertexIds(self):
+        """
+        Retrieves the ids of all vertices.
+        """
+        return [vertex.getId() for vertex in self.vertices]
+
+    def getNeighbours(self, v):
+        """
+        Retrieves the (id, label, edge label) of every neighbor of a vertex, by id.
+        """
+        return self.adjacencyCache.get(v, [])
+
+    def getNeighboursWithLabel(self, v, label):
+        """
+        Retrieves the (id, edge label) of every neighbor of a vertex with the given label, by id.
+        """
+        return [(x, edgeLabel) for x, xLabel, edgeLabel in self.adjacencyCache.get(v, []) if xLabel == label]
+    
     def getVLabel(self, v):
         """
         Retrieves the label of a vertex.
@@ -26,6 +26,7 @@
 
 
 from PAMI.subgraphMining.topK import abstract as _ab
+from PAMI.sequentialPattern.basic._parallelMiner import _TaskPool
 
 
 class TKG(_ab._TKG):
@@ -34,9 +35,17 @@ class TKG(_ab._TKG):
     ELIMINATE_INFREQUENT_EDGE_LABELS = True
     EDGE_COUNT_PRUNING = True
     DYNAMIC_SEARCH = True
-    THREADED_DYNAMIC_SEARCH = True
+    # Shared by the runs of every miner, the result of a check only depending on the code
+    canonicalCodes = _ab.CanonicalCodes()
 
-    def __init__(self, iFile, k, maxNumberOfEdges=float('inf'), outputSingleVertices=True, outputGraphIds=False):
+    def __init__(self, iFile, k, maxNumberOfEdges=float('inf'), outputSingleVertices=True, outputGraphIds=False,
+                 workers=1, csr=None):
+        """
+        Initialize variables. With more than one worker the candidates found from the frequent edges are expanded on
+        worker processes, which share the support threshold of the top-k subgraphs. With csr the graphs are read
+        straight into CSR arrays, pruned and mined on them, without any vertex and edge object. By default csr is
+        used for a binary database written by Graphs2Binary only, csr=False keeping the vertex and edge objects for it
+        """
         self._memoryRSS = None
         self._memoryUSS = None
         self.runtime = None
@@ -54,7 +63,11 @@ class TKG(_ab._TKG):
         self.infrequentVerticesRemovedCount = 0
         self.infrequentVertexPairsRemovedCount = 0
         self.skipStrategyCount = 0
-        self.threadCount = 1
+        self.workers = workers
+        self.csr = _ab.BinaryGraphDatabase.isBinary(iFile) if csr is None else csr
+        self._graphDb = None
+        self._threshold = None
+        self._saved = None
         self.edgeRemovedByLabel = 0
         self.eliminatedWithMaxSize = 0
         self.emptyGraphsRemoved = 0
@@ -103,7 +116,15 @@ class TKG(_ab._TKG):
         Reads graph data from a file and constructs a list of graphs with vertices and edges.
         Handles character vertex labels by mapping them to unique integers.
         Edge labels are assumed to be integers.
+        A binary file written by Graphs2Binary is memory-mapped instead of parsed.
+        With csr every graph is read straight into CSR arrays.
         """
+        if _ab.BinaryGraphDatabase.isBinary(path):
+            return self.readBinaryGraphs(path)
+        if self.csr:
+            graphDatabase = list(_ab.CSRGraph.readText(path, lambda label: int(label) if label.isdigit() else self.get_label(label)))
+            self.graphCount = len(graphDatabase)
+            return graphDatabase
         with open(path, 'r') as br:
             graphDatabase = []
             vMap = {}
@@ -141,6 +162,30 @@ class TKG(_ab._TKG):
         self.graphCount = len(graphDatabase)
         return graphDatabase
 
+    def readBinaryGraphs(self, path):
+        """
+        Builds the graphs of a binary graph database written by Graphs2Binary, mapping the labels as readGraphs
+        does, once per label of the dictionary of the file. With csr, the default for a binary database, every graph
+        is built straight from the memory-mapped arrays of the file, the Vertex and Edge objects being built only
+        with csr=False.
+        """
+        vertexLabel = lambda label: int(label) if label.isdigit() else self.get_label(label)
+        if self.csr:
+            graphDatabase = [_ab.CSRGraph.fromEdges(*arrays) for arrays in
+                             _ab.BinaryGraphDatabase(path).graphArrays(vertexLabel, int)]
+            self.graphCount = len(graphDatabase)
+            return graphDatabase
+        graphDatabase = []
+        for gId, vertices, edges in _ab.BinaryGraphDatabase(path).graphs(vertexLabel, int):
+            vMap = {vId: _ab.Vertex(vId, vLabel) for vId, vLabel in vertices}
+            for v1, v2, eLabel, _ in edges:
+                edge = _ab.Edge(v1, v2, eLabel)
+                vMap[v1].addEdge(edge)
+                vMap[v2].addEdge(edge)
+            graphDatabase.append(_ab.Graph(gId, vMap))
+
+        self.graphCount = len(graphDatabase)
+        return graphDatabase
 
     def get_label(self, label_char):
         """
@@ -196,12 +241,18 @@ class TKG(_ab._TKG):
         # previousMinSup = self.minSup
 
         self.kSubgraphs.put(subgraph)
+        if self._saved is not None:
+            self._saved.append(subgraph)
         if self.kSubgraphs.qsize() > self.k:
             while self.kSubgraphs.qsize() > self.k:
                 lower = self.kSubgraphs.get()
 
                 if lower.support > self.minSup:
                     self.minSup = lower.support
+            if self._threshold is not None and self.minSup > self._threshold.value:
+                with self._threshold.get_lock():
+                    if self.minSup > self._threshold.value:
+                        self._threshold.value = self.minSup
 
 
     def getQueueSize(self, queue):
@@ -231,10 +282,10 @@ class TKG(_ab._TKG):
                 mappedV1 = iso[v1]
                 if v1 < v2:
                     mappedVertices = set(iso.values())
-                    for mappedV2 in g.getAllNeighbors(mappedV1):
-                        if v2Label == mappedV2.getLabel() and mappedV2.getId() not in mappedVertices and eLabel == g.getEdgeLabel(mappedV1, mappedV2.getId()):
+                    for mappedV2, edgeLabel in g.getNeighboursWithLabel(mappedV1, v2Label):
+                        if mappedV2 not in mappedVertices and eLabel == edgeLabel:
                             tempIso = iso.copy()
-                            tempIso[v2] = mappedV2.getId()
+                            tempIso[v2] = mappedV2
                             updateIsoms.append(tempIso)
                 else:
                     mappedV2 = iso[v2]
@@ -290,17 +341,18 @@ class TKG(_ab._TKG):
                 if self.EDGE_COUNT_PRUNING and c.size >= g.getEdgeCount():
                     self.pruneByEdgeCount += 1
                     continue
-                for vertex in g.vertices:
-                    for e in vertex.getEdgeList():
-                        v1Label = g.getVLabel(e.v1)
-                        v2Label = g.getVLabel(e.v2)
+                for vId in g.getVertexIds():
+                    v1Label = g.getVLabel(vId)
+                    for _, v2Label, edgeLabel in g.getNeighbours(vId):
                         if v1Label < v2Label:
-                            ee1 = _ab.ExtendedEdge(0, 1, v1Label, v2Label, e.getEdgeLabel())
+                            ee1 = _ab.ExtendedEdge(0, 1, v1Label, v2Label, edgeLabel)
                         else:
-                            ee1 = _ab.ExtendedEdge(0, 1, v2Label, v1Label, e.getEdgeLabel())
+                            ee1 = _ab.ExtendedEdge(0, 1, v2Label, v1Label, edgeLabel)
                         extensions.setdefault(ee1, set()).add(graphId)
         else:
             rightMost = c.getRightMost()
+            # A mapped vertex carries the label of the code vertex it is mapped from
+            vLabels = c.getAllVLabels()
             for graphId in graphIds:
                 g = graphDB[graphId]
                 if self.EDGE_COUNT_PRUNING and c.size >= g.getEdgeCount():
@@ -310,19 +362,19 @@ class TKG(_ab._TKG):
                 for isom in isoms:
                     invertedIsom = {v: k for k, v in isom.items()}
                     mappedRm = isom[rightMost]
-                    mappedRmLabel = g.getVLabel(mappedRm)
-                    for x in g.getAllNeighbors(mappedRm):
-                        invertedX = invertedIsom.get(x.getId())
+                    mappedRmLabel = vLabels[rightMost]
+                    for x, xLabel, edgeLabel in g.getNeighbours(mappedRm):
+                        invertedX = invertedIsom.get(x)
                         if invertedX is not None and c.onRightMostPath(invertedX) and not c.containEdge(rightMost, invertedX):
-                            ee = _ab.ExtendedEdge(rightMost, invertedX, mappedRmLabel, x.getLabel(), g.getEdgeLabel(mappedRm, x.getId()))
+                            ee = _ab.ExtendedEdge(rightMost, invertedX, mappedRmLabel, xLabel, edgeLabel)
                             extensions.setdefault(ee, set()).add(g.getId())
                     mappedVertices = set(isom.values())
                     for v in c.getRightMostPath():
                         mappedV = isom[v]
-                        mappedVLabel = g.getVLabel(mappedV)
-                        for x in g.getAllNeighbors(mappedV):
-                            if x.getId() not in mappedVertices:
-                                ee = _ab.ExtendedEdge(v, rightMost + 1, mappedVLabel, x.getLabel(), g.getEdgeLabel(mappedV, x.getId()))
+                        mappedVLabel = vLabels[v]
+                        for x, xLabel, edgeLabel in g.getNeighbours(mappedV):
+                            if x not in mappedVertices:
+                                ee = _ab.ExtendedEdge(v, rightMost + 1, mappedVLabel, xLabel, edgeLabel)
                                 extensions.setdefault(ee, set()).add(g.getId())
         return extensions
 
@@ -332,15 +384,21 @@ class TKG(_ab._TKG):
         if outputFrequentVertices or self.ELIMINATE_INFREQUENT_VERTICES:
             self.findAllOnlyOneVertex(graphDB, outputFrequentVertices)
         
-        for g in graphDB:
-            g.precalculateVertexList()
+        if not self.csr:
+            for g in graphDB:
+                g.precalculateVertexList()
     
         if self.ELIMINATE_INFREQUENT_VERTEX_PAIRS or self.ELIMINATE_INFREQUENT_EDGE_LABELS:
             self.removeInfrequentVertexPairs(graphDB)
     
         graphIds = set()
         for i, g in enumerate(graphDB):
-            if g.vertices and len(g.vertices) != 0:
+            if self.csr:
+                if g.getVertexCount() != 0:
+                    graphIds.add(i)
+                else:
+                    self.emptyGraphsRemoved += 1
+            elif g.vertices and len(g.vertices) != 0:
                 if self.infrequentVerticesRemovedCount > 0:
                     g.precalculateVertexList()
     
@@ -353,28 +411,76 @@ class TKG(_ab._TKG):
         if not outputFrequentVertices or self.frequentVertexLabels:
             if self.DYNAMIC_SEARCH:
                 self.gspanDynamicDFS(_ab.DfsCode(), graphDB, graphIds)
-                
-                if self.THREADED_DYNAMIC_SEARCH:
-                    self.startThreads(graphDB, self.candidates, self.minSup)
 
+                if self.workers > 1 and self.candidates.qsize() > 1:
+                    self.startWorkers(graphDB)
                 else:
-                    while self.candidates:
-                        candidate = self.candidates.pop()
-                        if len(candidate.setOfGraphsIds) < self.minSup:
-                            continue
-                        self.gspanDynamicDFS(candidate.dfsCode, graphDB, candidate.setOfGraphsIds)
+                    self.expandCandidates(graphDB)
             else:
                 self.gspanDfs(_ab.DfsCode(), graphDB, graphIds)
 
-    def startThreads(self, graphDB, candidates, minSup):
-        threads = []
-        for _ in range(self.threadCount):
-            thread = _ab.DfsThread(graphDB, candidates, minSup, self)
-            thread.start()
-            threads.append(thread)
-    
-        for thread in threads:
-            thread.join()
+    def expandCandidates(self, graphDB):
+        """
+        Expands the candidates of highest support first until the support of the best candidate left falls below
+        the support threshold of the top-k subgraphs
+
+        :param graphDB: the graph database
+        """
+        while not self.candidates.empty():
+            _, candidate = self.candidates.get()
+            if self._threshold is not None and self._threshold.value > self.minSup:
+                self.minSup = self._threshold.value
+            if candidate.support < self.minSup:
+                break
+            self.gspanDynamicDFS(candidate.dfsCode, graphDB, candidate.setOfGraphsIds)
+
+    def startWorkers(self, graphDB):
+        """
+        Expands every candidate found from the frequent edges as a task of the worker processes. The workers are
+        forked once the graph database is read and pruned, so they share it instead of receiving a copy with every
+        task, and an idle worker takes the candidate of highest support still waiting. The support threshold lives
+        in shared memory: a worker raises it as soon as its own top-k subgraphs allow it and reads it before every
+        expansion, so the pruning of every worker tightens with the subgraphs found by the others.
+
+        :param graphDB: the graph database
+        """
+        tasks = []
+        while not self.candidates.empty():
+            _, candidate = self.candidates.get()
+            tasks.append((candidate.support, candidate))
+        self._graphDb = graphDB
+        self._threshold = _ab._multiprocessing.Value('i', self.minSup)
+        with _TaskPool(self, self.workers) as pool:
+            pool.run(tasks, self._mergePatterns)
+        self._graphDb = None
+        self._threshold = None
+
+    def _mineTask(self, candidate):
+        """
+        Expands a candidate and the candidates found from it
+
+        :param candidate: the candidate
+        :type candidate: FrequentSubgraph
+        :return: the subgraphs saved by the expansion that still reach the support threshold
+        :rtype: list
+        """
+        self._saved = []
+        self.candidates = _ab.PriorityQueue()
+        self.registerAsCandidate(candidate)
+        self.expandCandidates(self._graphDb)
+        saved, self._saved = self._saved, None
+        return [subgraph for subgraph in saved if subgraph.support >= self.minSup]
+
+    def _mergePatterns(self, subgraphs):
+        """
+        Saves the subgraphs found by a worker into the top-k subgraphs of this process
+
+        :param subgraphs: the subgraphs
+        :type subgraphs: list
+        """
+        for subgraph in subgraphs:
+            if subgraph.support >= self.minSup:
+                self.savePattern(subgraph)
 
     def gspanDfs(self, c: _ab.DfsCode, graphDB, subgraphId):
         if c.size == self.maxNumberOfEdges - 1:
@@ -412,20 +518,11 @@ class TKG(_ab._TKG):
 
     
     def isCanonical(self, c: _ab.DfsCode):
-        canC = _ab.DfsCode()
-        for i in range(c.size):
-            extensions = self.rightMostPathExtensionsFromSingle(canC, _ab.Graph(-1, None, c))
-            minEe = None
-            for ee in extensions.keys():
-                if minEe is None or ee.smallerThan(minEe):
-                    minEe = ee
-
-            if minEe is not None and minEe.smallerThan(c.getAt(i)):
-                return False
-            
-            if minEe is not None:
-                canC.add(minEe)
-        return True
+        """
+        Checks that a DFS code is the minimum DFS code of its graph, stopping at the first rightmost path extension
+        smaller than the code, with the checked codes kept in a bounded least recently used cache.
+        """
+        return TKG.canonicalCodes.isCanonical(c)
 
 
     class Pair:
@@ -449,7 +546,13 @@ class TKG(_ab._TKG):
     def findAllOnlyOneVertex(self, graphDB, outputFrequentVertices):
         self.frequentVertexLabels = []
         labelM = {} 
+        # the infrequent labels of every CSR graph, removed at once
+        infrequentLabels = {}
         for g in graphDB:
+            if self.csr:
+                for vLabel in g.getConnectedLabels():
+                    labelM.setdefault(vLabel, set()).add(g.getId())
+                continue
             for v in g.getNonPrecalculatedAllVertices():
                 if v.getEdgeList():
                     vLabel = v.getLabel()
@@ -464,11 +567,21 @@ class TKG(_ab._TKG):
                     self.savePattern(_ab.FrequentSubgraph(tempD, tempSupG, sup))
             elif TKG.ELIMINATE_INFREQUENT_VERTICES:
                 for graphId in tempSupG:
-                    g = graphDB[graphId]
-                    g.removeInfrequentLabel(label)
+                    if self.csr:
+                        infrequentLabels.setdefault(graphId, []).append(label)
+                    else:
+                        graphDB[graphId].removeInfrequentLabel(label)
                     self.infrequentVerticesRemovedCount += 1
+        for graphId, labels in infrequentLabels.items():
+            graphDB[graphId].removeInfrequentLabels(labels)
 
     def removeInfrequentVertexPairs(self, graphDB):
+        if self.csr:
+            pairsRemoved, labelsRemoved = _ab.CSRGraph.removeInfrequentEntries(
+                graphDB, self.minSup, TKG.ELIMINATE_INFREQUENT_VERTEX_PAIRS, TKG.ELIMINATE_INFREQUENT_EDGE_LABELS)
+            self.infrequentVertexPairsRemovedCount += pairsRemoved
+            self.edgeRemovedByLabel += labelsRemoved
+            return
 
         alreadySeenPair = None
         matrix = None
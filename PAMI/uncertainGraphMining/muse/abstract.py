@@ -3,9 +3,12 @@ from .graph import UncertainGraph
 from .vertex import Vertex
 from .edge import Edge
 from .dfsCode import DFSCode
+from PAMI.subgraphMining.basic.csrGraph import CSRGraph
+from PAMI.extras.convert.Graphs2Binary import BinaryGraphDatabase
 
 import math
 import random
+import numpy as np
 from copy import deepcopy
 
 import itertools
@@ -2,13 +2,36 @@
 
 from PAMI.uncertainGraphMining.muse import abstract as _ab
 class Muse(_ab._MUSE):
-    def __init__(self, file_path):
+    # Edges whose DNF probability is computed exactly, over all their possible worlds
+    exactEdges = 16
+    # Cells of the Bernoulli matrix of possible worlds drawn at once
+    batchCells = 1 << 22
+
+    def __init__(self, file_path, seed=None, csr=None):
+        """
+        :param file_path: the uncertain graph database
+        :type file_path: str
+        :param seed: seed of the random generator, or a numpy.random.Generator, so that the sampled estimates can be
+                     reproduced
+        :type seed: int or numpy.random.Generator
+        :param csr: read the graphs straight into CSR arrays, the vertex and edge objects of a graph being built only
+                    while it is examined. By default it is used for a binary database written by Graphs2Binary only
+        :type csr: bool
+        """
         self.graphCount = None
+        self.csr = _ab.BinaryGraphDatabase.isBinary(file_path) if csr is None else csr
         self.graphDatabase = self.readGraph(file_path)
         self.F = set()
+        self._rng = _ab.np.random.default_rng(seed)
 
 
     def readGraph(self, path):
+        if _ab.BinaryGraphDatabase.isBinary(path):
+            return self.readBinaryGraph(path)
+        if self.csr:
+            graphDatabase = list(_ab.CSRGraph.readText(path, entryOrder=True))
+            self.graphCount = len(graphDatabase)
+            return graphDatabase
         with open(path, 'r') as f:
             graphDatabase = []
             vMap = {}
@@ -46,10 +69,60 @@ class Muse(_ab._MUSE):
         self.graphCount = len(graphDatabase)
         return graphDatabase
 
+    def readBinaryGraph(self, path):
+        """
+        Builds the uncertain graphs of a binary graph database written by Graphs2Binary. With csr, the default for a
+        binary database, every graph is built straight from the memory-mapped arrays of the file, the Vertex and Edge
+        objects being built only with csr=False
+
+        :param path: path to the binary file, converted from a database whose edges carry their probability
+        :type path: str
+        :return: the uncertain graphs of the database
+        :rtype: list
+        """
+        if self.csr:
+            graphDatabase = [_ab.CSRGraph.fromEdges(*arrays, entryOrder=True)
+                             for arrays in _ab.BinaryGraphDatabase(path).graphArrays()]
+            self.graphCount = len(graphDatabase)
+            return graphDatabase
+        graphDatabase = []
+        for gId, vertices, edges in _ab.BinaryGraphDatabase(path).graphs():
+            vMap = {vId: _ab.Vertex(vId, vLabel) for vId, vLabel in vertices}
+            for v1, v2, eLabel, eProb in edges:
+                e = _ab.Edge(v1, v2, eLabel, eProb)
+                vMap[v1].addEdge(e)
+                vMap[v2].addEdge(e)
+            graphDatabase.append(_ab.UncertainGraph(gId, vMap))
+
+        self.graphCount = len(graphDatabase)
+        return graphDatabase
+
+    def _vertexMap(self, graph):
+        """
+        The vertices of a graph of the database by id. A graph held as CSR arrays is given new Vertex and Edge objects
+        for the time it is examined, built in the order of the input file as readGraph builds them
+
+        :param graph: the graph
+        :type graph: UncertainGraph or CSRGraph
+        :return: the vertex of every id
+        :rtype: dict
+        """
+        if not isinstance(graph, _ab.CSRGraph):
+            return graph.getVertexMap()
+        ids = graph.vertexIds.tolist()
+        vMap = {vId: _ab.Vertex(vId, vLabel) for vId, vLabel in zip(ids, graph.vertexLabels.tolist())}
+        sources, targets, edgeLabels, probabilities = graph.getEdges()
+        probabilities = [1.0] * len(sources) if probabilities is None else probabilities.tolist()
+        for v1, v2, eLabel, eProb in zip(sources.tolist(), targets.tolist(), edgeLabels.tolist(), probabilities):
+            e = _ab.Edge(ids[v1], ids[v2], eLabel, eProb)
+            vMap[ids[v1]].addEdge(e)
+            vMap[ids[v2]].addEdge(e)
+        return vMap
+
     def _generateImplicatedGraphs(self):
         implicatedGraphs = []
         for uncertainGraph in self.graphDatabase:
-            vMap = uncertainGraph.getVertexMap()
+            vMap = self._vertexMap(uncertainGraph)
             edges = [(e.v1, e.v2, e.edgeLabel, e.existenceProbability) for v in vMap.values() for e in v.getEdgeList()]
             edges = list(set(edges))  # Remove duplicates
 
@@ -107,16 +180,34 @@ class Muse(_ab._MUSE):
 
         return implicatedDatabase
 
+    def _sampleWorlds(self, probabilities, count):
+        """
+        Draws possible worlds as a Bernoulli matrix with a row per world and a column per edge
+
+        :param probabilities: the existence probability of every edge
+        :type probabilities: numpy.ndarray
+        :param count: the number of worlds
+        :type count: int
+        :return: True where the edge exists in the world
+        :rtype: numpy.ndarray
+        """
+        return self._rng.random((count, len(probabilities))) < probabilities
+
     def _sampleGraph(self, uncertainGraph):
-        sampledGraph = _ab.deepcopy(uncertainGraph)
-        for vertex in sampledGraph.getVertexMap().values():
-            edgesToRemove = []
-            for edge in vertex.getEdgeList():
-                if _ab.random.random() > edge.existenceProbability:
-                    edgesToRemove.append(edge)
-            for edge in edgesToRemove:
-                vertex.edges.remove(edge)
-        return sampledGraph
+        """
+        Draws a possible world of an uncertain graph. The vertices are new and the edges drawn are shared with the
+        uncertain graph instead of being copied
+        """
+        vertexMap = self._vertexMap(uncertainGraph)
+        edges = list(dict.fromkeys(e for v in vertexMap.values() for e in v.getEdgeList()))
+        probabilities = _ab.np.array([e.getExistenceProbability() for e in edges], dtype=float)
+        world = self._sampleWorlds(probabilities, 1)[0]
+        vMap = {vId: _ab.Vertex(vId, vertex.getLabel()) for vId, vertex in vertexMap.items()}
+        for e, exists in zip(edges, world):
+            if exists:
+                vMap[e.v1].addEdge(e)
+                vMap[e.v2].addEdge(e)
+        return _ab.UncertainGraph(uncertainGraph.id, vMap)
 
     def _checkSubgraph(self, graph, subgraph):
         """ Check if subgraph is present in graph using DFS Code for subgraph isomorphism check """
@@ -128,59 +219,116 @@ class Muse(_ab._MUSE):
         return subgraphCode.isSubcodeOf(graphCode)
 
     def _constructDnfFormula(self, embeddings):
-        """ Construct the DNF formula from embeddings """
-        dnfFormula = []
-        for embedding in embeddings:
-            prob = 1
-            for edge in embedding.getEdgeList():
-                prob *= edge.getExistenceProbability()
-            dnfFormula.append(prob)
-        return dnfFormula
-
-    def estimateProbability(self, dnfFormula, epsilon, delta, n, minsup):
-        """ Estimate the probability using FPRAS """
+        """
+        Construct the DNF formula from embeddings: a clause per embedding, true in the worlds holding all its edges
+
+        :return: the clauses as a boolean matrix with a column per edge, and the existence probability of every edge
+        :rtype: tuple
+        """
+        edgeIndex = {}
+        rows = [[edgeIndex.setdefault(edge, len(edgeIndex)) for edge in embedding.getEdgeList()]
+                for embedding in embeddings]
+        clauses = _ab.np.zeros((len(rows), len(edgeIndex)), dtype=bool)
+        for row, columns in enumerate(rows):
+            clauses[row, columns] = True
+        probabilities = _ab.np.array([edge.getExistenceProbability() for edge in edgeIndex], dtype=float)
+        return clauses, probabilities
+
+    def _batchRows(self, clauseColumns):
+        """
+        :return: the number of worlds checked at once, so that neither their float copy nor their product with the
+                 clauses exceeds batchCells
+        :rtype: int
+        """
+        return max(1, self.batchCells // max(1, *clauseColumns.shape))
+
+    def _satisfied(self, worlds, clauseColumns):
+        """
+        :param worlds: the possible worlds, as drawn by _sampleWorlds
+        :type worlds: numpy.ndarray
+        :param clauseColumns: the clauses as a float32 matrix with a row per edge, cast once by the caller
+        :type clauseColumns: numpy.ndarray
+        :return: for every world, whether one of the clauses has none of its edges missing from it
+        :rtype: numpy.ndarray
+        """
+        rows = self._batchRows(clauseColumns)
+        satisfied = _ab.np.empty(len(worlds), dtype=bool)
+        for start in range(0, len(worlds), rows):
+            missing = (~worlds[start:start + rows]).astype(_ab.np.float32) @ clauseColumns
+            satisfied[start:start + rows] = (missing == 0).any(axis=1)
+        return satisfied
+
+    def _sampleDnf(self, clauses, probabilities, N):
+        """
+        The share of N sampled worlds satisfying the DNF formula, the worlds being drawn in batches
+        """
+        clauseColumns = _ab.np.ascontiguousarray(clauses.T, dtype=_ab.np.float32)
+        batch = self._batchRows(clauseColumns)
+        satisfied = 0
+        for start in range(0, N, batch):
+            worlds = self._sampleWorlds(probabilities, min(batch, N - start))
+            satisfied += int(self._satisfied(worlds, clauseColumns).sum())
+        return satisfied / N
+
+    def estimateProbability(self, clauses, probabilities, epsilon, delta, minsup):
+        """
+        Estimate the probability of the DNF formula from sampled possible worlds
+
+        :param clauses: the clauses, as returned by _constructDnfFormula
+        :type clauses: numpy.ndarray
+        :param probabilities: the existence probability of every edge
+        :type probabilities: numpy.ndarray
+        :return: the lower and upper bounds of the probability
+        :rtype: tuple
+        """
+        n = len(clauses)
+        if n == 0:
+            return 0, 0
         epsilonPrime = epsilon * minsup / 2
         N = _ab.math.ceil((4 * n * _ab.math.log(2 / delta)) / (epsilonPrime ** 2))
-        Z = sum(dnfFormula)
-        X = Y = 0
-
-        for _ in range(N):
-            i = _ab.random.randint(0, n - 1)
-            Ci = dnfFormula[i]
-            Y += Ci
-            if all(_ab.random.random() > dnfFormula[j] for j in range(n) if j != i):
-                X += Ci
-
-        pHat = (X * Z) / Y if Y > 0 else 0
+        pHat = self._sampleDnf(clauses, probabilities, N)
         return max(0, pHat - epsilonPrime), min(1, pHat + epsilonPrime)
 
     def _approxOccProb(self, uncertainGraph, subgraph, epsilon, delta, minsup):
         embeddings = []
-        for node in uncertainGraph.getVertexMap().values():
-            if self._checkSubgraph(uncertainGraph.getVertexMap(), subgraph):
+        vertexMap = self._vertexMap(uncertainGraph)
+        for node in vertexMap.values():
+            if self._checkSubgraph(vertexMap, subgraph):
                 embeddings.append(node)  # Collect embeddings as Vertex objects
 
         n = len(embeddings)
         if n == 0:
             return 0, 0
 
-        dnfFormula = self._constructDnfFormula(embeddings)
-        return self.estimateProbability(dnfFormula, epsilon, delta, n, minsup)
-
-    def _computeProbabilityFromDnf(self, dnfFormula):
-        """ Compute the probability of the DNF formula being true """
-        return sum(dnfFormula) / len(dnfFormula) if dnfFormula else 0
+        clauses, probabilities = self._constructDnfFormula(embeddings)
+        return self.estimateProbability(clauses, probabilities, epsilon, delta, minsup)
+
+    def _computeProbabilityFromDnf(self, clauses, probabilities):
+        """
+        Compute the probability of the DNF formula being true by summing the probabilities of the possible worlds
+        satisfying it, all worlds of its edges being enumerated as one boolean matrix
+        """
+        count = len(probabilities)
+        if len(clauses) == 0:
+            return 0
+        worlds = ((_ab.np.arange(1 << count)[:, None] >> _ab.np.arange(count)) & 1).astype(bool)
+        weights = _ab.np.where(worlds, probabilities, 1 - probabilities).prod(axis=1)
+        clauseColumns = _ab.np.ascontiguousarray(clauses.T, dtype=_ab.np.float32)
+        return float(weights[self._satisfied(worlds, clauseColumns)].sum())
 
     def _approxExpSup(self, subgraph, database, minsup, epsilon, delta):
         l = u = 0
         for Gi in database:
-            Xi = [vertex for vertex in Gi.getVertexMap().values() if
-                  self._checkSubgraph(Gi.getVertexMap(), subgraph)]
+            vertexMap = self._vertexMap(Gi)
+            Xi = [vertex for vertex in vertexMap.values() if self._checkSubgraph(vertexMap, subgraph)]
             if len(Xi) > 0 and 2 * len(Xi) - 5 / len(Xi) >= _ab.math.log(2 / delta) / (epsilon * minsup) ** 2:
                 alpha, beta = self._approxOccProb(Gi, subgraph, epsilon, delta, minsup)
             else:
-                dnfFormula = self._constructDnfFormula(Xi)
-                alpha = beta = self._computeProbabilityFromDnf(dnfFormula)
+                clauses, probabilities = self._constructDnfFormula(Xi)
+                if len(probabilities) <= self.exactEdges:
+                    alpha = beta = self._computeProbabilityFromDnf(clauses, probabilities)
+                else:
+                    alpha, beta = self.estimateProbability(clauses, probabilities, epsilon, delta, minsup)
             l += alpha
             u += beta
         n = len(database)
@@ -189,7 +337,7 @@ class Muse(_ab._MUSE):
     def _generateInitialPatterns(self):
         patterns = set()
         for graph in self.graphDatabase:
-            vertex_map = graph.getVertexMap()
+            vertex_map = self._vertexMap(graph)
             for vertex in vertex_map.values():
                 for edge in vertex.getEdgeList():
                     pattern = {
@@ -202,7 +350,7 @@ class Muse(_ab._MUSE):
     def _generateSuperpatterns(self, pattern):
         superpatterns = set()
         for graph in self.graphDatabase:
-            for vertex in graph.getVertexMap().values():
+            for vertex in self._vertexMap(graph).values():
                 for edge in vertex.getEdgeList():
                     if (vertex.id, vertex.getLabel()) in pattern:
                         new_pattern = dict(pattern)
@@ -218,7 +366,7 @@ class Muse(_ab._MUSE):
             S_dict = dict(S)
             embeddings = []
             for Gi in self.graphDatabase:
-                if self._checkSubgraph(Gi.getVertexMap(), S_dict):
+                if self._checkSubgraph(self._vertexMap(Gi), S_dict):
                     embeddings.append(S_dict)
             l, u = self._approxExpSup(S_dict, self.graphDatabase, minsup, epsilon, delta)
             if l >= (1 - epsilon) * minsup and u >= minsup:
@@ -62,7 +62,8 @@ _minSup = str()
 _minWeight = int()
 _miniWeight = int()
 _maxWeight = int()
-_weights = {}
+# weight of every frequent item indexed by its rank; self._weights keeps the weights by item name
+_rankWeights = []
 _fp._sys.setrecursionlimit(20000)
 
 
@@ -73,15 +74,15 @@ class _Node:
     :Attributes:
 
         itemId: int
-            storing item of a node
+            storing the rank of the item of a node
 
-        counter: int
+        freq: int
             To maintain the support of node
 
         parent: node
             To maintain the parent of node
 
-        children: list
+        children: dict
             To maintain the children of node
 
     :Methods:
@@ -90,9 +91,11 @@ class _Node:
             Updates the nodes children list and parent for the given node
     """
 
-    def __init__(self, item: str, children: list) -> None:
+    __slots__ = ('itemId', 'freq', 'parent', 'children')
+
+    def __init__(self, item: int, children: dict) -> None:
         self.itemId = item
-        self.counter = 1
+        self.freq = 1
         self.parent = None
         self.children = children
 
@@ -110,7 +113,7 @@ class _Node:
 
 class _Tree:
     """
-    A class used to represent the frequentPatternGrowth tree structure
+    A class used to represent the frequentPatternGrowth tree structure over integer ranks of items
 
     :Attributes:
 
@@ -127,11 +130,11 @@ class _Tree:
 
         addTransaction(transaction, freq)
             adding items of  transactions into the tree as nodes and freq is the count of nodes
-        getFinalConditionalPatterns(node)
+        getFinalConditionalPatterns(node, weight)
             getting the conditional patterns from fp-tree for a node
-        getConditionalPatterns(patterns, frequencies)
-            sort the patterns by removing the items with lower minSup
-        generatePatterns(prefix)
+        getConditionalPatterns(patterns, frequencies, weight)
+            sort the patterns by removing the items which cannot reach minSup under the max-weight bound of the base
+        generatePatterns(prefix, weight)
             generating the patterns from fp-tree
     """
 
@@ -140,7 +143,7 @@ class _Tree:
         self.summaries = {}
         self.info = {}
 
-    def addTransaction(self, transaction: List[str], count: int) -> None:
+    def addTransaction(self, transaction: List[int], count: int) -> None:
         """
         Adding transaction into tree
 
@@ -152,25 +155,26 @@ class _Tree:
         """
         # This method takes transaction as input and returns the tree
         currentNode = self.root
-        for i in range(len(transaction)):
-            if transaction[i] not in currentNode.children:
-                newNode = _Node(transaction[i], {})
-                newNode.freq = count
-                currentNode.addChild(newNode)
-                if transaction[i] in self.summaries:
-                    self.summaries[transaction[i]].append(newNode)
+        for item in transaction:
+            child = currentNode.children.get(item)
+            if child is None:
+                child = _Node(item, {})
+                child.freq = count
+                currentNode.addChild(child)
+                if item in self.summaries:
+                    self.summaries[item].append(child)
                 else:
-                    self.summaries[transaction[i]] = [newNode]
-                currentNode = newNode
+                    self.summaries[item] = [child]
             else:
-                currentNode = currentNode.children[transaction[i]]
-                currentNode.freq += count
+                child.freq += count
+            currentNode = child
 
-    def getFinalConditionalPatterns(self, alpha: str) -> Tuple[List[List[str]], List[int], Dict[str, int]]:
+    def getFinalConditionalPatterns(self, alpha: int, weight: float) -> Tuple[List[List[int]], List[int], Dict[int, int]]:
         """
         Generates the conditional patterns for a node
 
         :param alpha: node to generate conditional patterns
+        :param weight: the maximum weight of the items in the prefix of the conditional base
         :return: returns conditional patterns, frequency of each item in conditional patterns
         """
         finalPatterns = []
@@ -185,19 +189,23 @@ class _Tree:
                 set2.reverse()
                 finalPatterns.append(set2)
                 finalFreq.append(set1)
-        finalPatterns, finalFreq, info = self.getConditionalTransactions(finalPatterns, finalFreq)
+        finalPatterns, finalFreq, info = self.getConditionalTransactions(finalPatterns, finalFreq, weight)
         return finalPatterns, finalFreq, info
 
     @staticmethod
-    def getConditionalTransactions(ConditionalPatterns: List[List[str]], conditionalFreq: List[int]) -> Tuple[List[List[str]], List[int], Dict[str, int]]:
+    def getConditionalTransactions(ConditionalPatterns: List[List[int]], conditionalFreq: List[int],
+                                   weight: float) -> Tuple[List[List[int]], List[int], Dict[int, int]]:
         """
-        To calculate the frequency of items in conditional patterns and sorting the patterns
+        To calculate the frequency of items in conditional patterns and sorting the patterns.
+        The weight of any pattern grown from the base is bounded by the largest weight among the prefix and the
+        frequent items of the base, so that bound is computed once per base from the weight array.
 
         :param ConditionalPatterns: paths of a node
         :param conditionalFreq: frequency of each item in the path
+        :param weight: the maximum weight of the items in the prefix of the conditional base
         :return: conditional patterns and frequency of each item in transactions
         """
-        global _minSup, _miniWeight
+        global _minSup, _rankWeights
         pat = []
         freq = []
         data1 = {}
@@ -207,7 +215,11 @@ class _Tree:
                     data1[j] += conditionalFreq[i]
                 else:
                     data1[j] = conditionalFreq[i]
-        up_dict = {k: v for k, v in data1.items() if v >= _minSup and v * _miniWeight > _minSup}
+        data1 = {k: v for k, v in data1.items() if v >= _minSup}
+        for k in data1:
+            if _rankWeights[k] > weight:
+                weight = _rankWeights[k]
+        up_dict = {k: v for k, v in data1.items() if v * weight > _minSup}
         count = 0
         for p in ConditionalPatterns:
             p1 = [v for v in p if v in up_dict]
@@ -218,25 +230,27 @@ class _Tree:
             count += 1
         return pat, freq, up_dict
 
-    def generatePatterns(self, prefix: List[str]) -> Generator[Tuple[List[str], int], None, None]:
+    def generatePatterns(self, prefix: List[int], weight: float = 0) -> Generator[Tuple[List[int], int], None, None]:
         """
         To generate the frequent patterns
 
         :param prefix: an empty list
+        :param weight: the maximum weight of the items in prefix
         :return: Frequent patterns that are extracted from fp-tree
         """
-        global _miniWeight, _maxWeight, _minWeight, _minSup
+        global _rankWeights
         for i in sorted(self.summaries, key=lambda x: (self.info.get(x), -x)):
             pattern = prefix[:]
             pattern.append(i)
             yield pattern, self.info[i]
-            patterns, freq, info = self.getFinalConditionalPatterns(i)
+            patternWeight = max(weight, _rankWeights[i])
+            patterns, freq, info = self.getFinalConditionalPatterns(i, patternWeight)
             conditionalTree = _Tree()
             conditionalTree.info = info.copy()
             for pat in range(len(patterns)):
                 conditionalTree.addTransaction(patterns[pat], freq[pat])
             if len(patterns) > 0:
-                for q in conditionalTree.generatePatterns(pattern):
+                for q in conditionalTree.generatePatterns(pattern, patternWeight):
                     yield q
 
 
@@ -299,7 +313,13 @@ class WFIM(_fp._weightedFrequentPatterns):
             To store the total amount of RSS memory consumed by the program
 
         Database : list
-            To store the transactions of a database in list
+            To store the transactions of a database as lists of integer item ids
+
+        strToInt : dict
+            To map every item name to its integer id
+
+        intToStr : list
+            To map every integer id back to its item name
 
         mapSupport : Dictionary
             To maintain the information of item and their frequency
@@ -408,6 +428,8 @@ class WFIM(_fp._weightedFrequentPatterns):
     __mapSupport = {}
     __lno = 0
     __tree = _Tree()
+    __strToInt = {}
+    __intToStr = []
     __rank = {}
     __rankDup = {}
 
@@ -416,17 +438,21 @@ class WFIM(_fp._weightedFrequentPatterns):
 
     def __creatingItemSets(self) -> None:
         """
-        Storing the complete transactions of the database/input file in a database variable
+        Storing the complete transactions of the database/input file in a database variable, with every item
+        replaced by an integer id assigned in order of first appearance
 
         :return: None
         """
         self.__Database = []
+        self.__strToInt = {}
+        self.__intToStr = []
         if isinstance(self._iFile, _fp._pd.DataFrame):
             if self._iFile.empty:
                 print("its empty..")
             i = self._iFile.columns.values.tolist()
             if 'Transactions' in i:
-                self.__Database = self._iFile['Transactions'].tolist()
+                for tr in self._iFile['Transactions'].tolist():
+                    self.__Database.append(self.__encode(tr))
 
             # print(self.Database)
         if isinstance(self._iFile, str):
@@ -437,7 +463,7 @@ class WFIM(_fp._weightedFrequentPatterns):
                     line = line.decode("utf-8")
                     temp = [i.rstrip() for i in line.split(self._sep)]
                     temp = [x for x in temp if x]
-                    self.__Database.append(temp)
+                    self.__Database.append(self.__encode(temp))
             else:
                 try:
                     with open(self._iFile, 'r', encoding='utf-8') as f:
@@ -445,20 +471,36 @@ class WFIM(_fp._weightedFrequentPatterns):
                             line.strip()
                             temp = [i.rstrip() for i in line.split(self._sep)]
                             temp = [x for x in temp if x]
-                            # print(len(temp))
-                            self.__Database.append(temp)
+                            self.__Database.append(self.__encode(temp))
                 except IOError:
                     print("File Not Found")
                     quit()
 
+    def __encode(self, transaction: List[str]) -> List[int]:
+        """
+        Replaces the items of a transaction with their integer ids
+
+        :param transaction: items of a transaction
+        :type transaction: list
+        :return: list of integer ids
+        """
+        encoded = []
+        for item in transaction:
+            itemId = self.__strToInt.get(item)
+            if itemId is None:
+                itemId = len(self.__intToStr)
+                self.__strToInt[item] = itemId
+                self.__intToStr.append(item)
+            encoded.append(itemId)
+        return encoded
+
     def _scanningWeights(self) -> None:
         """
         Storing the weights of the variables in input file in a weights variable
 
         :return: None
         """
-        global _weights
-        _weights = {}
+        self._weights = {}
         if isinstance(self._wFile, _fp._pd.DataFrame):
             items, weights = [], []
             if self._wFile.empty:
@@ -469,7 +511,7 @@ class WFIM(_fp._weightedFrequentPatterns):
             if 'weights' in i:
                 weights = self._wFile['weights'].tolist()
             for i in range(len(weights)):
-                _weights[items[i]] = weights[i]
+                self._weights[items[i]] = weights[i]
 
             # print(self.Database)
         if isinstance(self._wFile, str):
@@ -480,7 +522,7 @@ class WFIM(_fp._weightedFrequentPatterns):
                     line = line.decode("utf-8")
                     temp = [i.rstrip() for i in line.split(self._sep)]
                     temp = [x for x in temp if x]
-                    _weights[temp[0]] = temp[1]
+                    self._weights[temp[0]] = int(float(temp[1]))
             else:
                 try:
                     with open(self._wFile, 'r', encoding='utf-8') as f:
@@ -489,7 +531,7 @@ class WFIM(_fp._weightedFrequentPatterns):
                             temp = [i.rstrip() for i in line.split(self._sep)]
                             temp = [x for x in temp if x]
                             s = int(float(temp[1]))
-                            _weights[temp[0]] = s
+                            self._weights[temp[0]] = s
                 except IOError:
                     print("File Not Found")
                     quit()
@@ -513,41 +555,37 @@ class WFIM(_fp._weightedFrequentPatterns):
                 value = int(value)
         return value
 
-    def __frequentOneItem(self) -> List[str]:
+    def __frequentOneItem(self) -> List[int]:
         """
         Generating One frequent items sets
 
-        :return: list
+        :return: list of the integer ids of the frequent items ordered by their rank
         """
         global _maxWeight
-        self.__mapSupport = {}
+        support = [0] * len(self.__intToStr)
         for tr in self.__Database:
-            for i in range(0, len(tr)):
-                if tr[i] not in self.__mapSupport:
-                    self.__mapSupport[tr[i]] = 1
-                else:
-                    self.__mapSupport[tr[i]] += 1
-        self.__mapSupport = {k: v for k, v in self.__mapSupport.items() if v >= self._minSup and v * _maxWeight > self._minSup}
+            for i in tr:
+                support[i] += 1
+        self.__mapSupport = {k: v for k, v in enumerate(support) if v >= self._minSup and v * _maxWeight > self._minSup}
         genList = [k for k, v in sorted(self.__mapSupport.items(), key=lambda x: x[1], reverse=True)]
         self.__rank = dict([(index, item) for (item, index) in enumerate(genList)])
         return genList
 
-    def __updateTransactions(self, itemSet: List[str]) -> List[List[int]]:
+    def __updateTransactions(self) -> List[List[int]]:
         """
         Updates the items in transactions with rank of items according to their support
 
         :Example: oneLength = {'a':7, 'b': 5, 'c':'4', 'd':3}
                     rank = {'a':0, 'b':1, 'c':2, 'd':3}
 
-        :param itemSet: list of one-frequent items
         :return: list
         """
         list1 = []
+        rank = [-1] * len(self.__intToStr)
+        for item, index in self.__rank.items():
+            rank[item] = index
         for tr in self.__Database:
-            list2 = []
-            for i in range(len(tr)):
-                if tr[i] in itemSet:
-                    list2.append(self.__rank[tr[i]])
+            list2 = [rank[i] for i in tr if rank[i] >= 0]
             if len(list2) >= 1:
                 list2.sort()
                 list1.append(list2)
@@ -596,7 +634,7 @@ class WFIM(_fp._weightedFrequentPatterns):
 
         :return: None
         """
-        global _minSup, _minWeight, _miniWeight, _maxWeight, _weights
+        global _minSup, _minWeight, _miniWeight, _maxWeight, _rankWeights
         self.__startTime = _fp._time.time()
         if self._iFile is None:
             raise Exception("Please enter the file path or file name:")
@@ -604,15 +642,17 @@ class WFIM(_fp._weightedFrequentPatterns):
             raise Exception("Please enter the Minimum Support")
         self.__creatingItemSets()
         self._scanningWeights()
-        _weights = {k: v for k, v in _weights.items() if v >= _minWeight}
-        _maxWeight = max([s for s in _weights.values()])
-        _miniWeight = min([s for s in _weights.values()])
+        weights = {k: v for k, v in self._weights.items() if v >= _minWeight}
+        _maxWeight = max([s for s in weights.values()])
+        _miniWeight = min([s for s in weights.values()])
         self._minSup = self.__convert(self._minSup)
         _minSup = self._minSup
         itemSet = self.__frequentOneItem()
-        updatedTransactions = self.__updateTransactions(itemSet)
+        updatedTransactions = self.__updateTransactions()
+        self.__rankDup = {}
         for x, y in self.__rank.items():
-            self.__rankDup[y] = x
+            self.__rankDup[y] = self.__intToStr[x]
+        _rankWeights = [weights.get(self.__intToStr[item], _maxWeight) for item in itemSet]
         info = {self.__rank[k]: v for k, v in self.__mapSupport.items()}
         __Tree = self.__buildTree(updatedTransactions, info)
         patterns = __Tree.generatePatterns([])
@@ -57,25 +57,11 @@ from deprecated import deprecated
 
 _expSup = str()
 _expWSup = str()
-_weights = {}
+# weight of every frequent item indexed by its rank; self._weights keeps the weights by item name
+_rankWeights = []
 _finalPatterns = {}
-_ab._sys.setrecursionlimit(20000)
-class _Item:
-    """
-    A class used to represent the item with probability in transaction of dataset
-
-    :Attributes:
-
-        item : int or word
-          Represents the name of the item
-
-        probability : float
-          Represent the existential probability(likelihood presence) of an item
-    """
 
-    def __init__(self, item: int, probability: float) -> None:
-        self.item = item
-        self.probability = probability
+_ab._sys.setrecursionlimit(20000)
 
 
 class _Node(object):
@@ -85,14 +71,11 @@ class _Node(object):
     :Attributes:
 
         item : int
-          storing item of a node
-
+          storing the rank of the item of a node
         probability : int
           To maintain the expected support of node
-
         parent : node
           To maintain the parent of every node
-
         children : list
           To maintain the children of node
 
@@ -102,7 +85,9 @@ class _Node(object):
             storing the children to their respective parent nodes
     """
 
-    def __init__(self, item, children: list) -> None:
+    __slots__ = ('item', 'probability', 'children', 'parent')
+
+    def __init__(self, item, children: dict) -> None:
         self.item = item
         self.probability = 1
         self.children = children
@@ -119,32 +104,31 @@ class _Node(object):
         self.children[node.item] = node
         node.parent = self
 
-#global _finalPatterns, _expSup, _expWSup, _weights
+
 class _Tree(object):
     """
-    A class used to represent the frequentPatternGrowth tree structure
+    A class used to represent the frequentPatternGrowth tree structure over integer ranks of items
 
     :Attributes:
 
         root : Node
             Represents the root node of the tree
-
         summaries : dictionary
             storing the nodes with same item name
-
         info : dictionary
             stores the support of items
 
+
     :Methods:
 
         addTransaction(transaction)
             creating transaction as a branch in frequentPatternTree
         addConditionalPattern(prefixPaths, supportOfItems)
             construct the conditional tree for prefix paths
-        conditionalPatterns(Node)
+        conditionalPatterns(Node, weight)
             generates the conditional patterns from tree for specific node
-        conditionalTransactions(prefixPaths,Support)
-            takes the prefixPath of a node and support at child of the path and extract the frequent items from prefixPaths and generates prefixPaths with items which are frequent
+        conditionalTransactions(prefixPaths, Support, weight)
+            takes the prefixPath of a node and support at child of the path and extract the items which can still reach the thresholds from prefixPaths
         remove(Node)
             removes the node from tree once after generating all the patterns respective to the node
         generatePatterns(Node)
@@ -161,40 +145,31 @@ class _Tree(object):
         """
         Adding transaction into tree
 
-        :param transaction: it represents the one self.Database in database
+        :param transaction: it represents the one self.Database in database as (rank, probability) pairs
         :type transaction: list
         :return: None
         """
         currentNode = self.root
-        for i in range(len(transaction)):
-            if transaction[i].item not in currentNode.children:
-                newNode = _Node(transaction[i].item, {})
-                l1 = i - 1
-                lp = []
-                while l1 >= 0:
-                    lp.append(transaction[l1].probability)
-                    l1 -= 1
-                if len(lp) == 0:
-                    newNode.probability = transaction[i].probability
-                else:
-                    newNode.probability = max(lp) * transaction[i].probability
-                currentNode.addChild(newNode)
-                if transaction[i].item in self.summaries:
-                    self.summaries[transaction[i].item].append(newNode)
-                else:
-                    self.summaries[transaction[i].item] = [newNode]
-                currentNode = newNode
+        prefixProbability = None
+        for item, probability in transaction:
+            if prefixProbability is None:
+                value = probability
             else:
-                currentNode = currentNode.children[transaction[i].item]
-                l1 = i - 1
-                lp = []
-                while l1 >= 0:
-                    lp.append(transaction[l1].probability)
-                    l1 -= 1
-                if len(lp) == 0:
-                    currentNode.probability += transaction[i].probability
+                value = prefixProbability * probability
+            child = currentNode.children.get(item)
+            if child is None:
+                child = _Node(item, {})
+                child.probability = value
+                currentNode.addChild(child)
+                if item in self.summaries:
+                    self.summaries[item].append(child)
                 else:
-                    currentNode.probability += max(lp) * transaction[i].probability
+                    self.summaries[item] = [child]
+            else:
+                child.probability += value
+            currentNode = child
+            if prefixProbability is None or probability > prefixProbability:
+                prefixProbability = probability
 
     def addConditionalPattern(self, transaction, sup) -> None:
         """
@@ -208,26 +183,28 @@ class _Tree(object):
         """
         # This method takes transaction, support and constructs the conditional tree
         currentNode = self.root
-        for i in range(len(transaction)):
-            if transaction[i] not in currentNode.children:
-                newNode = _Node(transaction[i], {})
-                newNode.probability = sup
-                currentNode.addChild(newNode)
-                if transaction[i] in self.summaries:
-                    self.summaries[transaction[i]].append(newNode)
+        for item in transaction:
+            child = currentNode.children.get(item)
+            if child is None:
+                child = _Node(item, {})
+                child.probability = sup
+                currentNode.addChild(child)
+                if item in self.summaries:
+                    self.summaries[item].append(child)
                 else:
-                    self.summaries[transaction[i]] = [newNode]
-                currentNode = newNode
+                    self.summaries[item] = [child]
             else:
-                currentNode = currentNode.children[transaction[i]]
-                currentNode.probability += sup
+                child.probability += sup
+            currentNode = child
 
-    def conditionalPatterns(self, alpha) -> tuple:
+    def conditionalPatterns(self, alpha, weight) -> tuple:
         """
         generates all the conditional patterns of respective node
 
         :param alpha : it represents the Node in tree
         :type alpha : _Node
+        :param weight : the maximum weight of the items in the prefix of the conditional base
+        :type weight : float
         :return: tuple
         """
         # This method generates conditional patterns of node by traversing the tree
@@ -243,7 +220,7 @@ class _Tree(object):
                 set2.reverse()
                 finalPatterns.append(set2)
                 sup.append(s)
-        finalPatterns, support, info = self.conditionalTransactions(finalPatterns, sup)
+        finalPatterns, support, info = self.conditionalTransactions(finalPatterns, sup, weight)
         return finalPatterns, support, info
 
     def removeNode(self, nodeValue) -> None:
@@ -254,21 +231,24 @@ class _Tree(object):
         :type nodeValue : node
         :return: None
         """
-
         for i in self.summaries[nodeValue]:
             del i.parent.children[nodeValue]
 
-    def conditionalTransactions(self, condPatterns, support) -> tuple:
+    def conditionalTransactions(self, condPatterns, support, weight) -> tuple:
         """
-        It generates the conditional patterns with frequent items
+        It generates the conditional patterns with the items that can still reach both thresholds.
+        The weight of any pattern grown from the base is bounded by the largest weight among the prefix and the
+        frequent items of the base, so that bound is computed once per base from the weight array.
 
         :param condPatterns : conditionalPatterns generated from conditionalPattern method for respective node
         :type condPatterns : list
         :param support : the support of conditional pattern in tree
         :type support : int
+        :param weight : the maximum weight of the items in the prefix of the conditional base
+        :type weight : float
         :return: tuple
         """
-        global _expSup, _expWSup
+        global _expSup, _expWSup, _rankWeights
         pat = []
         sup = []
         count = {}
@@ -278,47 +258,50 @@ class _Tree(object):
                     count[j] += support[i]
                 else:
                     count[j] = support[i]
-        updatedDict = {}
-        updatedDict = {k: v for k, v in count.items() if v >= _expSup}
-        count = 0
-        for p in condPatterns:
-            p1 = [v for v in p if v in updatedDict]
+        count = {k: v for k, v in count.items() if v >= _expSup}
+        for k in count:
+            if _rankWeights[k] > weight:
+                weight = _rankWeights[k]
+        updatedDict = {k: v for k, v in count.items() if v * weight >= _expWSup}
+        for i in range(len(condPatterns)):
+            p1 = [v for v in condPatterns[i] if v in updatedDict]
             trans = sorted(p1, key=lambda x: updatedDict[x], reverse=True)
             if len(trans) > 0:
                 pat.append(trans)
-                sup.append(support[count])
-                count += 1
+                sup.append(support[i])
         return pat, sup, updatedDict
 
-
-    def generatePatterns(self, prefix) -> None:
+    def generatePatterns(self, prefix, weightSum=0, weight=0) -> None:
         """
         Generates the patterns
 
         :param prefix : forms the combination of items
         :type prefix : list
+        :param weightSum : the sum of the weights of the items in prefix
+        :type weightSum : float
+        :param weight : the maximum weight of the items in prefix
+        :type weight : float
         :return: None
         """
-
-        global _finalPatterns, _expSup, _expWSup, _weights
+        global _finalPatterns, _expSup, _expWSup, _rankWeights
         for i in sorted(self.summaries, key=lambda x: (self.info.get(x))):
             pattern = prefix[:]
             pattern.append(i)
-            weight = 0
-            for k in pattern:
-                weight = weight + _weights[k]
-            weight = weight/len(pattern)
-            if self.info.get(i) >= _expSup and self.info.get(i) * weight >= _expWSup:
-                _finalPatterns[tuple(pattern)] = self.info.get(i)
-                patterns, support, info = self.conditionalPatterns(i)
+            patternWeightSum = weightSum + _rankWeights[i]
+            patternWeight = max(weight, _rankWeights[i])
+            if self.info.get(i) >= _expSup:
+                if self.info.get(i) * patternWeightSum / len(pattern) >= _expWSup:
+                    _finalPatterns[tuple(pattern)] = self.info.get(i)
+                patterns, support, info = self.conditionalPatterns(i, patternWeight)
                 conditionalTree = _Tree()
                 conditionalTree.info = info.copy()
                 for pat in range(len(patterns)):
                     conditionalTree.addConditionalPattern(patterns[pat], support[pat])
                 if len(patterns) > 0:
-                    conditionalTree.generatePatterns(pattern)
+                    conditionalTree.generatePatterns(pattern, patternWeightSum, patternWeight)
             self.removeNode(i)
 
+
 class WUFIM(_ab._weightedFrequentPatterns):
     """
     About this algorithm
@@ -375,7 +358,11 @@ class WUFIM(_ab._weightedFrequentPatterns):
           To record the completion time of the mining process
 
         Database : list
-          To store the transactions of a database in list
+          To store the transactions of a database as lists of (item id, probability) pairs
+        strToInt : dict
+          To map every item name to its integer id
+        intToStr : list
+          To map every integer id back to its item name
 
         mapSupport : Dictionary
           To maintain the information of item and their frequency
@@ -486,6 +473,8 @@ class WUFIM(_ab._weightedFrequentPatterns):
     _memoryUSS = float()
     _memoryRSS = float()
     _Database = []
+    _strToInt = {}
+    _intToStr = []
     _rank = {}
     _expSup = float()
     _expWSup = float()
@@ -496,26 +485,25 @@ class WUFIM(_ab._weightedFrequentPatterns):
 
     def _creatingItemSets(self) -> None:
         """
-        Scans the uncertain transactional dataset
+        Scans the uncertain transactional dataset, replacing every item with an integer id assigned in order of
+        first appearance
 
         :return: None
         """
         self._Database = []
+        self._strToInt = {}
+        self._intToStr = []
         if isinstance(self._iFile, _ab._pd.DataFrame):
             uncertain, data = [], []
             if self._iFile.empty:
                 print("its empty..")
             i = self._iFile.columns.values.tolist()
             if 'Transactions' in i:
-                self._Database = self._iFile['Transactions'].tolist()
+                data = self._iFile['Transactions'].tolist()
             if 'uncertain' in i:
                 uncertain = self._iFile['uncertain'].tolist()
             for k in range(len(data)):
-                tr = []
-                for j in range(len(data[k])):
-                    product = _Item(data[k][j], uncertain[k][j])
-                    tr.append(product)
-                self._Database.append(tr)
+                self._Database.append(self._encode(data[k], [float(j) for j in uncertain[k]]))
 
             # print(self.Database)
         if isinstance(self._iFile, str):
@@ -523,39 +511,51 @@ class WUFIM(_ab._weightedFrequentPatterns):
                 data = _ab._urlopen(self._iFile)
                 for line in data:
                     line = line.decode("utf-8")
-                    line = line.strip()
-                    line = [i for i in line.split(':')]
-                    temp1 = [i.rstrip() for i in line[0].split(self._sep)]
-                    temp2 = [i.rstrip() for i in line[1].split(self._sep)]
-                    temp1 = [x for x in temp1 if x]
-                    temp2 = [x for x in temp2 if x]
-                    tr = []
-                    for i in range(len(temp1)):
-                        item = temp1[i]
-                        probability = float(temp2[i])
-                        product = _Item(item, probability)
-                        tr.append(product)
-                    self._Database.append(tr)
+                    self._Database.append(self._parseLine(line))
             else:
                 try:
                     with open(self._iFile, 'r') as f:
                         for line in f:
-                            line = line.strip()
-                            line = [i for i in line.split(':')]
-                            temp1 = [i.rstrip() for i in line[0].split(self._sep)]
-                            temp2 = [i.rstrip() for i in line[1].split(self._sep)]
-                            temp1 = [x for x in temp1 if x]
-                            temp2 = [x for x in temp2 if x]
-                            tr = []
-                            for i in range(len(temp1)):
-                                item = temp1[i]
-                                probability = float(temp2[i])
-                                product = _Item(item, probability)
-                                tr.append(product)
-                            self._Database.append(tr)
+                            self._Database.append(self._parseLine(line))
                 except IOError:
                     print("File Not Found")
 
+    def _parseLine(self, line) -> list:
+        """
+        Splits a line of the uncertain transactional dataset into an encoded transaction
+
+        :param line: a line of the input file
+        :type line: str
+        :return: list of (item id, probability) pairs
+        """
+        line = line.strip()
+        line = [i for i in line.split(':')]
+        temp1 = [i.rstrip() for i in line[0].split(self._sep)]
+        temp2 = [i.rstrip() for i in line[1].split(self._sep)]
+        temp1 = [x for x in temp1 if x]
+        temp2 = [float(x) for x in temp2 if x]
+        return self._encode(temp1, temp2)
+
+    def _encode(self, items, probabilities) -> list:
+        """
+        Replaces the items of a transaction with their integer ids
+
+        :param items: items of a transaction
+        :type items: list
+        :param probabilities: existential probabilities of the items
+        :type probabilities: list
+        :return: list of (item id, probability) pairs
+        """
+        transaction = []
+        for i in range(len(items)):
+            itemId = self._strToInt.get(items[i])
+            if itemId is None:
+                itemId = len(self._intToStr)
+                self._strToInt[items[i]] = itemId
+                self._intToStr.append(items[i])
+            transaction.append((itemId, probabilities[i]))
+        return transaction
+
     def _scanningWeights(self) -> None:
         """
         Scans the uncertain transactional dataset
@@ -597,24 +597,21 @@ class WUFIM(_ab._weightedFrequentPatterns):
 
     def _frequentOneItem(self) -> tuple:
         """
-        Takes the self.Database and calculates the support of each item in the dataset and assign the ranks to the items by decreasing support and returns the frequent items list
+        Takes the self.Database and calculates the support of each item in the dataset and assign the ranks to the items by decreasing support and returns the frequent items list.
+        An item is kept while its expected support times the largest item weight can still reach expWSup.
 
-        :param self.Database : it represents the one self.Database in database
-        :type self.Database : list
         :return: tuple
         """
-
-        mapSupport = {}
+        support = [0] * len(self._intToStr)
         for i in self._Database:
-            for j in i:
-                if j.item not in mapSupport:
-                    if self._weights.get(j.item) is not None:
-                        mapSupport[j.item] = [j.probability, self._weights[j.item]]
-                else:
-                    mapSupport[j.item][0] += j.probability
-        mapSupport = {k: v[0] for k, v in mapSupport.items() if v[0] >= self._expSup and v[0] * v[1] >= self._expWSup}
+            for item, probability in i:
+                support[item] += probability
+        weights = [self._weights.get(item) for item in self._intToStr]
+        maxWeight = max([w for w in weights if w is not None], default=0)
+        mapSupport = {k: v for k, v in enumerate(support)
+                      if weights[k] is not None and v >= self._expSup and v * maxWeight >= self._expWSup}
         plist = [k for k, v in sorted(mapSupport.items(), key=lambda x: x[1], reverse=True)]
-        self.rank = dict([(index, item) for (item, index) in enumerate(plist)])
+        self.rank = dict([(item, index) for (index, item) in enumerate(plist)])
         return mapSupport, plist
 
     @staticmethod
@@ -635,49 +632,23 @@ class WUFIM(_ab._weightedFrequentPatterns):
             rootNode.addTransaction(data[i])
         return rootNode
 
-    def _updateTransactions(self, dict1) -> list:
+    def _updateTransactions(self) -> list:
         """
         Remove the items which are not frequent from self.Database and updates the self.Database with rank of items
 
-        :param dict1 : frequent items with support
-        :type dict1 : dictionary
         :return: list
         """
         list1 = []
+        rank = [-1] * len(self._intToStr)
+        for item, index in self.rank.items():
+            rank[item] = index
         for tr in self._Database:
-            list2 = []
-            for i in range(0, len(tr)):
-                if tr[i].item in dict1:
-                    list2.append(tr[i])
-            if len(list2) >= 2:
-                basket = list2
-                basket.sort(key=lambda val: self.rank[val.item])
-                list2 = basket
+            list2 = [(rank[item], probability) for item, probability in tr if rank[item] >= 0]
+            if len(list2) >= 1:
+                list2.sort()
                 list1.append(list2)
         return list1
 
-    @staticmethod
-    def _check(i, x) -> int:
-        """
-        To check the presence of item or pattern in transaction
-
-        :param x: it represents the pattern
-        :type x : list
-        :param i : represents the uncertain self.Database
-        :type i : list
-        :return: integer number
-        """
-
-        # This method taken a transaction as input and returns the tree
-        for m in x:
-            k = 0
-            for n in i:
-                if m == n.item:
-                    k += 1
-            if k == 0:
-                return 0
-        return 1
-
     def _convert(self, value) -> float:
         """
         To convert the type of user specified minSup value
@@ -696,39 +667,39 @@ class WUFIM(_ab._weightedFrequentPatterns):
                 value = int(value)
         return value
 
-    #global _finalPatterns
     def _removeFalsePositives(self) -> None:
         """
         To remove the false positive patterns generated in frequent patterns.
 
         :return: patterns with accurate probability
         """
-        global _finalPatterns
-        periods = {}
-        for i in self._Database:
-            for x, y in _finalPatterns.items():
-                if len(x) == 1:
-                    periods[x] = y
-                else:
-                    s = 1
-                    check = self._check(i, x)
-                    if check == 1:
-                        for j in i:
-                            if j.item in x:
-                                s *= j.probability
-                        if x in periods:
-                            periods[x] += s
-                        else:
-                            periods[x] = s
-        for x, y in periods.items():
+        global _finalPatterns, _rankWeights
+        tidList = {}
+        for tid in range(len(self.Database1)):
+            for item, probability in self.Database1[tid]:
+                if item not in tidList:
+                    tidList[item] = {}
+                tidList[item][tid] = probability
+        for x, y in _finalPatterns.items():
+            if len(x) > 1:
+                y = 0
+                items = sorted(x, key=lambda item: len(tidList[item]))
+                for tid, probability in tidList[items[0]].items():
+                    s = probability
+                    for item in items[1:]:
+                        if tid not in tidList[item]:
+                            break
+                        s *= tidList[item][tid]
+                    else:
+                        y += s
             weight = 0
             for i in x:
-                weight += self._weights[i]
+                weight += _rankWeights[i]
             weight = weight / len(x)
-            if weight * y >= self._expWSup:
+            if y >= self._expSup and weight * y >= self._expWSup:
                 sample = str()
                 for i in x:
-                    sample = sample + i + "\t"
+                    sample = sample + self._rankDup[i] + "\t"
                 self._finalPatterns[sample] = y
 
     @deprecated(
@@ -744,20 +715,22 @@ class WUFIM(_ab._weightedFrequentPatterns):
         """
         mine() method where the patterns are mined by constructing tree and remove the false patterns by counting the original support of a patternS
         """
-        global _expSup, _expWSup, _weights, _finalPatterns
+        global _expSup, _expWSup, _rankWeights, _finalPatterns
         self._startTime = _ab._time.time()
         self._Database, self._weights = [], {}
         self._creatingItemSets()
         self._scanningWeights()
-        _weights = self._weights
         self._expSup = float(self._expSup)
         self._expWSup = float(self._expWSup)
         _expSup = self._expSup
         _expWSup = self._expWSup
         self._finalPatterns = {}
+        _finalPatterns = {}
         mapSupport, plist = self._frequentOneItem()
-        self.Database1 = self._updateTransactions(mapSupport)
-        info = {k: v for k, v in mapSupport.items()}
+        self.Database1 = self._updateTransactions()
+        self._rankDup = [self._intToStr[item] for item in plist]
+        _rankWeights = [self._weights[item] for item in self._rankDup]
+        info = {self.rank[k]: v for k, v in mapSupport.items()}
         Tree1 = self._buildTree(self.Database1, info)
         Tree1.generatePatterns([])
         self._removeFalsePositives()
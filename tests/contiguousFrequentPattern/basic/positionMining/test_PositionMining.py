@@ -0,0 +1,72 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/contiguousFrequentPattern/basic/positionMining/test_PositionMining.py
+
+import os
+import re
+import random
+import unittest
+import pandas as pd
+from PAMI.contiguousFrequentPattern.basic.PositionMining import PositionMining
+
+_directory = os.path.dirname(os.path.abspath(__file__))
+
+
+def _bruteForce(sequences, minSup, maxLength):
+    positions = {}
+    offset = 0
+    for sequence in sequences:
+        for start in range(len(sequence)):
+            for end in range(start + 1, min(len(sequence), start + maxLength - 1) + 1):
+                positions.setdefault(sequence[start:end], set()).add(offset + start)
+        offset += len(sequence) + 1
+    return {pattern: found for pattern, found in positions.items() if len(found) >= minSup}
+
+
+class TestPositionMining(unittest.TestCase):
+
+    def setUp(self):
+        self.inputFile = "test_position_mining_input.csv"
+
+    def tearDown(self):
+        if os.path.exists(self.inputFile):
+            os.remove(self.inputFile)
+
+    def _mine(self, sequences, minSup, maxLength):
+        pd.DataFrame(sequences).to_csv(self.inputFile)
+        miner = PositionMining(minSup, self.inputFile, maxLength)
+        miner.mine()
+        return miner
+
+    def test_matches_brute_force(self):
+        rng = random.Random(7)
+        # the last alphabet packs fewer symbols in a key than the longest pattern, which takes prefix doubling
+        cases = [('ACGT', 3, 8), ('AC', 5, 12), ('ACGTN', 1, 5), ('xyz', 2, 20), ('AB' * 20 + 'cdefghijklmnopqrst', 2, 30)]
+        for alphabet, minSup, maxLength in cases:
+            sequences = [''.join(rng.choice(alphabet) for _ in range(rng.randint(1, 40))) for _ in range(12)]
+            miner = self._mine(sequences, minSup, maxLength)
+            expected = _bruteForce(sequences, minSup, maxLength)
+            self.assertEqual(miner.getPatterns(), {pattern: len(found) for pattern, found in expected.items()})
+            for pattern, found in expected.items():
+                self.assertEqual(miner.getPattern_positions(pattern), found)
+            self.assertEqual(miner.get_Klength_patterns(2),
+                             {pattern: len(found) for pattern, found in expected.items() if len(pattern) == 2})
+
+    def test_runs_of_one_symbol(self):
+        miner = self._mine(['AAAAC', 'CAAA'], 2, 20)
+        self.assertEqual(miner.getPatterns()['AA'], 5)
+        self.assertEqual(miner.getPatterns()['AAA'], 3)
+        self.assertEqual(miner.getPattern_positions('AAA'), {0, 1, 7})
+
+    def test_stored_results(self):
+        # the stored results were mined by position-list joins, which missed the patterns repeating a symbol
+        for case, minSup in [(1, 50), (3, 50)]:
+            miner = PositionMining(minSup, os.path.join(_directory, "test%d.csv" % case))
+            miner.mine()
+            stored = pd.read_csv(os.path.join(_directory, "result_testcase_%d.csv" % case))
+            patterns = {pattern: sup for pattern, sup in miner.getPatterns().items()
+                        if not re.search(r'(.)\1', pattern)}
+            self.assertEqual(patterns, dict(zip(stored['Patterns'], stored['Support'])))
+
+
+if __name__ == '__main__':
+    unittest.main()
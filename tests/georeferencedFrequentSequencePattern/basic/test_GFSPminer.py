@@ -0,0 +1,114 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/georeferencedFrequentSequencePattern/basic/test_GFSPminer.py
+
+import io
+import os
+import ast
+import random
+import unittest
+import contextlib
+from PAMI.georeferencedFrequentSequencePattern.basic.GFSPminer import GFSPminer
+from PAMI.georeferencedFrequentSequencePattern.basic.GFSP_Miner import GFSP_Miner
+
+
+def _contains(sequence, pattern):
+    def place(index, previous):
+        if index == len(pattern):
+            return True
+        for position in range(previous + 1, len(sequence)):
+            if pattern[index] <= sequence[position] and place(index + 1, position):
+                return True
+        return False
+    return place(0, -1)
+
+
+def _bruteForce(sequences, neighbours, minSup):
+    items = sorted({item for sequence in sequences for itemset in sequence for item in itemset})
+    patterns = {}
+    frontier = [()]
+    while frontier:
+        nextFrontier = []
+        for pattern in frontier:
+            extensions = [pattern[:-1] + (pattern[-1] | {item},) for item in items if pattern and item > max(pattern[-1])]
+            extensions += [pattern + (frozenset([item]),) for item in items]
+            for extension in extensions:
+                sup = sum(1 for sequence in sequences if _contains(sequence, extension))
+                if sup < minSup:
+                    continue
+                nextFrontier.append(extension)
+                distinct = sorted(set().union(*extension))
+                if all(b in neighbours[a] for a in distinct for b in distinct if a != b):
+                    patterns[extension] = sup
+        frontier = nextFrontier
+    return patterns
+
+
+def _parse(key):
+    itemsets, current = [], set()
+    for item in ast.literal_eval(key):
+        if item == -1:
+            itemsets.append(frozenset(current))
+            current = set()
+        else:
+            current.add(item)
+    return tuple(itemsets)
+
+
+class TestGFSPminer(unittest.TestCase):
+
+    def setUp(self):
+        self.inputFile = "test_gfspminer_input.txt"
+        self.neighbourFile = "test_gfspminer_neighbours.txt"
+
+    def tearDown(self):
+        for path in (self.inputFile, self.neighbourFile):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def _write(self, seed):
+        rng = random.Random(seed)
+        items = 'abcdefgh'
+        sequences = [[set(rng.sample(items, rng.randint(1, 2))) for _ in range(rng.randint(1, 6))]
+                     for _ in range(30)]
+        with open(self.inputFile, 'w') as f:
+            for sequence in sequences:
+                f.write(' -1 '.join(' '.join(sorted(itemset)) for itemset in sequence) + ' -1 -2\n')
+        neighbours = {item: set() for item in items}
+        with open(self.neighbourFile, 'w') as f:
+            for item in items:
+                listed = [other for other in items if other != item and rng.random() < 0.3]
+                for other in listed:
+                    neighbours[item].add(other)
+                    neighbours[other].add(item)
+                f.write('\t'.join([item] + listed) + '\n')
+        return sequences, neighbours
+
+    def _mine(self, miner):
+        with contextlib.redirect_stdout(io.StringIO()):
+            miner.mine()
+        return miner.getPatterns()
+
+    def test_matches_brute_force(self):
+        for seed in range(4):
+            sequences, neighbours = self._write(seed)
+            patterns = self._mine(GFSPminer(self.inputFile, self.neighbourFile, 4))
+            self.assertEqual({_parse(key): sup for key, sup in patterns.items()},
+                             _bruteForce(sequences, neighbours, 4))
+
+    def test_single_item_keys(self):
+        self._write(0)
+        patterns = self._mine(GFSPminer(self.inputFile, self.neighbourFile, 4))
+        for key in patterns:
+            pattern = ast.literal_eval(key)
+            if len(pattern) == 2:
+                self.assertEqual(pattern[1], -1)
+
+    def test_workers(self):
+        self._write(1)
+        serial = self._mine(GFSPminer(self.inputFile, self.neighbourFile, 4))
+        self.assertEqual(self._mine(GFSPminer(self.inputFile, self.neighbourFile, 4, workers=2)), serial)
+        self.assertEqual(self._mine(GFSP_Miner(self.inputFile, self.neighbourFile, 4)), serial)
+
+
+if __name__ == '__main__':
+    unittest.main()
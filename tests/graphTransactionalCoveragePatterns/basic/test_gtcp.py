@@ -0,0 +1,101 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/graphTransactionalCoveragePatterns/basic/test_gtcp.py
+
+import os
+import random
+import unittest
+from PAMI.graphTransactionalCoveragePattern.basic.GTCP import GTCP
+
+
+def _write(path, seed, numGraphs=60, numVertices=8, numEdges=10, vertexLabels=3, edgeLabels=2):
+    rng = random.Random(seed)
+    with open(path, 'w') as f:
+        for i in range(numGraphs):
+            f.write("t # %d\n" % i)
+            n = rng.randint(3, numVertices)
+            for v in range(n):
+                f.write("v %d %d\n" % (v, rng.randint(1, vertexLabels)))
+            pairs = {tuple(sorted(rng.sample(range(n), 2))) for _ in range(rng.randint(2, numEdges))}
+            for v1, v2 in sorted(pairs):
+                f.write("e %d %d %d\n" % (v1, v2, rng.randint(1, edgeLabels)))
+        f.write("t # -1\n")
+
+
+def _cmine(fragments, total, minGTC, minGTPC, maxOR):
+    # Cmine on python sets of fragment ids, recomputing the coverage of every prefix
+    coverage = lambda pattern: set().union(*[fragments[g] for g in pattern])
+    freq = sorted([(g, len(fragments[g]) / total) for g in range(len(fragments))
+                   if len(fragments[g]) / total >= minGTC], key=lambda x: x[1], reverse=True)
+    patterns, nol = [], []
+    for g, cs in freq:
+        if cs >= minGTPC:
+            patterns.append(([g], cs))
+        else:
+            nol.append([g])
+    while nol:
+        level, nol = nol, []
+        for i in range(len(level)):
+            for j in range(i + 1, len(level)):
+                if level[i][:-1] != level[j][:-1]:
+                    break
+                if len(fragments[level[i][-1]]) >= len(fragments[level[j][-1]]):
+                    pattern = level[i] + [level[j][-1]]
+                else:
+                    pattern = level[j] + [level[i][-1]]
+                prefix, last = coverage(pattern[:-1]), fragments[pattern[-1]]
+                cs = len(prefix | last) / total
+                if len(prefix & last) / len(last) <= maxOR:
+                    if cs >= minGTPC:
+                        patterns.append((pattern, cs))
+                    else:
+                        nol.append(pattern)
+    return patterns
+
+
+class TestGTCP(unittest.TestCase):
+
+    def setUp(self):
+        self.input_file = "test_gtcp_input.txt"
+
+    def tearDown(self):
+        if os.path.exists(self.input_file):
+            os.remove(self.input_file)
+
+    def test_flat_transactions(self):
+        _write(self.input_file, 0)
+        obj = GTCP(self.input_file, 0.2, 0.1, 0.6, 0.3)
+        self.assertEqual(obj.numGraphs, 60)
+        fragments = [set() for _ in range(obj.numGraphs)]
+        for fragment in obj.Sf:
+            for gid in fragment["GIDs"]:
+                fragments[gid].add(fragment["FID"])
+        total = len(obj.Sf)
+        for g in range(obj.numGraphs):
+            self.assertEqual(obj.Coverage(g), len(fragments[g]) / total)
+        rng = random.Random(1)
+        for _ in range(50):
+            pattern = rng.sample(range(obj.numGraphs), 3)
+            union = obj.patternCoverage(pattern[:-1])
+            self.assertEqual({f for f in range(total) if (int(union[f >> 6]) >> (f & 63)) & 1},
+                             fragments[pattern[0]] | fragments[pattern[1]])
+            if fragments[pattern[-1]]:
+                prefix, last = fragments[pattern[0]] | fragments[pattern[1]], fragments[pattern[-1]]
+                self.assertEqual(obj.OverlapRatio(pattern),
+                                 (len(prefix & last) / len(last), len(prefix | last) / total))
+
+    def test_same_patterns_as_recomputed_coverage(self):
+        for seed, params in [(2, (0.2, 0.1, 0.6, 0.3)), (3, (0.3, 0.2, 0.8, 0.5))]:
+            _write(self.input_file, seed)
+            obj = GTCP(self.input_file, params[0], params[1], params[2], params[3])
+            obj.mine()
+            fragments = [set() for _ in range(obj.numGraphs)]
+            for fragment in obj.Sf:
+                for gid in fragment["GIDs"]:
+                    fragments[gid].add(fragment["FID"])
+            expected = _cmine(fragments, len(obj.Sf), *params[1:])
+            self.assertTrue(len(expected) > 1)
+            self.assertEqual([(list(p), c) for p, c in obj.getPatterns()], expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/highUtilityPattern/basic/test_EFIMCore.py
+
+import os
+import random
+import unittest
+from unittest import mock
+from itertools import combinations
+from PAMI.highUtilityPattern.basic.EFIM import EFIM
+from PAMI.highUtilityPattern.basic import _EFIMCore
+from PAMI.highUtilityPattern.basic import abstract as _ab
+from PAMI.highUtilityFrequentPattern.basic.HUFIM import HUFIM
+from PAMI.relativeHighUtilityPattern.basic.RHUIM import RHUIM
+from PAMI.highUtilityGeoreferencedFrequentPattern.basic.SHUFIM import SHUFIM
+
+
+class TestEFIMCore(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(11)
+        self.inputFile = "test_efim_core_input.txt"
+        self.neighbourFile = "test_efim_core_neighbours.txt"
+        self.items = ['a', 'b', 'c', 'd', 'e', 'f']
+        self.transactions = []
+        lines = []
+        for _ in range(30):
+            items = random.sample(self.items, random.randint(1, 5))
+            utilities = [random.randint(1, 10) for _ in items]
+            self.transactions.append(dict(zip(items, utilities)))
+            lines.append('\t'.join(items) + ':' + str(sum(utilities)) + ':' + '\t'.join(map(str, utilities)))
+        with open(self.inputFile, 'w') as f:
+            f.write('\n'.join(lines) + '\n')
+        self.neighbours = {item: set() for item in self.items}
+        for x, y in combinations(self.items, 2):
+            if random.random() < 0.6:
+                self.neighbours[x].add(y)
+                self.neighbours[y].add(x)
+        with open(self.neighbourFile, 'w') as f:
+            f.write('\n'.join('\t'.join([item] + sorted(self.neighbours[item])) for item in self.items) + '\n')
+
+    def tearDown(self):
+        for path in (self.inputFile, self.neighbourFile):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def _bruteForce(self, accept):
+        patterns = {}
+        for length in range(1, len(self.items) + 1):
+            for itemset in combinations(self.items, length):
+                containing = [t for t in self.transactions if all(item in t for item in itemset)]
+                utility = sum(t[item] for t in containing for item in itemset)
+                if containing and accept(itemset, utility, len(containing)):
+                    patterns[frozenset(itemset)] = (utility, len(containing))
+        return patterns
+
+    def _mine(self, miner):
+        miner.mine()
+        return {frozenset(pattern.split('\t')): value for pattern, value in miner.getPatterns().items()}
+
+    def test_efim(self):
+        patterns = self._mine(EFIM(self.inputFile, 60))
+        expected = self._bruteForce(lambda itemset, utility, support: utility >= 60)
+        self.assertEqual({k: int(v) for k, v in patterns.items()}, {k: v[0] for k, v in expected.items()})
+
+    def test_chunked_reader(self):
+        expected = self._mine(EFIM(self.inputFile, 60))
+        chunkSize = _EFIMCore._Dataset._chunkSize
+        _EFIMCore._Dataset._chunkSize = 64
+        try:
+            miner = EFIM(self.inputFile, 60)
+            self.assertEqual(self._mine(miner), expected)
+        finally:
+            _EFIMCore._Dataset._chunkSize = chunkSize
+        self.assertEqual(miner._dataset.getTransactionCount(), len(self.transactions))
+        promising = {item for item in self.items
+                     if sum(sum(t.values()) for t in self.transactions if item in t) >= 60}
+        self.assertEqual(sorted(miner._dataset.intToStr[miner._newNamesToOldNames[item]] for item in
+                                set(i for t in miner._dataset.getTransactions() for i in t.getItems())),
+                         sorted(promising))
+
+    def test_url_is_downloaded_once(self):
+        expected = self._mine(EFIM(self.inputFile, 60))
+        url = "https://example.com/test_efim_core_input.txt"
+        downloads = []
+
+        def urlopen(path):
+            downloads.append(path)
+            return open(self.inputFile, 'rb')
+
+        with mock.patch.object(_ab, '_urlopen', urlopen), mock.patch.object(_EFIMCore._Dataset, '_chunkSize', 64):
+            miner = EFIM(url, 60)
+            self.assertEqual(self._mine(miner), expected)
+        self.assertEqual(downloads, [url])
+        self.assertIsNone(miner._dataset._spool)
+
+    def test_min_support(self):
+        patterns = self._mine(HUFIM(self.inputFile, 40, 4))
+        expected = self._bruteForce(lambda itemset, utility, support: utility >= 40 and support >= 4)
+        self.assertEqual(patterns, {k: list(v) for k, v in expected.items()})
+
+    def test_min_relative_utility(self):
+        single = {item: sum(t.get(item, 0) for t in self.transactions) for item in self.items}
+        patterns = self._mine(RHUIM(self.inputFile, 30, 40.0))
+        expected = self._bruteForce(
+            lambda itemset, utility, support: utility >= 30 and utility / sum(single[i] for i in itemset) * 100 >= 40)
+        self.assertEqual(set(patterns), set(expected))
+        for itemset, (utility, ratio) in patterns.items():
+            self.assertEqual(utility, expected[itemset][0])
+            self.assertAlmostEqual(ratio, utility / sum(single[i] for i in itemset))
+
+    def test_neighbourhood(self):
+        patterns = self._mine(SHUFIM(self.inputFile, self.neighbourFile, 40, 3))
+        expected = self._bruteForce(
+            lambda itemset, utility, support: utility >= 40 and support >= 3 and
+            all(y in self.neighbours[x] for x, y in combinations(itemset, 2)))
+        self.assertEqual(patterns, {k: list(v) for k, v in expected.items()})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/highUtilityPattern/basic/test_HMinerUPGrowth.py
+
+import os
+import random
+import unittest
+from itertools import combinations
+from PAMI.highUtilityPattern.basic.HMiner import HMiner
+from PAMI.highUtilityPattern.basic.UPGrowth import UPGrowth
+
+
+class TestHMinerUPGrowth(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(13)
+        self.inputFile = "test_hminer_upgrowth_input.txt"
+        self.items = [str(i) for i in range(1, 8)]
+        self.transactions = []
+        for _ in range(25):
+            items = random.sample(self.items, random.randint(1, 5))
+            self.transactions.append({item: random.randint(1, 9) for item in items})
+        # repeated transactions give identical projections that the joins merge
+        self.transactions += [dict(t) for t in self.transactions[:8]]
+        self.transactions += [{'1': 2, '2': 3, '3': 4}] * 4
+        with open(self.inputFile, 'w') as f:
+            for transaction in self.transactions:
+                items = list(transaction)
+                f.write('\t'.join(items) + ':' + str(sum(transaction.values())) + ':' +
+                        '\t'.join(str(transaction[item]) for item in items) + '\n')
+
+    def tearDown(self):
+        if os.path.exists(self.inputFile):
+            os.remove(self.inputFile)
+
+    def _bruteForce(self, minUtil):
+        patterns = {}
+        for length in range(1, len(self.items) + 1):
+            for itemset in combinations(self.items, length):
+                utility = sum(sum(t[item] for item in itemset) for t in self.transactions
+                              if all(item in t for item in itemset))
+                if utility >= minUtil:
+                    patterns[frozenset(itemset)] = utility
+        return patterns
+
+    def _mine(self, miner):
+        miner.mine()
+        return {frozenset(pattern.split()): int(utility) for pattern, utility in miner.getPatterns().items()}
+
+    def test_hminer_blocks(self):
+        for minUtil in (30, 60, 100):
+            expected = self._bruteForce(minUtil)
+            for blockSize in (1 << 20, 7, 1):
+                with self.subTest(minUtil=minUtil, blockSize=blockSize):
+                    miner = HMiner(self.inputFile, minUtil)
+                    miner._blockSize = blockSize
+                    self.assertEqual(self._mine(miner), expected)
+
+    def test_upgrowth(self):
+        for minUtil in (30, 60, 100):
+            with self.subTest(minUtil=minUtil):
+                self.assertEqual(self._mine(UPGrowth(self.inputFile, minUtil)), self._bruteForce(minUtil))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/highUtilityPatternsInStreams/test_HUPMS.py
+
+import io
+import os
+import random
+import itertools
+import unittest
+import contextlib
+from PAMI.highUtilityPatternsInStreams.HUPMS import HUPMS
+
+
+class TestHUPMS(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(7)
+        self.inputFile = "test_hupms_input.txt"
+        self.outputFile = "test_hupms_output.txt"
+        lines = []
+        for _ in range(32):
+            items = random.sample(['a', 'b', 'c', 'd', 'e', 'f'], random.randint(1, 4))
+            utilities = [random.randint(1, 5) for _ in items]
+            lines.append(','.join(items) + ':' + str(sum(utilities)) + ':' + ','.join(map(str, utilities)))
+        with open(self.inputFile, 'w') as f:
+            f.write('\n'.join(lines) + '\n')
+
+    def tearDown(self):
+        if os.path.exists(self.inputFile):
+            os.remove(self.inputFile)
+
+    def _asSets(self, patterns):
+        return {window: {(frozenset(itemset), utility) for itemset, utility in results}
+                for window, results in patterns.items()}
+
+    def test_incremental_matches_full_mining(self):
+        full = HUPMS(self.inputFile, self.outputFile, 20, 3, 4, ',')
+        full.mine()
+        expected = self._asSets(full.getPatterns())
+
+        incremental = HUPMS(self.inputFile, self.outputFile, 20, 3, 4, ',', incremental=True)
+        incremental.mine()
+        self.assertEqual(self._asSets(incremental.getPatterns()), expected)
+
+    def test_callback_deltas_replay_windows(self):
+        deltas = []
+        incremental = HUPMS(self.inputFile, self.outputFile, 20, 3, 4, ',', incremental=True,
+                            callback=lambda window, windowDeltas: deltas.append((window, windowDeltas)))
+        incremental.mine()
+
+        patterns = self._asSets(incremental.getPatterns())
+        self.assertEqual([window for window, _ in deltas], list(patterns.keys()))
+        current = {}
+        for window, windowDeltas in deltas:
+            for sign, itemset, utility in windowDeltas:
+                if sign == '+':
+                    current[frozenset(itemset)] = utility
+                else:
+                    self.assertIn(frozenset(itemset), current)
+                    del current[frozenset(itemset)]
+            self.assertEqual({(itemset, utility) for itemset, utility in current.items()}, patterns[window])
+
+    def test_multi_character_items_match_brute_force(self):
+        # items sharing their first character must still be ordered as the header table orders them
+        names = ['a1', 'a10', 'a2', 'b7', 'b70', 'c']
+        for seed in range(4):
+            rng = random.Random(seed)
+            transactions, lines = [], []
+            for _ in range(36):
+                items = rng.sample(names, rng.randint(1, 4))
+                utilities = [rng.randint(1, 5) for _ in items]
+                transactions.append(dict(zip(items, utilities)))
+                lines.append(','.join(items) + ':' + str(sum(utilities)) + ':' + ','.join(map(str, utilities)))
+            with open(self.inputFile, 'w') as f:
+                f.write('\n'.join(lines) + '\n')
+
+            for incremental in (False, True):
+                miner = HUPMS(self.inputFile, self.outputFile, 20, 3, 3, ',', incremental=incremental)
+                with contextlib.redirect_stdout(io.StringIO()):
+                    miner.mine()
+                patterns = self._asSets(miner.getPatterns())
+                self.assertTrue(patterns)
+                for (start, end), found in patterns.items():
+                    expected = set()
+                    for length in range(1, len(names) + 1):
+                        for itemset in itertools.combinations(names, length):
+                            utility = sum(sum(transaction[item] for item in itemset)
+                                          for transaction in transactions[start:end]
+                                          if all(item in transaction for item in itemset))
+                            if utility >= 20:
+                                expected.add((frozenset(itemset), utility))
+                    self.assertEqual(found, expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
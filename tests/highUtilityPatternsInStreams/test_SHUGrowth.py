@@ -0,0 +1,82 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/highUtilityPatternsInStreams/test_SHUGrowth.py
+
+import io
+import os
+import random
+import itertools
+import unittest
+import contextlib
+from PAMI.highUtilityPatternsInStreams.SHUGrowth import SHUGrowth
+
+
+class TestSHUGrowth(unittest.TestCase):
+
+    def setUp(self):
+        self.inputFile = "test_shugrowth_input.txt"
+        self.outputFile = "test_shugrowth_output.txt"
+
+    def tearDown(self):
+        for file in (self.inputFile, self.outputFile):
+            if os.path.exists(file):
+                os.remove(file)
+
+    def _write(self, seed):
+        rng = random.Random(seed)
+        transactions, lines = [], []
+        for _ in range(36):
+            items = rng.sample(['a', 'b', 'c', 'd', 'e', 'f'], rng.randint(1, 4))
+            utilities = [rng.randint(1, 5) for _ in items]
+            transactions.append(dict(zip(items, utilities)))
+            lines.append(','.join(items) + ':' + str(sum(utilities)) + ':' + ','.join(map(str, utilities)))
+        with open(self.inputFile, 'w') as f:
+            f.write('\n'.join(lines) + '\n')
+        return transactions
+
+    def _mine(self, **kwargs):
+        miner = SHUGrowth(self.inputFile, self.outputFile, 20, 3, 3, ',', **kwargs)
+        with contextlib.redirect_stdout(io.StringIO()):
+            miner.mine()
+        return {window: {(frozenset(itemset), utility) for itemset, utility in results}
+                for window, results in miner.getPatterns().items()}
+
+    def _bruteForce(self, transactions, window):
+        start, end = window
+        expected = set()
+        for length in range(1, 7):
+            for itemset in itertools.combinations('abcdef', length):
+                utility = sum(sum(transaction[item] for item in itemset) for transaction in transactions[start:end]
+                              if all(item in transaction for item in itemset))
+                if utility >= 20:
+                    expected.add((frozenset(itemset), utility))
+        return expected
+
+    def test_full_and_incremental_match_brute_force(self):
+        for seed in range(6):
+            transactions = self._write(seed)
+            full = self._mine()
+            self.assertTrue(full)
+            for window, patterns in full.items():
+                self.assertEqual(patterns, self._bruteForce(transactions, window))
+            self.assertEqual(self._mine(incremental=True), full)
+
+    def test_callback_deltas_replay_windows(self):
+        self._write(7)
+        deltas = []
+        patterns = self._mine(incremental=True, callback=lambda window, windowDeltas: deltas.append((window, windowDeltas)))
+
+        self.assertEqual([window for window, _ in deltas], list(patterns.keys()))
+        current = {}
+        for window, windowDeltas in deltas:
+            for sign, itemset, utility in windowDeltas:
+                if sign == '+':
+                    self.assertNotEqual(current.get(frozenset(itemset)), utility)
+                    current[frozenset(itemset)] = utility
+                else:
+                    self.assertIn(frozenset(itemset), current)
+                    del current[frozenset(itemset)]
+            self.assertEqual({(itemset, utility) for itemset, utility in current.items()}, patterns[window])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/multipleMinimumSequentialPatterns/basic/test_MMSBPrefixSpan.py
+
+import io
+import os
+import ast
+import random
+import unittest
+import contextlib
+import numpy as np
+from PAMI.extras.calculateMISValues.MISVector import MISVector
+from PAMI.multipleMinimumSupportBasedSequentialPattern.basic.MMSBPrefixSpan import MMSBprefixSpan
+
+
+def _contains(sequence, pattern, maxGap):
+    def place(index, previous):
+        if index == len(pattern):
+            return True
+        for position in range(previous + 1, len(sequence)):
+            if index and position - previous > maxGap:
+                break
+            if pattern[index] <= sequence[position] and place(index + 1, position):
+                return True
+        return False
+    return place(0, -1)
+
+
+def _bruteForce(sequences, minSup, maxGap, maxLength):
+    items = sorted({item for sequence in sequences for itemset in sequence for item in itemset})
+    patterns = {}
+    frontier = [()]
+    while frontier:
+        nextFrontier = []
+        for pattern in frontier:
+            extensions = [pattern[:-1] + (pattern[-1] | {item},) for item in items if pattern and item > max(pattern[-1])]
+            if len(pattern) < maxLength:
+                extensions += [pattern + (frozenset([item]),) for item in items]
+            for extension in extensions:
+                sup = sum(1 for sequence in sequences if _contains(sequence, extension, maxGap))
+                if sup >= minSup:
+                    patterns[extension] = sup
+                    nextFrontier.append(extension)
+        frontier = nextFrontier
+    return patterns
+
+
+class TestMMSBPrefixSpan(unittest.TestCase):
+
+    def setUp(self):
+        self.inputFile = "test_mmsb_prefixspan_input.txt"
+
+    def tearDown(self):
+        if os.path.exists(self.inputFile):
+            os.remove(self.inputFile)
+
+    def test_mis_vector(self):
+        np.testing.assert_array_equal(MISVector([10, 4, 7], 0.5, 3), [5, 3, 3.5])
+        np.testing.assert_array_equal(MISVector(np.array([10, 4, 7]), 2, 3), [8, 3, 5])
+        np.testing.assert_array_equal(MISVector([10, 4], "2", 3), [8, 3])
+
+    def _check(self, seed, X, **constraints):
+        rng = random.Random(seed)
+        sequences = [[set(rng.sample('abcdefg', rng.randint(1, 2))) for _ in range(rng.randint(1, 6))]
+                     for _ in range(30)]
+        with open(self.inputFile, 'w') as f:
+            for sequence in sequences:
+                f.write('\t-1\t'.join('\t'.join(sorted(itemset)) for itemset in sequence) + '\t-1\t-2\n')
+        miner = MMSBprefixSpan(self.inputFile, 3, X, **constraints)
+        with contextlib.redirect_stdout(io.StringIO()):
+            miner.mine()
+        patterns = {}
+        for key, sup in miner.getPatterns().items():
+            itemsets, current = [], set()
+            for item in ast.literal_eval(key):
+                if item == -1:
+                    itemsets.append(frozenset(current))
+                    current = set()
+                else:
+                    current.add(item)
+            patterns[tuple(itemsets)] = sup
+        frequent = _bruteForce(sequences, 3, constraints.get('maxGap', float('inf')),
+                               constraints.get('maxlen', float('inf')))
+        supports = {next(iter(pattern[0])): sup for pattern, sup in frequent.items() if len(pattern) == 1
+                    and len(pattern[0]) == 1}
+        MIS = dict(zip(supports, MISVector(list(supports.values()), X, 3)))
+        expected = {pattern: sup for pattern, sup in frequent.items()
+                    if sup >= min(MIS[item] for itemset in pattern for item in itemset)}
+        self.assertEqual(patterns, expected)
+
+    def test_against_brute_force(self):
+        for seed, X in ((0, 1), (1, 0.6), (2, 3)):
+            self._check(seed, X)
+
+    def test_constraints(self):
+        self._check(3, 0.6, maxGap=1)
+        self._check(4, 1, maxGap=2, maxlen=2)
+        self._check(5, 2, maxGap=2, workers=2)
+
+
+if __name__ == '__main__':
+    unittest.main()
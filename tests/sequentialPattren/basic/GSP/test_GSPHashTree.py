@@ -0,0 +1,110 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/sequentialPattren/basic/GSP/test_GSPHashTree.py
+
+import io
+import os
+import random
+import unittest
+import contextlib
+from PAMI.sequentialPattern.basic.GSP import GSP
+
+
+def _contains(sequence, elements, minGap, maxGap, window):
+    """Tries every run of itemsets for every element of the pattern"""
+    failed = set()
+
+    def place(index, lastStart, lastEnd):
+        if index == len(elements):
+            return True
+        if (index, lastStart, lastEnd) in failed:
+            return False
+        for start in range(len(sequence)):
+            for end in range(start, min(len(sequence), start + window + 1)):
+                if not elements[index] <= set().union(*sequence[start:end + 1]):
+                    continue
+                if index and (start - lastEnd <= minGap or end - lastStart > maxGap):
+                    continue
+                if place(index + 1, start, end):
+                    return True
+        failed.add((index, lastStart, lastEnd))
+        return False
+    return place(0, -1, -1)
+
+
+def _bruteForce(sequences, minSup, minGap, maxGap, window):
+    items = sorted({item for sequence in sequences for itemset in sequence for item in itemset})
+    patterns = {}
+    frontier = [()]
+    while frontier:
+        nextFrontier = []
+        for pattern in frontier:
+            extensions = [pattern + (frozenset([item]),) for item in items]
+            if pattern:
+                extensions += [pattern[:-1] + (pattern[-1] | {item},) for item in items if item > max(pattern[-1])]
+            for extension in extensions:
+                sup = sum(1 for sequence in sequences if _contains(sequence, extension, minGap, maxGap, window))
+                if sup >= minSup:
+                    patterns[extension] = sup
+                    nextFrontier.append(extension)
+        frontier = nextFrontier
+    return patterns
+
+
+def _asElements(key, sepSeq):
+    if isinstance(key, str):
+        return (frozenset([key]),)
+    elements, current = [], set()
+    for item in key:
+        if item == sepSeq:
+            elements.append(frozenset(current))
+            current = set()
+        else:
+            current.add(item)
+    elements.append(frozenset(current))
+    return tuple(elements)
+
+
+class TestGSPHashTree(unittest.TestCase):
+
+    def setUp(self):
+        self.inputFile = "test_gsp_hash_tree_input.txt"
+
+    def tearDown(self):
+        if os.path.exists(self.inputFile):
+            os.remove(self.inputFile)
+
+    def _check(self, seed, minSup=4, **constraints):
+        rng = random.Random(seed)
+        sequences = [[set(rng.sample('abcde', rng.randint(1, 2))) for _ in range(rng.randint(1, 6))]
+                     for _ in range(25)]
+        with open(self.inputFile, 'w') as f:
+            for sequence in sequences:
+                f.write(' -1 '.join(' '.join(sorted(itemset)) for itemset in sequence) + ' -1 -2\n')
+        # the reader keeps the trailing -2 as an itemset of its own
+        sequences = [sequence + [{'-2'}] for sequence in sequences]
+        miner = GSP(self.inputFile, minSup, **constraints)
+        with contextlib.redirect_stdout(io.StringIO()):
+            miner.mine()
+        patterns = {_asElements(key, '-1'): sup for key, sup in miner.getPatterns().items()}
+        expected = _bruteForce(sequences, minSup, constraints.get('minGap', 0), constraints.get('maxGap', float('inf')),
+                               constraints.get('window', 0))
+        self.assertEqual(patterns, expected)
+
+    def test_without_constraints(self):
+        for seed in range(3):
+            self._check(seed)
+
+    def test_gaps(self):
+        for seed in range(3):
+            self._check(seed, maxGap=2)
+            self._check(seed, minGap=1)
+            self._check(seed, minGap=1, maxGap=3)
+
+    def test_window(self):
+        for seed in range(3):
+            self._check(seed, 7, window=1)
+            self._check(seed, 7, window=1, maxGap=2)
+
+
+if __name__ == '__main__':
+    unittest.main()
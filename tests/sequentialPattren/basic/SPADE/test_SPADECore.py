@@ -0,0 +1,109 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/sequentialPattren/basic/SPADE/test_SPADECore.py
+
+import io
+import os
+import random
+import unittest
+import contextlib
+from PAMI.sequentialPattern.basic.SPADE import SPADE
+from PAMI.sequentialPattern.basic.SPADEPlus import SPADEPlus
+from PAMI.sequentialPattern.basic.bitSPADE import bitSPADE
+
+
+def _contains(sequence, pattern, maxGap):
+    """Whether the sequence has an occurrence of the pattern with consecutive itemsets at most maxGap apart"""
+    def search(index, previous):
+        if index == len(pattern):
+            return True
+        for eid in range(previous + 1, len(sequence)):
+            if previous >= 0 and eid - previous > maxGap:
+                break
+            if pattern[index] <= sequence[eid] and search(index + 1, eid):
+                return True
+        return False
+    return search(0, -1)
+
+
+def _bruteForce(sequences, minSup, maxGap=float("inf"), maxLen=float("inf")):
+    items = sorted({item for sequence in sequences for itemset in sequence for item in itemset})
+    patterns, frontier = {}, [()]
+    while frontier:
+        nextFrontier = []
+        for pattern in frontier:
+            if sum(len(itemset) for itemset in pattern) >= maxLen:
+                continue
+            extensions = [pattern + (frozenset([item]),) for item in items]
+            if pattern:
+                extensions += [pattern[:-1] + (pattern[-1] | {item},) for item in items if item > max(pattern[-1])]
+            for extension in extensions:
+                support = sum(1 for sequence in sequences if _contains(sequence, extension, maxGap))
+                if support >= minSup:
+                    patterns[extension] = support
+                    nextFrontier.append(extension)
+        frontier = nextFrontier
+    return patterns
+
+
+def _parse(key):
+    """The pattern of a SPADE output key as a tuple of itemsets"""
+    if not key.startswith('('):
+        return (frozenset([key]),)
+    pattern, itemset = [], set()
+    for item in eval(key):
+        if item == '-1':
+            pattern.append(frozenset(itemset))
+            itemset = set()
+        else:
+            itemset.add(item)
+    return tuple(pattern)
+
+
+class TestSPADECore(unittest.TestCase):
+
+    def setUp(self):
+        self.inputFile = "test_spade_core_input.txt"
+
+    def tearDown(self):
+        if os.path.exists(self.inputFile):
+            os.remove(self.inputFile)
+
+    def _write(self, seed):
+        rng = random.Random(seed)
+        sequences = [[set(rng.sample('abcde', rng.randint(1, 2))) for _ in range(rng.randint(1, 6))]
+                     for _ in range(30)]
+        with open(self.inputFile, 'w') as f:
+            for sequence in sequences:
+                f.write(' -1 '.join(' '.join(sorted(itemset)) for itemset in sequence) + ' -1 -2\n')
+        # the reader keeps the trailing -2 as an itemset of its own
+        return [sequence + [{'-2'}] for sequence in sequences]
+
+    def _mine(self, miner):
+        with contextlib.redirect_stdout(io.StringIO()):
+            miner.mine()
+        patterns = {_parse(key): support for key, support in miner.getPatterns().items()}
+        self.assertEqual(len(patterns), len(miner.getPatterns()))
+        return patterns
+
+    def test_matches_brute_force(self):
+        for seed in range(4):
+            sequences = self._write(seed)
+            expected = _bruteForce(sequences, 4)
+            self.assertEqual(self._mine(SPADE(self.inputFile, 4)), expected)
+            self.assertEqual(self._mine(bitSPADE(self.inputFile, 4)), expected)
+
+    def test_constraints_match_brute_force(self):
+        for seed in range(4):
+            sequences = self._write(seed)
+            for maxGap, maxLen in ((1, float("inf")), (2, 3), (float("inf"), 2)):
+                self.assertEqual(self._mine(SPADEPlus(self.inputFile, 4, maxlen=maxLen, maxGap=maxGap)),
+                                 _bruteForce(sequences, 4, maxGap, maxLen))
+
+    def test_relative_support(self):
+        self._write(0)
+        absolute = self._mine(SPADE(self.inputFile, 6))
+        self.assertEqual(self._mine(SPADE(self.inputFile, 0.2)), absolute)
+
+
+if __name__ == '__main__':
+    unittest.main()
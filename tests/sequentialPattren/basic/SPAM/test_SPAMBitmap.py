@@ -0,0 +1,110 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/sequentialPattren/basic/SPAM/test_SPAMBitmap.py
+
+import os
+import random
+import unittest
+from PAMI.sequentialPattern.basic.SPAM import SPAM
+
+
+def _oldBitmap(sequences, item, maxSeqLen):
+    """The list-of-ints bitmap of the previous SPAM: itemset p of a sequence is bit 2 ** (maxSeqLen - p - 1)"""
+    bitmap = []
+    for sequence in sequences:
+        value = 0
+        for position, itemset in enumerate(sequence):
+            if item in itemset:
+                value |= 1 << (maxSeqLen - position - 1)
+        bitmap.append(value)
+    return bitmap
+
+
+def _oldSstep(bitmap):
+    nextS = []
+    for value in bitmap:
+        if value == 0:
+            nextS.append(0)
+        else:
+            nextS.append((1 << (value.bit_length() - 1)) - 1)
+    return nextS
+
+
+def _oldCountSup(bitmap):
+    return sum(1 for value in bitmap if value != 0)
+
+
+class TestSPAMBitmap(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(3)
+        self.inputFile = "test_spam_bitmap_input.txt"
+        self.items = ['i' + str(k) for k in range(8)]
+        self.sequences = []
+        for length in [1, 2, 5, 63, 64, 65, 150, 3, 130, 7] + [random.randint(1, 6) for _ in range(10)]:
+            self.sequences.append([set(random.sample(self.items, random.randint(1, 2))) for _ in range(length)])
+        with open(self.inputFile, 'w') as f:
+            for sequence in self.sequences:
+                f.write(' -1 '.join(' '.join(sorted(itemset)) for itemset in sequence) + ' -1 -2\n')
+                # the reader keeps the trailing -2 as an itemset of its own
+                sequence.append({'-2'})
+        self.maxSeqLen = max(len(sequence) for sequence in self.sequences)
+        self.miner = SPAM(self.inputFile, 8)
+        self.miner.mine()
+
+    def tearDown(self):
+        if os.path.exists(self.inputFile):
+            os.remove(self.inputFile)
+
+    def _asOld(self, row):
+        """Converts a packed row into the list-of-ints layout, dropping the bits beyond each sequence"""
+        bitmap = []
+        for s, sequence in enumerate(self.sequences):
+            value = 0
+            for position in range(len(sequence)):
+                word = int(row[self.miner._offsets[s] + (position >> 6)])
+                if word >> (position & 63) & 1:
+                    value |= 1 << (self.maxSeqLen - position - 1)
+            bitmap.append(value)
+        return bitmap
+
+    def _clip(self, bitmap):
+        """Drops the bits of the old layout that lie beyond the end of each sequence"""
+        return [value >> (self.maxSeqLen - len(sequence)) << (self.maxSeqLen - len(sequence))
+                for value, sequence in zip(bitmap, self.sequences)]
+
+    def test_bitmaps_and_sstep(self):
+        self.assertGreater(self.miner._offsets[-1], len(self.sequences))
+        for index, item in enumerate(self.miner._Database):
+            old = _oldBitmap(self.sequences, item, self.maxSeqLen)
+            row = self.miner._bitmaps[index]
+            self.assertEqual(self._asOld(row), old)
+            self.assertEqual(int(self.miner.countSup(row)), _oldCountSup(old))
+            self.assertEqual(self._asOld(self.miner.Sstep(row)), self._clip(_oldSstep(old)))
+
+    def test_extend(self):
+        candidates = list(range(len(self.miner._Database)))
+        for index, item in enumerate(self.miner._Database):
+            old = _oldBitmap(self.sequences, item, self.maxSeqLen)
+            for transform, oldTransform in ((self.miner.Sstep, _oldSstep), (lambda row: row, lambda bitmap: bitmap)):
+                frequent, bitmaps, supports = self.miner._extend(transform(self.miner._bitmaps[index]), candidates)
+                expected = []
+                for other in candidates:
+                    otherOld = _oldBitmap(self.sequences, self.miner._Database[other], self.maxSeqLen)
+                    joined = [x & y for x, y in zip(oldTransform(old), otherOld)]
+                    if _oldCountSup(joined) >= self.miner._minSup:
+                        expected.append((other, joined, _oldCountSup(joined)))
+                self.assertEqual(frequent, [other for other, _, _ in expected])
+                self.assertEqual(supports, [support for _, _, support in expected])
+                for bitmap, (_, joined, _) in zip(bitmaps, expected):
+                    self.assertEqual(self._asOld(bitmap), joined)
+
+    def test_block_size(self):
+        expected = dict(self.miner.getPatterns())
+        miner = SPAM(self.inputFile, 8)
+        miner._blockWords = 1
+        miner.mine()
+        self.assertEqual(miner.getPatterns(), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
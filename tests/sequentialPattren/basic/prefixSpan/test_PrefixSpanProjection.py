@@ -0,0 +1,89 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/sequentialPattren/basic/prefixSpan/test_PrefixSpanProjection.py
+
+import io
+import os
+import random
+import unittest
+import contextlib
+from PAMI.sequentialPattern.basic.PrefixSpan import PrefixSpan
+
+
+def _contains(sequence, pattern):
+    position = 0
+    for itemset in pattern:
+        while position < len(sequence) and not itemset <= sequence[position]:
+            position += 1
+        if position == len(sequence):
+            return False
+        position += 1
+    return True
+
+
+def _bruteForce(sequences, minSup):
+    items = sorted({item for sequence in sequences for itemset in sequence for item in itemset})
+    patterns, frontier = {}, [()]
+    while frontier:
+        nextFrontier = []
+        for pattern in frontier:
+            extensions = [pattern + (frozenset([item]),) for item in items]
+            if pattern:
+                extensions += [pattern[:-1] + (pattern[-1] | {item},) for item in items if item > max(pattern[-1])]
+            for extension in extensions:
+                support = sum(1 for sequence in sequences if _contains(sequence, extension))
+                if support >= minSup:
+                    patterns[extension] = support
+                    nextFrontier.append(extension)
+        frontier = nextFrontier
+    return patterns
+
+
+def _parse(key):
+    pattern, itemset = [], set()
+    for item in eval(key):
+        if item == ':':
+            pattern.append(frozenset(itemset))
+            itemset = set()
+        else:
+            itemset.add(item)
+    return tuple(pattern)
+
+
+class TestPrefixSpanProjection(unittest.TestCase):
+
+    def setUp(self):
+        self.inputFile = "test_prefixspan_projection_input.txt"
+
+    def tearDown(self):
+        if os.path.exists(self.inputFile):
+            os.remove(self.inputFile)
+
+    def _mine(self, sequences, minSup):
+        with open(self.inputFile, 'w') as f:
+            for sequence in sequences:
+                f.write(' : '.join(' '.join(sorted(itemset)) for itemset in sequence) + '\n')
+        miner = PrefixSpan(self.inputFile, minSup)
+        with contextlib.redirect_stdout(io.StringIO()):
+            miner.mine()
+        patterns = {_parse(key): support for key, support in miner.getPatterns().items()}
+        self.assertEqual(len(patterns), len(miner.getPatterns()))
+        return patterns
+
+    def test_matches_brute_force(self):
+        for seed in range(5):
+            rng = random.Random(seed)
+            sequences = [[set(rng.sample('abcdefg', rng.randint(1, 4))) for _ in range(rng.randint(1, 6))]
+                         for _ in range(40)]
+            self.assertEqual(self._mine(sequences, 5), _bruteForce(sequences, 5))
+
+    def test_itemset_extension_in_a_later_itemset(self):
+        # (a b) first ends in the second itemset, but (a b c) only occurs in the last one
+        sequences = [[{'a'}, {'a', 'b'}, {'d'}, {'a', 'b', 'c'}]] * 2 + [[{'c'}]]
+        patterns = self._mine(sequences, 2)
+        self.assertEqual(patterns[(frozenset('abc'),)], 2)
+        self.assertEqual(patterns[(frozenset('a'), frozenset('abc'))], 2)
+        self.assertEqual(patterns, _bruteForce(sequences, 2))
+
+
+if __name__ == '__main__':
+    unittest.main()
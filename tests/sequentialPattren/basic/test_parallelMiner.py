@@ -0,0 +1,62 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/sequentialPattren/basic/test_parallelMiner.py
+
+import io
+import os
+import random
+import unittest
+import contextlib
+from PAMI.sequentialPattern.basic.GSP import GSP
+from PAMI.sequentialPattern.basic.SPADE import SPADE
+from PAMI.sequentialPattern.basic.SPADEPlus import SPADEPlus
+from PAMI.sequentialPattern.basic.SPAM import SPAM
+from PAMI.sequentialPattern.basic.PrefixSpan import PrefixSpan
+from PAMI.sequentialPattern.basic._parallelMiner import _TaskPool
+
+
+class _SquareMiner:
+
+    def _mineTask(self, task):
+        return [task * task]
+
+
+class TestParallelMiner(unittest.TestCase):
+
+    def setUp(self):
+        self.inputFile = "test_parallel_miner_input.txt"
+        self.prefixSpanFile = "test_parallel_miner_prefixspan_input.txt"
+        rng = random.Random(3)
+        items = ['i' + str(k) for k in range(8)]
+        with open(self.inputFile, 'w') as f, open(self.prefixSpanFile, 'w') as g:
+            for _ in range(60):
+                sequence = [rng.sample(items, rng.randint(1, 3)) for _ in range(rng.randint(1, 5))]
+                f.write(' -1 '.join(' '.join(itemset) for itemset in sequence) + ' -1 -2\n')
+                g.write(' : '.join(' '.join(itemset) for itemset in sequence) + '\n')
+
+    def tearDown(self):
+        for file in (self.inputFile, self.prefixSpanFile):
+            if os.path.exists(file):
+                os.remove(file)
+
+    def _mine(self, miner):
+        with contextlib.redirect_stdout(io.StringIO()):
+            miner.mine()
+        return miner.getPatterns()
+
+    def test_workers_give_the_same_patterns(self):
+        for algorithm, inputFile in ((GSP, self.inputFile), (SPADE, self.inputFile), (SPADEPlus, self.inputFile),
+                                     (SPAM, self.inputFile), (PrefixSpan, self.prefixSpanFile)):
+            serial = self._mine(algorithm(inputFile, 8))
+            self.assertTrue(serial)
+            self.assertEqual(self._mine(algorithm(inputFile, 8, workers=2)), serial, algorithm.__name__)
+
+    def test_pool_runs_every_task_once(self):
+        for workers in (1, 3):
+            results = []
+            with _TaskPool(_SquareMiner(), workers) as pool:
+                pool.run([(size, size) for size in range(10)], results.extend)
+            self.assertEqual(sorted(results), [size * size for size in range(10)])
+
+
+if __name__ == '__main__':
+    unittest.main()
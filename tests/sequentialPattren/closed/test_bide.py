@@ -0,0 +1,69 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/sequentialPattren/closed/test_bide.py
+
+import io
+import os
+import ast
+import random
+import unittest
+import contextlib
+from PAMI.sequentialPattern.basic.PrefixSpan import PrefixSpan
+from PAMI.sequentialPattern.closed.bide import BIDE
+
+
+def _asItemsets(key):
+    itemsets, current = [], []
+    for item in ast.literal_eval(key):
+        if item == ':':
+            itemsets.append(frozenset(current))
+            current = []
+        else:
+            current.append(item)
+    return tuple(itemsets)
+
+
+def _isSubsequence(pattern, sequence):
+    index = 0
+    for itemset in sequence:
+        if index < len(pattern) and pattern[index] <= itemset:
+            index += 1
+    return index == len(pattern)
+
+
+class TestBIDE(unittest.TestCase):
+
+    def setUp(self):
+        self.inputFile = "test_bide_input.txt"
+
+    def tearDown(self):
+        if os.path.exists(self.inputFile):
+            os.remove(self.inputFile)
+
+    def _mine(self, miner):
+        with contextlib.redirect_stdout(io.StringIO()):
+            miner.mine()
+        return {_asItemsets(key): sup for key, sup in miner.getPatterns().items()}
+
+    def test_small_database(self):
+        with open(self.inputFile, 'w') as f:
+            f.write("a : b c : d\na : b c\nb c : d\n")
+        expected = {(frozenset('bc'),): 3, (frozenset('a'), frozenset('bc')): 2, (frozenset('bc'), frozenset('d')): 2}
+        self.assertEqual(self._mine(BIDE(self.inputFile, 2)), expected)
+
+    def test_against_prefixspan(self):
+        for seed in range(8):
+            rng = random.Random(seed)
+            with open(self.inputFile, 'w') as f:
+                for _ in range(30):
+                    f.write(' : '.join(' '.join(rng.sample('abcdef', rng.randint(1, 3)))
+                                       for _ in range(rng.randint(1, 6))) + '\n')
+            frequent = self._mine(PrefixSpan(self.inputFile, 4))
+            expected = {pattern: sup for pattern, sup in frequent.items()
+                        if not any(sup == other and pattern != longer and _isSubsequence(pattern, longer)
+                                   for longer, other in frequent.items())}
+            self.assertEqual(self._mine(BIDE(self.inputFile, 4)), expected)
+            self.assertEqual(self._mine(BIDE(self.inputFile, 4, workers=2)), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
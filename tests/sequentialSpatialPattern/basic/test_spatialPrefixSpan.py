@@ -0,0 +1,116 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/sequentialSpatialPattern/basic/test_spatialPrefixSpan.py
+
+import io
+import os
+import ast
+import random
+import unittest
+import contextlib
+from PAMI.sequentialSpatialPattern.basic.spatialPrefixSpan import spatialPrefixSpan
+
+
+def _contains(sequence, pattern, maxGap):
+    def place(index, previous):
+        if index == len(pattern):
+            return True
+        for position in range(previous + 1, len(sequence)):
+            if index and position - previous > maxGap:
+                break
+            if pattern[index] <= sequence[position] and place(index + 1, position):
+                return True
+        return False
+    return place(0, -1)
+
+
+def _allowed(pattern, neighbours):
+    # every item is preceded only by items it lists as neighbours
+    seen = []
+    for itemset in pattern:
+        for item in sorted(itemset):
+            if item not in neighbours or any(other not in neighbours[item] for other in seen):
+                return False
+            seen.append(item)
+    return True
+
+
+def _bruteForce(sequences, neighbours, minSup, maxLength, maxGap):
+    items = sorted({item for sequence in sequences for itemset in sequence for item in itemset})
+    patterns = {}
+    frontier = [()]
+    while frontier:
+        nextFrontier = []
+        for pattern in frontier:
+            extensions = [pattern[:-1] + (pattern[-1] | {item},) for item in items if pattern and item > max(pattern[-1])]
+            if len(pattern) < maxLength:
+                extensions += [pattern + (frozenset([item]),) for item in items]
+            for extension in extensions:
+                sup = sum(1 for sequence in sequences if _contains(sequence, extension, maxGap))
+                if sup < minSup:
+                    continue
+                nextFrontier.append(extension)
+                if _allowed(extension, neighbours):
+                    patterns[extension] = sup
+        frontier = nextFrontier
+    return patterns
+
+
+def _parse(key):
+    itemsets, current = [], set()
+    for item in ast.literal_eval(key):
+        if item == -1:
+            itemsets.append(frozenset(current))
+            current = set()
+        else:
+            current.add(item)
+    return tuple(itemsets)
+
+
+class TestSpatialPrefixSpan(unittest.TestCase):
+
+    def setUp(self):
+        self.inputFile = "test_spatial_prefixspan_input.txt"
+        self.neighbourFile = "test_spatial_prefixspan_neighbours.txt"
+
+    def tearDown(self):
+        for path in (self.inputFile, self.neighbourFile):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def _write(self, seed):
+        rng = random.Random(seed)
+        items = 'abcdef'
+        sequences = [[set(rng.sample(items, rng.randint(1, 2))) for _ in range(rng.randint(1, 5))]
+                     for _ in range(25)]
+        with open(self.inputFile, 'w') as f:
+            for sequence in sequences:
+                f.write(' -1 '.join(' '.join(sorted(itemset)) for itemset in sequence) + ' -1 -2\n')
+        # one sided neighbourhoods, items listing themselves and an item without a line
+        neighbours = {}
+        with open(self.neighbourFile, 'w') as f:
+            for item in items[:-1]:
+                neighbours[item] = {other for other in items if rng.random() < 0.5}
+                f.write('\t'.join([item] + sorted(neighbours[item])) + '\n')
+        return sequences, neighbours
+
+    def _mine(self, miner):
+        with contextlib.redirect_stdout(io.StringIO()):
+            miner.mine()
+        return miner.getPatterns()
+
+    def test_matches_brute_force(self):
+        for seed, maxLength, maxGap in [(0, float("inf"), float("inf")), (1, float("inf"), float("inf")),
+                                        (2, 2, float("inf")), (3, float("inf"), 1), (4, 3, 2)]:
+            sequences, neighbours = self._write(seed)
+            patterns = self._mine(spatialPrefixSpan(self.inputFile, self.neighbourFile, 3, '\t', maxLength, maxGap))
+            self.assertEqual({_parse(key): sup for key, sup in patterns.items()},
+                             _bruteForce(sequences, neighbours, 3, maxLength, maxGap))
+
+    def test_workers(self):
+        self._write(5)
+        serial = self._mine(spatialPrefixSpan(self.inputFile, self.neighbourFile, 3))
+        self.assertEqual(self._mine(spatialPrefixSpan(self.inputFile, self.neighbourFile, 3, workers=2)), serial)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/subgraphMining/basic/test_canonicalCode.py
+
+import random
+import unittest
+from PAMI.subgraphMining.basic.gspan import GSpan
+from PAMI.subgraphMining.basic.canonicalCode import CanonicalCodes
+from PAMI.subgraphMining.basic.dfsCode import DFSCode
+from PAMI.subgraphMining.basic.edge import Edge
+from PAMI.subgraphMining.basic.graph import Graph
+from PAMI.subgraphMining.basic.vertex import Vertex
+
+
+def _rebuildingIsCanonical(miner, c):
+    """
+    The check rebuilding the graph of the code and searching its isomorphisms again at every step
+    """
+    canC = DFSCode()
+    for i in range(c.size):
+        extensions = miner.rightMostPathExtensionsFromSingle(canC, Graph(-1, None, c))
+        minEe = None
+        for ee in extensions.keys():
+            if minEe is None or ee.smallerThan(minEe):
+                minEe = ee
+        if minEe is not None and minEe.smallerThan(c.getAt(i)):
+            return False
+        if minEe is not None:
+            canC.add(minEe)
+    return True
+
+
+def _randomGraph(rng, numVertices, numEdges, vertexLabels, edgeLabels):
+    vMap = {v: Vertex(v, rng.randint(1, vertexLabels)) for v in range(numVertices)}
+    pairs = {tuple(sorted(rng.sample(range(numVertices), 2))) for _ in range(numEdges)}
+    for v1, v2 in pairs:
+        e = Edge(v1, v2, rng.randint(1, edgeLabels))
+        vMap[v1].addEdge(e)
+        vMap[v2].addEdge(e)
+    return Graph(0, vMap)
+
+
+class TestCanonicalCode(unittest.TestCase):
+
+    def test_same_result_as_rebuilding_check(self):
+        rng = random.Random(5)
+        miner = GSpan("unused", 0.5)
+        canonical = 0
+        for _ in range(300):
+            graph = _randomGraph(rng, rng.randint(2, 7), rng.randint(1, 12), rng.randint(1, 3), rng.randint(1, 2))
+            c = DFSCode()
+            for _ in range(rng.randint(1, 8)):
+                extensions = sorted(miner.rightMostPathExtensionsFromSingle(c, graph), key=repr)
+                if not extensions:
+                    break
+                c.add(rng.choice(extensions))
+                expected = _rebuildingIsCanonical(miner, c)
+                canonical += expected
+                self.assertEqual(CanonicalCodes().isCanonical(c), expected, str(c))
+        self.assertGreater(canonical, 0)
+
+    def test_cache_is_bounded(self):
+        codes = CanonicalCodes(maxSize=2)
+        graph = _randomGraph(random.Random(1), 6, 10, 2, 1)
+        miner = GSpan("unused", 0.5)
+        c = DFSCode()
+        checked = []
+        for _ in range(4):
+            c.add(min(miner.rightMostPathExtensionsFromSingle(c, graph), key=repr))
+            checked.append(c.copy())
+            codes.isCanonical(c)
+        self.assertEqual(len(codes._cache), 2)
+        codes.isCanonical(checked[-1])
+        self.assertEqual(codes.hits, 1)
+        codes.isCanonical(checked[0])
+        self.assertEqual(codes.hits, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
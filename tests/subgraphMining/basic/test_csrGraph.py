@@ -0,0 +1,110 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/subgraphMining/basic/test_csrGraph.py
+
+import os
+import random
+import unittest
+from PAMI.subgraphMining.basic.gspan import GSpan
+from PAMI.subgraphMining.basic.csrGraph import CSRGraph
+from PAMI.subgraphMining.topK.tkg import TKG
+
+
+def _write(path, seed, numGraphs=25, numVertices=9, numEdges=12, vertexLabels=3, edgeLabels=2):
+    rng = random.Random(seed)
+    with open(path, 'w') as f:
+        for i in range(numGraphs):
+            f.write("t # %d\n" % i)
+            n = rng.randint(2, numVertices)
+            ids = rng.sample(range(3 * numVertices), n)
+            for v in ids:
+                f.write("v %d %d\n" % (v, rng.randint(1, vertexLabels)))
+            pairs = {tuple(sorted(rng.sample(ids, 2))) for _ in range(rng.randint(1, numEdges))}
+            for v1, v2 in sorted(pairs):
+                f.write("e %d %d %d\n" % (v1, v2, rng.randint(1, edgeLabels)))
+
+
+def _patterns(miner):
+    return sorted((str(s.dfsCode), s.support, sorted(s.setOfGraphsIds)) for s in miner.frequentSubgraphs)
+
+
+def _entries(graph):
+    ids = graph.vertexIds.tolist()
+    return sorted((ids[v], ids[x], label) for v in graph.getVertexIds() for x, _, label in graph.getNeighbours(v))
+
+
+class TestCSRGraph(unittest.TestCase):
+
+    def setUp(self):
+        self.input_file = "test_csr_graph_input.txt"
+
+    def tearDown(self):
+        if os.path.exists(self.input_file):
+            os.remove(self.input_file)
+
+    def test_same_adjacency_as_graph(self):
+        _write(self.input_file, 0)
+        for g in GSpan(self.input_file, 0.1).readGraphs(self.input_file):
+            csr = CSRGraph.fromGraph(g)
+            ids = csr.vertexIds.tolist()
+            self.assertEqual(ids, sorted(g.vMap))
+            self.assertEqual(csr.getEdgeCount(), g.getEdgeCount())
+            labels = {g.getVLabel(v) for v in ids}
+            for v in csr.getVertexIds():
+                original = ids[v]
+                self.assertEqual(csr.getVLabel(v), g.getVLabel(original))
+                expected = sorted((g.getVLabel(x), x, edgeLabel) for x, _, edgeLabel in g.getNeighbours(original))
+                neighbours = csr.getNeighbours(v)
+                self.assertEqual([(label, ids[x], edgeLabel) for x, label, edgeLabel in neighbours], expected)
+                for label in labels:
+                    self.assertEqual([(ids[x], edgeLabel) for x, edgeLabel in csr.getNeighboursWithLabel(v, label)],
+                                     [(x, edgeLabel) for l, x, edgeLabel in expected if l == label])
+                for x in csr.getVertexIds():
+                    self.assertEqual(csr.isNeighboring(v, x), g.isNeighboring(original, ids[x]))
+                    self.assertEqual(csr.getEdgeLabel(v, x), g.getEdgeLabel(original, ids[x]))
+            for label in labels:
+                self.assertEqual([ids[v] for v in csr.findAllWithLabel(label)], sorted(g.findAllWithLabel(label)))
+
+    def test_read_text_same_graph(self):
+        _write(self.input_file, 1)
+        graphs = GSpan(self.input_file, 0.1).readGraphs(self.input_file)
+        csrGraphs = list(CSRGraph.readText(self.input_file))
+        self.assertEqual(len(csrGraphs), len(graphs))
+        for g, csr in zip(graphs, csrGraphs):
+            expected = CSRGraph.fromGraph(g)
+            ids = csr.vertexIds.tolist()
+            self.assertEqual(ids, list(g.vMap))
+            self.assertEqual(sorted(zip(ids, csr.vertexLabels.tolist())),
+                             sorted(zip(expected.vertexIds.tolist(), expected.vertexLabels.tolist())))
+            self.assertEqual(_entries(csr), _entries(expected))
+
+    def test_gspan_same_patterns_on_csr(self):
+        for seed in range(3):
+            for labels in [(3, 2), (8, 6)]:
+                _write(self.input_file, seed, vertexLabels=labels[0], edgeLabels=labels[1])
+                for minSup, maxEdges in [(0.2, float('inf')), (0.1, 3)]:
+                    expected = GSpan(self.input_file, minSup, maxNumberOfEdges=maxEdges)
+                    expected.mine()
+                    miner = GSpan(self.input_file, minSup, maxNumberOfEdges=maxEdges, csr=True)
+                    miner.mine()
+                    self.assertEqual(_patterns(miner), _patterns(expected))
+                    # the labels and entries pruned on the arrays are those pruned from the Vertex and Edge objects
+                    self.assertEqual([miner.infrequentVerticesRemovedCount, miner.infrequentVertexPairsRemoved,
+                                      miner.edgeRemovedByLabel, miner.emptyGraphsRemoved],
+                                     [expected.infrequentVerticesRemovedCount, expected.infrequentVertexPairsRemoved,
+                                      expected.edgeRemovedByLabel, expected.emptyGraphsRemoved])
+
+    def test_tkg_same_top_k_on_csr(self):
+        for seed in range(3):
+            _write(self.input_file, seed)
+            for k in [5, 40]:
+                expected = TKG(self.input_file, k)
+                expected.mine()
+                miner = TKG(self.input_file, k, csr=True)
+                miner.mine()
+                self.assertEqual([s.support for s in miner.getSubgraphsList()],
+                                 [s.support for s in expected.getSubgraphsList()])
+                self.assertEqual(miner.getMinSupport(), expected.getMinSupport())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/subgraphMining/basic/test_graphIdBitmap.py
+
+import os
+import pickle
+import random
+import unittest
+from PAMI.subgraphMining.basic.gspan import GSpan
+from PAMI.subgraphMining.basic.dfsCode import DFSCode
+from PAMI.subgraphMining.basic.graphIdBitmap import GraphIdBitmap
+
+
+def _write(path, seed, numGraphs=40, numVertices=8, numEdges=10, vertexLabels=3, edgeLabels=2):
+    rng = random.Random(seed)
+    with open(path, 'w') as f:
+        for i in range(numGraphs):
+            f.write("t # %d\n" % i)
+            n = rng.randint(2, numVertices)
+            for v in range(n):
+                f.write("v %d %d\n" % (v, rng.randint(1, vertexLabels)))
+            pairs = {tuple(sorted(rng.sample(range(n), 2))) for _ in range(rng.randint(1, numEdges))}
+            for v1, v2 in sorted(pairs):
+                f.write("e %d %d %d\n" % (v1, v2, rng.randint(1, edgeLabels)))
+
+
+class TestGraphIdBitmap(unittest.TestCase):
+
+    def setUp(self):
+        self.input_file = "test_graph_id_bitmap_input.txt"
+
+    def tearDown(self):
+        if os.path.exists(self.input_file):
+            os.remove(self.input_file)
+
+    def test_same_ids_as_set(self):
+        rng = random.Random(0)
+        # sparse ids over several chunks, and a dense chunk held as a bitmap container
+        for ids in [[], [rng.randrange(300000) for _ in range(3000)], list(range(65000, 72000)) + [5, 3, 5]]:
+            bitmap = GraphIdBitmap(ids)
+            expected = set(ids)
+            self.assertEqual(len(bitmap), len(expected))
+            self.assertEqual(list(bitmap), sorted(expected))
+            self.assertEqual(bitmap, expected)
+            self.assertEqual(expected, bitmap)
+            self.assertTrue(all(graphId in bitmap for graphId in ids))
+            self.assertFalse(-1 in bitmap or 300001 in bitmap)
+            self.assertEqual(pickle.loads(pickle.dumps(bitmap)), bitmap)
+
+    def test_infrequent_extensions_are_dropped(self):
+        _write(self.input_file, 0)
+        miner = GSpan(self.input_file, 0.3)
+        graphDb = miner.readGraphs(self.input_file)
+        graphIds = set(range(len(graphDb)))
+        miner.minSup = 0
+        allExtensions, allProjections = miner.rightMostPathExtensions(DFSCode(), graphDb, graphIds)
+        miner.minSup = 12
+        extensions, projections = miner.rightMostPathExtensions(DFSCode(), graphDb, graphIds)
+        frequent = {ee: ids for ee, ids in allExtensions.items() if len(ids) >= 12}
+        self.assertTrue(len(frequent) < len(allExtensions))
+        self.assertTrue(set(frequent) <= set(extensions))
+        self.assertTrue(len(extensions) < len(allExtensions))
+        for ee, ids in frequent.items():
+            self.assertEqual(extensions[ee], ids)
+            self.assertEqual(len(projections[ee]), len(allProjections[ee]))
+            self.assertIsInstance(extensions[ee], GraphIdBitmap)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/subgraphMining/basic/test_graphs2Binary.py
+
+import os
+import random
+import unittest
+from PAMI.extras.convert.Graphs2Binary import Graphs2Binary, BinaryGraphDatabase
+from PAMI.extras.stats.graphDatabase import graphDatabase
+from PAMI.subgraphMining.basic.gspan import GSpan
+from PAMI.subgraphMining.basic.csrGraph import CSRGraph
+from PAMI.subgraphMining.topK.tkg import TKG
+from PAMI.uncertainGraphMining.muse.muse import Muse
+
+
+def _write(path, seed, labels, numGraphs=40, numVertices=8, numEdges=10, probabilities=False):
+    rng = random.Random(seed)
+    with open(path, 'w') as f:
+        for i in range(numGraphs):
+            f.write("t # %d\n" % i)
+            n = rng.randint(2, numVertices)
+            ids = rng.sample(range(3 * numVertices), n)
+            for v in ids:
+                f.write("v %d %s\n" % (v, rng.choice(labels)))
+            pairs = {tuple(sorted(rng.sample(ids, 2))) for _ in range(rng.randint(1, numEdges))}
+            for v1, v2 in sorted(pairs):
+                f.write("e %d %d %d" % (v1, v2, rng.randint(1, 3)))
+                f.write(" %.2f\n" % rng.random() if probabilities else "\n")
+        f.write("t # -1\n")
+
+
+def _structure(graphs):
+    structure = []
+    for g in graphs:
+        vertices = g.vertexMap if hasattr(g, 'vertexMap') else g.vMap
+        structure.append((g.id, [(v.getId(), v.getLabel(), [(e.v1, e.v2, e.getEdgeLabel(),
+                                                           getattr(e, 'existenceProbability', None))
+                                                          for e in v.getEdgeList()]) for v in vertices.values()]))
+    return structure
+
+
+class TestGraphs2Binary(unittest.TestCase):
+
+    def setUp(self):
+        self.input_file = "test_graphs2binary_input.txt"
+        self.binary_file = "test_graphs2binary_input.bin"
+
+    def tearDown(self):
+        for path in (self.input_file, self.binary_file):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def _convert(self):
+        Graphs2Binary(self.input_file, self.binary_file).convert()
+        self.assertTrue(BinaryGraphDatabase.isBinary(self.binary_file))
+        self.assertFalse(BinaryGraphDatabase.isBinary(self.input_file))
+
+    def test_gspan_reads_the_same_graphs(self):
+        _write(self.input_file, 0, ['C', 'O', 'N', '7'])
+        self._convert()
+        text, binary = GSpan(self.input_file, 0.1), GSpan(self.binary_file, 0.1, csr=False)
+        self.assertEqual(_structure(binary.readGraphs(self.binary_file)), _structure(text.readGraphs(self.input_file)))
+        self.assertEqual(binary.label_mapping, text.label_mapping)
+        self.assertEqual(binary.graphCount, 40)
+        text.mine()
+        patterns = sorted((str(s.dfsCode), s.support) for s in text.frequentSubgraphs)
+        binary.mine()
+        self.assertEqual(sorted((str(s.dfsCode), s.support) for s in binary.frequentSubgraphs), patterns)
+        # a binary database is read into CSR arrays by default
+        binary = GSpan(self.binary_file, 0.1)
+        graphs = binary.readGraphs(self.binary_file)
+        self.assertTrue(all(isinstance(g, CSRGraph) for g in graphs))
+        self.assertEqual([list(zip(g.vertexIds.tolist(), g.vertexLabels.tolist())) for g in graphs],
+                         [[(v.getId(), v.getLabel()) for v in g.vMap.values()] for g in text.readGraphs(self.input_file)])
+        binary.mine()
+        self.assertEqual(sorted((str(s.dfsCode), s.support) for s in binary.frequentSubgraphs), patterns)
+
+    def test_tkg_and_graph_database(self):
+        _write(self.input_file, 1, ['1', '2', '3'])
+        self._convert()
+        text, binary = TKG(self.input_file, 10), TKG(self.binary_file, 10, csr=False)
+        self.assertEqual(_structure(binary.readGraphs(self.binary_file)), _structure(text.readGraphs(self.input_file)))
+        text.mine()
+        binary.mine()
+        self.assertEqual(sorted((str(s.dfsCode), s.support) for s in binary.getSubgraphsList()),
+                         sorted((str(s.dfsCode), s.support) for s in text.getSubgraphsList()))
+        self.assertEqual(graphDatabase(self.binary_file).graphs, graphDatabase(self.input_file).graphs)
+        binary = TKG(self.binary_file, 10)
+        self.assertTrue(binary.csr)
+        binary.mine()
+        self.assertEqual(sorted((str(s.dfsCode), s.support) for s in binary.getSubgraphsList()),
+                         sorted((str(s.dfsCode), s.support) for s in text.getSubgraphsList()))
+
+    def test_muse_reads_the_probabilities(self):
+        _write(self.input_file, 2, ['1', '2'], probabilities=True)
+        self._convert()
+        expected = _structure(Muse(self.input_file).graphDatabase)
+        self.assertEqual(_structure(Muse(self.binary_file, csr=False).graphDatabase), expected)
+        muse = Muse(self.binary_file)
+        self.assertTrue(muse.csr)
+        self.assertEqual([(g.id, [(v.getId(), v.getLabel(), [(e.v1, e.v2, e.getEdgeLabel(), e.existenceProbability)
+                                                             for e in v.getEdgeList()])
+                                  for v in muse._vertexMap(g).values()]) for g in muse.graphDatabase], expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
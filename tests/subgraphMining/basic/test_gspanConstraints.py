@@ -0,0 +1,86 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/subgraphMining/basic/test_gspanConstraints.py
+
+import os
+import random
+import unittest
+from PAMI.subgraphMining.basic.gspan import GSpan
+
+
+def _write(path, seed, numGraphs=30, numVertices=9, numEdges=16, vertexLabels=3, edgeLabels=3):
+    rng = random.Random(seed)
+    with open(path, 'w') as f:
+        for i in range(numGraphs):
+            f.write("t # %d\n" % i)
+            n = rng.randint(2, numVertices)
+            for v in range(n):
+                f.write("v %d %d\n" % (v, rng.randint(1, vertexLabels)))
+            pairs = {tuple(sorted(rng.sample(range(n), 2))) for _ in range(rng.randint(1, numEdges))}
+            for v1, v2 in sorted(pairs):
+                f.write("e %d %d %d\n" % (v1, v2, rng.randint(1, edgeLabels)))
+
+
+def _satisfies(subgraph, constraints):
+    edges = [ee for ee in subgraph.dfsCode.getEeList() if ee.edgeLabel != -1]
+    vertexLabels = set(subgraph.dfsCode.getAllVLabels()) if edges else {subgraph.dfsCode.getEeList()[0].vLabel1}
+    edgeLabels = {ee.edgeLabel for ee in edges}
+    degrees = {}
+    for ee in edges:
+        degrees[ee.v1] = degrees.get(ee.v1, 0) + 1
+        degrees[ee.v2] = degrees.get(ee.v2, 0) + 1
+    return (set(constraints.get('requiredVertexLabels', ())) <= vertexLabels
+            and set(constraints.get('requiredEdgeLabels', ())) <= edgeLabels
+            and not vertexLabels & set(constraints.get('forbiddenVertexLabels', ()))
+            and not edgeLabels & set(constraints.get('forbiddenEdgeLabels', ()))
+            and (len(degrees) if edges else 1) <= constraints.get('maxNumberOfVertices', float('inf'))
+            and max(degrees.values(), default=0) <= constraints.get('maxDegree', float('inf')))
+
+
+def _patterns(subgraphs):
+    return sorted((str(s.dfsCode), s.support, sorted(s.setOfGraphsIds)) for s in subgraphs)
+
+
+class TestGSpanConstraints(unittest.TestCase):
+
+    def setUp(self):
+        self.input_file = "test_gspan_constraints_input.txt"
+
+    def tearDown(self):
+        if os.path.exists(self.input_file):
+            os.remove(self.input_file)
+
+    def test_same_patterns_as_post_filtering(self):
+        cases = [{'forbiddenVertexLabels': [3]},
+                 {'forbiddenEdgeLabels': [1, 2]},
+                 {'maxNumberOfVertices': 2},
+                 {'maxDegree': 1},
+                 {'maxDegree': 2, 'forbiddenEdgeLabels': [3]},
+                 {'requiredVertexLabels': [1, 2]},
+                 {'requiredEdgeLabels': [3], 'maxNumberOfVertices': 4},
+                 {'requiredVertexLabels': [2], 'requiredEdgeLabels': [1, 3], 'forbiddenVertexLabels': [3]}]
+        for seed in range(2):
+            _write(self.input_file, seed)
+            miner = GSpan(self.input_file, 0.1)
+            miner.mine()
+            for constraints in cases:
+                expected = _patterns(s for s in miner.frequentSubgraphs if _satisfies(s, constraints))
+                self.assertTrue(len(expected) > 0)
+                for kwargs in [{}, {'csr': True}, {'workers': 2}]:
+                    constrained = GSpan(self.input_file, 0.1, **dict(constraints, **kwargs))
+                    constrained.mine()
+                    self.assertEqual(_patterns(constrained.frequentSubgraphs), expected, (constraints, kwargs))
+
+    def test_labels_as_in_the_input_file(self):
+        with open(self.input_file, 'w') as f:
+            for i in range(4):
+                f.write("t # %d\nv 0 C\nv 1 O\nv 2 N\ne 0 1 1\ne 1 2 2\n" % i)
+        miner = GSpan(self.input_file, 0.5, outputSingleVertices=False, requiredVertexLabels=['N'],
+                      forbiddenEdgeLabels=['1'])
+        miner.mine()
+        self.assertEqual(len(miner.frequentSubgraphs), 1)
+        self.assertEqual(miner.frequentSubgraphs[0].support, 4)
+        self.assertEqual([ee.edgeLabel for ee in miner.frequentSubgraphs[0].dfsCode.getEeList()], [2])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/subgraphMining/basic/test_gspanEmbeddings.py
+
+import os
+import random
+import unittest
+from PAMI.subgraphMining.basic.gspan import GSpan
+from PAMI.subgraphMining.basic.dfsCode import DFSCode
+
+
+class _IsomorphismGSpan(GSpan):
+    """
+    gSpan extending every code by searching its isomorphisms in each graph again
+    """
+
+    def rightMostPathExtensions(self, c, graphDb, graphIds, embeddings=None):
+        extensions = {}
+        for iD in graphIds:
+            for ee, ids in self.rightMostPathExtensionsFromSingle(c, graphDb[iD]).items():
+                extensions.setdefault(ee, set()).update(ids)
+        return extensions, {ee: None for ee in extensions}
+
+
+def _write(path, seed, numGraphs=25, numVertices=8, numEdges=10, vertexLabels=3, edgeLabels=2):
+    rng = random.Random(seed)
+    with open(path, 'w') as f:
+        for i in range(numGraphs):
+            f.write("t # %d\n" % i)
+            n = rng.randint(2, numVertices)
+            for v in range(n):
+                f.write("v %d %d\n" % (v, rng.randint(1, vertexLabels)))
+            pairs = {tuple(sorted(rng.sample(range(n), 2))) for _ in range(rng.randint(1, numEdges))}
+            for v1, v2 in sorted(pairs):
+                f.write("e %d %d %d\n" % (v1, v2, rng.randint(1, edgeLabels)))
+
+
+def _patterns(miner):
+    return sorted((str(s.dfsCode), s.support, sorted(s.setOfGraphsIds)) for s in miner.frequentSubgraphs)
+
+
+class TestGSpanEmbeddings(unittest.TestCase):
+
+    def setUp(self):
+        self.input_file = "test_gspan_embeddings_input.txt"
+
+    def tearDown(self):
+        if os.path.exists(self.input_file):
+            os.remove(self.input_file)
+
+    def test_same_patterns_as_isomorphism_search(self):
+        for seed in range(6):
+            _write(self.input_file, seed, vertexLabels=2 + seed % 3)
+            for minSup, maxEdges in [(0.2, float('inf')), (0.1, 4)]:
+                expected = _IsomorphismGSpan(self.input_file, minSup, maxNumberOfEdges=maxEdges)
+                expected.mine()
+                miner = GSpan(self.input_file, minSup, maxNumberOfEdges=maxEdges)
+                miner.mine()
+                self.assertEqual(_patterns(miner), _patterns(expected))
+
+    def test_embeddings_follow_the_code(self):
+        _write(self.input_file, 7)
+        miner = GSpan(self.input_file, 0.2)
+        graphDb = miner.readGraphs(self.input_file)
+        code = DFSCode()
+        extensions, projections = miner.rightMostPathExtensions(code, graphDb, set(range(len(graphDb))))
+        for depth in range(3):
+            ee = max(extensions, key=lambda x: len(extensions[x]))
+            code.add(ee)
+            embeddings = projections[ee]
+            self.assertEqual({embedding.getGraphId() for embedding in embeddings}, extensions[ee])
+            for embedding in embeddings:
+                vertexMap = embedding.getVertexMap(code)
+                g = graphDb[embedding.getGraphId()]
+                self.assertEqual(len(set(vertexMap)), len(vertexMap))
+                for edge in code.getEeList():
+                    self.assertEqual(g.getVLabel(vertexMap[edge.v1]), edge.vLabel1)
+                    self.assertEqual(g.getVLabel(vertexMap[edge.v2]), edge.vLabel2)
+                    self.assertEqual(g.getEdgeLabel(vertexMap[edge.v1], vertexMap[edge.v2]), edge.edgeLabel)
+            extensions, projections = miner.rightMostPathExtensions(code, graphDb, extensions[ee], embeddings)
+
+
+if __name__ == '__main__':
+    unittest.main()
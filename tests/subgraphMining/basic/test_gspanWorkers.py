@@ -0,0 +1,49 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/subgraphMining/basic/test_gspanWorkers.py
+
+import os
+import random
+import unittest
+from PAMI.subgraphMining.basic.gspan import GSpan
+
+
+def _write(path, seed, numGraphs=30, numVertices=8, numEdges=10, vertexLabels=3, edgeLabels=2):
+    rng = random.Random(seed)
+    with open(path, 'w') as f:
+        for i in range(numGraphs):
+            f.write("t # %d\n" % i)
+            n = rng.randint(2, numVertices)
+            for v in range(n):
+                f.write("v %d %d\n" % (v, rng.randint(1, vertexLabels)))
+            pairs = {tuple(sorted(rng.sample(range(n), 2))) for _ in range(rng.randint(1, numEdges))}
+            for v1, v2 in sorted(pairs):
+                f.write("e %d %d %d\n" % (v1, v2, rng.randint(1, edgeLabels)))
+
+
+def _patterns(miner):
+    return sorted((str(s.dfsCode), s.support, sorted(s.setOfGraphsIds)) for s in miner.frequentSubgraphs)
+
+
+class TestGSpanWorkers(unittest.TestCase):
+
+    def setUp(self):
+        self.input_file = "test_gspan_workers_input.txt"
+
+    def tearDown(self):
+        if os.path.exists(self.input_file):
+            os.remove(self.input_file)
+
+    def test_same_patterns_as_serial(self):
+        for seed in range(3):
+            _write(self.input_file, seed)
+            for minSup, maxEdges in [(0.2, float('inf')), (0.1, 3), (0.1, 1)]:
+                expected = GSpan(self.input_file, minSup, maxNumberOfEdges=maxEdges)
+                expected.mine()
+                miner = GSpan(self.input_file, minSup, maxNumberOfEdges=maxEdges, workers=2)
+                miner.mine()
+                self.assertEqual(_patterns(miner), _patterns(expected))
+                self.assertEqual(miner.patternCount, expected.patternCount)
+
+
+if __name__ == '__main__':
+    unittest.main()
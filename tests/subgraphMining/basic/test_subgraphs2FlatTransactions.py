@@ -0,0 +1,96 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/subgraphMining/basic/test_subgraphs2FlatTransactions.py
+
+import os
+import random
+import unittest
+from PAMI.extras.convert.Subgraphs2FlatTransactions import Subgraphs2FlatTransactions
+from PAMI.subgraphMining.basic.gspan import GSpan
+
+
+def _write(path, seed, numGraphs=30, numVertices=8, numEdges=10, vertexLabels=3, edgeLabels=2):
+    rng = random.Random(seed)
+    with open(path, 'w') as f:
+        for i in range(numGraphs):
+            f.write("t # %d\n" % i)
+            n = rng.randint(2, numVertices)
+            for v in range(n):
+                f.write("v %d %d\n" % (v, rng.randint(1, vertexLabels)))
+            pairs = {tuple(sorted(rng.sample(range(n), 2))) for _ in range(rng.randint(1, numEdges))}
+            for v1, v2 in sorted(pairs):
+                f.write("e %d %d %d\n" % (v1, v2, rng.randint(1, edgeLabels)))
+
+
+class TestSubgraphs2FlatTransactions(unittest.TestCase):
+
+    def setUp(self):
+        self.input_file = "test_flat_transactions_input.txt"
+        self.saved_file = "test_flat_transactions_saved.txt"
+        self.streamed_file = "test_flat_transactions_streamed.txt"
+
+    def tearDown(self):
+        for path in (self.input_file, self.saved_file, self.streamed_file):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def test_streamed_as_saved(self):
+        _write(self.input_file, 0)
+        gsp = GSpan(self.input_file, 0.2, outputSingleVertices=False, outputGraphIds=True)
+        gsp.mine()
+        mappings = gsp.getSubgraphGraphMapping()
+        self.assertEqual([(fid, list(gids)) for fid, gids in gsp.iterSubgraphGraphMapping()],
+                         [(m["FID"], m["GIDs"]) for m in mappings])
+
+        obj = Subgraphs2FlatTransactions()
+        obj.getFlatTransactions(mappings)
+        obj.saveFlatTransactions(self.saved_file)
+        count = Subgraphs2FlatTransactions().streamFlatTransactions(gsp.iterSubgraphGraphMapping(), self.streamed_file)
+        with open(self.saved_file) as saved, open(self.streamed_file) as streamed:
+            lines = saved.read()
+            self.assertEqual(streamed.read(), lines)
+        self.assertEqual(count, len(obj.flatTransactions))
+        self.assertTrue(count > 0)
+
+    def test_written_from_the_callback(self):
+        _write(self.input_file, 1)
+        gsp = GSpan(self.input_file, 0.2, outputGraphIds=True)
+        gsp.mine()
+        obj = Subgraphs2FlatTransactions()
+        obj.getFlatTransactions(gsp.getSubgraphGraphMapping())
+        obj.saveFlatTransactions(self.saved_file)
+
+        reported = []
+        flat = Subgraphs2FlatTransactions()
+
+        def callback(fid, subgraph):
+            reported.append((fid, str(subgraph.dfsCode), sorted(subgraph.setOfGraphsIds)))
+            flat.addSubgraph(fid, subgraph)
+
+        streamed = GSpan(self.input_file, 0.2, outputGraphIds=True, callback=callback)
+        streamed.mine()
+        self.assertEqual(streamed.frequentSubgraphs, [])
+        self.assertEqual(streamed.patternCount, gsp.patternCount)
+        self.assertEqual(reported, [(i, str(s.dfsCode), sorted(s.setOfGraphsIds))
+                                    for i, s in enumerate(gsp.frequentSubgraphs)])
+        self.assertEqual(flat.writeFlatTransactions(self.streamed_file), len(obj.flatTransactions))
+        with open(self.saved_file) as saved, open(self.streamed_file) as written:
+            self.assertEqual(written.read(), saved.read())
+
+        # the subtrees mined by the workers are reported by the calling process
+        reported = []
+        GSpan(self.input_file, 0.2, workers=2, callback=callback).mine()
+        self.assertEqual([fid for fid, _, _ in reported], list(range(len(reported))))
+        self.assertEqual(sorted(r[1:] for r in reported),
+                         sorted((str(s.dfsCode), sorted(s.setOfGraphsIds)) for s in gsp.frequentSubgraphs))
+
+    def test_unordered_and_repeated_fragments(self):
+        mappings = [(3, [1, 0]), (1, [1]), (0, [2, 1]), (1, [1])]
+        count = Subgraphs2FlatTransactions().streamFlatTransactions(iter(mappings), self.streamed_file, sep='\t')
+        with open(self.streamed_file) as f:
+            self.assertEqual(f.read().splitlines(), ["0\t1\t3", "3", "0"])
+        self.assertEqual(count, 3)
+        self.assertEqual(Subgraphs2FlatTransactions().getFlatTransactions(mappings), {1: [0, 1, 3], 0: [3], 2: [0]})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/subgraphMining/topK/test_tkgWorkers.py
+
+import os
+import random
+import unittest
+from PAMI.subgraphMining.topK.tkg import TKG
+
+
+def _write(path, seed, numGraphs=40, numVertices=8, numEdges=10, vertexLabels=3, edgeLabels=2):
+    rng = random.Random(seed)
+    with open(path, 'w') as f:
+        for i in range(numGraphs):
+            f.write("t # %d\n" % i)
+            n = rng.randint(2, numVertices)
+            for v in range(n):
+                f.write("v %d %d\n" % (v, rng.randint(1, vertexLabels)))
+            pairs = {tuple(sorted(rng.sample(range(n), 2))) for _ in range(rng.randint(1, numEdges))}
+            for v1, v2 in sorted(pairs):
+                f.write("e %d %d %d\n" % (v1, v2, rng.randint(1, edgeLabels)))
+
+
+class TestTKGWorkers(unittest.TestCase):
+
+    def setUp(self):
+        self.input_file = "test_tkg_workers_input.txt"
+
+    def tearDown(self):
+        if os.path.exists(self.input_file):
+            os.remove(self.input_file)
+
+    def test_same_top_k_as_serial(self):
+        for seed in range(3):
+            _write(self.input_file, seed)
+            for k in [5, 30, 100]:
+                expected = TKG(self.input_file, k)
+                expected.mine()
+                miner = TKG(self.input_file, k, workers=2)
+                miner.mine()
+                # Subgraphs of equal support may be kept in any order, so the supports are compared
+                self.assertEqual([s.support for s in miner.getSubgraphsList()],
+                                 [s.support for s in expected.getSubgraphsList()])
+                self.assertEqual(miner.getMinSupport(), expected.getMinSupport())
+                above = expected.getMinSupport()
+                self.assertEqual(sorted(str(s.dfsCode) for s in miner.getSubgraphsList() if s.support > above),
+                                 sorted(str(s.dfsCode) for s in expected.getSubgraphsList() if s.support > above))
+
+
+if __name__ == '__main__':
+    unittest.main()
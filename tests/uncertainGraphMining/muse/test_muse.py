@@ -0,0 +1,95 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/uncertainGraphMining/muse/test_muse.py
+
+import os
+import unittest
+import numpy as np
+from PAMI.uncertainGraphMining.muse.muse import Muse
+from PAMI.uncertainGraphMining.muse.edge import Edge
+
+
+class _Embedding:
+
+    def __init__(self, edges):
+        self.edges = edges
+
+    def getEdgeList(self):
+        return self.edges
+
+
+class TestMuse(unittest.TestCase):
+
+    def setUp(self):
+        self.input_file = "test_muse_input.txt"
+        with open(self.input_file, 'w') as f:
+            f.write("t # 0\nv 0 1\nv 1 2\nv 2 1\ne 0 1 1 1.0\ne 1 2 1 0.0\ne 0 2 2 0.5\n")
+        self.edges = [Edge(0, 1, 1, 0.5), Edge(1, 2, 1, 0.7), Edge(2, 3, 1, 0.2), Edge(0, 3, 2, 0.9)]
+        # (e0 and e1) or (e1 and e2) or e3
+        self.embeddings = [_Embedding(self.edges[:2]), _Embedding(self.edges[1:3]), _Embedding(self.edges[3:])]
+        p = [0.5, 0.7, 0.2, 0.9]
+        self.exact = 1 - (1 - p[3]) * (1 - (p[1] * (p[0] + p[2] - p[0] * p[2])))
+
+    def tearDown(self):
+        if os.path.exists(self.input_file):
+            os.remove(self.input_file)
+
+    def test_exact_probability(self):
+        muse = Muse(self.input_file, seed=1)
+        clauses, probabilities = muse._constructDnfFormula(self.embeddings)
+        self.assertEqual(clauses.shape, (3, 4))
+        self.assertAlmostEqual(muse._computeProbabilityFromDnf(clauses, probabilities), self.exact)
+
+    def test_batches_bounded_by_clauses(self):
+        muse = Muse(self.input_file, seed=1)
+        muse.batchCells = 6
+        clauses, probabilities = muse._constructDnfFormula(self.embeddings * 3)
+        self.assertEqual(muse._batchRows(clauses.T), 1)
+        self.assertAlmostEqual(muse._computeProbabilityFromDnf(clauses, probabilities), self.exact)
+        estimates = []
+        for cells in [6, 1 << 22]:
+            muse = Muse(self.input_file, seed=5)
+            muse.batchCells = cells
+            estimates.append(muse._sampleDnf(clauses, probabilities, 500))
+        self.assertEqual(estimates[0], estimates[1])
+
+    def test_estimate_is_seeded_and_close(self):
+        bounds = []
+        for _ in range(2):
+            muse = Muse(self.input_file, seed=np.random.default_rng(7))
+            muse.batchCells = 1000
+            clauses, probabilities = muse._constructDnfFormula(self.embeddings)
+            bounds.append(muse.estimateProbability(clauses, probabilities, 0.2, 0.05, 0.5))
+        self.assertEqual(bounds[0], bounds[1])
+        low, high = bounds[0]
+        self.assertAlmostEqual((low + high) / 2, self.exact, delta=0.01)
+        self.assertAlmostEqual(high - low, 0.1)
+
+    def test_sample_graph_shares_edges(self):
+        muse = Muse(self.input_file, seed=3)
+        graph = muse.graphDatabase[0]
+        edges = {e for v in graph.getVertexMap().values() for e in v.getEdgeList()}
+        for _ in range(20):
+            sampled = muse._sampleGraph(graph)
+            sampledEdges = {e for v in sampled.getVertexMap().values() for e in v.getEdgeList()}
+            self.assertTrue(sampledEdges <= edges)
+            self.assertIn(Edge(0, 1, 1), sampledEdges)
+            self.assertNotIn(Edge(1, 2, 1), sampledEdges)
+            for e in sampledEdges:
+                self.assertTrue(any(e is original for original in edges))
+        self.assertEqual(len(graph.getVertexMap()[0].getEdgeList()), 2)
+
+    def test_same_patterns_on_csr(self):
+        with open(self.input_file, 'w') as f:
+            f.write("t # 0\nv 0 1\nv 1 2\nv 2 1\nv 3 2\ne 0 1 1 0.9\ne 1 2 1 0.4\ne 0 2 2 0.5\ne 3 1 1 0.7\n"
+                    "t # 1\nv 0 1\nv 1 2\ne 0 1 1 0.8\n"
+                    "t # 2\nv 5 2\nv 1 1\nv 2 1\ne 1 5 1 0.3\ne 2 5 1 0.6\ne 2 2 2 0.5\n")
+        patterns = []
+        for csr in (False, True):
+            muse = Muse(self.input_file, seed=1, csr=csr)
+            patterns.append(sorted(sorted((i, v.vLabel) for i, v in f) for f in muse.mine(0.3, 0.1, 0.05)))
+        self.assertEqual(len(patterns[0]), 7)
+        self.assertEqual(patterns[1], patterns[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
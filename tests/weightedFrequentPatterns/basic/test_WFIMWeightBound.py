@@ -0,0 +1,62 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/weightedFrequentPatterns/basic/test_WFIMWeightBound.py
+
+import os
+import random
+import unittest
+from itertools import combinations
+from PAMI.weightedFrequentPattern.basic.WFIM import WFIM
+
+
+class TestWFIMWeightBound(unittest.TestCase):
+
+    def setUp(self):
+        self.inputFile = "test_wfim_input.txt"
+        self.weightFile = "test_wfim_weights.txt"
+        self.items = [chr(97 + i) for i in range(8)]
+
+    def tearDown(self):
+        for path in (self.inputFile, self.weightFile):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def _writeDatabase(self, seed, weights):
+        random.seed(seed)
+        self.transactions = [set(random.sample(self.items, random.randint(1, 5))) for _ in range(40)]
+        with open(self.inputFile, 'w') as f:
+            f.write('\n'.join('\t'.join(sorted(transaction)) for transaction in self.transactions) + '\n')
+        self.weights = {item: random.choice(weights) for item in self.items}
+        with open(self.weightFile, 'w') as f:
+            f.write('\n'.join(item + '\t' + str(weight) for item, weight in self.weights.items()) + '\n')
+
+    def _checkPatterns(self, minSup):
+        miner = WFIM(self.inputFile, self.weightFile, minSup, 0)
+        miner.mine()
+        patterns = {tuple(sorted(pattern.split())): support for pattern, support in miner.getPatterns().items()}
+        for length in range(1, len(self.items) + 1):
+            for itemset in combinations(self.items, length):
+                support = sum(1 for transaction in self.transactions if transaction.issuperset(itemset))
+                # no superset of a pruned pattern can have support times its largest weight above minSup
+                if support >= minSup and support * max(self.weights[item] for item in itemset) > minSup:
+                    self.assertIn(itemset, patterns)
+                if itemset in patterns:
+                    self.assertEqual(patterns[itemset], support)
+                    self.assertGreaterEqual(support, minSup)
+
+    def test_weights_of_zero_or_one(self):
+        for seed in range(10, 16):
+            self._writeDatabase(seed, [0, 1])
+            for minSup in (4, 8):
+                with self.subTest(seed=seed, minSup=minSup):
+                    self._checkPatterns(minSup)
+
+    def test_weights_of_two_or_more(self):
+        for seed in range(10, 16):
+            self._writeDatabase(seed, [2, 3, 5])
+            for minSup in (4, 8):
+                with self.subTest(seed=seed, minSup=minSup):
+                    self._checkPatterns(minSup)
+
+
+if __name__ == '__main__':
+    unittest.main()
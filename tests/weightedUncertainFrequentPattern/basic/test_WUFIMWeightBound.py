@@ -0,0 +1,70 @@
+# To test simply use the following command:
+# python -m unittest PathToPAMI/PAMI/tests/weightedUncertainFrequentPattern/basic/test_WUFIMWeightBound.py
+
+import os
+import random
+import unittest
+from itertools import combinations
+from PAMI.weightedUncertainFrequentPattern.basic.WUFIM import WUFIM
+
+
+class TestWUFIMWeightBound(unittest.TestCase):
+
+    def setUp(self):
+        self.inputFile = "test_wufim_input.txt"
+        self.weightFile = "test_wufim_weights.txt"
+        self.items = [chr(97 + i) for i in range(10)]
+
+    def _writeDatabase(self, seed):
+        random.seed(seed)
+        self.transactions = []
+        with open(self.inputFile, 'w') as f:
+            for _ in range(50):
+                items = random.sample(self.items, random.randint(1, 5))
+                probabilities = [round(random.uniform(0.1, 1), 2) for _ in items]
+                self.transactions.append(dict(zip(items, probabilities)))
+                f.write('\t'.join(items) + ':' + '\t'.join(map(str, probabilities)) + '\n')
+        self.weights = {item: random.randint(1, 9) for item in self.items[:9]}
+        with open(self.weightFile, 'w') as f:
+            f.write('\n'.join(item + '\t' + str(weight) for item, weight in self.weights.items()) + '\n')
+
+    def tearDown(self):
+        for path in (self.inputFile, self.weightFile):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def _expectedSupport(self, itemset):
+        support = 0
+        for transaction in self.transactions:
+            if all(item in transaction for item in itemset):
+                probability = 1
+                for item in itemset:
+                    probability *= transaction[item]
+                support += probability
+        return support
+
+    def _checkPatterns(self, expSup, expWSup):
+        miner = WUFIM(self.inputFile, self.weightFile, expSup, expWSup)
+        miner.mine()
+        patterns = {tuple(sorted(pattern.split())): support for pattern, support in miner.getPatterns().items()}
+        for length in range(1, len(self.weights) + 1):
+            for itemset in combinations(sorted(self.weights), length):
+                support = self._expectedSupport(itemset)
+                weight = sum(self.weights[item] for item in itemset) / length
+                if support >= expSup and support * weight >= expWSup:
+                    self.assertIn(itemset, patterns)
+                if itemset in patterns:
+                    self.assertAlmostEqual(patterns[itemset], support)
+                    self.assertGreaterEqual(patterns[itemset], expSup)
+                    self.assertGreaterEqual(patterns[itemset] * weight, expWSup)
+
+    def test_patterns_reach_both_thresholds(self):
+        for seed in range(5, 15):
+            self._writeDatabase(seed)
+            for expSup, expWSup in ((1.0, 8.0), (2.0, 6.0)):
+                with self.subTest(seed=seed, expSup=expSup, expWSup=expWSup):
+                    self._checkPatterns(expSup, expWSup)
+
+
+if __name__ == '__main__':
+    unittest.main()